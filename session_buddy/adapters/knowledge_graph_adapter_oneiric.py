@@ -17,19 +17,32 @@ Key Features:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 import typing as t
 import uuid
+from collections import deque
 from datetime import UTC, datetime
 
+import numpy as np
+
 from session_buddy.adapters.knowledge_graph_adapter_phase3 import (
     Phase3RelationshipMixin,
 )
 from session_buddy.adapters.settings import KnowledgeGraphAdapterSettings
+from session_buddy.utils.graph_index import AdjacencyIndex
+from session_buddy.utils.vector_sql import vector_literal
 
 logger = logging.getLogger(__name__)
 
+# Embedding batches in flight at once during a backfill
+_BACKFILL_CONCURRENCY = 4
+# Source rows per similarity tile in batch relationship discovery; bounds the
+# score matrix to tile_rows x entity_count floats
+_SIMILARITY_TILE_ROWS = 1024
+
 if t.TYPE_CHECKING:
     from pathlib import Path
     from types import TracebackType
@@ -52,6 +65,7 @@ except ImportError:
 try:
     from session_buddy.reflection.embeddings import (
         generate_embedding,
+        generate_embeddings,
     )
 
     EMBEDDING_AVAILABLE = True
@@ -131,6 +145,8 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         self._duckpgq_installed = False
         self._initialized = False
         self._embedding_initialized = False
+        # Adjacency index for find_path, built on first use
+        self._adjacency: AdjacencyIndex | None = None
 
         # HTTP embedding providers are stateless — no session initialization needed
         self._embedding_session = None
@@ -168,6 +184,7 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         if hasattr(self, "conn") and self.conn is not None:
             self.conn.close()
             self.conn = None
+        self._adjacency = None
 
     def __del__(self) -> None:
         """Destructor to ensure cleanup."""
@@ -480,18 +497,50 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         if not EMBEDDING_AVAILABLE:
             return None
 
-        # Combine entity information for rich semantic representation
+        text = self._entity_embedding_text(entity_name, entity_type, observations)
+
+        try:
+            return await generate_embedding(text)
+        except Exception:  # noqa: BLE001 - best-effort optional embedding; any provider failure must yield None so storage proceeds without it
+            # Silently fail - embeddings are optional
+            return None
+
+    @staticmethod
+    def _entity_embedding_text(
+        entity_name: str,
+        entity_type: str,
+        observations: list[str],
+    ) -> str:
+        """Combine entity information for rich semantic representation."""
         text_parts = [entity_name, entity_type]
         if observations:
             text_parts.extend(observations)
+        return " ".join(text_parts)
+
+    async def _generate_entity_embeddings(
+        self,
+        entities: list[tuple[str, str, list[str]]],
+    ) -> list[list[float] | None]:
+        """Generate embeddings for many entities in batched provider calls.
+
+        Args:
+            entities: ``(name, entity_type, observations)`` tuples
+
+        Returns:
+            One embedding (or None) per input entity, in order
 
-        text = " ".join(text_parts)
+        """
+        if not EMBEDDING_AVAILABLE or not entities:
+            return [None] * len(entities)
 
+        texts = [
+            self._entity_embedding_text(name, entity_type, observations)
+            for name, entity_type, observations in entities
+        ]
         try:
-            return await generate_embedding(text)
+            return await generate_embeddings(texts)
         except Exception:  # noqa: BLE001 - best-effort optional embedding; any provider failure must yield None so storage proceeds without it
-            # Silently fail - embeddings are optional
-            return None
+            return [None] * len(entities)
 
     async def _find_similar_entities(
         self,
@@ -523,21 +572,25 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         if not embedding:
             return []
 
-        # Build similarity query
-        sql = """
-            SELECT id, name, entity_type, observations,
-                   array_cosine_similarity(embedding, ?) as similarity
-            FROM kg_entities
-            WHERE id != ?
-              AND embedding IS NOT NULL
-              AND array_cosine_similarity(embedding, ?) > ?
+        # Build similarity query. The source vector is inlined as a constant
+        # (see utils.vector_sql) and the similarity is computed once per row.
+        sql = f"""
+            SELECT id, name, entity_type, observations, similarity
+            FROM (
+                SELECT id, name, entity_type, observations, created_at,
+                       array_cosine_similarity(
+                           embedding, {vector_literal(embedding, len(embedding))}
+                       ) as similarity
+                FROM kg_entities
+                WHERE id != ?
+                  AND embedding IS NOT NULL
+            )
+            WHERE similarity > ?
             ORDER BY similarity DESC, created_at DESC
             LIMIT ?
         """
 
-        results = conn.execute(
-            sql, (embedding, entity_id, embedding, threshold, limit)
-        ).fetchall()
+        results = conn.execute(sql, (entity_id, threshold, limit)).fetchall()
 
         similar_entities = []
         for row in results:
@@ -754,6 +807,10 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
                 json.dumps(metadata or {}),
             ),
         )
+        if self._adjacency is not None:
+            self._adjacency.add_edge(
+                resolved_from_entity, resolved_to_entity, relation_type
+            )
 
         return {
             "id": relation_id,
@@ -932,74 +989,81 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
             for row in result
         ]
 
+    async def delete_relation(self, relation_id: str) -> bool:
+        """Delete a relationship by ID.
+
+        Args:
+            relation_id: Relationship ID
+
+        Returns:
+            True if the relationship existed and was deleted
+
+        """
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT from_entity, to_entity, relation_type "
+            "FROM kg_relationships WHERE id = ?",
+            (relation_id,),
+        ).fetchone()
+        if not row:
+            return False
+
+        conn.execute("DELETE FROM kg_relationships WHERE id = ?", (relation_id,))
+        if self._adjacency is not None:
+            self._adjacency.remove_edge(row[0], row[1], row[2])
+        return True
+
+    def _get_adjacency(self) -> AdjacencyIndex:
+        """Return the adjacency index, rebuilding it if the table drifted.
+
+        Writes through this adapter update the index in place; the edge
+        count check catches writes made through other connections.
+        """
+        conn = self._get_conn()
+        edge_count = conn.execute("SELECT COUNT(*) FROM kg_relationships").fetchone()[0]
+        if self._adjacency is None or self._adjacency.edge_count != edge_count:
+            self._adjacency = AdjacencyIndex.from_duckdb(conn)
+        return self._adjacency
+
     async def find_path(
         self,
         from_entity: str,
         to_entity: str,
         max_depth: int = 5,
+        k: int = 1,
+        relation_types: list[str] | None = None,
     ) -> list[dict[str, t.Any]]:
-        """Find paths between two entities using breadth-first search.
+        """Find shortest paths between two entities.
+
+        Uses a cached adjacency index and bidirectional breadth-first
+        search; with ``k > 1`` further loopless paths are returned in order
+        of hop count.
 
         Args:
             from_entity: Starting entity name
             to_entity: Target entity name
             max_depth: Maximum path length to search
+            k: Maximum number of paths to return
+            relation_types: Only follow relationships of these types
 
         Returns:
             Paths found between entities with hop counts
 
         """
-        conn = self._get_conn()
         resolved_from_entity = await self._resolve_entity_id(from_entity)
         resolved_to_entity = await self._resolve_entity_id(to_entity)
 
-        # Get all relationships in one query (sync, fast local operation)
-        result = conn.execute(
-            "SELECT from_entity, to_entity, relation_type FROM kg_relationships",
-        ).fetchall()
-
-        # Build adjacency list
-        graph: dict[str, list[tuple[str, str]]] = {}
-        for row in result:
-            from_e = row[0]
-            to_e = row[1]
-            rel_type = row[2]
-
-            if from_e not in graph:
-                graph[from_e] = []
-            graph[from_e].append((to_e, rel_type))
-
-        # BFS to find shortest path
-        from collections import deque
-
-        queue: deque[tuple[str, list[str], list[str]]] = deque(
-            [(resolved_from_entity, [resolved_from_entity], [])],
+        paths = self._get_adjacency().k_shortest_paths(
+            resolved_from_entity,
+            resolved_to_entity,
+            max_depth=max_depth,
+            k=k,
+            relation_types=relation_types,
         )
-        visited = {resolved_from_entity}
-
-        paths: list[dict[str, t.Any]] = []
-        while queue and not paths:  # Find first path only (refurb FURB115)
-            current, path, relations = queue.popleft()
-
-            if len(path) > max_depth + 1:
-                continue
-
-            if current == resolved_to_entity and len(path) > 1:
-                paths.append(
-                    {
-                        "path": path,
-                        "relations": relations,
-                        "hops": len(path) - 1,
-                    },
-                )
-                break
-
-            for neighbor, rel_type in graph.get(current, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, [*path, neighbor], [*relations, rel_type]))
-
-        return paths
+        return [
+            {"path": path, "relations": relations, "hops": len(relations)}
+            for path, relations in paths
+        ]
 
     async def get_stats(self) -> dict[str, t.Any]:
         """Get statistics about the knowledge graph with connectivity metrics.
@@ -1087,72 +1151,123 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         entity_type: str | None = None,
         batch_size: int = 50,
         overwrite: bool = False,
+        limit: int | None = None,
+        cursor: str | None = None,
+        concurrency: int = _BACKFILL_CONCURRENCY,
     ) -> dict[str, t.Any]:
-        """Generate embeddings for entities missing them.
+        """Backfill embeddings for entities, streaming through the table.
+
+        Entities are paged in ID order (keyset pagination), embedded in
+        batches with up to ``concurrency`` batches in flight, and written
+        back with one bulk UPDATE per batch. Batches are written in page
+        order, so the returned ``cursor`` is always safe to resume from.
 
         Args:
             entity_type: Optional filter by entity type
-            batch_size: Number of entities to process per batch
-            overwrite: Regenerate existing embeddings
+            batch_size: Number of entities embedded per batch
+            overwrite: Regenerate existing embeddings (e.g. after a model change)
+            limit: Maximum number of entities to process (None for all)
+            cursor: Resume after this entity ID (from a previous result)
+            concurrency: Maximum embedding batches in flight
 
         Returns:
-            Dictionary with results including count of embeddings generated
+            Dictionary with generated/failed counts, the resume cursor and
+            throughput
 
         """
         conn = self._get_conn()
 
-        # Build query to find entities without embeddings
-        conditions = ["embedding IS NULL"]
+        conditions = []
         params: list[t.Any] = []
-
         if not overwrite:
             conditions.append("embedding IS NULL")
         if entity_type:
             conditions.append("entity_type = ?")
             params.append(entity_type)
-
+        conditions.append("id > ?")
         where_clause = " AND ".join(conditions)
-
-        # Get entities needing embeddings
         sql = f"""
             SELECT id, name, entity_type, observations
             FROM kg_entities
             WHERE {where_clause}
+            ORDER BY id
             LIMIT ?
         """
-        params.append(batch_size)
-
-        results = conn.execute(sql, params).fetchall()
 
         generated = 0
         failed = 0
+        batches = 0
+        remaining = limit
+        last_id = cursor or ""
+        started = time.perf_counter()
+        in_flight: deque[tuple[list[t.Any], asyncio.Task[list[list[float] | None]]]] = (
+            deque()
+        )
 
-        for row in results:
-            entity_id = row[0]
-            name = row[1]
-            entity_type_val = row[2]
-            observations = list(row[3]) if row[3] else []
-
-            try:
-                embedding = await self._generate_entity_embedding(
-                    name, entity_type_val, observations
+        async def _write_oldest() -> None:
+            nonlocal generated, failed, batches, cursor
+            rows, task = in_flight.popleft()
+            embeddings = await task
+            ids = [row[0] for row, emb in zip(rows, embeddings, strict=True) if emb]
+            vectors = [emb for emb in embeddings if emb]
+            if ids:
+                conn.execute(
+                    """
+                    UPDATE kg_entities SET embedding = u.embedding
+                    FROM (
+                        SELECT unnest(?::VARCHAR[]) AS id,
+                               unnest(?::FLOAT[384][]) AS embedding
+                    ) u
+                    WHERE kg_entities.id = u.id
+                    """,
+                    (ids, vectors),
                 )
+            generated += len(ids)
+            failed += len(rows) - len(ids)
+            batches += 1
+            cursor = rows[-1][0]
+            logger.debug(
+                "Embedding backfill batch %d written (cursor=%s)", batches, cursor
+            )
 
-                if embedding:
-                    conn.execute(
-                        "UPDATE kg_entities SET embedding = ? WHERE id = ?",
-                        (embedding, entity_id),
+        try:
+            while remaining is None or remaining > 0:
+                page_size = (
+                    batch_size if remaining is None else min(batch_size, remaining)
+                )
+                rows = conn.execute(sql, [*params, last_id, page_size]).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                if remaining is not None:
+                    remaining -= len(rows)
+                task = asyncio.create_task(
+                    self._generate_entity_embeddings(
+                        [
+                            (row[1], row[2], list(row[3]) if row[3] else [])
+                            for row in rows
+                        ]
                     )
-                    generated += 1
-                else:
-                    failed += 1
-            except Exception:  # noqa: BLE001 - batch embedding generation must continue past per-entity failures and report aggregate counts
-                failed += 1
-
+                )
+                in_flight.append((rows, task))
+                if len(in_flight) >= max(1, concurrency):
+                    await _write_oldest()
+            while in_flight:
+                await _write_oldest()
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+        elapsed = time.perf_counter() - started
+        processed = generated + failed
         return {
             "generated": generated,
             "failed": failed,
-            "total_processed": generated + failed,
+            "total_processed": processed,
+            "batches": batches,
+            "cursor": cursor,
+            "elapsed_seconds": round(elapsed, 3),
+            "entities_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0,
         }
 
     async def batch_discover_relationships(
@@ -1164,11 +1279,17 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
     ) -> dict[str, t.Any]:
         """Batch discover relationships for multiple entities.
 
+        Loads the embedding matrix once and scores source entities against
+        every embedded entity in tiles, keeping the top ``batch_size``
+        neighbours above ``threshold`` per source. Pairs that are already
+        connected (in either direction) are dropped with one anti-join and
+        the remaining relations are inserted in bulk.
+
         Args:
             entity_type: Optional filter by entity type
             threshold: Similarity threshold (0.0-1.0)
             limit: Maximum number of entities to process
-            batch_size: Entities per batch
+            batch_size: Maximum relationships created per entity
 
         Returns:
             Dictionary with results including relationships created
@@ -1176,53 +1297,161 @@ class KnowledgeGraphDatabaseAdapterOneiric(Phase3RelationshipMixin):
         """
         conn = self._get_conn()
 
-        # Build query to find entities with embeddings
-        conditions = ["embedding IS NOT NULL"]
+        rows = conn.execute(
+            "SELECT id, name, entity_type, embedding FROM kg_entities "
+            "WHERE embedding IS NOT NULL ORDER BY id"
+        ).fetchall()
+        source_sql = "SELECT id FROM kg_entities WHERE embedding IS NOT NULL"
         params: list[t.Any] = []
-
         if entity_type:
-            conditions.append("entity_type = ?")
+            source_sql += " AND entity_type = ?"
             params.append(entity_type)
-
-        where_clause = " AND ".join(conditions)
-
-        # Get entities to process
-        sql = f"""
-            SELECT id
-            FROM kg_entities
-            WHERE {where_clause}
-            LIMIT ?
-        """
+        source_sql += " LIMIT ?"
         params.append(limit)
+        source_ids = [row[0] for row in conn.execute(source_sql, params).fetchall()]
 
-        results = conn.execute(sql, params).fetchall()
+        if not rows or not source_ids or batch_size <= 0:
+            return {
+                "entities_processed": 0,
+                "relationships_created": 0,
+                "avg_relationships_per_entity": 0,
+            }
 
-        relationships_created = 0
-        entities_processed = 0
+        position = {row[0]: i for i, row in enumerate(rows)}
+        sources = np.asarray([position[entity_id] for entity_id in source_ids])
+        candidates = self._top_similar_pairs(
+            np.asarray([row[3] for row in rows], dtype=np.float32),
+            sources,
+            threshold,
+            batch_size,
+        )
+        candidates = self._drop_connected_pairs(
+            [(rows[i][0], rows[j][0], similarity) for i, j, similarity in candidates]
+        )
 
-        for row in results:
-            entity_id = row[0]
-            try:
-                created = await self._auto_discover_relationships(
-                    entity_id=entity_id,
-                    max_relationships=batch_size,
-                    similarity_threshold=threshold,
-                )
-                relationships_created += len(created)
-                entities_processed += 1
-            except Exception:
-                logger.debug(
-                    "Skipping entity relationship discovery failure", exc_info=True
-                )
-                # Silently skip failures
+        # Each unordered pair is related once, by the first source reaching it.
+        linked: set[frozenset[str]] = set()
+        relations: list[tuple[str, str, str, dict[str, t.Any]]] = []
+        entities = {row[0]: {"name": row[1], "entity_type": row[2]} for row in rows}
+        for from_id, to_id, similarity in candidates:
+            pair = frozenset((from_id, to_id))
+            if pair in linked:
                 continue
+            linked.add(pair)
+            relation_type, confidence = self._infer_relationship_type(
+                entities[from_id], entities[to_id], similarity
+            )
+            properties = {
+                "similarity": similarity,
+                "confidence": confidence,
+                "auto_discovered": True,
+                "discovery_method": "semantic",
+            }
+            relations.append((from_id, to_id, relation_type, properties))
+
+        self._insert_relations(relations)
 
+        entities_processed = len(source_ids)
         return {
             "entities_processed": entities_processed,
-            "relationships_created": relationships_created,
-            "avg_relationships_per_entity": (
-                round(relationships_created / entities_processed, 2)
-                if entities_processed > 0
-                else 0
+            "relationships_created": len(relations),
+            "avg_relationships_per_entity": round(
+                len(relations) / entities_processed, 2
             ),
         }
+
+    @staticmethod
+    def _top_similar_pairs(
+        embeddings: np.ndarray,
+        sources: np.ndarray,
+        threshold: float,
+        k: int,
+    ) -> list[tuple[int, int, float]]:
+        """Top-``k`` cosine neighbours above ``threshold`` for each source row.
+
+        Returns ``(source row, neighbour row, similarity)`` in source order,
+        best neighbour first.
+        """
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        unit = embeddings / np.where(norms > 0, norms, 1.0)
+        k = min(k, len(unit) - 1)
+        pairs: list[tuple[int, int, float]] = []
+        if k <= 0:
+            return pairs
+
+        for start in range(0, len(sources), _SIMILARITY_TILE_ROWS):
+            tile = sources[start : start + _SIMILARITY_TILE_ROWS]
+            scores = unit[tile] @ unit.T
+            scores[np.arange(len(tile)), tile] = -np.inf
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            for row, source in enumerate(tile.tolist()):
+                pairs.extend(
+                    (source, neighbour, score)
+                    for neighbour, score in zip(
+                        top[row].tolist(), top_scores[row].tolist(), strict=True
+                    )
+                    if score > threshold
+                )
+        return pairs
+
+    def _drop_connected_pairs(
+        self, pairs: list[tuple[str, str, float]]
+    ) -> list[tuple[str, str, float]]:
+        """Remove pairs already joined by a relationship in either direction."""
+        if not pairs:
+            return pairs
+        # Two equi-joins rather than one OR-join so DuckDB can hash both.
+        connected = (
+            self._get_conn()
+            .execute(
+                """
+                WITH c AS (
+                    SELECT unnest(?::VARCHAR[]) AS a, unnest(?::VARCHAR[]) AS b
+                )
+                SELECT c.a, c.b FROM c JOIN kg_relationships r
+                    ON r.from_entity = c.a AND r.to_entity = c.b
+                UNION
+                SELECT c.a, c.b FROM c JOIN kg_relationships r
+                    ON r.from_entity = c.b AND r.to_entity = c.a
+                """,
+                ([pair[0] for pair in pairs], [pair[1] for pair in pairs]),
+            )
+            .fetchall()
+        )
+        if not connected:
+            return pairs
+        existing = set(connected)
+        return [pair for pair in pairs if (pair[0], pair[1]) not in existing]
+
+    def _insert_relations(
+        self, relations: list[tuple[str, str, str, dict[str, t.Any]]]
+    ) -> None:
+        """Insert ``(from_id, to_id, relation_type, properties)`` rows in bulk."""
+        if not relations:
+            return
+        now = datetime.now(tz=UTC)
+        self._get_conn().execute(
+            """
+            INSERT INTO kg_relationships
+            (id, from_entity, to_entity, relation_type, properties,
+             created_at, updated_at, metadata)
+            SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                   unnest(?::VARCHAR[]), unnest(?::VARCHAR[]), ?, ?, '{}'
+            """,
+            (
+                [str(uuid.uuid4()) for _ in relations],
+                [relation[0] for relation in relations],
+                [relation[1] for relation in relations],
+                [relation[2] for relation in relations],
+                [json.dumps(relation[3]) for relation in relations],
+                now,
+                now,
+            ),
+        )
+        if self._adjacency is not None:
+            for from_id, to_id, relation_type, _ in relations:
+                self._adjacency.add_edge(from_id, to_id, relation_type)
@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import itertools
 import json
 import logging
+import time
 import typing as t
 from contextlib import suppress
 from datetime import UTC, datetime
@@ -26,6 +28,8 @@ if t.TYPE_CHECKING:
     import duckdb
     import numpy as np
 
+    from session_buddy.search_enhanced import PatternIndex
+
 # Runtime imports (available at runtime but optional for type checking)
 try:
     import numpy as np
@@ -41,7 +45,11 @@ ort = None
 AutoTokenizer: type | None = None  # Not needed for HTTP
 
 from session_buddy.adapters.settings import ReflectionAdapterSettings
-from session_buddy.cache.query_cache import QueryCacheManager
+from session_buddy.cache.query_cache import (
+    QueryCacheEntry,
+    QueryCacheManager,
+    SemanticQueryCache,
+)
 from session_buddy.ingesters.redaction import (
     ALLOWED_METADATA_KEYS,
     RedactionSizeError,
@@ -49,6 +57,7 @@ from session_buddy.ingesters.redaction import (
     redact_metadata,
 )
 from session_buddy.insights.models import validate_collection_name
+from session_buddy.memory.access_log import AccessLogWriter
 from session_buddy.memory.category_evolution import CategoryEvolutionEngine
 from session_buddy.memory.causal import (
     infer_causal_links_for as _infer_causal_links_for,
@@ -68,6 +77,14 @@ from session_buddy.memory.peer_modeling import (
     upsert_peer_model,
 )
 from session_buddy.memory.schema_v2 import SCHEMA_V2_SQL
+from session_buddy.reflection.quantization import (
+    DEFAULT_CALIBRATION_SIGMA,
+    Calibration,
+    QuantizedIndex,
+    calibrate_from_table,
+    dequantize,
+    quantize,
+)
 from session_buddy.skills.distiller import (
     DEFAULT_EVIDENCE_THRESHOLD as _DEFAULT_EVIDENCE_THRESHOLD,
 )
@@ -83,10 +100,72 @@ from session_buddy.skills.distiller import (
 from session_buddy.skills.distiller import (
     search_distilled_skills as _search_distilled_skills,
 )
-from session_buddy.utils.fingerprint import MinHashSignature
+from session_buddy.utils.db_executor import DuckDBExecutor
+from session_buddy.utils.fingerprint import MinHashSignature, lsh_band_keys
+from session_buddy.utils.fulltext import (
+    FullTextIndex,
+    normalize_scores,
+    reciprocal_rank_fusion,
+)
+from session_buddy.utils.vector_sql import fetch_scored_rows, vector_literal
 
 logger = logging.getLogger(__name__)
 
+# Embeddings required before quantization ranges are learned from the data
+# rather than the fixed fallback range
+_MIN_CALIBRATION_ROWS = 256
+
+# Text indexed per full-text source; must match what ``_index_fulltext``
+# builds in Python (content followed by tags)
+_FULLTEXT_SQL: t.Final[dict[str, str]] = {
+    "conversations": "content",
+    "reflections": "concat_ws(' ', content, array_to_string(tags, ' '))",
+}
+
+# Conversations written per transaction by ``store_conversations_bulk``
+_BULK_BATCH_SIZE = 500
+
+
+def _redact_conversation(
+    content: str, metadata: t.Mapping[str, t.Any] | None
+) -> tuple[str, dict[str, t.Any]]:
+    """Redact conversation content and allowlist-filter its metadata."""
+    try:
+        return (
+            redact(content),
+            redact_metadata(dict(metadata or {}), set(ALLOWED_METADATA_KEYS)),
+        )
+    except RedactionSizeError:
+        # Re-raise with a clearer error — 64KB+ conversation content is
+        # a configuration error, not a transient one.
+        msg = (
+            "store_conversation rejected oversized payload "
+            f"(> {65536} bytes); split the content or raise MAX_REDACTION_BYTES."
+        )
+        raise ValueError(msg) from None
+
+
+def _metadata_project(metadata: t.Mapping[str, t.Any]) -> str | None:
+    """Return the ``project`` column value carried by conversation metadata."""
+    project = metadata.get("project")
+    return str(project) if isinstance(project, (str, int, float)) else None
+
+
+def _prepare_conversations(
+    records: t.Sequence[t.Mapping[str, t.Any]],
+) -> list[tuple[str, dict[str, t.Any], MinHashSignature]]:
+    """Redact and fingerprint a batch of conversation records.
+
+    Pure CPU work with no adapter state, so bulk writes run it off the loop.
+    """
+    prepared = []
+    for record in records:
+        content, metadata = _redact_conversation(
+            record["content"], record.get("metadata")
+        )
+        prepared.append((content, metadata, MinHashSignature.from_text(content)))
+    return prepared
+
 
 class _CachedConnection:
     """Wrapper for cached connections with reference counting.
@@ -99,6 +178,8 @@ class _CachedConnection:
         self.conn = conn
         self.cache_key = cache_key
         self.ref_count = 1
+        # Shared so a write through one adapter retires every adapter's entries
+        self.query_cache: QueryCacheManager | None = None
 
     def release(self) -> None:
         """Decrement reference count; close connection if no more references."""
@@ -195,9 +276,19 @@ class ReflectionDatabaseAdapterOneiric:
         self._cache_hits: int = 0
         self._cache_misses: int = 0
         self._hnsw_available: bool = False
+        # Scalar quantization: active calibration and in-memory code matrix
+        self._calibration: Calibration | None = None
+        self._quantized_index: QuantizedIndex | None = None
+        # BM25 posting lists behind the text search paths
+        self._fulltext: FullTextIndex | None = None
+        # Code/error patterns extracted at ingest for EnhancedSearchEngine
+        self._patterns: PatternIndex | None = None
 
         # Query cache for performance optimization (Phase 1: Query Cache)
         self._query_cache: QueryCacheManager | None = None
+        self._access_log: AccessLogWriter | None = None
+        # Worker threads running queries and writes off the event loop
+        self._executor: DuckDBExecutor | None = None
 
     def __enter__(self) -> t.Self:
         """Sync context manager entry (not recommended - use async)."""
@@ -288,7 +379,7 @@ class ReflectionDatabaseAdapterOneiric:
         access_type: str,
         query_text: str | None = None,
     ) -> None:
-        """Unconditionally write a row to ``memory_access_log``.
+        """Unconditionally record a row for ``memory_access_log``.
 
         The Conscious Agent analysis loop reads from ``memory_access_log``
         to decide which memories to promote. Per the rollout plan, the
@@ -303,6 +394,8 @@ class ReflectionDatabaseAdapterOneiric:
         * It does not consult any feature flag. The flag gates the
           background analysis loop, not the write path.
         * It tolerates ``memory_id=None`` (a search that hits nothing).
+        * It does not write on the calling path. Events are buffered by
+          :class:`AccessLogWriter` and written in batches in the background.
 
         Args:
             memory_id: ID of the memory being accessed, or None for
@@ -314,22 +407,19 @@ class ReflectionDatabaseAdapterOneiric:
 
         """
         try:
-            if not self._initialized:
+            if not self._initialized or self._access_log is None:
                 # No connection yet — we cannot log. Silently drop.
                 return
-            self.conn.execute(
-                """
-                INSERT INTO memory_access_log (
-                    id, memory_id, access_type, query_text, timestamp
-                )
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                [str(ULID()), memory_id, access_type, query_text],
-            )
+            self._access_log.record(memory_id, access_type, query_text)
         except Exception:
             # Instrumentation must NEVER break the read path.
             logger.debug("memory_access_log write failed", exc_info=True)
 
+    async def _flush_access_log(self) -> None:
+        """Write buffered access events before reading ``memory_access_log``."""
+        if self._access_log is not None:
+            await self._access_log.aflush()
+
     def close(self) -> None:
         """Close adapter connections (sync version for compatibility)."""
         try:
@@ -360,12 +450,20 @@ class ReflectionDatabaseAdapterOneiric:
     async def aclose(self) -> None:
         """Close adapter connections (async)."""
         # Close query cache properly BEFORE closing connection (Phase 1: Query Cache - Phase 6 fix)
-        # This prevents race conditions by clearing cache while connection is still alive
+        # Pending L2 writes are flushed while the connection is still alive;
+        # entries stay valid across restarts because keys carry generations.
         if self._query_cache:
             with suppress(Exception):
-                self._query_cache.invalidate()  # Clear cache
-                await asyncio.sleep(0.1)  # Phase 6: Wait for pending operations
+                await self._query_cache.flush()
             self._query_cache = None
+        if self._access_log:
+            with suppress(Exception):
+                await self._access_log.aclose()
+            self._access_log = None
+        if self._executor:
+            # Waits for in-flight work; worker cursors close before the parent
+            await asyncio.to_thread(self._executor.close)
+            self._executor = None
 
         # Now close the connection
         if self.conn:
@@ -438,12 +536,46 @@ class ReflectionDatabaseAdapterOneiric:
         # Create tables if they don't exist
         self._create_tables()
 
-        # Initialize query cache (Phase 1: Query Cache)
-        self._query_cache = QueryCacheManager(
-            l1_max_size=1000,
-            l2_ttl_days=7,
+        # Initialize query cache (Phase 1: Query Cache). Adapters sharing a
+        # cached connection share one cache and its generation counters.
+        shared = None
+        if self.db_path != ":memory:":
+            shared = _typed_connection_cache.get(str(Path(self.db_path).resolve()))
+            if shared is not None and shared.conn is not self.conn:
+                shared = None
+        if shared is not None and shared.query_cache is not None:
+            self._query_cache = shared.query_cache
+        else:
+            self._query_cache = QueryCacheManager(
+                l1_max_size=1000,
+                l2_ttl_days=7,
+                semantic_cache=(
+                    SemanticQueryCache(
+                        dim=self.embedding_dim,
+                        max_entries=self.settings.semantic_cache_size,
+                        max_distance=self.settings.semantic_cache_max_distance,
+                        verify_rate=self.settings.semantic_cache_verify_rate,
+                    )
+                    if self.settings.enable_semantic_cache
+                    else None
+                ),
+            )
+            await self._query_cache.initialize(conn=self.conn)
+            if shared is not None:
+                shared.query_cache = self._query_cache
+
+        self._access_log = AccessLogWriter(
+            self.conn,
+            capacity=self.settings.access_log_buffer_size,
+            batch_size=self.settings.access_log_batch_size,
+            flush_interval=self.settings.access_log_flush_interval,
+        )
+        self._executor = DuckDBExecutor(
+            self.conn,
+            read_workers=self.settings.db_read_workers,
+            on_connect=self._configure_worker_conn,
+            name=f"reflection-{self.collection_name}",
         )
-        await self._query_cache.initialize(conn=self.conn)
 
         # Initialize category evolution engine (Phase 5)
         self._category_engine = CategoryEvolutionEngine(
@@ -668,6 +800,7 @@ class ReflectionDatabaseAdapterOneiric:
                 normalized_query TEXT NOT NULL,
                 project TEXT,
                 result_ids TEXT[],
+                scores DOUBLE[],
                 hit_count INTEGER DEFAULT 1,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -676,6 +809,10 @@ class ReflectionDatabaseAdapterOneiric:
             """
         )
 
+        _safe_alter(
+            "ALTER TABLE query_cache_l2 ADD COLUMN IF NOT EXISTS scores DOUBLE[]"
+        )
+
         # Create indexes for query cache
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_query_cache_l2_accessed ON query_cache_l2(last_accessed)"
@@ -756,6 +893,59 @@ class ReflectionDatabaseAdapterOneiric:
             "CREATE INDEX IF NOT EXISTS idx_fingerprints_collection ON content_fingerprints(collection_name)"
         )
 
+        # LSH band index: one row per (memory, band). Band keys are salted per
+        # band, so a duplicate-candidate probe is a single IN-list lookup.
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprint_lsh_bands (
+                content_type TEXT NOT NULL,
+                band_key BIGINT NOT NULL,
+                content_id TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_fingerprint_lsh_key ON fingerprint_lsh_bands(band_key)"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_fingerprint_lsh_content ON fingerprint_lsh_bands(content_id)"
+        )
+        self._ensure_lsh_index()
+
+        # Full-text posting lists (BM25) for the text search paths. Rows
+        # written elsewhere are picked up by ``_synced_fulltext`` on search.
+        self._fulltext = FullTextIndex(self.conn)
+        self._fulltext.ensure_schema()
+
+        # Code/error patterns for EnhancedSearchEngine, extracted on store.
+        # Imported here: search_enhanced imports this module.
+        from session_buddy.search_enhanced import PatternIndex
+
+        self._patterns = PatternIndex(self.conn)
+        self._patterns.ensure_schema()
+
+        # ========================================================================
+        # SCALAR QUANTIZATION (uint8 codes for first-pass vector search)
+        # ========================================================================
+        # ``embedding_q`` holds one byte per dimension, encoded with the ranges
+        # persisted in ``embedding_calibration``.
+        _safe_alter(
+            f"ALTER TABLE {self._table('conversations')} ADD COLUMN IF NOT EXISTS embedding_q BLOB"
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_calibration (
+                table_name TEXT PRIMARY KEY,
+                dim INTEGER NOT NULL,
+                lo BLOB NOT NULL,
+                hi BLOB NOT NULL,
+                sample_count BIGINT,
+                calibrated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        self._load_calibration()
+
         # ========================================================================
         # CATEGORY EVOLUTION (Phase 5: Intelligent Subcategory Organization)
         # ========================================================================
@@ -1056,6 +1246,8 @@ class ReflectionDatabaseAdapterOneiric:
         384d vectors, so no mean-pooling or normalization needed.
 
         Cache is handled by generate_embedding()'s thread-safe dict cache.
+        Concurrent calls (e.g. parallel ``store_conversation`` writes) are
+        micro-batched into shared provider requests by the pooled client.
         """
         # Import here to avoid circular imports
         from session_buddy.reflection.embeddings import (
@@ -1068,11 +1260,28 @@ class ReflectionDatabaseAdapterOneiric:
             logger.exception("HTTP embedding failed")
             return None
 
+    async def _generate_embeddings(self, texts: list[str]) -> list[list[float] | None]:
+        """Generate embeddings for several texts through the batching client.
+
+        Delegates to generate_embeddings() from embeddings.py, which serves
+        cached texts directly and sends the rest to the providers in as few
+        batched requests as possible. Returns one entry per input text.
+        """
+        from session_buddy.reflection.embeddings import (
+            generate_embeddings as http_generate_embeddings,
+        )
+
+        try:
+            return await http_generate_embeddings(texts)
+        except Exception:
+            logger.exception("HTTP batch embedding failed")
+            return [None] * len(texts)
+
     def _quantize_embedding(self, embedding: list[float]) -> list[int] | None:
         """Quantize embedding from float32 to uint8 for 4x memory compression.
 
-        Uses global calibration data (min/max across all embeddings)
-        to ensure consistent quantization across the dataset.
+        Uses global calibration data (per-dimension ranges across all
+        embeddings) to ensure consistent quantization across the dataset.
 
         Args:
             embedding: Float32 embedding vector (384 dimensions)
@@ -1083,27 +1292,7 @@ class ReflectionDatabaseAdapterOneiric:
         if not self.settings.enable_quantization:
             return None
 
-        # Get global calibration data
-        calibration_data = self._get_calibration_data()
-        if not calibration_data:
-            logger.warning("Quantization enabled but no calibration data available")
-            return None
-
-        min_vals, max_vals = calibration_data
-
-        # Convert to numpy array for efficient computation
-        arr = np.array(embedding, dtype=np.float32)
-
-        # Avoid division by zero
-        range_vals = max_vals - min_vals
-        range_vals = np.where(range_vals == 0, 1.0, range_vals)  # Prevent div/0
-
-        # Scale to [0, 255] and convert to uint8
-        quantized = np.clip(((arr - min_vals) / range_vals) * 255, 0, 255).astype(
-            np.uint8
-        )
-
-        result: list[int] = quantized.tolist()
+        result: list[int] = quantize(embedding, self._current_calibration()).tolist()
         return result  # [384] uint8 values
 
     def _dequantize_embedding(self, quantized: list[int]) -> list[float] | None:
@@ -1118,64 +1307,52 @@ class ReflectionDatabaseAdapterOneiric:
         if not self.settings.enable_quantization or not quantized:
             return None
 
-        # Get global calibration data
-        calibration_data = self._get_calibration_data()
-        if not calibration_data:
-            return None
-
-        min_vals, max_vals = calibration_data
-
-        # Convert to numpy arrays
-        quantized_arr = np.array(quantized, dtype=np.uint8)
-        min_vals_arr = np.array(min_vals, dtype=np.float32)
-        max_vals_arr = np.array(max_vals, dtype=np.float32)
-
-        # Calculate range
-        range_vals = max_vals_arr - min_vals_arr
+        result: list[float] = dequantize(
+            quantized, self._current_calibration()
+        ).tolist()
+        return result
 
-        # Dequantize: scale back from [0, 255] to original range
-        dequantized = (
-            quantized_arr.astype(np.float32) / 255.0 * range_vals + min_vals_arr
-        )
+    def _current_calibration(self) -> Calibration:
+        """Return the active calibration, falling back to a fixed range.
 
-        result: list[float] = dequantized.tolist()
-        return result
+        The fallback (+/-0.15 per dimension) covers typical all-MiniLM-L6-v2
+        values and is used until ``calibrate_quantization()`` has run.
+        """
+        if self._calibration is None:
+            self._calibration = Calibration.fixed(self.embedding_dim)
+        return self._calibration
 
     def _get_calibration_data(
         self,
     ) -> tuple[np.ndarray, np.ndarray] | None:
-        """Get global calibration data (min/max across all embeddings).
+        """Get global calibration data (per-dimension min/max).
 
         Returns:
             Tuple of (min_values, max_values) as numpy arrays, or None if unavailable
 
-        Note:
-            This implementation uses fixed calibration data for simplicity.
-            In production, you would compute this from all embeddings in the database.
         """
-        if not hasattr(self, "_calibration_min"):
-            # Use fixed calibration data for all-MiniLM-L6-v2 model
-            # These values represent typical min/max across the embedding space
-            self._calibration_min: np.ndarray = np.full((384,), -0.15, dtype=np.float32)
-            self._calibration_max: np.ndarray = np.full((384,), 0.15, dtype=np.float32)
-
-        return self._calibration_min, self._calibration_max
+        calibration = self._current_calibration()
+        return calibration.lo, calibration.hi
 
     def _update_calibration_data(self, all_embeddings: list[list[float]]) -> None:
-        """Update calibration data from all embeddings in the database.
+        """Update calibration data from in-memory embeddings.
+
+        Stored embeddings are calibrated in-database by
+        ``calibrate_quantization()``; this is for callers holding vectors.
 
         Args:
-            all_embeddings: List of all embedding vectors in the database
+            all_embeddings: List of embedding vectors
         """
         if not all_embeddings:
             return
 
-        # Stack all embeddings and compute min/max per dimension
         stacked = np.array(all_embeddings, dtype=np.float32)  # Shape: [N, 384]
-
-        # Compute min/max across all embeddings for each dimension
-        self._calibration_min = np.min(stacked, axis=0)  # Shape: [384]
-        self._calibration_max = np.max(stacked, axis=0)  # Shape: [384]
+        self._calibration = Calibration(
+            lo=np.min(stacked, axis=0),
+            hi=np.max(stacked, axis=0),
+            sample_count=len(stacked),
+        )
+        self._quantized_index = None
 
         logger.debug(f"Updated calibration data from {len(all_embeddings)} embeddings")
 
@@ -1185,6 +1362,193 @@ class ReflectionDatabaseAdapterOneiric:
         hash_obj = hashlib.sha256(content_bytes)
         return hash_obj.hexdigest()[:16]
 
+    def _band_keys(self, fingerprint: MinHashSignature) -> list[int]:
+        """Return LSH band keys for ``fingerprint`` using adapter settings."""
+        return fingerprint.band_keys(
+            self.settings.dedup_lsh_bands, self.settings.dedup_lsh_rows
+        )
+
+    def _index_fingerprint_bands(
+        self,
+        content_type: t.Literal["conversation", "reflection"],
+        content_ids: list[str],
+        fingerprints: list[MinHashSignature],
+        conn: t.Any = None,
+    ) -> None:
+        """(Re)write the LSH band rows for stored memories."""
+        if not content_ids:
+            return
+        conn = conn or self.conn
+        bands = self.settings.dedup_lsh_bands
+        keys = lsh_band_keys(
+            np.asarray([f.signature for f in fingerprints]),
+            bands,
+            self.settings.dedup_lsh_rows,
+        )
+        self._remove_fingerprint_bands(content_type, content_ids, conn)
+        conn.execute(
+            """
+            INSERT INTO fingerprint_lsh_bands (content_type, band_key, content_id)
+            SELECT ?, unnest(?::BIGINT[]), unnest(?::VARCHAR[])
+            """,
+            [
+                content_type,
+                keys.ravel().tolist(),
+                np.repeat(content_ids, bands).tolist(),
+            ],
+        )
+
+    def _remove_fingerprint_bands(
+        self,
+        content_type: t.Literal["conversation", "reflection"],
+        content_ids: list[str],
+        conn: t.Any = None,
+    ) -> None:
+        """Drop LSH band rows for deleted or rewritten memories."""
+        if not content_ids:
+            return
+        (conn or self.conn).execute(
+            """
+            DELETE FROM fingerprint_lsh_bands
+            WHERE content_type = ? AND content_id IN (SELECT unnest(?::VARCHAR[]))
+            """,
+            [content_type, content_ids],
+        )
+
+    def _index_fulltext(
+        self,
+        source: t.Literal["conversations", "reflections"],
+        doc_id: str,
+        content: str,
+        tags: list[str] | None = None,
+        conn: t.Any = None,
+    ) -> None:
+        """(Re)write the full-text postings for one stored memory."""
+        fulltext = self._fulltext_on(conn)
+        if fulltext is None:
+            return
+        text = " ".join([content, *(tags or [])])
+        fulltext.index_documents(source, [(doc_id, text)])
+
+    def _fulltext_on(self, conn: t.Any = None) -> FullTextIndex | None:
+        """Return the full-text index bound to ``conn`` (default: ``self.conn``)."""
+        if self._fulltext is None or conn is None:
+            return self._fulltext
+        return FullTextIndex(conn)
+
+    def _patterns_on(self, conn: t.Any = None) -> PatternIndex | None:
+        """Return the pattern index bound to ``conn`` (default: ``self.conn``)."""
+        if self._patterns is None or conn is None:
+            return self._patterns
+        from session_buddy.search_enhanced import PatternIndex
+
+        return PatternIndex(
+            conn, self._patterns.code_searcher, self._patterns.error_matcher
+        )
+
+    def _invalidate_cached_searches(self, suffix: str, project: str | None) -> None:
+        """Retire cached searches over a table that a write could change."""
+        if self._query_cache:
+            self._query_cache.bump_generation(self._table(suffix), project)
+
+    def _index_patterns(self, conv_id: str, content: str, conn: t.Any = None) -> None:
+        """(Re)extract the code and error patterns of one stored conversation."""
+        patterns = self._patterns_on(conn)
+        if patterns is not None:
+            patterns.index_conversations([(conv_id, content)])
+
+    def _synced_fulltext(
+        self, source: t.Literal["conversations", "reflections"]
+    ) -> FullTextIndex:
+        """Return the full-text index with ``source`` caught up to its table."""
+        if self._fulltext is None:
+            self._fulltext = FullTextIndex(self.conn)
+            self._fulltext.ensure_schema()
+        self._fulltext.sync(source, self._table(source), _FULLTEXT_SQL[source])
+        return self._fulltext
+
+    def _ensure_lsh_index(self) -> None:
+        """Backfill the LSH band table for databases that predate it."""
+        indexed = self.conn.execute(
+            "SELECT COUNT(*) FROM fingerprint_lsh_bands"
+        ).fetchone()[0]
+        if indexed:
+            return
+        for content_type in ("conversation", "reflection"):
+            with suppress(Exception):
+                has_rows = self.conn.execute(
+                    f"SELECT 1 FROM {self._table(f'{content_type}s')} "
+                    "WHERE fingerprint IS NOT NULL LIMIT 1"
+                ).fetchone()
+                if has_rows:
+                    self.rebuild_lsh_index()
+                    return
+
+    def rebuild_lsh_index(self, batch_size: int = 1000) -> int:
+        """Rebuild the LSH band table from stored fingerprints.
+
+        Needed after changing ``dedup_lsh_bands``/``dedup_lsh_rows``; runs
+        automatically once for databases created before the band table.
+        Legacy fingerprints are recomputed from content and written back.
+
+        Args:
+            batch_size: Rows fetched and indexed per round trip
+
+        Returns:
+            Number of memories indexed
+
+        """
+        bands = self.settings.dedup_lsh_bands
+        rows = self.settings.dedup_lsh_rows
+        self.conn.execute("DELETE FROM fingerprint_lsh_bands")
+        indexed = 0
+
+        for content_type in ("conversation", "reflection"):
+            table_name = self._table(f"{content_type}s")
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"SELECT id, content, fingerprint FROM {table_name} "
+                "WHERE fingerprint IS NOT NULL"
+            )
+            while batch := cursor.fetchmany(batch_size):
+                ids: list[str] = []
+                signatures: list[list[int]] = []
+                upgraded: list[tuple[bytes, str]] = []
+                for memory_id, content, blob in batch:
+                    try:
+                        signature = MinHashSignature.from_bytes(blob)
+                    except ValueError:
+                        continue
+                    if signature.needs_migration:
+                        signature = MinHashSignature.from_text(content or "")
+                        upgraded.append((signature.to_bytes(), memory_id))
+                    ids.append(memory_id)
+                    signatures.append(signature.signature)
+                if upgraded:
+                    self.conn.executemany(
+                        f"UPDATE {table_name} SET fingerprint = ? WHERE id = ?",
+                        upgraded,
+                    )
+                if not ids:
+                    continue
+                keys = lsh_band_keys(np.asarray(signatures), bands, rows)
+                self.conn.execute(
+                    """
+                    INSERT INTO fingerprint_lsh_bands (content_type, band_key, content_id)
+                    SELECT ?, unnest(?::BIGINT[]), unnest(?::VARCHAR[])
+                    """,
+                    [
+                        content_type,
+                        keys.ravel().tolist(),
+                        np.repeat(ids, bands).tolist(),
+                    ],
+                )
+                indexed += len(ids)
+            cursor.close()
+
+        logger.info(f"Rebuilt LSH band index for {indexed} memories")
+        return indexed
+
     def _check_for_duplicates(
         self,
         fingerprint: MinHashSignature,
@@ -1193,6 +1557,10 @@ class ReflectionDatabaseAdapterOneiric:
     ) -> list[dict[str, t.Any]]:
         """Check for duplicate or near-duplicate content using MinHash similarity.
 
+        Candidates come from the LSH band table (any shared band key); only
+        their signatures are fetched and compared exactly, and content is
+        loaded for the rows that pass ``threshold``.
+
         Args:
             fingerprint: MinHash signature to compare against
             content_type: Either "conversation" or "reflection"
@@ -1204,21 +1572,23 @@ class ReflectionDatabaseAdapterOneiric:
         """
         table_name = self._table(f"{content_type}s")
 
-        # Get all fingerprints from the table
         result = self.conn.execute(
             f"""
-            SELECT id, content, fingerprint FROM {table_name}
+            SELECT id, fingerprint FROM {table_name}
             WHERE fingerprint IS NOT NULL
-            """
+              AND id IN (
+                SELECT content_id FROM fingerprint_lsh_bands
+                WHERE content_type = ?
+                  AND band_key IN (SELECT unnest(?::BIGINT[]))
+              )
+            """,
+            [content_type, self._band_keys(fingerprint)],
         ).fetchall()
 
-        duplicates: list[dict[str, t.Any]] = []
-
-        for row in result:
-            existing_id = row[0]
-            existing_content = row[1]
-            existing_fingerprint_bytes = row[2]
+        similarities: dict[str, float] = {}
+        upgraded: list[tuple[bytes, str]] = []
 
+        for existing_id, existing_fingerprint_bytes in result:
             if not existing_fingerprint_bytes:
                 continue
 
@@ -1227,6 +1597,17 @@ class ReflectionDatabaseAdapterOneiric:
                 existing_fingerprint = MinHashSignature.from_bytes(
                     existing_fingerprint_bytes
                 )
+                if existing_fingerprint.needs_migration:
+                    # Written by the old SHA-256 engine: recompute from the
+                    # stored content and persist the upgraded blob.
+                    content_row = self.conn.execute(
+                        f"SELECT content FROM {table_name} WHERE id = ?",
+                        [existing_id],
+                    ).fetchone()
+                    existing_fingerprint = MinHashSignature.from_text(
+                        (content_row[0] if content_row else None) or ""
+                    )
+                    upgraded.append((existing_fingerprint.to_bytes(), existing_id))
 
                 # Estimate Jaccard similarity
                 similarity = fingerprint.estimate_jaccard_similarity(
@@ -1234,18 +1615,39 @@ class ReflectionDatabaseAdapterOneiric:
                 )
 
                 if similarity >= threshold:
-                    duplicates.append(
-                        {
-                            "id": existing_id,
-                            "content": existing_content,
-                            "similarity": similarity,
-                            "content_type": content_type,
-                        }
-                    )
+                    similarities[existing_id] = similarity
             except Exception:
                 logger.exception("Error comparing fingerprints")
                 continue
 
+        if upgraded:
+            self.conn.executemany(
+                f"UPDATE {table_name} SET fingerprint = ? WHERE id = ?", upgraded
+            )
+            logger.info(f"Upgraded {len(upgraded)} legacy fingerprints in {table_name}")
+
+        if not similarities:
+            return []
+
+        contents = dict(
+            self.conn.execute(
+                f"""
+                SELECT id, content FROM {table_name}
+                WHERE id IN (SELECT unnest(?::VARCHAR[]))
+                """,
+                [list(similarities)],
+            ).fetchall()
+        )
+        duplicates: list[dict[str, t.Any]] = [
+            {
+                "id": existing_id,
+                "content": contents.get(existing_id),
+                "similarity": similarity,
+                "content_type": content_type,
+            }
+            for existing_id, similarity in similarities.items()
+        ]
+
         # Sort by similarity (highest first)
         duplicates.sort(key=itemgetter("similarity"), reverse=True)
         return duplicates
@@ -1302,19 +1704,7 @@ class ReflectionDatabaseAdapterOneiric:
         # Redact content + metadata BEFORE any duplicate check or write so
         # secrets never reach the on-disk store. The redaction module is
         # idempotent and dependency-free.
-        try:
-            redacted_content = redact(content)
-            redacted_metadata = redact_metadata(
-                dict(metadata or {}), set(ALLOWED_METADATA_KEYS)
-            )
-        except RedactionSizeError:
-            # Re-raise with a clearer error — 64KB+ conversation content is
-            # a configuration error, not a transient one.
-            msg = (
-                "store_conversation rejected oversized payload "
-                f"(> {65536} bytes); split the content or raise MAX_REDACTION_BYTES."
-            )
-            raise ValueError(msg) from None
+        redacted_content, redacted_metadata = _redact_conversation(content, metadata)
 
         # Generate MinHash fingerprint for duplicate detection (Phase 4)
         fingerprint = MinHashSignature.from_text(redacted_content)
@@ -1332,110 +1722,323 @@ class ReflectionDatabaseAdapterOneiric:
                 existing_id: str = duplicates[0]["id"]
                 return existing_id  # Return ID of most similar duplicate
 
-        conv_id = self._generate_id(redacted_content)
-        if not deduplicate:
-            existing_row = self.conn.execute(
-                f"""
-                SELECT 1
-                FROM {self._table("conversations")}
-                WHERE id = ?
-                LIMIT 1
-                """,
-                [conv_id],
-            ).fetchone()
-            if existing_row:
-                conv_id = str(ULID())
+        content_id = self._generate_id(redacted_content)
         now = datetime.now(UTC)
         metadata_json = json.dumps(redacted_metadata)
         # Extract the project from the (redacted) metadata dict; v2 has a
         # dedicated ``project`` column that callers expect to be filterable.
-        project_value = (
-            str(redacted_metadata["project"])
-            if isinstance(redacted_metadata.get("project"), (str, int, float))
-            else None
-        )
+        project_value = _metadata_project(redacted_metadata)
 
         # Generate embedding if enabled
         embedding = None
         if self.settings.enable_embeddings:
             embedding = await self._generate_embedding(redacted_content)
+        embedding_codes = None
+        if embedding is not None and self.settings.enable_quantization:
+            embedding_codes = quantize(embedding, self._current_calibration())
 
         # Convert MinHash fingerprint to bytes for storage
         fingerprint_bytes = fingerprint.to_bytes()
 
-        # v2 rewire: write to conversations_v2 with the new column set.
-        # We keep ``fingerprint`` (DuckDB stores BLOB as BLOB) for backward
-        # compatibility with the duplicate-detection path.
-        self.conn.execute(
-            f"""
-            INSERT INTO {self._table("conversations")}
-            (
-                id, content, embedding, category, subcategory, importance_score,
-                memory_tier, project, namespace, session_id, user_id,
-                searchable_content, reasoning, metadata, source_type,
-                turn_parent_id, causal_parent_id, timestamp, fingerprint
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                content = excluded.content,
-                embedding = excluded.embedding,
-                category = excluded.category,
-                subcategory = excluded.subcategory,
-                importance_score = excluded.importance_score,
-                memory_tier = excluded.memory_tier,
-                project = excluded.project,
-                namespace = excluded.namespace,
-                session_id = excluded.session_id,
-                user_id = excluded.user_id,
-                searchable_content = excluded.searchable_content,
-                reasoning = excluded.reasoning,
-                metadata = excluded.metadata,
-                source_type = excluded.source_type,
-                turn_parent_id = excluded.turn_parent_id,
-                causal_parent_id = excluded.causal_parent_id,
-                timestamp = excluded.timestamp,
-                fingerprint = excluded.fingerprint
-            """,
-            [
-                conv_id,
-                redacted_content,
-                embedding,
-                category or "context",  # default category for the rewire path
-                None,  # subcategory (None preserves current behavior)
-                0.5,  # importance_score default
-                memory_tier or "long_term",  # memory_tier default
-                project_value,
-                "default",  # namespace
-                None,  # session_id (not threaded through in this rewire)
-                "default",  # user_id
-                redacted_content,  # searchable_content: keep parity with v1
-                None,  # reasoning
-                metadata_json,
-                source_type,
-                turn_parent_id,
-                causal_parent_id,
-                now,
-                fingerprint_bytes,
-            ],
-        )
+        def _insert(conn: t.Any) -> str:
+            conv_id = content_id
+            if not deduplicate:
+                existing_row = conn.execute(
+                    f"""
+                    SELECT 1
+                    FROM {self._table("conversations")}
+                    WHERE id = ?
+                    LIMIT 1
+                    """,
+                    [conv_id],
+                ).fetchone()
+                if existing_row:
+                    conv_id = str(ULID())
+            # v2 rewire: write to conversations_v2 with the new column set.
+            # We keep ``fingerprint`` (DuckDB stores BLOB as BLOB) for backward
+            # compatibility with the duplicate-detection path.
+            conn.execute(
+                f"""
+                INSERT INTO {self._table("conversations")}
+                (
+                    id, content, embedding, category, subcategory, importance_score,
+                    memory_tier, project, namespace, session_id, user_id,
+                    searchable_content, reasoning, metadata, source_type,
+                    turn_parent_id, causal_parent_id, timestamp, fingerprint,
+                    embedding_q
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    content = excluded.content,
+                    embedding = excluded.embedding,
+                    embedding_q = excluded.embedding_q,
+                    category = excluded.category,
+                    subcategory = excluded.subcategory,
+                    importance_score = excluded.importance_score,
+                    memory_tier = excluded.memory_tier,
+                    project = excluded.project,
+                    namespace = excluded.namespace,
+                    session_id = excluded.session_id,
+                    user_id = excluded.user_id,
+                    searchable_content = excluded.searchable_content,
+                    reasoning = excluded.reasoning,
+                    metadata = excluded.metadata,
+                    source_type = excluded.source_type,
+                    turn_parent_id = excluded.turn_parent_id,
+                    causal_parent_id = excluded.causal_parent_id,
+                    timestamp = excluded.timestamp,
+                    fingerprint = excluded.fingerprint
+                """,
+                [
+                    conv_id,
+                    redacted_content,
+                    embedding,
+                    category or "context",  # default category for the rewire path
+                    None,  # subcategory (None preserves current behavior)
+                    0.5,  # importance_score default
+                    memory_tier or "long_term",  # memory_tier default
+                    project_value,
+                    "default",  # namespace
+                    None,  # session_id (not threaded through in this rewire)
+                    "default",  # user_id
+                    redacted_content,  # searchable_content: keep parity with v1
+                    None,  # reasoning
+                    metadata_json,
+                    source_type,
+                    turn_parent_id,
+                    causal_parent_id,
+                    now,
+                    fingerprint_bytes,
+                    embedding_codes.tobytes() if embedding_codes is not None else None,
+                ],
+            )
+            self._index_fingerprint_bands(
+                "conversation", [conv_id], [fingerprint], conn
+            )
+            self._index_fulltext("conversations", conv_id, redacted_content, conn=conn)
+            self._index_patterns(conv_id, redacted_content, conn)
+            # Phase 1 Feature #4: lineage / provenance. Only track writes
+            # that declare a source_type — sourceless writes (tests,
+            # legacy code, manual) intentionally have no provenance row.
+            self._write_provenance(
+                memory_id=conv_id,
+                source_type=source_type,
+                metadata=redacted_metadata,
+                conn=conn,
+            )
+            return conv_id
 
-        # Phase 1 Feature #4: lineage / provenance. Only track writes
-        # that declare a source_type — sourceless writes (tests,
-        # legacy code, manual) intentionally have no provenance row.
-        self._write_provenance(
-            memory_id=conv_id,
-            source_type=source_type,
-            metadata=redacted_metadata,
+        # The id check and every index write commit together on the writer
+        # thread, so no other write can claim the id in between
+        conv_id = await self._executor.write(
+            _insert, label="store_conversation", transaction=True
         )
+        self._invalidate_cached_searches("conversations", project_value)
+        if self._quantized_index is not None:
+            if embedding_codes is not None:
+                self._quantized_index.add(
+                    [conv_id], embedding_codes[np.newaxis, :], [project_value]
+                )
+            else:
+                self._quantized_index.remove([conv_id])
 
         return conv_id
 
+    async def store_conversations_bulk(
+        self,
+        records: t.Iterable[t.Mapping[str, t.Any]],
+        *,
+        batch_size: int = _BULK_BATCH_SIZE,
+    ) -> list[str]:
+        """Store many conversations with set-based writes.
+
+        Each record carries the arguments of :meth:`store_conversation`:
+        ``content`` plus optional ``metadata``, ``source_type``,
+        ``turn_parent_id``, ``causal_parent_id``, ``category`` and
+        ``memory_tier``. Instead of ``turn_parent_id`` a record may set
+        ``turn_parent_index`` to the position of an earlier record in the
+        same call, whose id is not known until it is stored.
+
+        Per batch, redaction and fingerprinting run in a worker thread,
+        embeddings are requested in one batched call, id collisions are
+        resolved with one query, and the rows, provenance and search
+        indexes are written in one transaction. Rows are stored as by
+        ``store_conversation(..., deduplicate=False)``.
+
+        Args:
+            records: Conversation records to store
+            batch_size: Records written per transaction
+
+        Returns:
+            Conversation IDs, in input order
+
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        ids: list[str] = []
+        for batch in itertools.batched(records, batch_size):
+            ids.extend(await self._store_conversation_batch(batch, ids))
+        return ids
+
+    async def _store_conversation_batch(
+        self,
+        records: t.Sequence[t.Mapping[str, t.Any]],
+        stored_ids: list[str],
+    ) -> list[str]:
+        """Store one batch of ``store_conversations_bulk``.
+
+        Args:
+            records: Records of this batch
+            stored_ids: IDs of the records stored by earlier batches
+
+        Returns:
+            IDs of this batch's records, in order
+
+        """
+        prepared = await asyncio.to_thread(_prepare_conversations, records)
+        contents = [content for content, _, _ in prepared]
+
+        embeddings: list[list[float] | None] = [None] * len(records)
+        if self.settings.enable_embeddings:
+            embeddings = await self._generate_embeddings(contents)
+        codes: list[np.ndarray | None] = [None] * len(records)
+        if self.settings.enable_quantization:
+            calibration = self._current_calibration()
+            codes = [
+                quantize(e, calibration) if e is not None else None for e in embeddings
+            ]
+
+        offset = len(stored_ids)
+        for position, record in enumerate(records):
+            index = record.get("turn_parent_index")
+            if index is not None and not 0 <= index < offset + position:
+                msg = f"turn_parent_index {index} does not precede record {offset + position}"
+                raise ValueError(msg)
+
+        table = self._table("conversations")
+        projects = [_metadata_project(metadata) for _, metadata, _ in prepared]
+        source_types = [record.get("source_type") for record in records]
+
+        def _insert(conn: t.Any) -> list[str]:
+            # Content-hash ids, except where the hash is taken (by a stored row
+            # or an earlier record of the batch) — same rule as store_conversation
+            conv_ids = [self._generate_id(content) for content in contents]
+            taken = {
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM {table} WHERE id IN (SELECT unnest(?::VARCHAR[]))",
+                    [conv_ids],
+                ).fetchall()
+            }
+            for position, conv_id in enumerate(conv_ids):
+                if conv_id in taken:
+                    conv_ids[position] = conv_id = str(ULID())
+                taken.add(conv_id)
+
+            turn_parents: list[str | None] = []
+            for record in records:
+                index = record.get("turn_parent_index")
+                if index is None:
+                    turn_parents.append(record.get("turn_parent_id"))
+                else:
+                    turn_parents.append(
+                        stored_ids[index]
+                        if index < offset
+                        else conv_ids[index - offset]
+                    )
+
+            conn.execute(
+                f"""
+                INSERT INTO {table}
+                (
+                    id, content, embedding, category, subcategory,
+                    importance_score, memory_tier, project, namespace,
+                    session_id, user_id, searchable_content, reasoning,
+                    metadata, source_type, turn_parent_id, causal_parent_id,
+                    timestamp, fingerprint, embedding_q
+                )
+                SELECT id, content, embedding, category, NULL, 0.5, memory_tier,
+                       project, 'default', NULL, 'default', content, NULL,
+                       metadata, source_type, turn_parent_id, causal_parent_id,
+                       ?, fingerprint, embedding_q
+                FROM (
+                    SELECT unnest(?::VARCHAR[]) AS id,
+                           unnest(?::VARCHAR[]) AS content,
+                           unnest(?::FLOAT[{self.embedding_dim}][]) AS embedding,
+                           unnest(?::VARCHAR[]) AS category,
+                           unnest(?::VARCHAR[]) AS memory_tier,
+                           unnest(?::VARCHAR[]) AS project,
+                           unnest(?::VARCHAR[]) AS metadata,
+                           unnest(?::VARCHAR[]) AS source_type,
+                           unnest(?::VARCHAR[]) AS turn_parent_id,
+                           unnest(?::VARCHAR[]) AS causal_parent_id,
+                           unnest(?::BLOB[]) AS fingerprint,
+                           unnest(?::BLOB[]) AS embedding_q
+                )
+                """,
+                [
+                    datetime.now(UTC),
+                    conv_ids,
+                    contents,
+                    embeddings,
+                    [r.get("category") or "context" for r in records],
+                    [r.get("memory_tier") or "long_term" for r in records],
+                    projects,
+                    [json.dumps(metadata) for _, metadata, _ in prepared],
+                    source_types,
+                    turn_parents,
+                    [r.get("causal_parent_id") for r in records],
+                    [fingerprint.to_bytes() for _, _, fingerprint in prepared],
+                    [c.tobytes() if c is not None else None for c in codes],
+                ],
+            )
+            self._index_fingerprint_bands(
+                "conversation", conv_ids, [f for _, _, f in prepared], conn
+            )
+            fulltext = self._fulltext_on(conn)
+            if fulltext is not None:
+                fulltext.index_documents(
+                    "conversations", list(zip(conv_ids, contents, strict=True))
+                )
+            patterns = self._patterns_on(conn)
+            if patterns is not None:
+                patterns.index_conversations(zip(conv_ids, contents, strict=True))
+            self._write_provenance_rows(
+                [
+                    (conv_id, source_type, metadata)
+                    for conv_id, source_type, (_, metadata, _) in zip(
+                        conv_ids, source_types, prepared, strict=True
+                    )
+                    if source_type is not None
+                ],
+                conn,
+            )
+            return conv_ids
+
+        conv_ids = await self._executor.write(
+            _insert, label="store_conversations_bulk", transaction=True
+        )
+
+        for project in set(projects):
+            self._invalidate_cached_searches("conversations", project)
+        if self._quantized_index is not None:
+            coded = [i for i, c in enumerate(codes) if c is not None]
+            if coded:
+                self._quantized_index.add(
+                    [conv_ids[i] for i in coded],
+                    np.stack([codes[i] for i in coded]),
+                    [projects[i] for i in coded],
+                )
+        return conv_ids
+
     def _write_provenance(
         self,
         *,
         memory_id: str,
         source_type: str | None,
         metadata: dict[str, t.Any] | None,
+        conn: t.Any = None,
     ) -> None:
         """Insert a ``memory_provenance`` row for a freshly written memory.
 
@@ -1448,16 +2051,31 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if source_type is None:
             return
-        meta = metadata or {}
-        source_ref = meta.get("source_session")
-        model = meta.get("model")
-        self.conn.execute(
+        self._write_provenance_rows([(memory_id, source_type, metadata)], conn)
+
+    def _write_provenance_rows(
+        self,
+        rows: list[tuple[str, str, t.Mapping[str, t.Any] | None]],
+        conn: t.Any = None,
+    ) -> None:
+        """Insert ``memory_provenance`` rows for ``(memory_id, source_type, metadata)``."""
+        if not rows:
+            return
+        metas = [metadata or {} for _, _, metadata in rows]
+        (conn or self.conn).execute(
             """
             INSERT INTO memory_provenance
                 (id, memory_id, source_type, source_ref, model)
-            VALUES (?, ?, ?, ?, ?)
+            SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                   unnest(?::VARCHAR[]), unnest(?::VARCHAR[])
             """,
-            [str(ULID()), memory_id, source_type, source_ref, model],
+            [
+                [str(ULID()) for _ in rows],
+                [memory_id for memory_id, _, _ in rows],
+                [source_type for _, source_type, _ in rows],
+                [meta.get("source_session") for meta in metas],
+                [meta.get("model") for meta in metas],
+            ],
         )
 
     async def memory_lineage(self, memory_id: str) -> list[dict[str, t.Any]]:
@@ -1469,17 +2087,21 @@ class ReflectionDatabaseAdapterOneiric:
         single row; transcripts and Conscious-Agent writes can produce
         more.
         """
-        result = self.conn.execute(
-            """
-            SELECT id, source_type, source_ref, extracted_at, model
-            FROM memory_provenance
-            WHERE memory_id = ?
-            ORDER BY extracted_at ASC
-            """,
-            [memory_id],
-        )
-        columns = [c[0] for c in (result.description or [])]
-        return [dict(zip(columns, row, strict=False)) for row in result.fetchall()]
+
+        def _lineage(conn: t.Any) -> list[dict[str, t.Any]]:
+            result = conn.execute(
+                """
+                SELECT id, source_type, source_ref, extracted_at, model
+                FROM memory_provenance
+                WHERE memory_id = ?
+                ORDER BY extracted_at ASC
+                """,
+                [memory_id],
+            )
+            columns = [c[0] for c in (result.description or [])]
+            return [dict(zip(columns, row, strict=False)) for row in result.fetchall()]
+
+        return await self._executor.read(_lineage, label="memory_lineage")
 
     async def prune_provenance_older_than(self, *, days: int = 90) -> int:
         """Delete provenance rows older than ``days``. Returns count.
@@ -1489,22 +2111,26 @@ class ReflectionDatabaseAdapterOneiric:
         lineage questions. Pruned rows are unrecoverable; the FK
         CASCADE trigger keeps the parent table unaffected.
         """
-        before_row = self.conn.execute(
-            "SELECT COUNT(*) FROM memory_provenance"
-        ).fetchone()
-        before = int(before_row[0]) if before_row else 0
-        self.conn.execute(
-            """
-            DELETE FROM memory_provenance
-            WHERE extracted_at < CURRENT_TIMESTAMP - INTERVAL (? || ' days')
-            """,
-            [days],
-        )
-        after_row = self.conn.execute(
-            "SELECT COUNT(*) FROM memory_provenance"
-        ).fetchone()
-        after = int(after_row[0]) if after_row else 0
-        return max(0, before - after)
+
+        def _prune(conn: t.Any) -> int:
+            before_row = conn.execute(
+                "SELECT COUNT(*) FROM memory_provenance"
+            ).fetchone()
+            before = int(before_row[0]) if before_row else 0
+            conn.execute(
+                """
+                DELETE FROM memory_provenance
+                WHERE extracted_at < CURRENT_TIMESTAMP - INTERVAL (? || ' days')
+                """,
+                [days],
+            )
+            after_row = conn.execute(
+                "SELECT COUNT(*) FROM memory_provenance"
+            ).fetchone()
+            after = int(after_row[0]) if after_row else 0
+            return max(0, before - after)
+
+        return await self._executor.write(_prune, label="prune_provenance")
 
     async def search_conversations(
         self,
@@ -1550,30 +2176,50 @@ class ReflectionDatabaseAdapterOneiric:
         )
 
         # Check cache first (Phase 1: Query Cache)
-        cached_results = self._get_cached_conversations(
+        cached_results = await self._get_cached_conversations(
             query=query,
             project=project,
             limit=limit,
+            threshold=threshold,
             use_cache=use_cache,
         )
         if cached_results is not None:
             return cached_results
 
-        # Perform search (vector or text fallback)
-        results = await self._search_conversations_db(
-            query=query,
+        # Paraphrases of a cached query reuse its results; a sample of these
+        # hits is searched again to measure false hits
+        query_embedding = await self._semantic_cache_embedding(query, use_cache)
+        similar_results = await self._get_similar_cached_conversations(
+            embedding=query_embedding,
+            project=project,
+            limit=limit,
+            threshold=threshold,
+        )
+        semantic = self._query_cache.semantic if self._query_cache else None
+        if similar_results is not None and not (semantic and semantic.should_verify()):
+            return similar_results
+
+        # Perform search (vector or text fallback)
+        results = await self._search_conversations_db(
+            query=query,
             limit=limit,
             threshold=threshold,
             project=project,
         )
+        if similar_results is not None and semantic is not None:
+            semantic.record_verification(
+                [r["id"] for r in similar_results], [r["id"] for r in results]
+            )
 
         # Populate cache for future searches (Phase 1: Query Cache)
         self._cache_conversation_results(
             query=query,
             project=project,
             limit=limit,
+            threshold=threshold,
             results=results,
             use_cache=use_cache,
+            embedding=query_embedding,
         )
 
         return results
@@ -1602,10 +2248,11 @@ class ReflectionDatabaseAdapterOneiric:
 
         Phase 1 Feature #5. The ``idx_v2_source_type_project`` covering index
         on ``(source_type, project, timestamp DESC)`` makes this an O(log n)
-        range scan rather than a full table scan.
+        range scan rather than a full table scan. ``query`` is matched
+        through the BM25 full-text index; a blank query matches every row.
 
         Args:
-            query: Text fragment to match in ``content`` (LIKE %query%).
+            query: Free-text query matched against ``content``.
             source_type: Optional provenance tag. Must be one of
                 ``claude_code``, ``crackerjack``, ``mahavishnu_workflow``,
                 ``manual``, ``migration`` — matching the v2 CHECK constraint.
@@ -1613,9 +2260,10 @@ class ReflectionDatabaseAdapterOneiric:
             limit: Maximum number of rows to return.
 
         Returns:
-            List of matching rows, most recent first. Each row contains
-            ``id``, ``content``, ``metadata``, ``source_type``, ``project``,
-            ``category``, ``timestamp``.
+            List of matching rows, best match first (most recent first for a
+            blank query). Each row contains ``id``, ``content``,
+            ``metadata``, ``source_type``, ``project``, ``category``,
+            ``timestamp`` and ``score``.
 
         Raises:
             ValueError: If ``source_type`` is not in the allowed set.
@@ -1629,40 +2277,58 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        sql = """
-            SELECT id, content, metadata, source_type, project, category, timestamp
-            FROM conversations_v2
-            WHERE content LIKE ?
-        """
-        params: list[t.Any] = [f"%{query}%"]
+        match = None
+        if query.strip():
+            match = self._synced_fulltext("conversations").match("conversations", query)
+            if match is None:
+                return []
+
+        select = "SELECT c.id, c.content, c.metadata, c.source_type, c.project, c.category, c.timestamp"
+        if match is None:
+            sql = f"{select}, 1.0 AS score FROM conversations_v2 c WHERE TRUE"
+            params: list[t.Any] = []
+            order = " ORDER BY c.timestamp DESC LIMIT ?"
+        else:
+            sql = f"""
+                {select}, m.score
+                FROM ({match.sql}) m
+                JOIN conversations_v2 c ON c.id = m.doc_id
+                WHERE TRUE
+            """
+            params = list(match.params)
+            order = " ORDER BY m.score DESC, c.timestamp DESC LIMIT ?"
         if source_type is not None:
-            sql += " AND source_type = ?"
+            sql += " AND c.source_type = ?"
             params.append(source_type)
         if project is not None:
-            sql += " AND project = ?"
+            sql += " AND c.project = ?"
             params.append(project)
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        sql += order
         params.append(limit)
 
-        rows = self.conn.execute(sql, params).fetchall()
-        return [
-            {
-                "id": row[0],
-                "content": row[1],
-                "metadata": json.loads(row[2]) if row[2] else {},
-                "source_type": row[3],
-                "project": row[4],
-                "category": row[5],
-                "timestamp": row[6],
-            }
-            for row in rows
-        ]
+        rows = await self._executor.fetchall(sql, params, label="search_by_source")
+        return normalize_scores(
+            [
+                {
+                    "id": row[0],
+                    "content": row[1],
+                    "metadata": json.loads(row[2]) if row[2] else {},
+                    "source_type": row[3],
+                    "project": row[4],
+                    "category": row[5],
+                    "timestamp": row[6],
+                    "score": float(row[7]),
+                }
+                for row in rows
+            ]
+        )
 
-    def _get_cached_conversations(
+    async def _get_cached_conversations(
         self,
         query: str,
         project: str | None,
         limit: int,
+        threshold: float,
         use_cache: bool,
     ) -> list[dict[str, t.Any]] | None:
         """Retrieve cached conversation search results if available.
@@ -1671,40 +2337,105 @@ class ReflectionDatabaseAdapterOneiric:
             query: Search query
             project: Optional project filter
             limit: Maximum number of results
+            threshold: Minimum similarity score of the search
             use_cache: Whether to check cache
 
         Returns:
-            Cached results or None if cache miss
+            Cached results in their original order and with their original
+            scores, or None if cache miss
 
         """
         if not (use_cache and self._query_cache):
             return None
 
-        cache_key = QueryCacheManager.compute_cache_key(
-            query=query,
+        cache_key = self._query_cache.scoped_cache_key(
+            self._table("conversations"),
+            query,
             project=project,
             limit=limit,
+            threshold=threshold,
         )
-        cached_result_ids = self._query_cache.get(cache_key)
+        entry = self._query_cache.get_entry(cache_key)
 
-        if cached_result_ids is None:
+        if entry is None:
             return None
 
-        # Cache hit - fetch full results by IDs
-        if not cached_result_ids:
+        return await self._fetch_cached_conversations(entry, project)
+
+    async def _semantic_cache_embedding(
+        self, query: str, use_cache: bool
+    ) -> list[float] | None:
+        """Embed ``query`` for the semantic cache tier, None when it is off."""
+        if not (
+            use_cache
+            and self._query_cache
+            and self._query_cache.semantic is not None
+            and self.settings.enable_embeddings
+        ):
+            return None
+        # The search itself re-requests this embedding from the shared cache
+        return await self._generate_embedding(query)
+
+    async def _get_similar_cached_conversations(
+        self,
+        embedding: list[float] | None,
+        project: str | None,
+        limit: int,
+        threshold: float,
+    ) -> list[dict[str, t.Any]] | None:
+        """Retrieve the cached results of a paraphrase of the query.
+
+        Args:
+            embedding: Query embedding, None when the semantic tier is off
+            project: Optional project filter
+            limit: Maximum number of results
+            threshold: Minimum similarity score of the search
+
+        Returns:
+            Cached results of the nearest cached query, or None on a miss
+
+        """
+        if embedding is None or not self._query_cache or not self._query_cache.semantic:
+            return None
+
+        scope = self._query_cache.semantic_scope(
+            self._table("conversations"),
+            project=project,
+            limit=limit,
+            threshold=threshold,
+        )
+        entry = self._query_cache.semantic.lookup(scope, embedding)
+        if entry is None:
+            return None
+
+        return await self._fetch_cached_conversations(entry, project)
+
+    async def _fetch_cached_conversations(
+        self, entry: QueryCacheEntry, project: str | None
+    ) -> list[dict[str, t.Any]]:
+        """Load the rows of a cache entry in rank order with their scores."""
+        if not entry.result_ids:
             return []
 
-        # Fetch cached results by IDs. The conversations_v2 schema uses
-        # ``timestamp`` rather than ``created_at``/``updated_at``.
-        id_list = "', '".join(cached_result_ids)
-        result = self.conn.execute(
-            f"""
-            SELECT id, content, metadata, timestamp
+        # The conversations_v2 schema uses ``timestamp`` rather than
+        # ``created_at``/``updated_at``.
+        sql = f"""
+            SELECT id, content, metadata, timestamp, project
             FROM {self._table("conversations")}
-            WHERE id IN ('{id_list}')
-            ORDER BY timestamp DESC
-            """
-        ).fetchall()
+            WHERE id IN (SELECT unnest(?::VARCHAR[]))
+        """
+        params: list[t.Any] = [entry.result_ids]
+        if project is not None:
+            sql += " AND project = ?"
+            params.append(project)
+        rows = {
+            row[0]: row
+            for row in await self._executor.fetchall(
+                sql, params, label="conversations.cached"
+            )
+        }
+        scores = dict(zip(entry.result_ids, entry.scores, strict=False))
+
         return [
             {
                 "id": row[0],
@@ -1712,10 +2443,12 @@ class ReflectionDatabaseAdapterOneiric:
                 "metadata": json.loads(row[2]) if row[2] else {},
                 "created_at": row[3],
                 "updated_at": row[3],
-                "score": 1.0,  # Cached results don't have original scores
+                "project": row[4],
+                "score": scores.get(row[0], 0.0),
                 "_cached": True,  # Mark as cached result
             }
-            for row in result
+            for doc_id in entry.result_ids
+            if (row := rows.get(doc_id)) is not None
         ]
 
     async def _search_conversations_db(
@@ -1744,19 +2477,34 @@ class ReflectionDatabaseAdapterOneiric:
             query_embedding = await self._generate_embedding(query)
 
         if query_embedding and self.settings.enable_vss:
-            return self._vector_search_conversations(
-                query_embedding=query_embedding,
-                limit=limit,
-                threshold=threshold,
-                project=project,
+            if self.settings.enable_quantization:
+                results = await self._quantized_search_conversations(
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    threshold=threshold,
+                    project=project,
+                )
+            else:
+                results = await self._vector_search_conversations(
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    threshold=threshold,
+                    project=project,
+                )
+            if not self.settings.enable_hybrid_search:
+                return results
+            # Vector results go first so fused rows keep their similarity
+            text_results = await self._text_search_conversations(
+                query=query, limit=limit, project=project
             )
-        return self._text_search_conversations(
+            return reciprocal_rank_fusion([results, text_results])[:limit]
+        return await self._text_search_conversations(
             query=query,
             limit=limit,
             project=project,
         )
 
-    def _vector_search_conversations(
+    async def _vector_search_conversations(
         self,
         query_embedding: list[float],
         limit: int,
@@ -1776,17 +2524,16 @@ class ReflectionDatabaseAdapterOneiric:
             List of matching conversations with scores
 
         """
-        # Set HNSW ef_search parameter if indexes exist
-        if self._hnsw_available:
-            self.conn.execute(f"SET hnsw_ef_search = {self.settings.hnsw_ef_search}")
-
-        vector_query = f"[{', '.join(map(str, query_embedding))}]"
-        # The conversations_v2 schema uses ``timestamp`` rather than
+        # The query vector is inlined as a constant (see utils.vector_sql)
+        # so DuckDB can fold it and VSS can use the HNSW index. The
+        # conversations_v2 schema uses ``timestamp`` rather than
         # ``created_at``/``updated_at``.
         sql = f"""
             SELECT
                 id, content, metadata, timestamp, project,
-                array_cosine_similarity(embedding, '{vector_query}'::FLOAT[{self.embedding_dim}]) as score
+                array_cosine_similarity(
+                    embedding, {vector_literal(query_embedding, self.embedding_dim)}
+                ) as score
             FROM conversations_v2
             WHERE embedding IS NOT NULL
         """
@@ -1796,30 +2543,362 @@ class ReflectionDatabaseAdapterOneiric:
             params.append(project)
         sql += " ORDER BY score DESC LIMIT ?"
         params.append(limit)
-        result = self.conn.execute(sql, params).fetchall()
+        rows = await self._executor.read(
+            lambda conn: fetch_scored_rows(
+                conn.execute(sql, params), "score", threshold
+            ),
+            label="conversations.vector",
+        )
+        return self._format_scored_conversations(rows)
 
-        # Filter by threshold and build results
+    @staticmethod
+    def _format_scored_conversations(
+        rows: list[dict[str, t.Any]],
+    ) -> list[dict[str, t.Any]]:
+        # Metadata is decoded only for rows that passed the threshold
         return [
             {
-                "id": row[0],
-                "content": row[1],
-                "metadata": json.loads(row[2]) if row[2] else {},
-                "created_at": row[3],
-                "updated_at": row[3],
-                "project": row[4],
-                "score": float(row[5]),
+                "id": row["id"],
+                "content": row["content"],
+                "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+                "created_at": row["timestamp"],
+                "updated_at": row["timestamp"],
+                "project": row["project"],
+                "score": float(row["score"]),
             }
-            for row in result
-            if row[5] >= threshold
+            for row in rows
         ]
 
-    def _text_search_conversations(
+    async def _quantized_search_conversations(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        threshold: float,
+        project: str | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """Two-pass vector search over uint8 codes with float32 rerank.
+
+        The in-memory code matrix is scanned for the top
+        ``limit * quantization_rerank_factor`` candidates, which are then
+        re-scored against their stored float32 embeddings, so returned
+        scores are exact cosine similarities.
+
+        Args:
+            query_embedding: Query vector embedding
+            limit: Maximum number of results
+            threshold: Minimum similarity score
+            project: Optional project filter
+
+        Returns:
+            List of matching conversations with scores
+
+        """
+        index = self._get_quantized_index()
+        if index is None or not len(index):
+            return await self._vector_search_conversations(
+                query_embedding=query_embedding,
+                limit=limit,
+                threshold=threshold,
+                project=project,
+            )
+
+        candidates = index.search(
+            query_embedding,
+            limit * max(1, self.settings.quantization_rerank_factor),
+            project=project,
+        )
+        if not candidates:
+            return []
+
+        sql = f"""
+            SELECT
+                id, content, metadata, timestamp, project,
+                array_cosine_similarity(
+                    embedding, {vector_literal(query_embedding, self.embedding_dim)}
+                ) as score
+            FROM {self._table("conversations")}
+            WHERE id IN (SELECT unnest(?::VARCHAR[])) AND embedding IS NOT NULL
+            ORDER BY score DESC LIMIT ?
+        """
+        params = [[memory_id for memory_id, _ in candidates], limit]
+        rows = await self._executor.read(
+            lambda conn: fetch_scored_rows(
+                conn.execute(sql, params), "score", threshold
+            ),
+            label="conversations.quantized",
+        )
+        return self._format_scored_conversations(rows)
+
+    def _load_calibration(self) -> None:
+        """Load the persisted calibration for the conversations table."""
+        row = self.conn.execute(
+            "SELECT dim, lo, hi, sample_count FROM embedding_calibration "
+            "WHERE table_name = ?",
+            [self._table("conversations")],
+        ).fetchone()
+        if row is None or row[0] != self.embedding_dim:
+            return
+        self._calibration = Calibration(
+            lo=np.frombuffer(row[1], dtype=np.float32).copy(),
+            hi=np.frombuffer(row[2], dtype=np.float32).copy(),
+            sample_count=int(row[3] or 0),
+        )
+        self._quantized_index = None
+
+    def _save_calibration(self, calibration: Calibration) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO embedding_calibration
+                (table_name, dim, lo, hi, sample_count, calibrated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(table_name) DO UPDATE SET
+                dim = excluded.dim,
+                lo = excluded.lo,
+                hi = excluded.hi,
+                sample_count = excluded.sample_count,
+                calibrated_at = excluded.calibrated_at
+            """,
+            [
+                self._table("conversations"),
+                self.embedding_dim,
+                calibration.lo.astype(np.float32).tobytes(),
+                calibration.hi.astype(np.float32).tobytes(),
+                calibration.sample_count,
+                datetime.now(UTC),
+            ],
+        )
+
+    def _encode_stored_embeddings(
+        self, *, only_missing: bool, batch_size: int = 4096
+    ) -> int:
+        """Write ``embedding_q`` codes for stored embeddings.
+
+        Args:
+            only_missing: Encode only rows without codes (otherwise all rows,
+                e.g. after recalibration)
+            batch_size: Rows encoded per UPDATE
+
+        Returns:
+            Number of rows encoded
+
+        """
+        table = self._table("conversations")
+        calibration = self._current_calibration()
+        where = "embedding IS NOT NULL"
+        if only_missing:
+            where += " AND embedding_q IS NULL"
+        # Materialize the work list first and walk it by rowid, so the
+        # inserts below never interleave with an open result set.
+        self.conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE _embedding_q_pending AS "
+            f"SELECT id, embedding FROM {table} WHERE {where}"
+        )
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM _embedding_q_pending"
+        ).fetchone()[0]
+        self.conn.execute(
+            "CREATE OR REPLACE TEMP TABLE _embedding_q_updates "
+            "(id VARCHAR, embedding_q BLOB)"
+        )
+        encoded = 0
+        try:
+            for start in range(0, total, batch_size):
+                batch = self.conn.execute(
+                    "SELECT id, embedding FROM _embedding_q_pending "
+                    "WHERE rowid >= ? AND rowid < ?",
+                    [start, start + batch_size],
+                ).fetchall()
+                codes = quantize([row[1] for row in batch], calibration)
+                self.conn.execute(
+                    "INSERT INTO _embedding_q_updates "
+                    "SELECT unnest(?::VARCHAR[]), unnest(?::BLOB[])",
+                    [[row[0] for row in batch], [code.tobytes() for code in codes]],
+                )
+                encoded += len(batch)
+            if encoded:
+                self.conn.execute(
+                    f"UPDATE {table} SET embedding_q = u.embedding_q "
+                    f"FROM _embedding_q_updates u WHERE {table}.id = u.id"
+                )
+        finally:
+            self.conn.execute("DROP TABLE IF EXISTS _embedding_q_pending")
+            self.conn.execute("DROP TABLE IF EXISTS _embedding_q_updates")
+        return encoded
+
+    def _get_quantized_index(self) -> QuantizedIndex | None:
+        """Build (once) the in-memory code matrix from ``embedding_q``.
+
+        Databases that have never been calibrated are calibrated first once
+        they hold enough embeddings for the per-dimension ranges to be
+        meaningful; rows stored without codes are encoded on the way in.
+        """
+        if self._quantized_index is not None:
+            return self._quantized_index
+        table = self._table("conversations")
+        try:
+            if self._calibration is None:
+                count = self.conn.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE embedding IS NOT NULL"
+                ).fetchone()[0]
+                if count >= _MIN_CALIBRATION_ROWS:
+                    self._calibrate_quantization()
+            self._encode_stored_embeddings(only_missing=True)
+
+            index = QuantizedIndex(self._current_calibration())
+            result = self.conn.execute(
+                f"SELECT id, project, embedding_q FROM {table} "
+                "WHERE embedding_q IS NOT NULL"
+            )
+            while batch := result.fetchmany(16384):
+                codes = np.frombuffer(
+                    b"".join(row[2] for row in batch), dtype=np.uint8
+                ).reshape(len(batch), self.embedding_dim)
+                index.add([row[0] for row in batch], codes, [row[1] for row in batch])
+        except Exception:
+            logger.warning("Failed to build quantized index", exc_info=True)
+            return None
+        self._quantized_index = index
+        return index
+
+    def _calibrate_quantization(
+        self, sigma: float = DEFAULT_CALIBRATION_SIGMA
+    ) -> Calibration | None:
+        calibration = calibrate_from_table(
+            self.conn, self._table("conversations"), self.embedding_dim, sigma=sigma
+        )
+        if calibration is None:
+            return None
+        self._save_calibration(calibration)
+        self._calibration = calibration
+        self._quantized_index = None
+        self._encode_stored_embeddings(only_missing=False)
+        return calibration
+
+    async def calibrate_quantization(
+        self, sigma: float = DEFAULT_CALIBRATION_SIGMA
+    ) -> dict[str, t.Any]:
+        """Recompute quantization ranges from stored embeddings.
+
+        Per-dimension statistics are aggregated inside DuckDB, persisted,
+        and every stored embedding is re-encoded with the new ranges.
+
+        Args:
+            sigma: Clip each dimension to ``mean +/- sigma * stddev``
+                (0 keeps the raw min/max)
+
+        Returns:
+            Dictionary with ``calibrated``, ``sample_count`` and ``encoded``
+
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        calibration = self._calibrate_quantization(sigma)
+        if calibration is None:
+            return {"calibrated": False, "sample_count": 0, "encoded": 0}
+        encoded = self.conn.execute(
+            f"SELECT COUNT(*) FROM {self._table('conversations')} "
+            "WHERE embedding_q IS NOT NULL"
+        ).fetchone()[0]
+        return {
+            "calibrated": True,
+            "sample_count": calibration.sample_count,
+            "encoded": int(encoded),
+        }
+
+    async def quantization_report(
+        self,
+        queries: list[str] | None = None,
+        k: int = 10,
+        sample_size: int = 50,
+    ) -> dict[str, t.Any]:
+        """Compare quantized search against float32 search.
+
+        Runs each query through both paths and reports recall@k of the
+        quantized results against the float32 results, per-path latency
+        percentiles and the memory held by the code matrix.
+
+        Args:
+            queries: Query texts; defaults to a sample of stored embeddings
+            k: Results per query
+            sample_size: Number of stored embeddings sampled when
+                ``queries`` is None
+
+        Returns:
+            Dictionary of recall, latency and memory figures
+
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if queries is None:
+            rows = await self._executor.fetchall(
+                f"SELECT embedding FROM {self._table('conversations')} "
+                f"WHERE embedding IS NOT NULL USING SAMPLE {int(sample_size)} ROWS",
+                label="quantization_report",
+            )
+            vectors = [list(row[0]) for row in rows]
+        else:
+            vectors = [
+                vector
+                for vector in await self._generate_embeddings(queries)
+                if vector is not None
+            ]
+
+        index = self._get_quantized_index()
+        recalls: list[float] = []
+        float_ms: list[float] = []
+        quantized_ms: list[float] = []
+        for vector in vectors:
+            started = time.perf_counter()
+            exact = await self._vector_search_conversations(vector, k, threshold=-1.0)
+            float_ms.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            approx = await self._quantized_search_conversations(
+                vector, k, threshold=-1.0
+            )
+            quantized_ms.append((time.perf_counter() - started) * 1000)
+
+            expected = {row["id"] for row in exact}
+            if expected:
+                found = {row["id"] for row in approx}
+                recalls.append(len(expected & found) / len(expected))
+
+        def _percentiles(samples: list[float]) -> dict[str, float]:
+            if not samples:
+                return {"p50": 0.0, "p99": 0.0}
+            p50, p99 = np.percentile(samples, [50, 99])
+            return {"p50": float(p50), "p99": float(p99)}
+
+        rows_indexed = len(index) if index is not None else 0
+        return {
+            "queries": len(vectors),
+            "k": k,
+            "rerank_factor": self.settings.quantization_rerank_factor,
+            "recall_at_k": float(np.mean(recalls)) if recalls else None,
+            "float_latency_ms": _percentiles(float_ms),
+            "quantized_latency_ms": _percentiles(quantized_ms),
+            "rows_indexed": rows_indexed,
+            "quantized_bytes": index.nbytes if index is not None else 0,
+            "float32_bytes": rows_indexed * self.embedding_dim * 4,
+        }
+
+    def _configure_worker_conn(self, conn: t.Any) -> None:
+        """Apply session settings to an executor worker's cursor.
+
+        ``hnsw_ef_search`` is set once per cursor rather than per query.
+        """
+        if self._hnsw_available:
+            conn.execute(f"SET hnsw_ef_search = {self.settings.hnsw_ef_search}")
+
+    async def _text_search_conversations(
         self,
         query: str,
         limit: int,
         project: str | None = None,
     ) -> list[dict[str, t.Any]]:
-        """Perform text-based search on conversations.
+        """Perform BM25 full-text search on conversations.
 
         Args:
             query: Search query string
@@ -1828,44 +2907,53 @@ class ReflectionDatabaseAdapterOneiric:
                 project are returned when set.
 
         Returns:
-            List of matching conversations with scores
+            List of matching conversations, best first, with scores scaled
+            so the best match scores 1.0
 
         """
+        match = self._synced_fulltext("conversations").match("conversations", query)
+        if match is None:
+            return []
+
         # The conversations_v2 schema uses ``timestamp`` rather than
         # ``created_at``/``updated_at``.
-        sql = """
-            SELECT id, content, metadata, timestamp, project
-            FROM conversations_v2
-            WHERE content LIKE ?
+        sql = f"""
+            SELECT c.id, c.content, c.metadata, c.timestamp, c.project, m.score
+            FROM ({match.sql}) m
+            JOIN conversations_v2 c ON c.id = m.doc_id
         """
-        params: list[t.Any] = [f"%{query}%"]
+        params: list[t.Any] = list(match.params)
         if project is not None:
-            sql += " AND project = ?"
+            sql += " WHERE c.project = ?"
             params.append(project)
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        sql += " ORDER BY m.score DESC, c.timestamp DESC LIMIT ?"
         params.append(limit)
-        result = self.conn.execute(sql, params).fetchall()
+        result = await self._executor.fetchall(sql, params, label="conversations.text")
 
-        return [
-            {
-                "id": row[0],
-                "content": row[1],
-                "metadata": json.loads(row[2]) if row[2] else {},
-                "created_at": row[3],
-                "updated_at": row[3],
-                "project": row[4],
-                "score": 1.0,  # Text search gets maximum score
-            }
-            for row in result
-        ]
+        return normalize_scores(
+            [
+                {
+                    "id": row[0],
+                    "content": row[1],
+                    "metadata": json.loads(row[2]) if row[2] else {},
+                    "created_at": row[3],
+                    "updated_at": row[3],
+                    "project": row[4],
+                    "score": float(row[5]),
+                }
+                for row in result
+            ]
+        )
 
     def _cache_conversation_results(
         self,
         query: str,
         project: str | None,
         limit: int,
+        threshold: float,
         results: list[dict[str, t.Any]],
         use_cache: bool,
+        embedding: list[float] | None = None,
     ) -> None:
         """Cache conversation search results for future queries.
 
@@ -1873,28 +2961,41 @@ class ReflectionDatabaseAdapterOneiric:
             query: Search query
             project: Optional project filter
             limit: Maximum number of results
+            threshold: Minimum similarity score of the search
             results: Search results to cache
             use_cache: Whether to populate cache
+            embedding: Query embedding to index in the semantic tier
 
         """
         if not (use_cache and self._query_cache and results):
             return
 
-        cache_key = QueryCacheManager.compute_cache_key(
-            query=query,
+        cache_key = self._query_cache.scoped_cache_key(
+            self._table("conversations"),
+            query,
             project=project,
             limit=limit,
+            threshold=threshold,
         )
-        result_ids = [r["id"] for r in results]
-        normalized_query = QueryCacheManager.normalize_query(query)
 
-        self._query_cache.put(
+        entry = self._query_cache.put(
             cache_key=cache_key,
-            result_ids=result_ids,
-            normalized_query=normalized_query,
+            result_ids=[r["id"] for r in results],
+            normalized_query=QueryCacheManager.normalize_query(query),
             project=project,
+            scores=[float(r.get("score", 0.0)) for r in results],
         )
 
+        semantic = self._query_cache.semantic
+        if entry is not None and embedding is not None and semantic is not None:
+            scope = self._query_cache.semantic_scope(
+                self._table("conversations"),
+                project=project,
+                limit=limit,
+                threshold=threshold,
+            )
+            semantic.add(scope, embedding, entry)
+
     async def get_stats(self) -> dict[str, t.Any]:
         """Get database statistics.
 
@@ -1905,20 +3006,17 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        # Get conversation count
-        conv_count = self.conn.execute(
-            f"SELECT COUNT(*) FROM {self._table('conversations')}"
-        ).fetchone()[0]
-
-        # Get reflection count
-        refl_count = self.conn.execute(
-            f"SELECT COUNT(*) FROM {self._table('reflections')}"
-        ).fetchone()[0]
-
-        # Get embedding stats
-        embedding_count = self.conn.execute(
-            f"SELECT COUNT(*) FROM {self._table('conversations')} WHERE embedding IS NOT NULL"
-        ).fetchone()[0]
+        # Conversation, embedding and reflection counts in one round trip
+        conv_count, embedding_count, refl_count = await self._executor.fetchone(
+            f"""
+            SELECT
+                (SELECT COUNT(*) FROM {self._table("conversations")}),
+                (SELECT COUNT(*) FROM {self._table("conversations")}
+                 WHERE embedding IS NOT NULL),
+                (SELECT COUNT(*) FROM {self._table("reflections")})
+            """,
+            label="stats",
+        )
 
         return {
             "total_conversations": conv_count,
@@ -1926,6 +3024,8 @@ class ReflectionDatabaseAdapterOneiric:
             "conversations_with_embeddings": embedding_count,
             "database_path": self.db_path,
             "collection_name": self.collection_name,
+            "access_log": self._access_log.get_stats() if self._access_log else {},
+            "executor": self._executor.get_stats() if self._executor else {},
         }
 
     async def store_reflection(
@@ -2002,72 +3102,80 @@ class ReflectionDatabaseAdapterOneiric:
         # tags, related_entities, project, namespace, timestamp) and the
         # legacy compatibility columns (created_at, updated_at, insight_type,
         # usage_count, last_used_at, confidence_score, fingerprint).
-        if embedding:
-            self.conn.execute(
-                f"""
-                INSERT INTO {self._table("reflections")}
-                (
-                    id, content, embedding, category, importance_score,
-                    memory_tier, tags, related_entities, project, namespace,
-                    timestamp, created_at, updated_at, insight_type,
-                    usage_count, last_used_at, confidence_score, fingerprint
+        def _insert(conn: t.Any) -> None:
+            if embedding:
+                conn.execute(
+                    f"""
+                    INSERT INTO {self._table("reflections")}
+                    (
+                        id, content, embedding, category, importance_score,
+                        memory_tier, tags, related_entities, project, namespace,
+                        timestamp, created_at, updated_at, insight_type,
+                        usage_count, last_used_at, confidence_score, fingerprint
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        reflection_id,
+                        content,
+                        embedding,
+                        "context",  # category default
+                        0.5,  # importance_score default
+                        "long_term",  # memory_tier default
+                        tags or [],
+                        None,  # related_entities (not threaded through here)
+                        project,  # Bug 3 fix: thread caller-provided project
+                        "default",  # namespace
+                        now,  # timestamp (v2)
+                        now,  # created_at (legacy)
+                        now,  # updated_at (legacy)
+                        None,  # insight_type (NULL to distinguish from insights)
+                        0,  # usage_count
+                        None,  # last_used_at
+                        0.5,  # confidence_score
+                        fingerprint_bytes,
+                    ),
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    reflection_id,
-                    content,
-                    embedding,
-                    "context",  # category default
-                    0.5,  # importance_score default
-                    "long_term",  # memory_tier default
-                    tags or [],
-                    None,  # related_entities (not threaded through here)
-                    project,  # Bug 3 fix: thread caller-provided project
-                    "default",  # namespace
-                    now,  # timestamp (v2)
-                    now,  # created_at (legacy)
-                    now,  # updated_at (legacy)
-                    None,  # insight_type (NULL to distinguish from insights)
-                    0,  # usage_count
-                    None,  # last_used_at
-                    0.5,  # confidence_score
-                    fingerprint_bytes,
-                ),
-            )
-        else:
-            self.conn.execute(
-                f"""
-                INSERT INTO {self._table("reflections")}
-                (
-                    id, content, embedding, category, importance_score,
-                    memory_tier, tags, related_entities, project, namespace,
-                    timestamp, created_at, updated_at, insight_type,
-                    usage_count, last_used_at, confidence_score, fingerprint
+            else:
+                conn.execute(
+                    f"""
+                    INSERT INTO {self._table("reflections")}
+                    (
+                        id, content, embedding, category, importance_score,
+                        memory_tier, tags, related_entities, project, namespace,
+                        timestamp, created_at, updated_at, insight_type,
+                        usage_count, last_used_at, confidence_score, fingerprint
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        reflection_id,
+                        content,
+                        None,  # embedding
+                        "context",  # category default
+                        0.5,  # importance_score default
+                        "long_term",  # memory_tier default
+                        tags or [],
+                        None,  # related_entities
+                        project,  # Bug 3 fix: thread caller-provided project
+                        "default",  # namespace
+                        now,  # timestamp
+                        now,  # created_at
+                        now,  # updated_at
+                        None,  # insight_type
+                        0,  # usage_count
+                        None,  # last_used_at
+                        0.5,  # confidence_score
+                        fingerprint_bytes,
+                    ),
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    reflection_id,
-                    content,
-                    None,  # embedding
-                    "context",  # category default
-                    0.5,  # importance_score default
-                    "long_term",  # memory_tier default
-                    tags or [],
-                    None,  # related_entities
-                    project,  # Bug 3 fix: thread caller-provided project
-                    "default",  # namespace
-                    now,  # timestamp
-                    now,  # created_at
-                    now,  # updated_at
-                    None,  # insight_type
-                    0,  # usage_count
-                    None,  # last_used_at
-                    0.5,  # confidence_score
-                    fingerprint_bytes,
-                ),
+            self._index_fingerprint_bands(
+                "reflection", [reflection_id], [fingerprint], conn
             )
+            self._index_fulltext("reflections", reflection_id, content, tags, conn)
+
+        await self._executor.write(_insert, label="store_reflection", transaction=True)
+        self._invalidate_cached_searches("reflections", project)
 
         # Auto-assign subcategory if category evolution engine is available (Phase 5)
         subcategory: str | None = None
@@ -2082,13 +3190,14 @@ class ReflectionDatabaseAdapterOneiric:
             if assignment.subcategory:
                 subcategory = assignment.subcategory
                 # Store subcategory with reflection
-                self.conn.execute(
+                await self._executor.execute(
                     f"""
                     UPDATE {self._table("reflections")}
                     SET subcategory = ?
                     WHERE id = ?
                     """,
                     [subcategory, reflection_id],
+                    label="store_reflection",
                 )
                 logger.info(
                     f"Assigned subcategory: {subcategory} (confidence: {assignment.confidence:.2f})"
@@ -2125,9 +3234,11 @@ class ReflectionDatabaseAdapterOneiric:
             await self.initialize()
 
         # Check cache first (Phase 1: Query Cache)
-        cached_results = self._get_cached_reflections(
+        cached_results = await self._get_cached_reflections(
             query=query,
             limit=limit,
+            use_embeddings=use_embeddings,
+            project=project,
             use_cache=use_cache,
         )
         if cached_results is not None:
@@ -2145,16 +3256,20 @@ class ReflectionDatabaseAdapterOneiric:
         self._cache_reflection_results(
             query=query,
             limit=limit,
+            use_embeddings=use_embeddings,
+            project=project,
             results=results,
             use_cache=use_cache,
         )
 
         return results
 
-    def _get_cached_reflections(
+    async def _get_cached_reflections(
         self,
         query: str,
         limit: int,
+        use_embeddings: bool,
+        project: str | None,
         use_cache: bool,
     ) -> list[dict[str, t.Any]] | None:
         """Retrieve cached reflection search results if available.
@@ -2162,42 +3277,52 @@ class ReflectionDatabaseAdapterOneiric:
         Args:
             query: Search query
             limit: Maximum number of results
+            use_embeddings: Whether the search may use embeddings
+            project: Optional project filter
             use_cache: Whether to check cache
 
         Returns:
-            Cached results or None if cache miss
+            Cached results in their original order and with their original
+            similarities, or None if cache miss
 
         """
         if not (use_cache and self._query_cache):
             return None
 
-        cache_key = QueryCacheManager.compute_cache_key(
-            query=query,
-            project=None,  # reflections don't have project filter
+        cache_key = self._query_cache.scoped_cache_key(
+            self._table("reflections"),
+            query,
+            project=project,
             limit=limit,
+            use_embeddings=use_embeddings,
         )
-        cached_result_ids = self._query_cache.get(cache_key)
+        entry = self._query_cache.get_entry(cache_key)
 
-        if cached_result_ids is None:
+        if entry is None:
             return None
 
         # Cache hit - fetch full results by IDs
-        if not cached_result_ids:
+        if not entry.result_ids:
             return []
 
-        # Fetch cached results by IDs
-        id_list = "', '".join(cached_result_ids)
-        result = self.conn.execute(
-            f"""
+        sql = f"""
             SELECT id, content, tags, created_at, updated_at
             FROM {self._table("reflections")}
-            WHERE id IN ('{id_list}')
+            WHERE id IN (SELECT unnest(?::VARCHAR[]))
                 AND insight_type IS NULL
-            ORDER BY created_at DESC
-            """
-        ).fetchall()
+        """
+        params: list[t.Any] = [entry.result_ids]
+        if project is not None:
+            sql += " AND project = ?"
+            params.append(project)
+        rows = {
+            row[0]: row
+            for row in await self._executor.fetchall(
+                sql, params, label="reflections.cached"
+            )
+        }
+        scores = dict(zip(entry.result_ids, entry.scores, strict=False))
 
-        # Reconstruct cached results
         return [
             {
                 "id": row[0],
@@ -2205,10 +3330,11 @@ class ReflectionDatabaseAdapterOneiric:
                 "tags": list(row[2]) if row[2] else [],
                 "created_at": row[3].isoformat() if row[3] else None,
                 "updated_at": row[4].isoformat() if row[4] else None,
-                "similarity": 1.0,  # Cached results don't have original scores
+                "similarity": scores.get(row[0], 0.0),
                 "_cached": True,  # Mark as cached result
             }
-            for row in result
+            for doc_id in entry.result_ids
+            if (row := rows.get(doc_id)) is not None
         ]
 
     async def _search_reflections_db(
@@ -2238,6 +3364,8 @@ class ReflectionDatabaseAdapterOneiric:
         self,
         query: str,
         limit: int,
+        use_embeddings: bool,
+        project: str | None,
         results: list[dict[str, t.Any]],
         use_cache: bool,
     ) -> None:
@@ -2246,6 +3374,8 @@ class ReflectionDatabaseAdapterOneiric:
         Args:
             query: Search query
             limit: Maximum number of results
+            use_embeddings: Whether the search may use embeddings
+            project: Optional project filter
             results: Search results to cache
             use_cache: Whether to populate cache
 
@@ -2253,19 +3383,20 @@ class ReflectionDatabaseAdapterOneiric:
         if not (use_cache and self._query_cache and results):
             return
 
-        cache_key = QueryCacheManager.compute_cache_key(
-            query=query,
-            project=None,
+        cache_key = self._query_cache.scoped_cache_key(
+            self._table("reflections"),
+            query,
+            project=project,
             limit=limit,
+            use_embeddings=use_embeddings,
         )
-        result_ids = [r["id"] for r in results]
-        normalized_query = QueryCacheManager.normalize_query(query)
 
         self._query_cache.put(
             cache_key=cache_key,
-            result_ids=result_ids,
-            normalized_query=normalized_query,
-            project=None,
+            result_ids=[r["id"] for r in results],
+            normalized_query=QueryCacheManager.normalize_query(query),
+            project=project,
+            scores=[float(r.get("similarity", 0.0)) for r in results],
         )
 
     async def _semantic_search_reflections(
@@ -2285,15 +3416,17 @@ class ReflectionDatabaseAdapterOneiric:
             return await self._text_search_reflections(query, limit, project)
 
         project_clause = "AND project = ?" if project is not None else ""
-        params: list[t.Any] = [query_embedding]
+        params: list[t.Any] = []
         if project is not None:
             params.append(project)
         params.append(limit)
 
-        results = self.conn.execute(
+        results = await self._executor.fetchall(
             f"""
             SELECT id, content, tags, created_at, updated_at,
-                   array_cosine_similarity(embedding::FLOAT[384], ?::FLOAT[384]) as similarity
+                   array_cosine_similarity(
+                       embedding, {vector_literal(query_embedding, self.embedding_dim)}
+                   ) as similarity
             FROM {self._table("reflections")}
             WHERE embedding IS NOT NULL
                 AND insight_type IS NULL
@@ -2302,7 +3435,8 @@ class ReflectionDatabaseAdapterOneiric:
             LIMIT ?
             """,
             params,
-        ).fetchall()
+            label="reflections.vector",
+        )
 
         return [
             {
@@ -2319,7 +3453,7 @@ class ReflectionDatabaseAdapterOneiric:
     async def _text_search_reflections(
         self, query: str, limit: int = 10, project: str | None = None
     ) -> list[dict[str, t.Any]]:
-        """Perform text search on reflections.
+        """Perform BM25 full-text search on reflections (content and tags).
 
         Filters for insight_type IS NULL to only return reflections, not insights.
         Bug 3 fix: accepts ``project`` and adds it to the ``WHERE`` clause.
@@ -2327,35 +3461,44 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        project_clause = "AND project = ?" if project is not None else ""
-        params: list[t.Any] = [f"%{query}%", query]
+        match = self._synced_fulltext("reflections").match("reflections", query)
+        if match is None:
+            return []
+
+        project_clause = "AND r.project = ?" if project is not None else ""
+        params: list[t.Any] = list(match.params)
         if project is not None:
             params.append(project)
         params.append(limit)
 
-        results = self.conn.execute(
+        results = await self._executor.fetchall(
             f"""
-            SELECT id, content, tags, created_at, updated_at
-            FROM {self._table("reflections")}
-            WHERE insight_type IS NULL
-                AND (content LIKE ? OR list_contains(tags, ?))
+            SELECT r.id, r.content, r.tags, r.created_at, r.updated_at, m.score
+            FROM ({match.sql}) m
+            JOIN {self._table("reflections")} r ON r.id = m.doc_id
+            WHERE r.insight_type IS NULL
                 {project_clause}
-            ORDER BY created_at DESC
+            ORDER BY m.score DESC, r.created_at DESC
             LIMIT ?
             """,
             params,
-        ).fetchall()
+            label="reflections.text",
+        )
 
-        return [
-            {
-                "id": row[0],
-                "content": row[1],
-                "tags": list(row[2]) if row[2] else [],
-                "created_at": row[3].isoformat() if row[3] else None,
-                "updated_at": row[4].isoformat() if row[4] else None,
-            }
-            for row in results
-        ]
+        return normalize_scores(
+            [
+                {
+                    "id": row[0],
+                    "content": row[1],
+                    "tags": list(row[2]) if row[2] else [],
+                    "created_at": row[3].isoformat() if row[3] else None,
+                    "updated_at": row[4].isoformat() if row[4] else None,
+                    "similarity": float(row[5]),
+                }
+                for row in results
+            ],
+            key="similarity",
+        )
 
     async def get_reflection_by_id(self, reflection_id: str) -> dict[str, t.Any] | None:
         """Get a reflection by its ID.
@@ -2370,14 +3513,15 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        result = self.conn.execute(
+        result = await self._executor.fetchone(
             f"""
             SELECT id, content, tags, created_at, updated_at
             FROM {self._table("reflections")}
             WHERE id = ?
             """,
             (reflection_id,),
-        ).fetchone()
+            label="reflections.get",
+        )
 
         if not result:
             return None
@@ -2455,71 +3599,94 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
+        # Buffered access events must land before their rows are deleted
+        await self._flush_access_log()
+
         # DuckDB auto-commits each statement unless explicitly bracketed
         # with ``BEGIN``/``COMMIT``. We rely on per-statement commit so
         # the cascade is incremental — if any single DELETE fails the
         # earlier ones stay applied. That is acceptable for a cascade
         # because the next call to ``delete_conversation`` for the same
         # id is idempotent and re-runs the rest of the cascade.
-        # 1. Free write-heavy instrumentation rows first.
-        self.conn.execute(
-            "DELETE FROM memory_access_log WHERE memory_id = ?",
-            [memory_id],
-        )
-
-        # 2. Direct child: provenance (Phase 1 Feature #4).
-        self.conn.execute(
-            "DELETE FROM memory_provenance WHERE memory_id = ?",
-            [memory_id],
-        )
+        def _cascade(conn: t.Any) -> tuple[list[tuple[t.Any, ...]], int]:
+            # 1. Free write-heavy instrumentation rows first.
+            conn.execute(
+                "DELETE FROM memory_access_log WHERE memory_id = ?",
+                [memory_id],
+            )
 
-        # 3. 2nd-level: relationships reference entities. Look up
-        #    the entity ids first, then remove any relationship
-        #    that points at them. This must happen BEFORE the
-        #    entities are deleted, otherwise we'd orphan rows.
-        entity_rows = self.conn.execute(
-            "SELECT id FROM memory_entities WHERE memory_id = ?",
-            [memory_id],
-        ).fetchall()
-        entity_ids = [row[0] for row in entity_rows]
-        if entity_ids:
-            placeholders = ",".join("?" * len(entity_ids))
-            params = entity_ids + entity_ids
-            self.conn.execute(
-                f"DELETE FROM memory_relationships "
-                f"WHERE from_entity_id IN ({placeholders}) "
-                f"OR to_entity_id IN ({placeholders})",
-                params,
+            # 2. Direct child: provenance (Phase 1 Feature #4).
+            conn.execute(
+                "DELETE FROM memory_provenance WHERE memory_id = ?",
+                [memory_id],
             )
 
-        # 4. Direct child: entities.
-        self.conn.execute(
-            "DELETE FROM memory_entities WHERE memory_id = ?",
-            [memory_id],
-        )
+            # 3. 2nd-level: relationships reference entities. Look up
+            #    the entity ids first, then remove any relationship
+            #    that points at them. This must happen BEFORE the
+            #    entities are deleted, otherwise we'd orphan rows.
+            entity_rows = conn.execute(
+                "SELECT id FROM memory_entities WHERE memory_id = ?",
+                [memory_id],
+            ).fetchall()
+            entity_ids = [row[0] for row in entity_rows]
+            if entity_ids:
+                placeholders = ",".join("?" * len(entity_ids))
+                params = entity_ids + entity_ids
+                conn.execute(
+                    f"DELETE FROM memory_relationships "
+                    f"WHERE from_entity_id IN ({placeholders}) "
+                    f"OR to_entity_id IN ({placeholders})",
+                    params,
+                )
 
-        # 5. Direct child: promotions.
-        self.conn.execute(
-            "DELETE FROM memory_promotions WHERE memory_id = ?",
-            [memory_id],
-        )
+            # 4. Direct child: entities.
+            conn.execute(
+                "DELETE FROM memory_entities WHERE memory_id = ?",
+                [memory_id],
+            )
 
-        # 6. Parent row. Use before/after COUNT to compute the
-        #    return value — DuckDB's Python ``execute()`` does
-        #    not expose a stable ``rowcount`` attribute.
-        before = self.conn.execute(
-            "SELECT COUNT(*) FROM conversations_v2 WHERE id = ?",
-            [memory_id],
-        ).fetchone()[0]
-        self.conn.execute(
-            "DELETE FROM conversations_v2 WHERE id = ?",
-            [memory_id],
+            # 5. Direct child: promotions.
+            conn.execute(
+                "DELETE FROM memory_promotions WHERE memory_id = ?",
+                [memory_id],
+            )
+
+            # Not FK children, but keep the LSH band, full-text and pattern
+            # indexes in step.
+            self._remove_fingerprint_bands("conversation", [memory_id], conn)
+            fulltext = self._fulltext_on(conn)
+            if fulltext is not None:
+                fulltext.remove_documents("conversations", [memory_id])
+            patterns = self._patterns_on(conn)
+            if patterns is not None:
+                patterns.remove_conversations([memory_id])
+
+            # 6. Parent row. Use before/after COUNT to compute the
+            #    return value — DuckDB's Python ``execute()`` does
+            #    not expose a stable ``rowcount`` attribute.
+            existing = conn.execute(
+                "SELECT project FROM conversations_v2 WHERE id = ?",
+                [memory_id],
+            ).fetchall()
+            conn.execute(
+                "DELETE FROM conversations_v2 WHERE id = ?",
+                [memory_id],
+            )
+            after = conn.execute(
+                "SELECT COUNT(*) FROM conversations_v2 WHERE id = ?",
+                [memory_id],
+            ).fetchone()[0]
+            return existing, int(after)
+
+        existing, after = await self._executor.write(
+            _cascade, label="delete_conversation"
         )
-        after = self.conn.execute(
-            "SELECT COUNT(*) FROM conversations_v2 WHERE id = ?",
-            [memory_id],
-        ).fetchone()[0]
-        return int(before) - int(after)
+        if self._quantized_index is not None:
+            self._quantized_index.remove([memory_id])
+        if existing:
+            self._invalidate_cached_searches("conversations", existing[0][0])
+        return len(existing) - after
 
     async def reset_database(self) -> None:
         """Reset the database by dropping and recreating tables."""
@@ -2551,6 +3718,13 @@ class ReflectionDatabaseAdapterOneiric:
             "query_cache_l2",
             "rewritten_queries",
             "content_fingerprints",
+            "fingerprint_lsh_bands",
+            "fts_documents",
+            "fts_postings",
+            "conversation_patterns",
+            "conversation_code_blocks",
+            "pattern_indexed_conversations",
+            "embedding_calibration",
             "memory_subcategories",
             "category_evolution_snapshots",
             "archived_subcategories",
@@ -2581,8 +3755,13 @@ class ReflectionDatabaseAdapterOneiric:
             # ``conversations`` resolves via ``_table``.
             _drop(self._table(name))
 
+        self._calibration = None
+        self._quantized_index = None
+
         # Recreate tables
         self._create_tables()
+        if self._query_cache:
+            self._query_cache.invalidate()
 
     async def health_check(self) -> bool:
         """Check if database is healthy.
@@ -2675,48 +3854,51 @@ class ReflectionDatabaseAdapterOneiric:
         }
 
         # Store insight with or without embedding
-        if embedding:
-            self.conn.execute(
-                f"""
-                INSERT INTO {self._table("reflections")}
-                (id, content, tags, metadata, embedding, created_at, updated_at,
-                 insight_type, usage_count, confidence_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    insight_id,
-                    content,
-                    topics or [],
-                    json.dumps(metadata),
-                    embedding,
-                    now,
-                    now,
-                    insight_type,
-                    0,  # usage_count starts at 0
-                    confidence_score,
-                ),
-            )
-        else:
-            self.conn.execute(
-                f"""
-                INSERT INTO {self._table("reflections")}
-                (id, content, tags, metadata, created_at, updated_at,
-                 insight_type, usage_count, confidence_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    insight_id,
-                    content,
-                    topics or [],
-                    json.dumps(metadata),
-                    now,
-                    now,
-                    insight_type,
-                    0,  # usage_count starts at 0
-                    confidence_score,
-                ),
-            )
+        def _insert(conn: t.Any) -> None:
+            if embedding:
+                conn.execute(
+                    f"""
+                    INSERT INTO {self._table("reflections")}
+                    (id, content, tags, metadata, embedding, created_at, updated_at,
+                     insight_type, usage_count, confidence_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        insight_id,
+                        content,
+                        topics or [],
+                        json.dumps(metadata),
+                        embedding,
+                        now,
+                        now,
+                        insight_type,
+                        0,  # usage_count starts at 0
+                        confidence_score,
+                    ),
+                )
+            else:
+                conn.execute(
+                    f"""
+                    INSERT INTO {self._table("reflections")}
+                    (id, content, tags, metadata, created_at, updated_at,
+                     insight_type, usage_count, confidence_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        insight_id,
+                        content,
+                        topics or [],
+                        json.dumps(metadata),
+                        now,
+                        now,
+                        insight_type,
+                        0,  # usage_count starts at 0
+                        confidence_score,
+                    ),
+                )
+            self._index_fulltext("reflections", insight_id, content, topics, conn)
 
+        await self._executor.write(_insert, label="store_insight", transaction=True)
         return insight_id
 
     async def search_insights(
@@ -2777,13 +3959,14 @@ class ReflectionDatabaseAdapterOneiric:
             return await self._text_search_insights(query, limit, min_quality_score)
 
         # Perform vector similarity search with quality filter
-        # Cast embedding to match query_embedding type for array_cosine_similarity
-        results = self.conn.execute(
+        results = await self._executor.fetchall(
             f"""
             SELECT
                 id, content, tags, metadata, created_at, updated_at,
                 insight_type, usage_count, last_used_at, confidence_score,
-                array_cosine_similarity(embedding::FLOAT[384], ?::FLOAT[384]) as similarity
+                array_cosine_similarity(
+                    embedding, {vector_literal(query_embedding, self.embedding_dim)}
+                ) as similarity
             FROM {self._table("reflections")}
             WHERE
                 embedding IS NOT NULL
@@ -2792,8 +3975,9 @@ class ReflectionDatabaseAdapterOneiric:
             ORDER BY similarity DESC, created_at DESC
             LIMIT ?
             """,
-            (query_embedding, min_quality_score, limit * 2),  # Get extra for filtering
-        ).fetchall()
+            (min_quality_score, limit * 2),  # Get extra for filtering
+            label="insights.vector",
+        )
 
         # Filter by similarity and format results
         formatted_results = []
@@ -2843,7 +4027,7 @@ class ReflectionDatabaseAdapterOneiric:
 
         # Special handling for wildcard - return all insights
         if query in {"*", ""}:
-            results = self.conn.execute(
+            results = await self._executor.fetchall(
                 f"""
                 SELECT
                     id, content, tags, metadata, created_at, updated_at,
@@ -2856,9 +4040,10 @@ class ReflectionDatabaseAdapterOneiric:
                 LIMIT ?
                 """,
                 (min_quality_score, limit),
-            ).fetchall()
+                label="insights.text",
+            )
         else:
-            results = self.conn.execute(
+            results = await self._executor.fetchall(
                 f"""
                 SELECT
                     id, content, tags, metadata, created_at, updated_at,
@@ -2872,7 +4057,8 @@ class ReflectionDatabaseAdapterOneiric:
                 LIMIT ?
                 """,
                 (f"%{query}%", query, min_quality_score, limit),
-            ).fetchall()
+                label="insights.text",
+            )
 
         formatted_results = []
         for row in results:
@@ -2916,9 +4102,9 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        try:
+        def _increment(conn: t.Any) -> bool:
             # Check if insight exists first
-            check_result = self.conn.execute(
+            check_result = conn.execute(
                 f"""
                 SELECT COUNT(*) FROM {self._table("reflections")}
                 WHERE id = ? AND insight_type IS NOT NULL
@@ -2930,7 +4116,7 @@ class ReflectionDatabaseAdapterOneiric:
                 return False
 
             # Atomic increment prevents race condition
-            self.conn.execute(
+            conn.execute(
                 f"""
                 UPDATE {self._table("reflections")}
                 SET
@@ -2942,6 +4128,9 @@ class ReflectionDatabaseAdapterOneiric:
                 (datetime.now(tz=UTC), datetime.now(tz=UTC), insight_id),
             )
             return True
+
+        try:
+            return await self._executor.write(_increment, label="update_insight_usage")
         except (duckdb.Error, OSError):
             return False
 
@@ -2960,49 +4149,59 @@ class ReflectionDatabaseAdapterOneiric:
         if not self._initialized:
             await self.initialize()
 
-        # Total insights count
-        total_result = self.conn.execute(
-            f"""
-            SELECT COUNT(*)
-            FROM {self._table("reflections")}
-            WHERE insight_type IS NOT NULL
-            """
-        ).fetchone()
-        total = total_result[0] if total_result else 0
+        def _statistics(
+            conn: t.Any,
+        ) -> tuple[int, float, float, dict[str, int]]:
+            # Total insights count
+            total_result = conn.execute(
+                f"""
+                SELECT COUNT(*)
+                FROM {self._table("reflections")}
+                WHERE insight_type IS NOT NULL
+                """
+            ).fetchone()
+            total = total_result[0] if total_result else 0
 
-        # Average quality score
-        quality_result = self.conn.execute(
-            f"""
-            SELECT AVG(CAST(json_extract(metadata, '$.quality_score') AS REAL))
-            FROM {self._table("reflections")}
-            WHERE
-                insight_type IS NOT NULL
-                AND json_extract(metadata, '$.quality_score') IS NOT NULL
-            """
-        ).fetchone()
-        avg_quality = quality_result[0] if quality_result and quality_result[0] else 0.0
+            # Average quality score
+            quality_result = conn.execute(
+                f"""
+                SELECT AVG(CAST(json_extract(metadata, '$.quality_score') AS REAL))
+                FROM {self._table("reflections")}
+                WHERE
+                    insight_type IS NOT NULL
+                    AND json_extract(metadata, '$.quality_score') IS NOT NULL
+                """
+            ).fetchone()
+            avg_quality = (
+                quality_result[0] if quality_result and quality_result[0] else 0.0
+            )
 
-        # Average usage count
-        usage_result = self.conn.execute(
-            f"""
-            SELECT AVG(usage_count)
-            FROM {self._table("reflections")}
-            WHERE insight_type IS NOT NULL
-            """
-        ).fetchone()
-        avg_usage = usage_result[0] if usage_result and usage_result[0] else 0.0
+            # Average usage count
+            usage_result = conn.execute(
+                f"""
+                SELECT AVG(usage_count)
+                FROM {self._table("reflections")}
+                WHERE insight_type IS NOT NULL
+                """
+            ).fetchone()
+            avg_usage = usage_result[0] if usage_result and usage_result[0] else 0.0
 
-        # Count by insight type
-        type_results = self.conn.execute(
-            f"""
-            SELECT insight_type, COUNT(*) as count
-            FROM {self._table("reflections")}
-            WHERE insight_type IS NOT NULL
-            GROUP BY insight_type
-            ORDER BY count DESC
-            """
-        ).fetchall()
-        by_type = {row[0]: row[1] for row in type_results}
+            # Count by insight type
+            type_results = conn.execute(
+                f"""
+                SELECT insight_type, COUNT(*) as count
+                FROM {self._table("reflections")}
+                WHERE insight_type IS NOT NULL
+                GROUP BY insight_type
+                ORDER BY count DESC
+                """
+            ).fetchall()
+            by_type = {row[0]: row[1] for row in type_results}
+            return total, avg_quality, avg_usage, by_type
+
+        total, avg_quality, avg_usage, by_type = await self._executor.read(
+            _statistics, label="insights.stats"
+        )
 
         return {
             "total": total,
@@ -3042,50 +4241,62 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-
-        # New memories: rows in conversations_v2 with matching session_id
-        # and timestamp inside the window.
-        new_memories_result = self.conn.execute(
-            """
-            SELECT id, content, category, subcategory, project, namespace,
-                   timestamp, session_id, importance_score
-            FROM conversations_v2
-            WHERE session_id = ?
-              AND timestamp > now() - INTERVAL '1 hour' * ?
-            ORDER BY timestamp DESC
-            """,
-            [session_id, window_hours],
-        )
-        new_memories_columns = [c[0] for c in (new_memories_result.description or [])]
-        new_memories_rows = new_memories_result.fetchall()
-        new_memories: list[dict[str, t.Any]] = [
-            dict(zip(new_memories_columns, row, strict=False))
-            for row in new_memories_rows
-        ]
-        new_memory_ids = [row["id"] for row in new_memories]
-
-        # Reinforced: memories in this session whose id appears in
-        # memory_access_log more than once during the window. We build
-        # a comma-separated IN-list to avoid DuckDB's bind semantics
-        # for ``ANY(?)`` lists.
-        reinforced: list[dict[str, t.Any]] = []
-        if new_memory_ids:
-            placeholders = ",".join(["?"] * len(new_memory_ids))
-            reinforced_rows = self.conn.execute(
-                f"""
-                SELECT memory_id, COUNT(*) AS access_count
-                FROM memory_access_log
-                WHERE memory_id IN ({placeholders})
+        # Reinforcement is counted from memory_access_log
+        await self._flush_access_log()
+
+        def _differential(
+            conn: t.Any,
+        ) -> tuple[list[dict[str, t.Any]], list[dict[str, t.Any]]]:
+            # New memories: rows in conversations_v2 with matching session_id
+            # and timestamp inside the window.
+            new_memories_result = conn.execute(
+                """
+                SELECT id, content, category, subcategory, project, namespace,
+                       timestamp, session_id, importance_score
+                FROM conversations_v2
+                WHERE session_id = ?
                   AND timestamp > now() - INTERVAL '1 hour' * ?
-                GROUP BY memory_id
-                HAVING COUNT(*) > 1
+                ORDER BY timestamp DESC
                 """,
-                [*new_memory_ids, window_hours],
-            ).fetchall()
-            reinforced = [
-                {"memory_id": row[0], "access_count": int(row[1])}
-                for row in reinforced_rows
+                [session_id, window_hours],
+            )
+            new_memories_columns = [
+                c[0] for c in (new_memories_result.description or [])
             ]
+            new_memories_rows = new_memories_result.fetchall()
+            new_memories: list[dict[str, t.Any]] = [
+                dict(zip(new_memories_columns, row, strict=False))
+                for row in new_memories_rows
+            ]
+            new_memory_ids = [row["id"] for row in new_memories]
+
+            # Reinforced: memories in this session whose id appears in
+            # memory_access_log more than once during the window. We build
+            # a comma-separated IN-list to avoid DuckDB's bind semantics
+            # for ``ANY(?)`` lists.
+            reinforced: list[dict[str, t.Any]] = []
+            if new_memory_ids:
+                placeholders = ",".join(["?"] * len(new_memory_ids))
+                reinforced_rows = conn.execute(
+                    f"""
+                    SELECT memory_id, COUNT(*) AS access_count
+                    FROM memory_access_log
+                    WHERE memory_id IN ({placeholders})
+                      AND timestamp > now() - INTERVAL '1 hour' * ?
+                    GROUP BY memory_id
+                    HAVING COUNT(*) > 1
+                    """,
+                    [*new_memory_ids, window_hours],
+                ).fetchall()
+                reinforced = [
+                    {"memory_id": row[0], "access_count": int(row[1])}
+                    for row in reinforced_rows
+                ]
+            return new_memories, reinforced
+
+        new_memories, reinforced = await self._executor.read(
+            _differential, label="session_differential"
+        )
 
         # Contradictions: NLP-based detection is out of scope for v1.
         contradictions: list[dict[str, t.Any]] = []
@@ -3095,7 +4306,7 @@ class ReflectionDatabaseAdapterOneiric:
         return {
             "session_id": session_id,
             "window_hours": window_hours,
-            "new_memory_count": len(new_memory_ids),
+            "new_memory_count": len(new_memories),
             "new_memories": new_memories,
             "reinforced_memories": reinforced,
             "contradictions": contradictions,
@@ -3125,7 +4336,10 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return get_peer_model(self.conn, peer_id=peer_id, project_id=project_id)
+        return await self._executor.read(
+            lambda conn: get_peer_model(conn, peer_id=peer_id, project_id=project_id),
+            label="get_peer_model",
+        )
 
     async def update_peer_model(
         self,
@@ -3156,12 +4370,15 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return upsert_peer_model(
-            self.conn,
-            peer_id=peer_id,
-            project_id=project_id,
-            representation_text=representation_text,
-            model=model,
+        return await self._executor.write(
+            lambda conn: upsert_peer_model(
+                conn,
+                peer_id=peer_id,
+                project_id=project_id,
+                representation_text=representation_text,
+                model=model,
+            ),
+            label="update_peer_model",
         )
 
     async def peer_context(
@@ -3184,12 +4401,15 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return build_peer_context(
-            self.conn,
-            peer_id=peer_id,
-            project_id=project_id,
-            recent_limit=recent_limit,
-            target_peer_id=target_peer_id,
+        return await self._executor.read(
+            lambda conn: build_peer_context(
+                conn,
+                peer_id=peer_id,
+                project_id=project_id,
+                recent_limit=recent_limit,
+                target_peer_id=target_peer_id,
+            ),
+            label="peer_context",
         )
 
     # ========================================================================
@@ -3225,12 +4445,15 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _record_observed_link(
-            self.conn,
-            from_id=from_id,
-            to_id=to_id,
-            link_type=link_type,
-            evidence=evidence,
+        return await self._executor.write(
+            lambda conn: _record_observed_link(
+                conn,
+                from_id=from_id,
+                to_id=to_id,
+                link_type=link_type,
+                evidence=evidence,
+            ),
+            label="record_observed_link",
         )
 
     async def infer_causal_links_for(
@@ -3251,10 +4474,11 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _infer_causal_links_for(
-            self.conn,
-            memory_id=memory_id,
-            lookback_limit=lookback_limit,
+        return await self._executor.write(
+            lambda conn: _infer_causal_links_for(
+                conn, memory_id=memory_id, lookback_limit=lookback_limit
+            ),
+            label="infer_causal_links",
         )
 
     async def causal_chain(
@@ -3273,7 +4497,12 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _walk_causal_chain(self.conn, start_id=start_id, max_depth=max_depth)
+        return await self._executor.read(
+            lambda conn: _walk_causal_chain(
+                conn, start_id=start_id, max_depth=max_depth
+            ),
+            label="causal_chain",
+        )
 
     async def prune_causal_links_older_than(self, *, days: int = 90) -> int:
         """Delete causal links stale for ``days``. Returns count.
@@ -3284,7 +4513,10 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _prune_causal_links_older_than(self.conn, days=days)
+        return await self._executor.write(
+            lambda conn: _prune_causal_links_older_than(conn, days=days),
+            label="prune_causal_links",
+        )
 
     # ========================================================================
     # Skill Distillation (Phase 1.5 Feature #6)
@@ -3317,10 +4549,13 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _distill_skills(
-            self.conn,
-            evidence_threshold=evidence_threshold,
-            model=model,
+        # Skill evidence is counted from memory_access_log
+        await self._flush_access_log()
+        return await self._executor.write(
+            lambda conn: _distill_skills(
+                conn, evidence_threshold=evidence_threshold, model=model
+            ),
+            label="distill_skills",
         )
 
     async def search_distilled_skills(
@@ -3341,7 +4576,10 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _search_distilled_skills(self.conn, query=query, limit=limit)
+        return await self._executor.read(
+            lambda conn: _search_distilled_skills(conn, query=query, limit=limit),
+            label="search_distilled_skills",
+        )
 
     async def reinforce_skill(self, *, skill_id: str) -> bool:
         """Bump ``evidence_count`` + ``last_reinforced_at`` for a skill.
@@ -3352,7 +4590,10 @@ class ReflectionDatabaseAdapterOneiric:
         """
         if not self._initialized:
             await self.initialize()
-        return _reinforce_skill(self.conn, skill_id=skill_id)
+        return await self._executor.write(
+            lambda conn: _reinforce_skill(conn, skill_id=skill_id),
+            label="reinforce_skill",
+        )
 
 
 # Alias for backward compatibility
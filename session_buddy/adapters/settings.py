@@ -45,6 +45,34 @@ class ReflectionAdapterSettings:
         "scalar"  # Currently supports: "scalar" (4x compression), "binary" (future)
     )
     quantization_accuracy_threshold: float = 0.95  # Minimum accuracy to maintain (95%)
+    # Candidates rescored in float32 per requested result (top k * factor)
+    quantization_rerank_factor: int = 4
+
+    # Near-duplicate detection (LSH band index over MinHash signatures).
+    # More rows per band -> fewer candidates; more bands -> higher recall.
+    dedup_lsh_bands: int = 32
+    dedup_lsh_rows: int = 4
+
+    # Fuse BM25 text matches into vector search results (reciprocal rank fusion)
+    enable_hybrid_search: bool = False
+
+    # Serve cached results to paraphrased conversation searches whose query
+    # embedding lies within this cosine distance of a cached query
+    enable_semantic_cache: bool = False
+    semantic_cache_max_distance: float = 0.05
+    semantic_cache_size: int = 512
+    # Fraction of semantic hits searched again to measure false hits
+    semantic_cache_verify_rate: float = 0.05
+
+    # memory_access_log events are buffered and written in batches; when
+    # the buffer is full the oldest events are dropped
+    access_log_buffer_size: int = 10_000
+    access_log_batch_size: int = 256
+    access_log_flush_interval: float = 1.0
+
+    # Worker threads serving queries off the event loop, each with its own
+    # DuckDB cursor; writes go through a single writer thread
+    db_read_workers: int = 4
 
     @classmethod
     def from_settings(cls) -> ReflectionAdapterSettings:
@@ -6,10 +6,13 @@ Provides enhanced search capabilities with faceted filtering, full-text search,
 and intelligent result ranking.
 """
 
-import hashlib
+import asyncio
+import contextlib
 import json
+import logging
 import sqlite3
 import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -18,6 +21,7 @@ import duckdb
 from .reflection_tools import ReflectionDatabase
 from .search_enhanced import EnhancedSearchEngine
 from .session_types import SQLCondition
+from .utils.fulltext import FullTextIndex
 from .utils.search import (
     SearchFacet,
     SearchFilter,
@@ -31,6 +35,14 @@ from .utils.search import (
 
 __all__ = ["AdvancedSearchEngine", "SearchFilter"]
 
+logger = logging.getLogger(__name__)
+
+# Source rows read and written per index batch
+_INDEX_BATCH_SIZE = 1000
+
+# Full-text index source covering search_index rows (keyed by search_index.id)
+_FULLTEXT_SOURCE = "search_index"
+
 
 class AdvancedSearchEngine:
     """Advanced search engine with faceted filtering and full-text search."""
@@ -39,6 +51,9 @@ class AdvancedSearchEngine:
         self.reflection_db = reflection_db
         self.enhanced_search = EnhancedSearchEngine(reflection_db)
         self.index_cache: dict[str, datetime] = {}
+        self._index_lock = asyncio.Lock()
+        self._index_task: asyncio.Task[None] | None = None
+        self._tables_ready_for: Any = None
 
         # Search configuration
         self.facet_configs = {
@@ -377,13 +392,12 @@ class AdvancedSearchEngine:
             }
 
     async def _ensure_search_index(self) -> None:
-        """Ensure search index is up to date."""
-        # Check when index was last updated
-        last_update = await self._get_last_index_update()
+        """Bring the search index up to date before a search.
 
-        # Update if older than 1 hour or if never updated
-        if not last_update or (datetime.now(UTC) - last_update).total_seconds() > 3600:
-            await self._rebuild_search_index()
+        Indexing is incremental, so this costs one probe query per source
+        when nothing has changed since the last run.
+        """
+        await self.update_search_index()
 
     async def _get_last_index_update(self) -> datetime | None:
         """Get timestamp of last index update."""
@@ -412,28 +426,94 @@ class AdvancedSearchEngine:
             # Table doesn't exist yet, will be created during index rebuild
             return None
 
+    async def update_search_index(self) -> dict[str, int]:
+        """Index rows inserted, updated or deleted since the last run.
+
+        Each source table is probed for its row count, newest timestamp and
+        an id checksum. Sources whose probe matches the stored watermark are
+        skipped. Otherwise only rows newer than the watermark or missing from
+        the index are re-indexed, and index rows whose source row is gone are
+        deleted. Facets are recomputed only when something changed.
+
+        Returns:
+            Counts of ``indexed`` and ``deleted`` index rows
+        """
+        if not self.reflection_db.conn:
+            return {"indexed": 0, "deleted": 0}
+
+        async with self._index_lock:
+            self._ensure_advanced_search_tables()
+            indexed, deleted = await self._index_conversations()
+            refl_indexed, refl_deleted = await self._index_reflections()
+            indexed += refl_indexed
+            deleted += refl_deleted
+
+            if indexed or deleted:
+                await self._update_search_facets()
+                logger.debug(
+                    "Search index updated: %d indexed, %d deleted", indexed, deleted
+                )
+
+        return {"indexed": indexed, "deleted": deleted}
+
     async def _rebuild_search_index(self) -> None:
         """Rebuild the search index from conversations and reflections."""
         # Ensure database tables exist before indexing
         if self.reflection_db.conn:
             self.reflection_db._create_tables()  # ty: ignore[unresolved-attribute]
             self._ensure_advanced_search_tables()
+            # Dropping the watermarks makes the next pass re-index every row
+            self.reflection_db.conn.execute("DELETE FROM search_index")
+            self.reflection_db.conn.execute("DELETE FROM search_index_state")
+            FullTextIndex(self.reflection_db.conn).clear(_FULLTEXT_SOURCE)
 
-        # Index conversations
-        await self._index_conversations()
+        async with self._index_lock:
+            # Index conversations
+            await self._index_conversations()
 
-        # Index reflections
-        await self._index_reflections()
+            # Index reflections
+            await self._index_reflections()
 
-        # Update facets
-        await self._update_search_facets()
+            # Update facets
+            await self._update_search_facets()
+
+    def start_background_indexing(self, interval_seconds: float = 60.0) -> None:
+        """Keep the search index current from a background task.
+
+        Args:
+            interval_seconds: Delay between incremental index passes
+        """
+        if self._index_task and not self._index_task.done():
+            return
+        self._index_task = asyncio.create_task(
+            self._background_index_loop(interval_seconds),
+            name="advanced-search-indexer",
+        )
+
+    async def stop_background_indexing(self) -> None:
+        """Stop the background indexing task if it is running."""
+        if not self._index_task:
+            return
+        self._index_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._index_task
+        self._index_task = None
+
+    async def _background_index_loop(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.update_search_index()
+            except duckdb.Error:
+                logger.exception("Background search indexing failed")
+            await asyncio.sleep(interval_seconds)
 
     def _ensure_advanced_search_tables(self) -> None:
         """Create advanced search tables if they do not already exist."""
-        if not self.reflection_db.conn:
+        conn = self.reflection_db.conn
+        if not conn or conn is self._tables_ready_for:
             return
 
-        self.reflection_db.conn.execute(
+        conn.execute(
             """
             CREATE TABLE IF NOT EXISTS search_index (
                 id TEXT PRIMARY KEY,
@@ -445,7 +525,7 @@ class AdvancedSearchEngine:
             )
             """
         )
-        self.reflection_db.conn.execute(
+        conn.execute(
             """
             CREATE TABLE IF NOT EXISTS search_facets (
                 id TEXT PRIMARY KEY,
@@ -457,45 +537,60 @@ class AdvancedSearchEngine:
             )
             """
         )
-        self.reflection_db.conn.commit()
-
-    async def _index_conversations(self) -> None:
-        """Index all conversations for search."""
-        if not self.reflection_db.conn:
-            return
+        # Per-source watermark: the probe values seen by the last index pass
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_index_state (
+                content_type TEXT PRIMARY KEY,
+                row_count BIGINT NOT NULL,
+                watermark TIMESTAMP,
+                id_checksum UBIGINT,
+                indexed_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        FullTextIndex(conn).ensure_schema()
+        conn.commit()
+        self._tables_ready_for = conn
 
-        conversations = self._fetch_conversations_for_indexing()
-        for row in conversations:
-            await self._process_conversation_for_index(row)
+    def _source_table(self, name: str) -> str:
+        """Resolve a source table name through the adapter when it has one."""
+        resolve = getattr(self.reflection_db, "_table", None)
+        return resolve(name) if callable(resolve) else name
 
-        self._commit_conversation_index()
+    async def _index_conversations(self) -> tuple[int, int]:
+        """Index conversations changed since the last run.
 
-    def _fetch_conversations_for_indexing(self) -> list[tuple[Any, ...]]:
-        """Fetch conversations from database for indexing."""
+        Returns:
+            Tuple of (rows indexed, rows deleted)
+        """
         if not self.reflection_db.conn:
-            return []
-
-        sql = "SELECT id, content, project, timestamp, metadata FROM conversations"
-        return self.reflection_db.conn.execute(sql).fetchall()
+            return 0, 0
+
+        return self._index_source(
+            content_type="conversation",
+            id_prefix="conv_",
+            table=self._source_table("conversations"),
+            columns="id, content, project, timestamp, metadata",
+            build=self._build_conversation_index_row,
+        )
 
-    async def _process_conversation_for_index(self, row: tuple[Any, ...]) -> None:
-        """Process a single conversation row for search indexing."""
-        conv_id, content, project, timestamp, metadata_json = row
+    def _build_conversation_index_row(
+        self, row: tuple[Any, ...]
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Build (content_id, indexed_content, search_metadata) for a conversation."""
+        conv_id, content, project, timestamp, _metadata_json = row
 
-        self._parse_conversation_metadata(metadata_json)
-        indexed_content = self._build_indexed_content(content, project)
+        tech_terms = extract_technical_terms(content)
+        indexed_content = self._build_indexed_content(content, project, tech_terms)
         search_metadata = self._build_conversation_search_metadata(
             project,
             timestamp,
             content,
             indexed_content,
+            tech_terms,
         )
-
-        self._insert_conversation_into_search_index(
-            conv_id,
-            indexed_content,
-            search_metadata,
-        )
+        return conv_id, indexed_content, search_metadata
 
     def _parse_conversation_metadata(self, metadata_json: str | None) -> dict[str, Any]:
         """Parse conversation metadata JSON safely."""
@@ -506,14 +601,20 @@ class AdvancedSearchEngine:
         except (json.JSONDecodeError, ValueError):
             return {}
 
-    def _build_indexed_content(self, content: str, project: str | None) -> str:
+    def _build_indexed_content(
+        self,
+        content: str,
+        project: str | None,
+        tech_terms: list[str] | None = None,
+    ) -> str:
         """Build indexed content with project and technical terms."""
         indexed_content = content
 
         if project:
             indexed_content += f" project:{project}"
 
-        tech_terms = extract_technical_terms(content)
+        if tech_terms is None:
+            tech_terms = extract_technical_terms(content)
         if tech_terms:
             indexed_content += " " + " ".join(tech_terms)
 
@@ -525,9 +626,11 @@ class AdvancedSearchEngine:
         timestamp: datetime | None,
         content: str,
         indexed_content: str,
+        tech_terms: list[str] | None = None,
     ) -> dict[str, Any]:
         """Build search metadata for conversation."""
-        tech_terms = extract_technical_terms(content)
+        if tech_terms is None:
+            tech_terms = extract_technical_terms(content)
         return {
             "project": project,
             "timestamp": timestamp.isoformat() if timestamp else None,
@@ -545,97 +648,209 @@ class AdvancedSearchEngine:
         if not self.reflection_db.conn:
             return
 
-        # Idempotent schema guard: tests / cold indexes may not have the
-        # advanced-search tables created yet. _ensure_advanced_search_tables
-        # is a no-op when the tables already exist.
         self._ensure_advanced_search_tables()
-
-        try:
-            self.reflection_db.conn.execute(
-                """
-                INSERT INTO search_index
-                (id, content_type, content_id, indexed_content, search_metadata, last_indexed)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (id) DO UPDATE SET
-                content_type = EXCLUDED.content_type,
-                content_id = EXCLUDED.content_id,
-                indexed_content = EXCLUDED.indexed_content,
-                search_metadata = EXCLUDED.search_metadata,
-                last_indexed = EXCLUDED.last_indexed
-                """,
-                [
-                    f"conv_{conv_id}",
-                    "conversation",
-                    conv_id,
-                    indexed_content,
-                    json.dumps(search_metadata),
-                    datetime.now(UTC),
-                ],
-            )
-        except (sqlite3.DatabaseError, sqlite3.IntegrityError, TypeError, ValueError):
-            # Table doesn't exist yet, will be created during index rebuild
-            return
+        self._upsert_index_rows(
+            "conversation",
+            "conv_",
+            [(conv_id, indexed_content, search_metadata)],
+        )
 
     def _commit_conversation_index(self) -> None:
         """Commit the conversation indexing transaction."""
         if self.reflection_db.conn:
             self.reflection_db.conn.commit()
 
-    async def _index_reflections(self) -> None:
-        """Index all reflections for search."""
+    async def _index_reflections(self) -> tuple[int, int]:
+        """Index reflections changed since the last run.
+
+        Returns:
+            Tuple of (rows indexed, rows deleted)
+        """
         if not self.reflection_db.conn:
-            return
+            return 0, 0
+
+        return self._index_source(
+            content_type="reflection",
+            id_prefix="refl_",
+            table=self._source_table("reflections"),
+            columns="id, content, tags, timestamp, metadata",
+            build=self._build_reflection_index_row,
+        )
 
-        sql = "SELECT id, content, tags, timestamp, metadata FROM reflections"
-        results = self.reflection_db.conn.execute(sql).fetchall()
+    def _build_reflection_index_row(
+        self, row: tuple[Any, ...]
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Build (content_id, indexed_content, search_metadata) for a reflection."""
+        refl_id, content, tags, timestamp, metadata_json = row
 
-        for row in results:
-            refl_id, content, tags, timestamp, metadata_json = row
+        # Extract metadata
+        metadata: dict[str, Any] = json.loads(metadata_json) if metadata_json else {}
 
-            # Extract metadata
-            metadata: dict[str, Any] = (
-                json.loads(metadata_json) if metadata_json else {}
-            )
+        # Create indexed content
+        indexed_content = content
+        if tags:
+            indexed_content += " " + " ".join(f"tag:{tag}" for tag in tags)
 
-            # Create indexed content
-            indexed_content = content
-            if tags:
-                indexed_content += " " + " ".join(f"tag:{tag}" for tag in tags)
+        # Create search metadata
+        base_metadata: dict[str, Any] = {
+            "tags": tags or [],
+            "timestamp": timestamp.isoformat() if timestamp else None,
+            "content_length": len(content),
+        }
+        return refl_id, indexed_content, base_metadata | metadata
 
-            # Create search metadata
-            base_metadata: dict[str, Any] = {
-                "tags": tags or [],
-                "timestamp": timestamp.isoformat() if timestamp else None,
-                "content_length": len(content),
-            }
-            search_metadata: dict[str, Any] = base_metadata | metadata
+    def _index_source(
+        self,
+        content_type: str,
+        id_prefix: str,
+        table: str,
+        columns: str,
+        build: Callable[[tuple[Any, ...]], tuple[str, str, dict[str, Any]]],
+    ) -> tuple[int, int]:
+        """Incrementally index one source table against its watermark.
+
+        Args:
+            content_type: ``content_type`` value of this source's index rows
+            id_prefix: Prefix joining source ids to index row ids
+            table: Source table name
+            columns: Source columns passed to ``build``, id first
+            build: Maps a source row to (content_id, indexed_content, metadata)
+
+        Returns:
+            Tuple of (rows indexed, rows deleted)
+        """
+        conn = self.reflection_db.conn
+        if not conn:
+            return 0, 0
 
-            # Insert or update search index
-            if self.reflection_db.conn:
-                self.reflection_db.conn.execute(
-                    """
-                    INSERT INTO search_index
-                    (id, content_type, content_id, indexed_content, search_metadata, last_indexed)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT (id) DO UPDATE SET
-                    content_type = EXCLUDED.content_type,
-                    content_id = EXCLUDED.content_id,
-                    indexed_content = EXCLUDED.indexed_content,
-                    search_metadata = EXCLUDED.search_metadata,
-                    last_indexed = EXCLUDED.last_indexed
-                    """,
-                    [
-                        f"refl_{refl_id}",
-                        "reflection",
-                        refl_id,
-                        indexed_content,
-                        json.dumps(search_metadata),
-                        datetime.now(UTC),
-                    ],
+        try:
+            probe = conn.execute(
+                f"SELECT COUNT(*), MAX(timestamp), BIT_XOR(HASH(id)) FROM {table}"
+            ).fetchone()
+        except duckdb.CatalogException:
+            # Source table not created yet; nothing to index
+            return 0, 0
+
+        state = conn.execute(
+            """
+            SELECT row_count, watermark, id_checksum
+            FROM search_index_state WHERE content_type = ?
+            """,
+            [content_type],
+        ).fetchone()
+        if probe is None or (state is not None and tuple(state) == tuple(probe)):
+            return 0, 0
+
+        row_count, newest, id_checksum = probe
+        watermark = state[1] if state else None
+
+        deleted_ids = [
+            row[0]
+            for row in conn.execute(
+                f"""
+                DELETE FROM search_index si
+                WHERE si.content_type = ?
+                  AND NOT EXISTS (SELECT 1 FROM {table} s WHERE s.id = si.content_id)
+                RETURNING si.id
+                """,
+                [content_type],
+            ).fetchall()
+        ]
+        FullTextIndex(conn).remove_documents(_FULLTEXT_SOURCE, deleted_ids)
+        deleted = len(deleted_ids)
+
+        # Rows newer than the watermark may be updates; rows missing from the
+        # index catch inserts whose timestamp is at or before the watermark.
+        # Keyset paging keeps each batch's reads separate from its writes.
+        changed_sql = f"""
+            SELECT {columns} FROM {table} s
+            WHERE s.id > ?
+              AND (
+                s.timestamp > ?
+                OR NOT EXISTS (
+                    SELECT 1 FROM search_index si WHERE si.id = ? || s.id
                 )
+              )
+            ORDER BY s.id
+            LIMIT ?
+        """
+        indexed = 0
+        cursor = ""
+        while True:
+            rows = conn.execute(
+                changed_sql, [cursor, watermark, id_prefix, _INDEX_BATCH_SIZE]
+            ).fetchall()
+            if not rows:
+                break
+            self._upsert_index_rows(
+                content_type, id_prefix, [build(row) for row in rows]
+            )
+            indexed += len(rows)
+            cursor = rows[-1][0]
+            if len(rows) < _INDEX_BATCH_SIZE:
+                break
 
-        if self.reflection_db.conn:
-            self.reflection_db.conn.commit()
+        conn.execute(
+            """
+            INSERT INTO search_index_state
+            (content_type, row_count, watermark, id_checksum, indexed_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (content_type) DO UPDATE SET
+            row_count = EXCLUDED.row_count,
+            watermark = EXCLUDED.watermark,
+            id_checksum = EXCLUDED.id_checksum,
+            indexed_at = EXCLUDED.indexed_at
+            """,
+            [content_type, row_count, newest, id_checksum, datetime.now(UTC)],
+        )
+        conn.commit()
+        return indexed, deleted
+
+    def _upsert_index_rows(
+        self,
+        content_type: str,
+        id_prefix: str,
+        rows: list[tuple[str, str, dict[str, Any]]],
+    ) -> None:
+        """Write a batch of (content_id, indexed_content, metadata) in one statement."""
+        if not self.reflection_db.conn or not rows:
+            return
+
+        content_ids = [str(content_id) for content_id, _, _ in rows]
+        self.reflection_db.conn.execute(
+            """
+            INSERT INTO search_index
+            (id, content_type, content_id, indexed_content, search_metadata, last_indexed)
+            SELECT ? || u.content_id, ?, u.content_id, u.indexed_content,
+                   u.search_metadata, ?
+            FROM (
+                SELECT unnest(?::VARCHAR[]) AS content_id,
+                       unnest(?::VARCHAR[]) AS indexed_content,
+                       unnest(?::VARCHAR[]) AS search_metadata
+            ) u
+            ON CONFLICT (id) DO UPDATE SET
+            content_type = EXCLUDED.content_type,
+            content_id = EXCLUDED.content_id,
+            indexed_content = EXCLUDED.indexed_content,
+            search_metadata = EXCLUDED.search_metadata,
+            last_indexed = EXCLUDED.last_indexed
+            """,
+            [
+                id_prefix,
+                content_type,
+                datetime.now(UTC),
+                content_ids,
+                [indexed_content for _, indexed_content, _ in rows],
+                [json.dumps(metadata) for _, _, metadata in rows],
+            ],
+        )
+        FullTextIndex(self.reflection_db.conn).index_documents(
+            _FULLTEXT_SOURCE,
+            (
+                (f"{id_prefix}{content_id}", indexed_content)
+                for content_id, indexed_content, _ in rows
+            ),
+        )
 
     def _get_facet_queries(self) -> dict[str, str]:
         """Get facet query definitions."""
@@ -670,45 +885,28 @@ class AdvancedSearchEngine:
             """,
         }
 
-    def _should_process_facet_value(self, facet_value: Any) -> bool:
-        """Check if facet value should be processed."""
-        return isinstance(facet_value, str) and bool(facet_value)
-
-    def _insert_facet_value(self, facet_name: str, facet_value: str) -> None:
-        """Insert a single facet value into the database."""
+    def _process_facet_query(self, facet_name: str, sql: str) -> None:
+        """Store the distinct values of one facet query in a single statement."""
         if not self.reflection_db.conn:
             return
 
-        # Idempotent schema guard: tests / cold indexes may not have the
-        # advanced-search tables created yet.
         self._ensure_advanced_search_tables()
 
-        facet_id = hashlib.md5(
-            f"{facet_name}_{facet_value}".encode(),
-            usedforsecurity=False,
-        ).hexdigest()
-
         try:
             self.reflection_db.conn.execute(
-                """
+                f"""
                 INSERT INTO search_facets
                 (id, content_type, content_id, facet_name, facet_value, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (id) DO UPDATE SET
-                content_type = EXCLUDED.content_type,
-                content_id = EXCLUDED.content_id,
-                facet_name = EXCLUDED.facet_name,
-                facet_value = EXCLUDED.facet_value,
-                created_at = EXCLUDED.created_at
+                SELECT md5(? || '_' || f.facet_value), 'search_facet',
+                       ? || '_' || f.facet_value, ?, f.facet_value, ?
+                FROM (
+                    SELECT DISTINCT CAST(facet_value AS VARCHAR) AS facet_value
+                    FROM ({sql})
+                ) f
+                WHERE f.facet_value IS NOT NULL AND f.facet_value <> ''
+                ON CONFLICT (id) DO NOTHING
                 """,
-                [
-                    facet_id,
-                    "search_facet",
-                    f"{facet_name}_{facet_value}",
-                    facet_name,
-                    facet_value,
-                    datetime.now(UTC).isoformat(),
-                ],
+                [facet_name, facet_name, facet_name, datetime.now(UTC).isoformat()],
             )
         except (
             sqlite3.DatabaseError,
@@ -720,21 +918,6 @@ class AdvancedSearchEngine:
             # Table doesn't exist yet, will be created during index rebuild
             return
 
-    def _process_facet_query(self, facet_name: str, sql: str) -> None:
-        """Process a single facet query."""
-        if not self.reflection_db.conn:
-            return
-
-        try:
-            results = self.reflection_db.conn.execute(sql).fetchall()
-
-            for facet_value, _count in results:
-                if self._should_process_facet_value(facet_value):
-                    self._insert_facet_value(facet_name, facet_value)
-        except (sqlite3.DatabaseError, sqlite3.IntegrityError, TypeError, ValueError):
-            # Table doesn't exist yet, will be created during index rebuild
-            return
-
     async def _update_search_facets(self) -> None:
         """Update search facets based on indexed content."""
         if not self.reflection_db.conn:
@@ -899,13 +1082,18 @@ class AdvancedSearchEngine:
         limit: int,
         offset: int,
     ) -> SQLCondition:
-        """Build complete SQL query for search."""
-        sql = """
-            SELECT content_id, content_type, indexed_content, search_metadata, last_indexed
-            FROM search_index
-            WHERE indexed_content LIKE ?
+        """Build complete SQL query for search.
+
+        Text matching and relevance come from the BM25 full-text index; a
+        query without indexable terms matches every row with score 0.
         """
-        params: list[str | datetime] = [f"%{query}%"]
+        sql, params = self._build_text_match_sql(
+            """
+            SELECT content_id, content_type, indexed_content, search_metadata,
+                   last_indexed, score
+            """,
+            query,
+        )
 
         result = self._add_content_type_filter(sql, params, content_type)
         sql, params = result.condition, result.params
@@ -922,6 +1110,35 @@ class AdvancedSearchEngine:
 
         return SQLCondition(condition=sql, params=params)
 
+    def _build_text_match_sql(
+        self, select: str, query: str, from_clause: str = "search_index si"
+    ) -> tuple[str, list[str | datetime]]:
+        """Select from search_index joined with the BM25 scores for ``query``.
+
+        Returns SQL ending in a WHERE clause that later ``AND`` conditions
+        can extend, plus its parameters.
+        """
+        match = (
+            FullTextIndex(self.reflection_db.conn).match(_FULLTEXT_SOURCE, query)
+            if self.reflection_db.conn
+            else None
+        )
+        if match is None:
+            sql = f"""
+                {select}
+                FROM {from_clause}, (SELECT 0.0 AS score)
+                WHERE TRUE
+            """
+            return sql, []
+
+        sql = f"""
+            {select}
+            FROM {from_clause}
+            JOIN ({match.sql}) m ON m.doc_id = si.id
+            WHERE TRUE
+        """
+        return sql, list(match.params)
+
     def _get_sql_field(self, field: str) -> str:
         """Map filter field to SQL column expression."""
         field_mappings = {
@@ -1166,8 +1383,8 @@ class AdvancedSearchEngine:
             sql += " ORDER BY last_indexed DESC"
         elif sort_by == "project":
             sql += " ORDER BY JSON_EXTRACT_STRING(search_metadata, '$.project')"
-        else:  # relevance - simple for now
-            sql += " ORDER BY LENGTH(indexed_content) DESC"  # Longer content = more relevant
+        else:  # relevance: BM25 score, newest first among ties
+            sql += " ORDER BY score DESC, last_indexed DESC"
         return sql
 
     def _prepare_sql_params(self, params: list[str | datetime]) -> list[str]:
@@ -1183,6 +1400,8 @@ class AdvancedSearchEngine:
     ) -> list[SearchResult]:
         """Convert SQL results to SearchResult objects."""
         search_results = []
+        # Scale BM25 scores so the best match is 1.0; unranked rows keep 0.8
+        best = max((float(row[5]) for row in results if len(row) > 5), default=0.0)
         for row in results:
             (
                 content_id,
@@ -1190,7 +1409,8 @@ class AdvancedSearchEngine:
                 indexed_content,
                 search_metadata_json,
                 last_indexed,
-            ) = row
+            ) = row[:5]
+            score = float(row[5]) / best if best > 0 and len(row) > 5 else 0.8
             metadata: dict[str, Any] = (
                 json.loads(search_metadata_json) if search_metadata_json else {}
             )
@@ -1201,7 +1421,7 @@ class AdvancedSearchEngine:
                     content_type=content_type or "unknown",
                     title=f"{(content_type or 'unknown').title()} from {metadata.get('project', 'Unknown')}",
                     content=truncate_content(indexed_content),
-                    score=0.8,  # Simple scoring for now
+                    score=score,
                     project=metadata.get("project"),
                     timestamp=ensure_timezone(last_indexed),
                     metadata=metadata,
@@ -1252,11 +1472,13 @@ class AdvancedSearchEngine:
             if facet_name in self.facet_configs:
                 facet_config = self.facet_configs[facet_name]
 
-                sql = """
-                    SELECT facet_value, COUNT(*) as count
-                    FROM search_facets sf
-                    JOIN search_index si ON sf.content_id = si.id
-                    WHERE sf.facet_name = ? AND si.indexed_content LIKE ?
+                sql, params = self._build_text_match_sql(
+                    "SELECT facet_value, COUNT(*) as count",
+                    query,
+                    "search_facets sf JOIN search_index si ON sf.content_id = si.id",
+                )
+                sql += """
+                    AND sf.facet_name = ?
                     GROUP BY facet_value
                     ORDER BY count DESC
                     LIMIT ?
@@ -1268,7 +1490,7 @@ class AdvancedSearchEngine:
                 try:
                     results = self.reflection_db.conn.execute(
                         sql,
-                        [facet_name, f"%{query}%", facet_config["size"]],
+                        [*params, facet_name, facet_config["size"]],
                     ).fetchall()
 
                     facets[facet_name] = SearchFacet(
@@ -5,13 +5,22 @@ to eliminate expensive vector searches for repeated queries.
 
 Cache Architecture:
     L1 (Memory): Fast LRU cache with ~1ms access time
-    L2 (DuckDB): Persistent cache with ~10ms access time
+    L2 (DuckDB): Persistent cache with ~10ms access time, written in batches
+    Semantic (optional): Nearest-neighbour lookup over recent query
+        embeddings, so paraphrased queries reuse cached results
+
+Invalidation:
+    Writers bump a generation counter for the table (and project) they
+    touched. Keys built with ``scoped_cache_key()`` embed the current
+    generations, so a write makes every affected key unreachable in O(1)
+    without scanning either tier.
 
 Usage:
     >>> cache = QueryCacheManager(l1_max_size=1000, l2_ttl_days=7)
     >>> await cache.initialize(conn=duckdb_conn)
-    >>> cache_key = cache.compute_cache_key("search query", project="myproject", limit=10)
-    >>> cache.put(cache_key, ["id1", "id2"], "search query")
+    >>> cache_key = cache.scoped_cache_key("conversations", "search query", project="myproject")
+    >>> cache.put(cache_key, ["id1", "id2"], "search query", scores=[0.9, 0.7])
+    >>> cache.bump_generation("conversations", project="myproject")  # on write
     >>> result = cache.get(cache_key)
     >>> stats = cache.get_stats()
 """
@@ -21,6 +30,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import random
 import threading
 import time
 from collections import OrderedDict
@@ -29,9 +39,16 @@ from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
+
 if TYPE_CHECKING:
     import duckdb
 
+# Generation scope shared by queries that are not filtered to one project
+_ALL_PROJECTS = "*"
+# Generation scope bumped by writes whose project is unknown
+_TABLE_EPOCH = "#epoch"
+
 
 @dataclass
 class QueryCacheEntry:
@@ -45,6 +62,7 @@ class QueryCacheEntry:
     created_at: float = field(default_factory=time.time)
     last_accessed: float = field(default_factory=time.time)
     ttl_seconds: int = 604800  # 7 days default
+    scores: list[float] = field(default_factory=list)
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -56,6 +74,183 @@ class QueryCacheEntry:
         self.hit_count += 1
 
 
+class SemanticQueryCache:
+    """Nearest-neighbour tier serving cached results to paraphrased queries.
+
+    Keeps the embeddings of recently cached queries in a fixed-size matrix
+    (oldest slot overwritten first). A lookup returns the entry of the most
+    similar cached query within ``max_distance`` cosine distance, considering
+    only queries cached under the same scope. Scopes come from
+    QueryCacheManager.semantic_scope() and embed data generations, so a write
+    retires neighbours the same way it retires exact keys.
+
+    Instrumentation:
+        - lookups / hits / hit_rate
+        - verified_hits / false_hits: a sample of hits (``verify_rate``) is
+          re-run by the caller and reported through record_verification()
+    """
+
+    def __init__(
+        self,
+        dim: int = 384,
+        max_entries: int = 512,
+        max_distance: float = 0.05,
+        verify_rate: float = 0.05,
+    ) -> None:
+        """Initialize the semantic tier.
+
+        Args:
+            dim: Embedding dimension
+            max_entries: Cached query embeddings kept in memory
+            max_distance: Largest cosine distance still served as a hit
+            verify_rate: Fraction of hits the caller should verify
+        """
+        self.dim = dim
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.verify_rate = verify_rate
+        self._matrix = np.zeros((max_entries, dim), dtype=np.float32)
+        self._entries: list[QueryCacheEntry | None] = [None] * max_entries
+        self._scopes: list[str | None] = [None] * max_entries
+        self._scope_rows: dict[str, set[int]] = {}
+        self._next_row = 0
+        self._lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            "lookups": 0,
+            "hits": 0,
+            "verified_hits": 0,
+            "false_hits": 0,
+        }
+
+    @staticmethod
+    def _unit(embedding: list[float]) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def lookup(self, scope: str, embedding: list[float]) -> QueryCacheEntry | None:
+        """Return the entry of the closest cached query in ``scope``.
+
+        Args:
+            scope: Scope from QueryCacheManager.semantic_scope()
+            embedding: Embedding of the new query
+
+        Returns:
+            Closest unexpired entry within ``max_distance``, None otherwise
+        """
+        query = self._unit(embedding)
+        with self._lock:
+            self._stats["lookups"] += 1
+            rows = self._scope_rows.get(scope)
+            if query is None or query.shape[0] != self.dim or not rows:
+                return None
+
+            candidates = np.fromiter(rows, dtype=np.int64, count=len(rows))
+            similarities = self._matrix[candidates] @ query
+            best = int(np.argmax(similarities))
+            if 1.0 - float(similarities[best]) > self.max_distance:
+                return None
+
+            entry = self._entries[int(candidates[best])]
+            if entry is None or entry.is_expired():
+                return None
+
+            entry.touch()
+            self._stats["hits"] += 1
+            return entry
+
+    def add(self, scope: str, embedding: list[float], entry: QueryCacheEntry) -> None:
+        """Remember ``entry`` under the embedding of the query that produced it.
+
+        Args:
+            scope: Scope from QueryCacheManager.semantic_scope()
+            embedding: Embedding of the cached query
+            entry: Exact-tier entry holding the ranked results
+        """
+        vector = self._unit(embedding)
+        if vector is None or vector.shape[0] != self.dim:
+            return
+
+        with self._lock:
+            row = self._next_row
+            self._next_row = (row + 1) % self.max_entries
+            self._release_row(row)
+            self._matrix[row] = vector
+            self._entries[row] = entry
+            self._scopes[row] = scope
+            self._scope_rows.setdefault(scope, set()).add(row)
+
+    def _release_row(self, row: int) -> None:
+        scope = self._scopes[row]
+        if scope is not None:
+            rows = self._scope_rows[scope]
+            rows.discard(row)
+            if not rows:
+                del self._scope_rows[scope]
+        self._entries[row] = None
+        self._scopes[row] = None
+
+    def discard(self, cache_key: str) -> None:
+        """Forget every neighbour pointing at an invalidated exact-tier entry."""
+        with self._lock:
+            for row, entry in enumerate(self._entries):
+                if entry is not None and entry.cache_key == cache_key:
+                    self._release_row(row)
+
+    def clear(self) -> None:
+        """Forget every cached neighbour."""
+        with self._lock:
+            for row in range(self.max_entries):
+                self._release_row(row)
+            self._next_row = 0
+
+    def should_verify(self) -> bool:
+        """Whether the caller should re-run this hit to measure false hits."""
+        return self.verify_rate > 0 and random.random() < self.verify_rate  # nosec B311
+
+    def record_verification(self, cached_ids: list[str], fresh_ids: list[str]) -> bool:
+        """Record the outcome of a re-run semantic hit.
+
+        A hit counts as false when fewer than half of the fresh results are
+        among the results it served.
+
+        Args:
+            cached_ids: Result IDs served from the semantic tier
+            fresh_ids: Result IDs of the same query searched for real
+
+        Returns:
+            True if the hit was false
+        """
+        overlap = len(set(cached_ids) & set(fresh_ids))
+        false_hit = overlap * 2 < len(fresh_ids)
+        with self._lock:
+            self._stats["verified_hits"] += 1
+            if false_hit:
+                self._stats["false_hits"] += 1
+        return false_hit
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get semantic tier statistics.
+
+        Returns:
+            Dictionary with lookups, hits, hit_rate, verified_hits,
+            false_hits, false_hit_rate and size
+        """
+        with self._lock:
+            stats: dict[str, int | float] = dict(self._stats)
+            stats["size"] = sum(len(rows) for rows in self._scope_rows.values())
+
+        stats["hit_rate"] = (
+            stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        )
+        stats["false_hit_rate"] = (
+            stats["false_hits"] / stats["verified_hits"]
+            if stats["verified_hits"]
+            else 0.0
+        )
+        return stats
+
+
 class QueryCacheManager:
     """Two-tier query cache with L1 memory and L2 DuckDB storage.
 
@@ -68,6 +263,11 @@ class QueryCacheManager:
         - DuckDB table for persistence
         - Survives process restarts
         - Slower access (~10ms latency)
+        - Writes are queued and upserted in batches, off the put() path
+
+    Invalidation:
+        - Per-table/per-project generation counters, persisted alongside L2
+        - Embedded in keys from scoped_cache_key(), bumped by writers
 
     Thread Safety:
         - Thread-safe for concurrent access
@@ -78,21 +278,36 @@ class QueryCacheManager:
         self,
         l1_max_size: int = 1000,
         l2_ttl_days: int = 7,
+        l2_batch_size: int = 64,
+        l2_flush_interval: float = 0.5,
+        semantic_cache: SemanticQueryCache | None = None,
     ) -> None:
         """Initialize query cache manager.
 
         Args:
             l1_max_size: Maximum number of entries in L1 cache (LRU eviction)
             l2_ttl_days: Default TTL for L2 cache entries in days
+            l2_batch_size: Pending L2 writes that trigger an immediate flush
+            l2_flush_interval: Seconds a pending L2 write waits for its batch
+            semantic_cache: Optional nearest-neighbour tier for paraphrases
         """
         self.l1_max_size = l1_max_size
         self.l2_ttl_seconds = l2_ttl_days * 86400
+        self.l2_batch_size = l2_batch_size
+        self.l2_flush_interval = l2_flush_interval
+        self.semantic = semantic_cache
         self._l1_cache: OrderedDict[str, QueryCacheEntry] = OrderedDict()
         self._l1_lock = threading.RLock()
 
         # L2 connection (set during initialize())
         self._conn: duckdb.DuckDBPyConnection | None = None
         self._l2_lock = threading.RLock()
+        self._l2_pending: dict[str, QueryCacheEntry] = {}
+        self._l2_flush_task: asyncio.Task[None] | None = None
+
+        # Generation counters by "<table>:<project>" scope
+        self._generations: dict[str, int] = {}
+        self._generation_lock = threading.Lock()
 
         # Statistics
         self._stats: dict[str, int | float] = {
@@ -105,6 +320,8 @@ class QueryCacheManager:
             "l1_hit_rate": 0.0,
             "l2_hit_rate": 0.0,
             "l1_size": 0,
+            "l2_pending": 0,
+            "l2_flushes": 0,
         }
         self._stats_lock = threading.Lock()
 
@@ -141,22 +358,35 @@ class QueryCacheManager:
             normalized_query TEXT NOT NULL,
             project TEXT,
             result_ids TEXT[],
+            scores DOUBLE[],
             hit_count INTEGER DEFAULT 1,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             ttl_seconds INTEGER DEFAULT 604800
         );
 
+        ALTER TABLE query_cache_l2 ADD COLUMN IF NOT EXISTS scores DOUBLE[];
+
         CREATE INDEX IF NOT EXISTS idx_query_cache_l2_accessed
         ON query_cache_l2(last_accessed);
 
         CREATE INDEX IF NOT EXISTS idx_query_cache_l2_project
         ON query_cache_l2(project);
+
+        CREATE TABLE IF NOT EXISTS query_cache_generations (
+            scope TEXT PRIMARY KEY,
+            generation BIGINT NOT NULL
+        );
         """
 
         # DuckDB connections are not safe to bounce across threads here.
         if self._conn:
             self._conn.execute(create_table_sql)
+            rows = self._conn.execute(
+                "SELECT scope, generation FROM query_cache_generations"
+            ).fetchall()
+            with self._generation_lock:
+                self._generations = {scope: generation for scope, generation in rows}
 
     @staticmethod
     def normalize_query(query: str) -> str:
@@ -243,12 +473,137 @@ class QueryCacheManager:
         key_string = json.dumps(components, sort_keys=True)
         return hashlib.sha256(key_string.encode()).hexdigest()
 
+    def generation(self, table: str, project: str | None = None) -> tuple[int, int]:
+        """Return the generations a query over ``table`` is keyed on.
+
+        Args:
+            table: Logical table name (e.g. "conversations")
+            project: Project filter of the query, None for all projects
+
+        Returns:
+            Tuple of (table epoch, project generation)
+        """
+        scope = _ALL_PROJECTS if project is None else project
+        with self._generation_lock:
+            return (
+                self._generations.get(f"{table}:{_TABLE_EPOCH}", 0),
+                self._generations.get(f"{table}:{scope}", 0),
+            )
+
+    def bump_generation(self, table: str, project: str | None = None) -> None:
+        """Invalidate every cached query a write to ``table`` could change.
+
+        A write in a known project bumps that project's generation and the
+        shared all-projects generation, leaving other projects' entries
+        valid. A write whose project is unknown (e.g. a delete by id)
+        bumps the table epoch, which every key over the table embeds.
+
+        Counters are persisted so L2 entries keyed on an old generation
+        stay unreachable after a restart.
+
+        Args:
+            table: Logical table that was written
+            project: Project of the written row, None if unknown
+        """
+        scopes = (
+            [f"{table}:{project}", f"{table}:{_ALL_PROJECTS}"]
+            if project is not None
+            else [f"{table}:{_TABLE_EPOCH}"]
+        )
+        with self._generation_lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+
+        if self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO query_cache_generations (scope, generation)
+                SELECT unnest(?::VARCHAR[]), 1
+                ON CONFLICT (scope) DO UPDATE SET
+                    generation = query_cache_generations.generation + 1
+                """,
+                [scopes],
+            )
+
+    def scoped_cache_key(
+        self,
+        table: str,
+        query: str,
+        project: str | None = None,
+        limit: int = 10,
+        **kwargs: Any,
+    ) -> str:
+        """Compute a cache key that expires when ``table`` is written.
+
+        Same as compute_cache_key() with the table and its current
+        generations mixed in, so bump_generation() retires the key.
+
+        Args:
+            table: Logical table the query reads
+            query: Search query string
+            project: Optional project filter
+            limit: Result limit
+            **kwargs: Additional search parameters
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        return self.compute_cache_key(
+            query,
+            project=project,
+            limit=limit,
+            table=table,
+            generation=self.generation(table, project),
+            **kwargs,
+        )
+
+    def semantic_scope(
+        self,
+        table: str,
+        project: str | None = None,
+        limit: int = 10,
+        **kwargs: Any,
+    ) -> str:
+        """Compute the semantic tier scope of a query over ``table``.
+
+        The scope is the scoped cache key without the query text: two queries
+        may only share results when every other parameter and the data
+        generations match.
+
+        Args:
+            table: Logical table the query reads
+            project: Optional project filter
+            limit: Result limit
+            **kwargs: Additional search parameters
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        return self.scoped_cache_key(table, "", project=project, limit=limit, **kwargs)
+
     def get(
         self,
         cache_key: str,
         check_l2: bool = True,
     ) -> list[str] | None:
-        """Get cached result IDs by cache key (async version).
+        """Get cached result IDs by cache key.
+
+        Args:
+            cache_key: Cache key from compute_cache_key()
+            check_l2: Whether to check L2 cache if L1 miss
+
+        Returns:
+            List of result IDs if found and not expired, None otherwise
+        """
+        entry = self.get_entry(cache_key, check_l2=check_l2)
+        return entry.result_ids if entry is not None else None
+
+    def get_entry(
+        self,
+        cache_key: str,
+        check_l2: bool = True,
+    ) -> QueryCacheEntry | None:
+        """Get a cached entry, with result IDs in rank order and their scores.
 
         Search order:
             1. Check L1 cache (memory)
@@ -260,7 +615,7 @@ class QueryCacheManager:
             check_l2: Whether to check L2 cache if L1 miss
 
         Returns:
-            List of result IDs if found and not expired, None otherwise
+            QueryCacheEntry if found and not expired, None otherwise
         """
         if not self._initialized:
             return None
@@ -284,7 +639,7 @@ class QueryCacheManager:
                 with self._stats_lock:
                     self._stats["l1_hits"] += 1
 
-                return entry.result_ids
+                return entry
 
             with self._stats_lock:
                 self._stats["l1_misses"] += 1
@@ -301,7 +656,7 @@ class QueryCacheManager:
                 with self._stats_lock:
                     self._stats["l2_hits"] += 1
 
-                return result.result_ids
+                return result
 
             with self._stats_lock:
                 self._stats["l2_misses"] += 1
@@ -320,10 +675,16 @@ class QueryCacheManager:
         if not self._conn:
             return None
 
+        # Writes still waiting for their batch are part of L2 already
+        with self._l2_lock:
+            pending = self._l2_pending.get(cache_key)
+        if pending is not None:
+            return None if pending.is_expired() else pending
+
         # Query L2 table (DuckDB operation is fast, <1ms, no need for threading)
         query_sql = """
         SELECT cache_key, normalized_query, project, result_ids,
-               hit_count, created_at, last_accessed, ttl_seconds
+               hit_count, created_at, last_accessed, ttl_seconds, scores
         FROM query_cache_l2
         WHERE cache_key = ?
         """
@@ -333,9 +694,19 @@ class QueryCacheManager:
         if not row:
             return None
 
-        # Type cast for zuban: DuckDB returns variadic tuple, but we know it's 8 elements
+        # Type cast for zuban: DuckDB returns variadic tuple, but we know it's 9 elements
         cache_row = cast(
-            tuple[str, str, str | None, list[str] | None, int, Any, Any, int | None],
+            tuple[
+                str,
+                str,
+                str | None,
+                list[str] | None,
+                int,
+                Any,
+                Any,
+                int | None,
+                list[float] | None,
+            ],
             row,
         )
 
@@ -349,6 +720,7 @@ class QueryCacheManager:
             created_at=cache_row[5].timestamp(),
             last_accessed=cache_row[6].timestamp(),
             ttl_seconds=cache_row[7] or 604800,  # Default 7 days if None
+            scores=list(cache_row[8]) if cache_row[8] else [],
         )
 
         # Check expiration
@@ -389,17 +761,25 @@ class QueryCacheManager:
         result_ids: list[str],
         normalized_query: str,
         project: str | None = None,
-    ) -> None:
+        scores: list[float] | None = None,
+    ) -> QueryCacheEntry | None:
         """Store result IDs in cache (both L1 and L2).
 
+        L1 is updated immediately; the L2 write is queued and upserted with
+        the rest of its batch (see flush_l2()).
+
         Args:
             cache_key: Cache key from compute_cache_key()
-            result_ids: List of result IDs to cache
+            result_ids: List of result IDs to cache, in rank order
             normalized_query: Normalized query string
             project: Optional project filter
+            scores: Optional score of each result, parallel to result_ids
+
+        Returns:
+            The stored entry, or None if the cache is not initialized
         """
         if not self._initialized:
-            return
+            return None
 
         # Create entry
         entry = QueryCacheEntry(
@@ -408,6 +788,7 @@ class QueryCacheManager:
             result_ids=result_ids,
             project=project,
             ttl_seconds=self.l2_ttl_seconds,
+            scores=scores or [],
         )
 
         # Store in L1
@@ -419,8 +800,15 @@ class QueryCacheManager:
         if self._conn:
             self._put_to_l2(entry)
 
+        return entry
+
     def _put_to_l2(self, entry: QueryCacheEntry) -> None:
-        """Store entry in L2 cache.
+        """Queue entry for the next batched L2 write.
+
+        The batch is flushed once it reaches ``l2_batch_size`` entries or
+        ``l2_flush_interval`` seconds after its first entry, whichever comes
+        first. Without a running event loop only the size trigger and
+        explicit flushes apply.
 
         Args:
             entry: Cache entry to store
@@ -428,33 +816,100 @@ class QueryCacheManager:
         if not self._conn:
             return
 
+        with self._l2_lock:
+            self._l2_pending[entry.cache_key] = entry
+            batch_full = len(self._l2_pending) >= self.l2_batch_size
+
+        if batch_full:
+            self.flush_l2()
+        else:
+            self._schedule_l2_flush()
+
+    def _schedule_l2_flush(self) -> None:
+        """Start the delayed flush of the pending L2 batch if none is running."""
+        if self._l2_flush_task is not None and not self._l2_flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._l2_flush_task = loop.create_task(self._flush_l2_later())
+
+    async def _flush_l2_later(self) -> None:
+        """Flush the pending L2 batch after ``l2_flush_interval`` seconds."""
+        await asyncio.sleep(self.l2_flush_interval)
+        with suppress(Exception):
+            self.flush_l2()
+
+    def flush_l2(self) -> int:
+        """Write all pending entries to L2 in one bulk upsert.
+
+        Returns:
+            Number of entries written
+        """
+        with self._l2_lock:
+            entries = list(self._l2_pending.values())
+            self._l2_pending.clear()
+
+        if not (entries and self._conn):
+            return 0
+
+        def _timestamps(attr: str) -> list[str]:
+            return [
+                time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(getattr(e, attr)))
+                for e in entries
+            ]
+
         upsert_sql = """
         INSERT INTO query_cache_l2
-        (cache_key, normalized_query, project, result_ids, created_at, last_accessed, ttl_seconds)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+        (cache_key, normalized_query, project, result_ids, scores,
+         created_at, last_accessed, ttl_seconds)
+        SELECT * FROM (
+            SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                   unnest(?::VARCHAR[]), unnest(?::VARCHAR[][]),
+                   unnest(?::DOUBLE[][]), unnest(?::TIMESTAMP[]),
+                   unnest(?::TIMESTAMP[]), unnest(?::INTEGER[])
+        )
         ON CONFLICT (cache_key) DO UPDATE SET
             result_ids = excluded.result_ids,
+            scores = excluded.scores,
             last_accessed = excluded.last_accessed,
             hit_count = query_cache_l2.hit_count + 1
         """
 
-        # Execute upsert directly (DuckDB operation is fast, <1ms)
-        if self._conn:
-            self._conn.execute(
-                upsert_sql,
-                [
-                    entry.cache_key,
-                    entry.normalized_query,
-                    entry.project,
-                    entry.result_ids,
-                    time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(entry.created_at)),
-                    time.strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                        time.gmtime(entry.last_accessed),
-                    ),
-                    entry.ttl_seconds,
-                ],
-            )
+        self._conn.execute(
+            upsert_sql,
+            [
+                [e.cache_key for e in entries],
+                [e.normalized_query for e in entries],
+                [e.project for e in entries],
+                [e.result_ids for e in entries],
+                [e.scores for e in entries],
+                _timestamps("created_at"),
+                _timestamps("last_accessed"),
+                [e.ttl_seconds for e in entries],
+            ],
+        )
+
+        with self._stats_lock:
+            self._stats["l2_flushes"] += 1
+
+        return len(entries)
+
+    async def flush(self) -> int:
+        """Cancel the delayed flush and write pending L2 entries now.
+
+        Call before the L2 connection goes away.
+
+        Returns:
+            Number of entries written
+        """
+        task, self._l2_flush_task = self._l2_flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        return self.flush_l2()
 
     def _delete_from_l2(self, cache_key: str) -> None:
         """Delete entry from L2 cache.
@@ -465,6 +920,9 @@ class QueryCacheManager:
         if not self._conn:
             return
 
+        with self._l2_lock:
+            self._l2_pending.pop(cache_key, None)
+
         delete_sql = "DELETE FROM query_cache_l2 WHERE cache_key = ?"
 
         # Execute delete directly (DuckDB operation is fast, <1ms)
@@ -496,6 +954,9 @@ class QueryCacheManager:
             with self._l1_lock:
                 self._l1_cache.clear()
 
+            if self.semantic is not None:
+                self.semantic.clear()
+
             if self._conn:
                 self._clear_l2()
         else:
@@ -504,11 +965,16 @@ class QueryCacheManager:
                 if cache_key in self._l1_cache:
                     del self._l1_cache[cache_key]
 
+            if self.semantic is not None:
+                self.semantic.discard(cache_key)
+
             if self._conn:
                 self._delete_from_l2(cache_key)
 
     def _clear_l2(self) -> None:
         """Clear all entries from L2 cache."""
+        with self._l2_lock:
+            self._l2_pending.clear()
         if not self._conn:
             return
         self._conn.execute("DELETE FROM query_cache_l2")
@@ -527,6 +993,10 @@ class QueryCacheManager:
             - l1_hit_rate: L1 hit rate (0-1)
             - l2_hit_rate: L2 hit rate (0-1)
             - l1_size: Current L1 cache size
+            - l2_pending: Entries waiting for the next batched L2 write
+            - l2_flushes: Number of batched L2 writes
+            - semantic_*: Semantic tier statistics, when the tier is enabled
+              (see SemanticQueryCache.get_stats())
         """
         with self._stats_lock:
             stats = self._stats.copy()
@@ -542,6 +1012,13 @@ class QueryCacheManager:
         with self._l1_lock:
             stats["l1_size"] = len(self._l1_cache)
 
+        with self._l2_lock:
+            stats["l2_pending"] = len(self._l2_pending)
+
+        if self.semantic is not None:
+            for name, value in self.semantic.get_stats().items():
+                stats[f"semantic_{name}"] = value
+
         return stats
 
     async def aclose(self) -> None:
@@ -560,6 +1037,9 @@ class QueryCacheManager:
                     break
             await asyncio.sleep(0.1)
 
+        with suppress(Exception):
+            await self.flush()
+
         # Now safe to close connection
         if self._conn:
             with suppress(Exception):
@@ -569,6 +1049,8 @@ class QueryCacheManager:
         # Clear caches
         with self._l1_lock:
             self._l1_cache.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
 
     def _track_operation(self, operation_name: str) -> None:
         """Track a pending operation for shutdown safety.
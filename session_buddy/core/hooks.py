@@ -3,6 +3,8 @@
 This module provides a full-featured hooks infrastructure that supports:
 - Pre/post operation hooks (checkpoint, tool execution, file edits, errors)
 - Priority-based execution with error handling
+- Concurrent execution of hooks that declare independent context access
+- Per-hook timeouts, fire-and-forget post hooks and latency histograms
 - Causal chain tracking for debugging intelligence
 - Extensible hook registration system
 
@@ -12,6 +14,8 @@ Architecture:
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -22,6 +26,8 @@ from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from session_buddy.utils.db_executor import LatencyHistogram
+
 if TYPE_CHECKING:
     from session_buddy.core.causal_chains import CausalChainTracker
     from session_buddy.core.intelligence import IntelligenceEngine
@@ -159,6 +165,19 @@ class Hook:
         error_handler: Optional async error handler for this hook
         enabled: Whether hook is active
         metadata: Additional hook information
+        reads: Context metadata keys the handler reads, None if unknown
+        writes: Context metadata keys the handler returns in
+            modified_context, None if unknown
+        depends_on: Names of hooks with a lower priority number that must
+            finish before this one starts
+        timeout: Seconds before the handler is cancelled and reported as
+            failed (None = no limit)
+        background: Run without waiting for the result (post hooks only);
+            the result is not returned and its context changes are dropped
+
+    Hooks that declare both ``reads`` and ``writes`` run concurrently with
+    other declared hooks they do not conflict with. Hooks that leave either
+    as None keep strict priority order against every other hook.
 
     Example:
         >>> async def my_handler(ctx: HookContext) -> HookResult:
@@ -178,6 +197,28 @@ class Hook:
     error_handler: Callable[[Exception], Awaitable[None]] | None = None
     enabled: bool = True
     metadata: dict[str, Any] = field(default_factory=dict)
+    reads: frozenset[str] | None = None
+    writes: frozenset[str] | None = None
+    depends_on: tuple[str, ...] = ()
+    timeout: float | None = None
+    background: bool = False
+
+    def conflicts_with(self, other: Hook) -> bool:
+        """Whether the two hooks must not run at the same time."""
+        if (
+            self.reads is None
+            or self.writes is None
+            or other.reads is None
+            or other.writes is None
+        ):
+            return True
+        return bool(
+            self.writes & (other.reads | other.writes) or other.writes & self.reads
+        )
+
+
+# Declared by hooks that neither read nor write context metadata
+NO_CONTEXT_KEYS: frozenset[str] = frozenset()
 
 
 class HooksManager:
@@ -185,7 +226,10 @@ class HooksManager:
 
     This manager handles:
         - Hook registration with priority ordering
-        - Sequential hook execution with error handling
+        - Dependency-aware hook execution with error handling: independent
+          hooks run concurrently, conflicting ones in priority order
+        - Fire-and-forget background post hooks
+        - Per-hook latency histograms
         - Integration with causal chain tracking
         - Default hook registration
 
@@ -212,6 +256,8 @@ class HooksManager:
         self._causal_tracker: CausalChainTracker | None = None
         self._intelligence_engine: IntelligenceEngine | None = None
         self.formatter = formatter or DefaultCodeFormatter()
+        self._latency: dict[HookType, dict[str, LatencyHistogram]] = {}
+        self._background_tasks: set[asyncio.Task[HookResult]] = set()
 
     async def initialize(self) -> None:
         """Initialize hook system with causal tracking and intelligence.
@@ -258,7 +304,14 @@ class HooksManager:
 
         Args:
             hook: Hook definition to register
+
+        Raises:
+            ValueError: If a pre-operation hook is marked as background
         """
+        if hook.background and hook.hook_type.startswith("pre_"):
+            msg = f"Pre-operation hook {hook.name} cannot run in the background"
+            raise ValueError(msg)
+
         if hook.hook_type not in self._hooks:
             self._hooks[hook.hook_type] = []
 
@@ -296,22 +349,26 @@ class HooksManager:
     ) -> list[HookResult]:
         """Execute all hooks for a given type.
 
-        Hooks execute in priority order (lower numbers first).
-        Failed hooks don't stop execution of subsequent hooks.
-        Modified context from each hook is accumulated.
+        A hook starts once every hook it depends on has finished: hooks
+        named in its ``depends_on`` and earlier (lower priority number)
+        hooks it conflicts with. Hooks without declared reads/writes
+        therefore run one at a time in priority order; independent ones
+        run concurrently. Failed hooks don't stop execution of subsequent
+        hooks. Modified context from each hook is merged into
+        ``context.metadata`` as soon as it finishes, before any hook that
+        depends on it starts. Background hooks are started afterwards with a
+        copy of the resulting context and not waited for.
 
         Args:
             hook_type: Type of hooks to execute
             context: Context to pass to each hook
 
         Returns:
-            List of hook execution results in execution order
+            List of foreground hook execution results in priority order
         """
-        results: list[HookResult] = []
-
         if hook_type not in self._hooks:
             self.logger.debug("No hooks registered for type: %s", hook_type)
-            return results
+            return []
 
         hooks = self._hooks[hook_type]
         self.logger.debug(
@@ -321,62 +378,195 @@ class HooksManager:
             context.session_id,
         )
 
+        foreground: list[Hook] = []
+        background: list[Hook] = []
         for hook in hooks:
             if not hook.enabled:
                 self.logger.debug("Skipping disabled hook: %s", hook.name)
-                continue
-
+            elif hook.background:
+                background.append(hook)
+            else:
+                foreground.append(hook)
+
+        waits = self._dependency_graph(foreground)
+        finished = [asyncio.Event() for _ in foreground]
+        slots: list[HookResult | None] = [None] * len(foreground)
+
+        async def _run(index: int) -> None:
+            hook = foreground[index]
+            for dependency in waits[index]:
+                await finished[dependency].wait()
             try:
-                start_monotonic = time.monotonic()
-                result = await hook.handler(context)
-                execution_time = (time.monotonic() - start_monotonic) * 1000
+                result = await self._run_hook(hook, context)
+                slots[index] = result
+                self._merge_context(hook, result, context)
+            finally:
+                finished[index].set()
 
-                result.execution_time_ms = execution_time
-                results.append(result)
+        async with asyncio.TaskGroup() as group:
+            for index in range(len(foreground)):
+                group.create_task(_run(index))
 
-                # Update context with modifications from hook
-                if result.modified_context:
-                    context.metadata.update(result.modified_context)
-                    self.logger.debug(
-                        "Hook %s modified context with %d keys",
+        results = [result for result in slots if result is not None]
+
+        for hook in background:
+            background_context = dataclasses.replace(
+                context, metadata=dict(context.metadata)
+            )
+            task = asyncio.create_task(self._run_hook(hook, background_context))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        self.logger.info(
+            "Executed %d/%d hooks for type=%s: %d succeeded, %d in background",
+            len(results),
+            len(hooks),
+            hook_type,
+            sum(1 for r in results if r.success),
+            len(background),
+        )
+
+        return results
+
+    def _dependency_graph(self, hooks: list[Hook]) -> list[list[int]]:
+        """Return, for each hook, the indexes of hooks it must wait for.
+
+        Args:
+            hooks: Enabled foreground hooks in priority order
+
+        Returns:
+            Lists of indexes into ``hooks``, all lower than the hook's own
+        """
+        positions = {hook.name: index for index, hook in enumerate(hooks)}
+        waits: list[list[int]] = []
+        for index, hook in enumerate(hooks):
+            dependencies: list[int] = []
+            for name in hook.depends_on:
+                position = positions.get(name)
+                if position is None or position >= index:
+                    self.logger.warning(
+                        "Hook %s depends on %s, which is not an enabled hook "
+                        "with a lower priority number; ignoring",
                         hook.name,
-                        len(result.modified_context),
+                        name,
                     )
+                    continue
+                dependencies.append(position)
+            dependencies.extend(
+                earlier
+                for earlier in range(index)
+                if earlier not in dependencies and hooks[earlier].conflicts_with(hook)
+            )
+            waits.append(dependencies)
+        return waits
 
-                self.logger.debug(
-                    "Hook %s completed: success=%s, time=%.2fms",
-                    hook.name,
-                    result.success,
-                    execution_time,
-                )
+    async def _run_hook(self, hook: Hook, context: HookContext) -> HookResult:
+        """Run one hook handler with its timeout, timing and error handling.
 
-            except Exception as e:
+        Args:
+            hook: Hook to run
+            context: Context passed to the handler
+
+        Returns:
+            The handler's result, or a failed result if it raised or timed out
+        """
+        deadline = asyncio.timeout(hook.timeout)
+        start_monotonic = time.monotonic()
+        try:
+            async with deadline:
+                result = await hook.handler(context)
+        except Exception as e:
+            execution_time = (time.monotonic() - start_monotonic) * 1000
+            self._observe_latency(hook, execution_time)
+            error = str(e)
+            if isinstance(e, TimeoutError) and deadline.expired():
+                error = f"Hook {hook.name} timed out after {hook.timeout}s"
+                self.logger.warning(error)
+            else:
                 self.logger.exception(
                     "Hook %s failed",
                     hook.name,
                 )
 
-                # Try error handler if available
-                if hook.error_handler:
-                    try:
-                        await hook.error_handler(e)
-                    except Exception:
-                        self.logger.exception(
-                            "Hook error handler failed for %s",
-                            hook.name,
-                        )
+            # Try error handler if available
+            if hook.error_handler:
+                try:
+                    await hook.error_handler(e)
+                except Exception:
+                    self.logger.exception(
+                        "Hook error handler failed for %s",
+                        hook.name,
+                    )
 
-                results.append(HookResult(success=False, error=str(e)))
+            return HookResult(
+                success=False, error=error, execution_time_ms=execution_time
+            )
 
-        self.logger.info(
-            "Executed %d/%d hooks for type=%s: %d succeeded",
-            len(results),
-            len(hooks),
-            hook_type,
-            sum(1 for r in results if r.success),
+        execution_time = (time.monotonic() - start_monotonic) * 1000
+        self._observe_latency(hook, execution_time)
+        result.execution_time_ms = execution_time
+        self.logger.debug(
+            "Hook %s completed: success=%s, time=%.2fms",
+            hook.name,
+            result.success,
+            execution_time,
         )
+        return result
 
-        return results
+    def _merge_context(
+        self, hook: Hook, result: HookResult, context: HookContext
+    ) -> None:
+        """Apply a hook's context modifications to the shared context."""
+        if not result.modified_context:
+            return
+
+        if hook.writes is not None:
+            undeclared = result.modified_context.keys() - hook.writes
+            if undeclared:
+                self.logger.warning(
+                    "Hook %s modified undeclared context keys: %s",
+                    hook.name,
+                    sorted(undeclared),
+                )
+
+        context.metadata.update(result.modified_context)
+        self.logger.debug(
+            "Hook %s modified context with %d keys",
+            hook.name,
+            len(result.modified_context),
+        )
+
+    def _observe_latency(self, hook: Hook, execution_time_ms: float) -> None:
+        """Record a hook run in its latency histogram."""
+        histograms = self._latency.setdefault(hook.hook_type, {})
+        histogram = histograms.get(hook.name)
+        if histogram is None:
+            histogram = histograms[hook.name] = LatencyHistogram()
+        histogram.observe(execution_time_ms)
+
+    def get_latency_stats(self) -> dict[HookType, dict[str, dict[str, Any]]]:
+        """Return latency histograms of every hook that has run.
+
+        Returns:
+            Mapping of hook type to hook name to histogram snapshot (count,
+            mean, max, p50/p95/p99 and bucket counts in milliseconds)
+        """
+        return {
+            hook_type: {
+                name: histogram.snapshot() for name, histogram in histograms.items()
+            }
+            for hook_type, histograms in self._latency.items()
+        }
+
+    async def wait_for_background_hooks(self, timeout: float | None = None) -> None:
+        """Wait for background hooks that are still running.
+
+        Args:
+            timeout: Seconds to wait at most (None = until all finished)
+        """
+        if not self._background_tasks:
+            return
+        await asyncio.wait(set(self._background_tasks), timeout=timeout)
 
     async def _register_default_hooks(self) -> None:
         """Register built-in default hooks.
@@ -395,6 +585,8 @@ class HooksManager:
                 hook_type=HookType.POST_FILE_EDIT,
                 priority=100,
                 handler=self._auto_format_handler,
+                reads=NO_CONTEXT_KEYS,
+                writes=NO_CONTEXT_KEYS,
             )
         )
 
@@ -405,6 +597,8 @@ class HooksManager:
                 hook_type=HookType.PRE_CHECKPOINT,
                 priority=50,
                 handler=self._quality_validation_handler,
+                reads=NO_CONTEXT_KEYS,
+                writes=frozenset({"validated_quality"}),
             )
         )
 
@@ -415,6 +609,8 @@ class HooksManager:
                 hook_type=HookType.POST_CHECKPOINT,
                 priority=200,
                 handler=self._pattern_learning_handler,
+                reads=NO_CONTEXT_KEYS,
+                writes=NO_CONTEXT_KEYS,
             )
         )
 
@@ -425,6 +621,8 @@ class HooksManager:
                 hook_type=HookType.POST_ERROR,
                 priority=10,
                 handler=self._causal_chain_handler,
+                reads=NO_CONTEXT_KEYS,
+                writes=NO_CONTEXT_KEYS,
             )
         )
 
@@ -433,8 +631,11 @@ class HooksManager:
             Hook(
                 name="collect_workflow_metrics",
                 hook_type=HookType.POST_CHECKPOINT,
-                priority=300,  # Run after pattern learning
+                priority=300,
                 handler=self._workflow_metrics_handler,
+                # Independent of pattern learning, so both run concurrently
+                reads=NO_CONTEXT_KEYS,
+                writes=NO_CONTEXT_KEYS,
             )
         )
 
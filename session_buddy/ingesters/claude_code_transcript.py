@@ -4,8 +4,8 @@ Claude Code writes conversation transcripts to::
 
     ~/.claude/projects/<encoded-path>/<session-uuid>.jsonl
 
-This ingester reads each ``.jsonl`` file line by line, parses the
-``user``/``assistant`` records, redacts secrets, and writes them to
+This ingester streams each ``.jsonl`` file line by line, parses the
+``user``/``assistant`` records, redacts secrets, and bulk-writes them to
 ``conversations_v2`` with provenance columns wired up
 (``source_type='claude_code'``, ``turn_parent_id`` linking the assistant
 turn to its parent user turn, ``category='claude_turn'``,
@@ -13,15 +13,22 @@ turn to its parent user turn, ``category='claude_turn'``,
 
 Records with a ``type`` other than ``user`` or ``assistant`` (e.g.
 ``queue-operation`` raw thinking blocks) are dropped.
+
+Transcripts are append-only, so a per-file checkpoint (inode + byte offset)
+lets re-runs parse only the bytes appended since the last pass; a rotated
+or truncated file starts over. :meth:`ClaudeCodeTranscriptIngester.watch`
+polls the transcript tree and tails files as they grow.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-import typing as t
+from collections import OrderedDict
+from contextlib import closing, suppress
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from session_buddy.ingesters.redaction import (
     ALLOWED_METADATA_KEYS,
@@ -33,6 +40,8 @@ from session_buddy.ingesters.redaction import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from session_buddy.adapters.reflection_adapter_oneiric import (
         ReflectionDatabaseAdapterOneiric,
     )
@@ -49,102 +58,274 @@ _CATEGORY: str = "claude_turn"
 #: Working memory tier — short-lived, gets promoted by Conscious Agent.
 _MEMORY_TIER: str = "working"
 
+#: Records parsed and written per bulk write; the checkpoint advances per chunk.
+_CHUNK_RECORDS: int = 500
+
+#: Record-uuid → row-id entries kept in memory; older ones are read back
+#: from ``transcript_turn_ids`` when a late turn references them.
+_MAX_TRACKED_PARENTS: int = 10_000
+
+_STATE_SCHEMA_SQL: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS transcript_ingest_checkpoints (
+        path VARCHAR PRIMARY KEY,
+        inode UBIGINT NOT NULL,
+        byte_offset BIGINT NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS transcript_turn_ids (
+        record_uuid VARCHAR PRIMARY KEY,
+        session_id VARCHAR,
+        row_id VARCHAR NOT NULL
+    )
+    """,
+)
+
+
+class _Turn(NamedTuple):
+    """One parsed transcript turn, ready for ``store_conversations_bulk``."""
+
+    row: dict[str, Any]
+    record_uuid: str | None
+    session_id: str | None
+    parent_uuid: str | None
+
 
 class ClaudeCodeTranscriptIngester:
-    """Ingest Claude Code JSONL transcripts into ``conversations_v2``."""
+    """Ingest Claude Code JSONL transcripts into ``conversations_v2``.
+
+    Checkpoints and the record-uuid → row-id map live in the adapter's
+    DuckDB database, so they survive restarts.
+    """
 
     def __init__(self, db: ReflectionDatabaseAdapterOneiric) -> None:
-        """Store the database adapter; nothing else is held in state."""
+        """Store the database adapter and an empty parent-id cache."""
         self._db = db
+        self._parent_id_by_uuid: OrderedDict[str, str] = OrderedDict()
+        self._schema_ready_for: Any = None
 
     async def ingest_file(
         self,
         path: Path,
         since_timestamp: str | None = None,
+        *,
+        resume: bool = True,
     ) -> int:
-        """Parse one ``.jsonl`` file and write records to v2.
+        """Parse one ``.jsonl`` file and write its new records to v2.
 
         Args:
             path: Path to the JSONL transcript.
             since_timestamp: Optional ISO 8601 lower bound; records with
                 ``timestamp < since_timestamp`` are skipped (inclusive).
+            resume: Start from the file's checkpoint. ``False`` re-reads
+                the file from the beginning.
 
         Returns:
             Number of records successfully written to v2.
 
         """
+        if self._db.conn is None:
+            await self._db.initialize()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return 0
+        key = str(path.resolve())
+        offset = self._load_offset(key, stat.st_ino) if resume else 0
+        if offset > stat.st_size:
+            # Truncated in place — treat as a new transcript
+            offset = 0
+        if offset == stat.st_size and resume:
+            return 0
+
         ingested = 0
-        for line in _iter_jsonl_lines(path):
-            record = _safe_parse(line)
-            if record is None:
-                continue
-            if not _should_ingest(record, since_timestamp):
-                continue
-            content = _extract_content(record)
-            if content is None:
-                continue
-            if len(content) > MAX_REDACTION_BYTES:
-                # Skip oversized payloads — they are almost always
-                # accidental binary blobs dumped into a transcript.
-                continue
-            try:
-                redacted = redact(content)
-            except RedactionSizeError:
-                continue
-            metadata = _build_metadata(record, redacted)
-            # ``REDACTED_MARKER`` is set so a redaction actually happened.
-            if REDACTED_MARKER in redacted:
-                metadata["redaction_applied"] = True
-            turn_parent = (
-                self._resolve_turn_parent(record) if _is_assistant(record) else None
+        while True:
+            turns, end_offset = await asyncio.to_thread(
+                _read_turns, path, offset, since_timestamp, _CHUNK_RECORDS
             )
-            row_id = await self._db.store_conversation(
-                content=redacted,
-                metadata=metadata,
-                source_type=SOURCE_TYPE,
-                turn_parent_id=turn_parent,
-                category=_CATEGORY,
-                memory_tier=_MEMORY_TIER,
-            )
-            record_uuid = record.get("uuid")
-            if isinstance(record_uuid, str):
-                self._track_parent(record_uuid, row_id)
-            ingested += 1
+            if end_offset == offset:
+                break
+            if turns:
+                ingested += await self._store_turns(turns)
+            offset = end_offset
+            self._save_offset(key, stat.st_ino, offset)
         return ingested
 
     async def ingest_directory(
         self,
         encoded_path: Path,
         since_timestamp: str | None = None,
+        *,
+        max_concurrency: int = 4,
     ) -> int:
         """Glob ``*.jsonl`` under ``encoded_path`` and ingest each.
 
-        Returns the total number of records ingested across all files.
+        Files are independent, so up to ``max_concurrency`` are read at
+        once. Returns the total number of records ingested across all files.
+        """
+        return await self._ingest_paths(
+            sorted(encoded_path.glob("*.jsonl")), since_timestamp, max_concurrency
+        )
+
+    async def watch(
+        self,
+        root: Path | None = None,
+        *,
+        poll_interval: float = 1.0,
+        stop_event: asyncio.Event | None = None,
+        max_concurrency: int = 4,
+    ) -> int:
+        """Tail every ``<root>/*/*.jsonl`` transcript until ``stop_event`` is set.
+
+        Each poll stats the transcripts and reads only the bytes appended
+        since their checkpoints, so idle files cost one ``stat`` per poll.
+
+        Args:
+            root: Transcript tree, ``~/.claude/projects`` by default.
+            poll_interval: Seconds between polls.
+            stop_event: Ends the watch after the current poll when set.
+            max_concurrency: Files read at once.
+
+        Returns:
+            Number of records ingested while watching.
+
         """
-        total = 0
-        for jsonl in sorted(encoded_path.glob("*.jsonl")):
-            total += await self.ingest_file(jsonl, since_timestamp=since_timestamp)
-        return total
+        root = root or Path.home() / ".claude" / "projects"
+        stop_event = stop_event or asyncio.Event()
+        ingested = 0
+        while True:
+            ingested += await self._ingest_paths(
+                sorted(root.glob("*/*.jsonl")), None, max_concurrency
+            )
+            if stop_event.is_set():
+                return ingested
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), poll_interval)
 
     # -- internal helpers -------------------------------------------------
 
+    async def _ingest_paths(
+        self,
+        paths: list[Path],
+        since_timestamp: str | None,
+        max_concurrency: int,
+    ) -> int:
+        """Ingest ``paths`` with at most ``max_concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def ingest(path: Path) -> int:
+            async with semaphore:
+                return await self.ingest_file(path, since_timestamp=since_timestamp)
+
+        return sum(await asyncio.gather(*(ingest(path) for path in paths)))
+
+    async def _store_turns(self, turns: list[_Turn]) -> int:
+        """Bulk-write one chunk of turns and remember their row ids."""
+        records = []
+        index_by_uuid: dict[str, int] = {}
+        for position, turn in enumerate(turns):
+            row = turn.row
+            if turn.parent_uuid is not None:
+                # Parents from this chunk get their ids in the same bulk write
+                if turn.parent_uuid in index_by_uuid:
+                    row["turn_parent_index"] = index_by_uuid[turn.parent_uuid]
+                else:
+                    row["turn_parent_id"] = self._resolve_turn_parent(
+                        {"parentUuid": turn.parent_uuid}
+                    )
+            if turn.record_uuid is not None:
+                index_by_uuid[turn.record_uuid] = position
+            records.append(row)
+
+        row_ids = await self._db.store_conversations_bulk(records)
+        tracked = [
+            (turn.record_uuid, turn.session_id, row_id)
+            for turn, row_id in zip(turns, row_ids, strict=True)
+            if turn.record_uuid is not None
+        ]
+        for record_uuid, _, row_id in tracked:
+            self._track_parent(record_uuid, row_id)
+        if tracked:
+            self._state_conn().execute(
+                """
+                INSERT OR REPLACE INTO transcript_turn_ids
+                    (record_uuid, session_id, row_id)
+                SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::VARCHAR[])
+                """,
+                [list(column) for column in zip(*tracked, strict=True)],
+            )
+        return len(row_ids)
+
+    def _state_conn(self) -> Any:
+        """Return the adapter connection with the ingest-state tables created."""
+        conn = self._db.conn
+        if self._schema_ready_for is not conn:
+            for statement in _STATE_SCHEMA_SQL:
+                conn.execute(statement)
+            self._schema_ready_for = conn
+        return conn
+
+    def _load_offset(self, key: str, inode: int) -> int:
+        """Return the checkpointed byte offset, 0 for new or rotated files."""
+        row = (
+            self._state_conn()
+            .execute(
+                "SELECT inode, byte_offset FROM transcript_ingest_checkpoints "
+                "WHERE path = ?",
+                [key],
+            )
+            .fetchone()
+        )
+        if row is None or row[0] != inode:
+            return 0
+        return int(row[1])
+
+    def _save_offset(self, key: str, inode: int, offset: int) -> None:
+        """Checkpoint the bytes of ``key`` consumed so far."""
+        self._state_conn().execute(
+            """
+            INSERT OR REPLACE INTO transcript_ingest_checkpoints
+                (path, inode, byte_offset, updated_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [key, inode, offset, datetime.now(UTC)],
+        )
+
     def _resolve_turn_parent(self, record: dict[str, Any]) -> str | None:
-        """Look up the in-memory parent-id map for an assistant turn.
+        """Look up the row id of an assistant turn's parent.
 
-        Falls back to ``None`` if the parent was not seen in this run
-        (e.g. partial transcripts).
+        Checks the in-memory cache first, then the persisted map. Falls
+        back to ``None`` if the parent was never ingested (e.g. partial
+        transcripts).
         """
         parent_uuid = record.get("parentUuid")
         if not isinstance(parent_uuid, str):
             return None
-        return self._parent_id_by_uuid.get(parent_uuid)
+        row_id = self._parent_id_by_uuid.get(parent_uuid)
+        if row_id is None:
+            row = (
+                self._state_conn()
+                .execute(
+                    "SELECT row_id FROM transcript_turn_ids WHERE record_uuid = ?",
+                    [parent_uuid],
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+            row_id = row[0]
+        self._track_parent(parent_uuid, row_id)
+        return row_id
 
     def _track_parent(self, parent_uuid: str, row_id: str) -> None:
-        """Record the v2 id produced for ``parent_uuid``."""
+        """Record the v2 id produced for ``parent_uuid``, evicting the oldest."""
         self._parent_id_by_uuid[parent_uuid] = row_id
-
-    # Initialised lazily so we don't shadow the param in __init__.
-    _parent_id_by_uuid: t.ClassVar[dict[str, str]] = {}
+        self._parent_id_by_uuid.move_to_end(parent_uuid)
+        if len(self._parent_id_by_uuid) > _MAX_TRACKED_PARENTS:
+            self._parent_id_by_uuid.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -152,10 +333,81 @@ class ClaudeCodeTranscriptIngester:
 # ---------------------------------------------------------------------------
 
 
-def _iter_jsonl_lines(path: Path) -> list[str]:
-    """Return non-empty lines from ``path`` (split, do not strip newlines)."""
-    with path.open("r", encoding="utf-8") as fh:
-        return [ln for ln in fh.read().splitlines() if ln.strip()]
+def _iter_jsonl_lines(path: Path, offset: int = 0) -> Iterator[tuple[str, int]]:
+    """Stream the lines of ``path`` from ``offset``.
+
+    Yields ``(line, end_offset)`` pairs, where ``end_offset`` is the byte
+    offset just past the line; blank lines come through as ``""`` so the
+    offset still advances over them. A final line without a newline is
+    only yielded when it parses as JSON; otherwise it is a record still
+    being written and is left for the next pass.
+    """
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        for raw in fh:
+            offset += len(raw)
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not raw.endswith(b"\n") and _safe_parse(line) is None:
+                return
+            yield line, offset
+
+
+def _read_turns(
+    path: Path, offset: int, since_timestamp: str | None, limit: int
+) -> tuple[list[_Turn], int]:
+    """Parse up to ``limit`` ingestable turns of ``path`` from ``offset``.
+
+    Runs in a worker thread. Returns the turns and the byte offset just
+    past the last line consumed.
+    """
+    turns: list[_Turn] = []
+    end_offset = offset
+    with closing(_iter_jsonl_lines(path, offset)) as lines:
+        for line, end_offset in lines:
+            turn = _parse_turn(line, since_timestamp) if line else None
+            if turn is not None:
+                turns.append(turn)
+                if len(turns) >= limit:
+                    break
+    return turns, end_offset
+
+
+def _parse_turn(line: str, since_timestamp: str | None) -> _Turn | None:
+    """Parse, filter and redact one transcript line."""
+    record = _safe_parse(line)
+    if record is None or not _should_ingest(record, since_timestamp):
+        return None
+    content = _extract_content(record)
+    if content is None:
+        return None
+    if len(content) > MAX_REDACTION_BYTES:
+        # Skip oversized payloads — they are almost always
+        # accidental binary blobs dumped into a transcript.
+        return None
+    try:
+        redacted = redact(content)
+    except RedactionSizeError:
+        return None
+    metadata = _build_metadata(record, redacted)
+    # ``REDACTED_MARKER`` is set so a redaction actually happened.
+    if REDACTED_MARKER in redacted:
+        metadata["redaction_applied"] = True
+    parent_uuid = record.get("parentUuid") if _is_assistant(record) else None
+    record_uuid = record.get("uuid")
+    session_id = record.get("sessionId")
+    return _Turn(
+        row={
+            "content": redacted,
+            "metadata": metadata,
+            "source_type": SOURCE_TYPE,
+            "turn_parent_id": None,
+            "category": _CATEGORY,
+            "memory_tier": _MEMORY_TIER,
+        },
+        record_uuid=record_uuid if isinstance(record_uuid, str) else None,
+        session_id=session_id if isinstance(session_id, str) else None,
+        parent_uuid=parent_uuid if isinstance(parent_uuid, str) else None,
+    )
 
 
 def _safe_parse(line: str) -> dict[str, Any] | None:
@@ -6,11 +6,23 @@ can run on hot ingestion paths without pulling in ``detect-secrets``.
 
 Idempotency: a second ``redact()`` pass over already-redacted text is a
 no-op because ``[REDACTED]`` does not match any of the patterns.
+
+Performance: redaction runs on every write. Each pattern carries a literal
+trigger that must occur in the text for the pattern to match, so most
+patterns are skipped with a substring check. Patterns that start with a
+literal (``AKIA``, ``ghp_``, ``eyJ``) let the regex engine jump straight to
+candidates. The patterns stay separate passes on purpose: a single
+alternation has no literal prefix to search for and benchmarked slower
+under CPython's ``re`` (see ``tests/performance/test_redaction_performance.py``).
 """
 
 from __future__ import annotations
 
 import re
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 MAX_REDACTION_BYTES = 65536
 REDACTED_MARKER = "[REDACTED]"
@@ -35,21 +47,34 @@ ALLOWED_METADATA_KEYS: frozenset[str] = frozenset(
     }
 )
 
-# Each pattern is compiled once at import time for reuse across calls.
-_SECRET_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"AKIA[0-9A-Z]{16}"),
-    re.compile(r"ghp_[A-Za-z0-9]{36}"),
-    re.compile(r"eyJ[A-Za-z0-9_-]+\.eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+"),
-    re.compile(r"password=\S+", re.IGNORECASE),
-    re.compile(r"Authorization:\s*\S+", re.IGNORECASE),
-    re.compile(r"\b10\.\d+\.\d+\.\d+\b"),
-    re.compile(r"\b192\.168\.\d+\.\d+\b"),
-    re.compile(r"\b172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+\b"),
-    re.compile(r"/Users/[^/\s]+/\.ssh/"),
-    re.compile(r"~/\.ssh/"),
-    re.compile(r"\S+@\S+\.\S+"),
-    re.compile(r"\+?\d{1,3}[-.\s]??\(?\d{1,4}\)?[-.\s]??\d{1,4}[-.\s]??\d{1,9}"),
-    re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
+# Characters kept back per chunk by :func:`redact_stream` so a secret at
+# the end of one chunk is matched together with the start of the next.
+STREAM_OVERLAP = 4096
+
+# Each pattern is compiled once at import time for reuse across calls, and
+# paired with a literal every match contains (``None``: always applied).
+# Patterns run in this order; later ones see earlier replacements.
+_SECRET_PATTERNS: tuple[tuple[re.Pattern[str], str | None], ...] = (
+    (re.compile(r"AKIA[0-9A-Z]{16}"), "AKIA"),
+    (re.compile(r"ghp_[A-Za-z0-9]{36}"), "ghp_"),
+    (re.compile(r"eyJ[A-Za-z0-9_-]+\.eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+"), "eyJ"),
+    (re.compile(r"password=\S+", re.IGNORECASE), "="),
+    (re.compile(r"Authorization:\s*\S+", re.IGNORECASE), ":"),
+    # ``\b10`` written as ``10(?<!\w10)`` so the regex leads with a literal
+    (re.compile(r"10(?<!\w10)\.\d+\.\d+\.\d+\b"), "10."),
+    (re.compile(r"192(?<!\w192)\.168\.\d+\.\d+\b"), "192.168."),
+    (re.compile(r"172(?<!\w172)\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+\b"), "172."),
+    (re.compile(r"/Users/[^/\s]+/\.ssh/"), "/.ssh/"),
+    (re.compile(r"~/\.ssh/"), "~/.ssh/"),
+    # Anchored at token starts: an unanchored ``\S+@`` retries from every
+    # character of a long token and goes quadratic on code blobs. Any
+    # match found mid-token also matches from the token start.
+    (re.compile(r"(?<!\S)\S+@\S+\.\S+"), "@"),
+    (
+        re.compile(r"\+?\d{1,3}[-.\s]??\(?\d{1,4}\)?[-.\s]??\d{1,4}[-.\s]??\d{1,9}"),
+        None,
+    ),
+    (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "-"),
 )
 
 
@@ -60,31 +85,69 @@ class RedactionSizeError(Exception):
 def _redact_iter(text: str) -> str:
     """Apply every secret pattern to ``text`` in order.
 
-    Used by both :func:`redact` and the truncation path so redaction logic
-    is defined in one place.
+    Used by :func:`redact`, the truncation path and :func:`redact_stream`
+    so redaction logic is defined in one place.
     """
-    for pattern in _SECRET_PATTERNS:
-        text = pattern.sub(REDACTED_MARKER, text)
+    for pattern, trigger in _SECRET_PATTERNS:
+        if trigger is None or trigger in text:
+            text = pattern.sub(REDACTED_MARKER, text)
     return text
 
 
-def redact(text: str, *, raise_on_oversize: bool = False) -> str:
+def redact(text: str, *, raise_on_oversize: bool = False, truncate: bool = True) -> str:
     """Replace secret-shaped substrings with ``[REDACTED]``.
 
     By default, content larger than ``MAX_REDACTION_BYTES`` (64KB) is
     truncated to the first 64KB and tagged with a ``[TRUNCATED]`` suffix.
     Set ``raise_on_oversize=True`` to recover the strict behavior, which
-    raises :class:`RedactionSizeError` for oversized input instead.
+    raises :class:`RedactionSizeError` for oversized input instead, or
+    ``truncate=False`` to redact oversized content in full.
     """
     if len(text) > MAX_REDACTION_BYTES:
         if raise_on_oversize:
             raise RedactionSizeError(
                 f"Input of {len(text)} bytes exceeds {MAX_REDACTION_BYTES} cap"
             )
-        return _redact_iter(text[:MAX_REDACTION_BYTES]) + TRUNCATED_MARKER
+        if truncate:
+            return _redact_iter(text[:MAX_REDACTION_BYTES]) + TRUNCATED_MARKER
+        return "".join(
+            redact_stream(
+                text[start : start + MAX_REDACTION_BYTES]
+                for start in range(0, len(text), MAX_REDACTION_BYTES)
+            )
+        )
     return _redact_iter(text)
 
 
+def redact_stream(
+    chunks: Iterable[str], *, overlap: int = STREAM_OVERLAP
+) -> Iterator[str]:
+    """Redact text of any size that arrives in chunks.
+
+    The last ``overlap`` characters of each chunk are held back and
+    redacted together with the next one. Text is only cut at a line break
+    (or other whitespace) so a secret is split across two redaction passes
+    only when it spans a line break or is longer than ``overlap``.
+
+    Yields redacted pieces whose concatenation is the redacted text.
+    """
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        limit = len(pending) - overlap
+        if limit <= 0:
+            continue
+        cut = pending.rfind("\n", 0, limit) + 1
+        if not cut:
+            cut = max(pending.rfind(" ", 0, limit), pending.rfind("\t", 0, limit)) + 1
+        if not cut:
+            cut = limit
+        yield _redact_iter(pending[:cut])
+        pending = pending[cut:]
+    if pending:
+        yield _redact_iter(pending)
+
+
 def redact_metadata(
     metadata: dict[str, object],
     allowlist: set[str],
@@ -131,8 +194,10 @@ __all__ = [
     "ALLOWED_METADATA_KEYS",
     "MAX_REDACTION_BYTES",
     "REDACTED_MARKER",
+    "STREAM_OVERLAP",
     "TRUNCATED_MARKER",
     "RedactionSizeError",
     "redact",
     "redact_metadata",
+    "redact_stream",
 ]
@@ -67,6 +67,7 @@ class SessionMetrics:
         - Session lifecycle (start, end, duration)
         - MCP event emission (success, failure, duration)
         - System health (active sessions, quality scores)
+        - Embedding cache (hits, misses, evictions per tier)
         - Performance (operation latencies)
 
     Attributes:
@@ -79,6 +80,7 @@ class SessionMetrics:
         mcp_event_emit_duration_seconds: Histogram for MCP event duration
         active_sessions: Gauge for currently active sessions
         session_quality_score: Gauge for session quality scores
+        embedding_cache_events_total: Counter for embedding cache events
 
     Example:
         >>> metrics = SessionMetrics()
@@ -185,6 +187,14 @@ class SessionMetrics:
             registry=self.registry,
         )
 
+        # Embedding cache metrics
+        self.embedding_cache_events_total = Counter(
+            "embedding_cache_events_total",
+            "Embedding cache lookups and evictions by tier",
+            ["tier", "event"],
+            registry=self.registry,
+        )
+
         self.logger.info("SessionMetrics initialized with Prometheus collectors")
 
     def record_session_start(self, component_name: str, shell_type: str) -> None:
@@ -351,6 +361,22 @@ class SessionMetrics:
             quality_score,
         )
 
+    def record_embedding_cache_event(
+        self, tier: str, event: str, count: int = 1
+    ) -> None:
+        """Record embedding cache hits, misses or evictions.
+
+        Args:
+            tier: Cache tier ("memory" or "disk")
+            event: Event type ("hit", "miss", "eviction")
+            count: Number of events to record
+
+        Example:
+            >>> metrics = SessionMetrics()
+            >>> metrics.record_embedding_cache_event("memory", "hit")
+        """
+        self.embedding_cache_events_total.labels(tier=tier, event=event).inc(count)
+
     def export_metrics(self) -> bytes:
         """Export metrics in Prometheus text format.
 
@@ -770,6 +770,8 @@ async def _delete_duplicate_content(
                     f"DELETE FROM {db._table('reflections')} WHERE id = ?",
                     [item_id],
                 )
+            if hasattr(db, "_remove_fingerprint_bands"):
+                db._remove_fingerprint_bands(item_type, [item_id])
 
             duplicates_removed += 1
             ids_removed.append(item_id)
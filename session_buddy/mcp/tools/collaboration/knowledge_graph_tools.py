@@ -699,6 +699,7 @@ async def _generate_embeddings_impl(
     entity_type: str | None = None,
     batch_size: int = 50,
     overwrite: bool = False,
+    cursor: str | None = None,
 ) -> str:
     """Generate embeddings for entities missing them."""
 
@@ -707,6 +708,7 @@ async def _generate_embeddings_impl(
             entity_type=entity_type,
             batch_size=batch_size,
             overwrite=overwrite,
+            cursor=cursor,
         )
 
         lines = [
@@ -716,6 +718,10 @@ async def _generate_embeddings_impl(
             f"❌ Failed: {result['failed']}",
             f"📊 Total Processed: {result['total_processed']}",
         ]
+        if result.get("entities_per_second"):
+            lines.append(f"⚡ Throughput: {result['entities_per_second']} entities/s")
+        if result.get("cursor"):
+            lines.append(f"🔖 Resume cursor: {result['cursor']}")
 
         _get_logger().info(
             "Embeddings generated",
@@ -926,9 +932,12 @@ def register_knowledge_graph_tools(mcp_server: Any) -> None:
         entity_type: str | None = None,
         batch_size: int = 50,
         overwrite: bool = False,
+        cursor: str | None = None,
     ) -> str:
         """Generate embeddings for entities missing them."""
-        return await _generate_embeddings_impl(entity_type, batch_size, overwrite)
+        return await _generate_embeddings_impl(
+            entity_type, batch_size, overwrite, cursor
+        )
 
     @mcp_server.tool()  # type: ignore[untyped-decorator]
     async def discover_relationships(
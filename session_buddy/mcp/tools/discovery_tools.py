@@ -64,6 +64,7 @@ ALL_TOOLS_REGISTRY: dict[str, str] = {
     "search_code": "Search code patterns in reflections.",
     "search_code_patterns": "Search for code patterns with regex support.",
     "search_errors": "Search for error patterns.",
+    "rebuild_pattern_index": "Backfill the code/error pattern index from stored conversations.",
     "search_temporal": "Search by time expression.",
     "get_more_results": "Get additional search results.",
     "search_regex": "Regex-based search across reflections.",
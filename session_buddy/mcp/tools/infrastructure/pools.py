@@ -172,7 +172,8 @@ async def pool_route_task(
     Args:
         prompt: Task prompt/instruction
         context: Optional execution context
-        selector: Pool selection strategy (least_loaded, round_robin, random)
+        selector: Pool selection strategy (least_loaded, round_robin, random,
+            latency)
         timeout: Maximum time to wait for result (seconds)
 
     Returns:
@@ -407,7 +408,7 @@ def _register_pool_execution_tools(mcp: FastMCP) -> None:
     async def create_pool(
         pool_id: str | None = None,
     ) -> str:
-        """Create a new worker pool with exactly 3 workers."""
+        """Create a new elastic worker pool (3 workers, scaling up under load)."""
         result = await pool_create(pool_id=pool_id)
         if result["success"]:
             return f"✅ Created pool {result['pool_id']} with {result['workers_count']} workers"
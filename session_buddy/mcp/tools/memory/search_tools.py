@@ -970,6 +970,23 @@ async def _reflection_stats_impl() -> str:
     return await execute_simple_database_tool(operation, "Reflection stats")
 
 
+async def _rebuild_pattern_index_operation(db: ReflectionDatabase) -> str:
+    """Execute pattern index rebuild operation."""
+    from session_buddy.search_enhanced import EnhancedSearchEngine
+
+    indexed = EnhancedSearchEngine(db).rebuild_pattern_index()
+    return f"✅ Re-extracted code and error patterns from {indexed} conversations"
+
+
+async def _rebuild_pattern_index_impl() -> str:
+    """Backfill the code/error pattern index from stored conversations."""
+
+    async def operation(db: ReflectionDatabase) -> str:
+        return await _rebuild_pattern_index_operation(db)
+
+    return await execute_simple_database_tool(operation, "Rebuild pattern index")
+
+
 async def _session_learning_report_impl(
     session_id: str, window_hours: int = 24
 ) -> dict[str, Any]:
@@ -1582,6 +1599,15 @@ def _register_code_and_error_search_tools(mcp: Any) -> None:
     ) -> str:
         return await _search_errors_impl(query, error_type, limit, project)
 
+    @mcp.tool()  # type: ignore[untyped-decorator]
+    async def rebuild_pattern_index() -> str:
+        """Re-extract code and error patterns for every stored conversation.
+
+        New conversations are indexed as they are stored; run this after
+        upgrading to backfill older history or after the extractors change.
+        """
+        return await _rebuild_pattern_index_impl()
+
     @mcp.tool()  # type: ignore[untyped-decorator]
     async def search_temporal(
         time_expression: str,
@@ -1654,10 +1680,17 @@ def _register_progressive_search_tools(mcp: Any) -> None:
         max_results: int = 30,
         max_tiers: int = 4,
         enable_early_stop: bool = True,
+        concurrent: bool = False,
     ) -> dict[str, Any]:
         """Execute multi-tier progressive search with early stopping."""
         return await _progressive_search_impl(
-            query, project, min_score, max_results, max_tiers, enable_early_stop
+            query,
+            project,
+            min_score,
+            max_results,
+            max_tiers,
+            enable_early_stop,
+            concurrent,
         )
 
     @mcp.tool()  # type: ignore[untyped-decorator]
@@ -1721,6 +1754,7 @@ async def _progressive_search_impl(
     max_results: int = 30,
     max_tiers: int = 4,
     enable_early_stop: bool = True,
+    concurrent: bool = False,
 ) -> dict[str, Any]:
     """Execute progressive search across multiple tiers.
 
@@ -1731,6 +1765,7 @@ async def _progressive_search_impl(
         max_results: Maximum total results across all tiers
         max_tiers: Maximum number of tiers to search (1-4)
         enable_early_stop: Whether to enable early stopping optimization
+        concurrent: Launch all tiers at once instead of one after another
 
     Returns:
         Dictionary with search results and metadata
@@ -1746,6 +1781,7 @@ async def _progressive_search_impl(
             max_results=max_results,
             max_tiers=max_tiers,
             enable_early_stop=enable_early_stop,
+            concurrent=concurrent,
         )
 
         # Format results for display
@@ -1766,6 +1802,7 @@ async def _progressive_search_impl(
             "early_stop": result.early_stop,
             "total_latency_ms": result.total_latency_ms,
             "early_stop_reason": result.metadata.get("early_stop_reason"),
+            "mode": result.metadata.get("mode"),
             "sample_results": formatted_results,
         }
 
@@ -1844,6 +1881,7 @@ async def _configure_tiers_impl(
                 "perfect_match_threshold": config.perfect_match_threshold,
                 "max_tiers": config.max_tiers,
                 "tier_timeout_ms": config.tier_timeout_ms,
+                "concurrent_tiers": config.concurrent_tiers,
                 "quality_weight": config.quality_weight,
                 "quantity_weight": config.quantity_weight,
             },
@@ -0,0 +1,212 @@
+"""Buffered writer for ``memory_access_log`` instrumentation.
+
+Every search records an access event for the Conscious Agent analysis
+loop. Writing each event with its own ``INSERT`` puts a DuckDB write on
+the read path, including cache hits. :class:`AccessLogWriter` instead
+appends events to a bounded in-memory ring buffer and writes them in
+batches from a background task:
+
+* a batch is flushed once ``batch_size`` events are buffered, or
+  ``flush_interval`` seconds after the first unflushed event;
+* when writes cannot keep up, the oldest buffered events are overwritten
+  and counted as dropped rather than slowing readers down;
+* pending events are flushed on ``aclose()`` and by the shutdown hook
+  registered through :func:`flush_all_access_logs`.
+
+Recording never raises: instrumentation must not break the read path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+import weakref
+from collections import deque
+from contextlib import suppress
+from datetime import UTC, datetime
+
+from ulid import ULID
+
+logger = logging.getLogger(__name__)
+
+# (memory_id, access_type, query_text, timestamp)
+_AccessEvent = tuple[str | None, str, str | None, datetime]
+
+# Writers with events that a shutdown must not lose
+_live_writers: weakref.WeakSet[AccessLogWriter] = weakref.WeakSet()
+
+
+class AccessLogWriter:
+    """Batch ``memory_access_log`` rows through a bounded ring buffer."""
+
+    def __init__(
+        self,
+        conn: t.Any,
+        *,
+        capacity: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Buffer events for ``conn``.
+
+        Args:
+            conn: DuckDB connection owning ``memory_access_log``
+            capacity: Events held before the oldest are dropped
+            batch_size: Buffered events that trigger an immediate flush
+            flush_interval: Seconds an event may wait for a flush
+
+        """
+        self.conn = conn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: deque[_AccessEvent] = deque(maxlen=capacity)
+        self._flush_task: asyncio.Task[None] | None = None
+        self._write_lock = asyncio.Lock()
+        self._recorded = 0
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._write_errors = 0
+        _live_writers.add(self)
+
+    def record(
+        self,
+        memory_id: str | None,
+        access_type: str,
+        query_text: str | None = None,
+    ) -> None:
+        """Buffer one access event; a flush is scheduled, never awaited."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append((memory_id, access_type, query_text, datetime.now(UTC)))
+        self._recorded += 1
+        self._schedule_flush(immediate=len(self._buffer) >= self.batch_size)
+
+    def flush(self) -> int:
+        """Write every buffered event on the calling thread.
+
+        Returns:
+            Number of rows written
+
+        """
+        events = self._drain()
+        if events:
+            self._write(self.conn, events)
+        return len(events)
+
+    async def aflush(self) -> int:
+        """Write every buffered event from a worker thread.
+
+        Returns:
+            Number of rows written
+
+        """
+        async with self._write_lock:
+            events = self._drain()
+            if not events:
+                return 0
+            # A cursor is a separate DuckDB connection to the same database,
+            # so the write does not contend with the loop's connection.
+            await asyncio.to_thread(self._write_with_cursor, events)
+            return len(events)
+
+    async def aclose(self) -> None:
+        """Cancel the scheduled flush and write what is still buffered."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await self.aflush()
+        _live_writers.discard(self)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return buffer and throughput counters."""
+        return {
+            "buffered": len(self._buffer),
+            "capacity": self._buffer.maxlen or 0,
+            "recorded": self._recorded,
+            "written": self._written,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "write_errors": self._write_errors,
+        }
+
+    def _schedule_flush(self, *, immediate: bool) -> None:
+        """Start a background flush unless one is already pending."""
+        if self._flush_task is not None and not self._flush_task.done():
+            if not immediate:
+                return
+            # A full batch does not wait out the pending timer
+            self._flush_task.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to flush from: sync callers pay for the write
+            if immediate:
+                self.flush()
+            return
+        self._flush_task = loop.create_task(
+            self._flush_after(0.0 if immediate else self.flush_interval)
+        )
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        await self.aflush()
+
+    def _drain(self) -> list[_AccessEvent]:
+        events = list(self._buffer)
+        self._buffer.clear()
+        return events
+
+    def _write_with_cursor(self, events: list[_AccessEvent]) -> None:
+        try:
+            cursor = self.conn.cursor()
+        except Exception:
+            # Connection already closed; nothing left to write to
+            self._write_errors += 1
+            logger.debug("memory_access_log flush failed", exc_info=True)
+            return
+        with cursor:
+            self._write(cursor, events)
+
+    def _write(self, conn: t.Any, events: list[_AccessEvent]) -> None:
+        """Insert ``events`` with one statement; failures are logged and dropped."""
+        memory_ids, access_types, query_texts, timestamps = zip(*events, strict=True)
+        try:
+            conn.execute(
+                """
+                INSERT INTO memory_access_log (
+                    id, memory_id, access_type, query_text, timestamp
+                )
+                SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::TIMESTAMPTZ[])::TIMESTAMP
+                """,
+                [
+                    [str(ULID()) for _ in events],
+                    list(memory_ids),
+                    list(access_types),
+                    list(query_texts),
+                    list(timestamps),
+                ],
+            )
+        except Exception:
+            # Instrumentation must NEVER break the read path.
+            self._write_errors += 1
+            logger.debug("memory_access_log write failed", exc_info=True)
+            return
+        self._written += len(events)
+        self._flushes += 1
+
+
+async def flush_all_access_logs() -> None:
+    """Flush every live writer; registered as a shutdown cleanup task."""
+    for writer in list(_live_writers):
+        with suppress(Exception):
+            await writer.aflush()
+
+
+__all__ = ["AccessLogWriter", "flush_all_access_logs"]
@@ -1,42 +1,99 @@
 """Worker pool management for Session-Buddy delegated execution.
 
-This module provides pool management for coordinating exactly 3 workers
-per pool, with task queues, health monitoring, and statistics tracking.
+This module provides pool management for coordinating elastic worker pools
+with priority task queues, admission control, health monitoring, and
+statistics tracking.
+
+A pool starts ``min_workers`` workers and adds more, up to ``max_workers``,
+while queued tasks outnumber idle workers and the estimated queue wait
+(backlog times the EWMA of service time) exceeds ``SCALE_UP_WAIT_SECONDS``.
+Workers that stay idle for ``idle_timeout`` seconds retire until the pool is
+back at ``min_workers``.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
+from .utils.db_executor import LatencyHistogram
 from .worker import Task, Worker
 
 logger = logging.getLogger(__name__)
 
 
-# Number of workers per pool (fixed at 3 per architecture)
+# Default (minimum) number of workers per pool
 WORKERS_PER_POOL = 3
 
+# Upper bound on workers a pool scales up to by default
+MAX_WORKERS_PER_POOL = 12
+
+# Queued tasks beyond which new submissions are rejected
+DEFAULT_MAX_QUEUE_SIZE = 256
+
+# Seconds a worker may idle before it retires (down to min_workers)
+SCALE_DOWN_IDLE_SECONDS = 30.0
+
+# Estimated queue wait above which another worker is started
+SCALE_UP_WAIT_SECONDS = 0.5
+
+# Weight of the newest sample in the service time moving average
+EWMA_ALPHA = 0.2
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when a pool's queue is full and it cannot accept more tasks."""
+
 
 class WorkerPool:
-    """Manages exactly 3 workers for delegated execution.
+    """Manages an elastic set of workers for delegated execution.
 
-    Each pool maintains a task queue and coordinates 3 workers
-    to process tasks asynchronously with health monitoring.
+    Each pool maintains a priority task queue and scales its workers between
+    ``min_workers`` and ``max_workers`` with the backlog, tracking queue
+    wait and execution time separately.
     """
 
-    def __init__(self, pool_id: str | None = None) -> None:
+    def __init__(
+        self,
+        pool_id: str | None = None,
+        *,
+        min_workers: int = WORKERS_PER_POOL,
+        max_workers: int = MAX_WORKERS_PER_POOL,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        idle_timeout: float = SCALE_DOWN_IDLE_SECONDS,
+    ) -> None:
         """Initialize a new worker pool.
 
         Args:
             pool_id: Optional pool identifier (auto-generated if not provided)
+            min_workers: Workers started up front and kept while idle
+            max_workers: Most workers the pool scales up to
+            max_queue_size: Queued tasks beyond which submissions are rejected
+            idle_timeout: Seconds an extra worker may idle before retiring
+
+        Raises:
+            ValueError: If the worker or queue bounds are invalid
         """
+        if min_workers < 1:
+            raise ValueError("min_workers must be at least 1")
+        if max_workers < min_workers:
+            raise ValueError("max_workers must be at least min_workers")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
         self.pool_id = pool_id or f"pool_{uuid.uuid4().hex[:8]}"
-        self.task_queue: asyncio.Queue[Task] = asyncio.Queue()
+        # Tasks order themselves by priority, deadline and submission
+        self.task_queue: asyncio.Queue[Task] = asyncio.PriorityQueue()
         self.workers: list[Worker] = []
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.idle_timeout = idle_timeout
+        self._worker_seq = 0
 
         # Pool state
         self.running = False
@@ -47,24 +104,28 @@ class WorkerPool:
         self.tasks_submitted = 0
         self.tasks_completed = 0
         self.tasks_failed = 0
+        self.tasks_rejected = 0
+        self.tasks_cancelled = 0
+        self.tasks_expired = 0
+        self.workers_started = 0
+        self.workers_retired = 0
+        self.queue_wait = LatencyHistogram()
+        self.execution_time = LatencyHistogram()
+        # Moving average of task execution seconds, None until a task ran
+        self.ewma_service_time: float | None = None
 
         logger.info(f"Worker pool {self.pool_id} created")
 
     async def initialize(self) -> None:
-        """Initialize exactly 3 workers for the pool."""
+        """Start the pool's minimum number of workers."""
         if self.running:
             logger.warning(f"Pool {self.pool_id} is already initialized")
             return
 
-        logger.info(f"Initializing {WORKERS_PER_POOL} workers for pool {self.pool_id}")
+        logger.info(f"Initializing {self.min_workers} workers for pool {self.pool_id}")
 
-        # Create exactly 3 workers
-        for i in range(WORKERS_PER_POOL):
-            worker_id = f"{self.pool_id}-worker-{i}"
-            worker = Worker(
-                worker_id=worker_id, queue=self.task_queue, pool_id=self.pool_id
-            )
-            self.workers.append(worker)
+        for _ in range(self.min_workers):
+            self.workers.append(self._create_worker())
 
         # Start all workers
         for worker in self.workers:
@@ -75,6 +136,121 @@ class WorkerPool:
 
         logger.info(f"Pool {self.pool_id} initialized with {len(self.workers)} workers")
 
+    def _create_worker(self) -> Worker:
+        """Create (but not start) a worker wired to the pool's callbacks."""
+        worker_id = f"{self.pool_id}-worker-{self._worker_seq}"
+        self._worker_seq += 1
+        self.workers_started += 1
+        return Worker(
+            worker_id=worker_id,
+            queue=self.task_queue,
+            pool_id=self.pool_id,
+            idle_timeout=self.idle_timeout,
+            on_idle=self._retire_idle_worker,
+            on_task_done=self._record_task,
+        )
+
+    def _retire_idle_worker(self, worker: Worker) -> bool:
+        """Let an idle worker exit while the pool is above ``min_workers``."""
+        if not self.running or len(self.workers) <= self.min_workers:
+            return False
+        if worker in self.workers:
+            self.workers.remove(worker)
+        self.workers_retired += 1
+        logger.info(
+            f"Pool {self.pool_id} scaled down to {len(self.workers)} workers "
+            f"(retired {worker.worker_id})"
+        )
+        return True
+
+    def _idle_workers(self) -> int:
+        return sum(1 for worker in self.workers if worker.idle is True)
+
+    def estimated_wait(self) -> float:
+        """Estimate seconds until a newly submitted task would finish.
+
+        Uses the backlog (queued plus running tasks) spread over the pool's
+        workers, times the moving average of service time. Pools that have
+        not run a task yet estimate zero.
+        """
+        if self.ewma_service_time is None:
+            return 0.0
+        busy = len(self.workers) - self._idle_workers()
+        backlog = self.task_queue.qsize() + busy
+        return (backlog / max(len(self.workers), 1) + 1) * self.ewma_service_time
+
+    async def _maybe_scale_up(self) -> None:
+        """Start workers while the backlog outgrows the idle workers.
+
+        One worker is added per queued task that no idle worker can pick up,
+        as long as the estimated wait is above ``SCALE_UP_WAIT_SECONDS`` (or
+        unknown, before any task has completed) and ``max_workers`` allows.
+        """
+        backlog = self.task_queue.qsize() - self._idle_workers()
+        if backlog <= 0 or len(self.workers) >= self.max_workers:
+            return
+        if (
+            self.ewma_service_time is not None
+            and self.task_queue.qsize()
+            * self.ewma_service_time
+            / max(len(self.workers), 1)
+            <= SCALE_UP_WAIT_SECONDS
+        ):
+            return
+
+        added = min(backlog, self.max_workers - len(self.workers))
+        new_workers = [self._create_worker() for _ in range(added)]
+        self.workers.extend(new_workers)
+        for worker in new_workers:
+            await worker.start()
+        logger.info(
+            f"Pool {self.pool_id} scaled up to {len(self.workers)} workers "
+            f"(backlog {self.task_queue.qsize()})"
+        )
+
+    def _record_task(self, task: Task) -> None:
+        """Record queue wait and execution time of a task a worker finished."""
+        if task.queue_wait is not None:
+            self.queue_wait.observe(task.queue_wait * 1000)
+        if task.status == "expired" and task.started_at is None:
+            # Dropped in the queue: it never used a worker
+            return
+        if task.execution_time is not None:
+            self.execution_time.observe(task.execution_time * 1000)
+            if self.ewma_service_time is None:
+                self.ewma_service_time = task.execution_time
+            else:
+                self.ewma_service_time += EWMA_ALPHA * (
+                    task.execution_time - self.ewma_service_time
+                )
+
+    def _check_capacity(self, count: int = 1) -> None:
+        """Reject submissions that would grow the queue past its limit.
+
+        Raises:
+            PoolSaturatedError: If ``count`` more tasks do not fit
+        """
+        if self.task_queue.qsize() + count > self.max_queue_size:
+            self.tasks_rejected += count
+            raise PoolSaturatedError(
+                f"Pool {self.pool_id} queue is full "
+                f"({self.task_queue.qsize()}/{self.max_queue_size} tasks)"
+            )
+
+    def _enqueue_time(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def _settle(self, task: Task, error: BaseException) -> None:
+        """Count a task the caller gave up on or that did not succeed.
+
+        A caller that stops waiting (timeout or cancellation) cancels the
+        task so it is skipped in the queue or stopped if already running.
+        """
+        if isinstance(error, (TimeoutError, asyncio.CancelledError)) and task.cancel():
+            self.tasks_cancelled += 1
+        if task.status == "expired":
+            self.tasks_expired += 1
+
     async def shutdown(self, timeout: float = 5.0) -> None:
         """Shutdown the pool and all workers.
 
@@ -87,11 +263,16 @@ class WorkerPool:
         logger.info(f"Shutting down pool {self.pool_id}")
 
         # Stop all workers
+        self.running = False
         stop_tasks = [worker.stop(timeout=timeout) for worker in self.workers]
         await asyncio.gather(*stop_tasks, return_exceptions=True)
 
         self.workers.clear()
-        self.running = False
+
+        # Release callers still waiting on tasks nobody will run
+        for _ in range(self.task_queue.qsize()):
+            if self.task_queue.get_nowait().cancel():
+                self.tasks_cancelled += 1
 
         logger.info(f"Pool {self.pool_id} shut down")
 
@@ -100,35 +281,52 @@ class WorkerPool:
         prompt: str,
         context: dict[str, Any] | None = None,
         timeout: float | None = None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
     ) -> Any:
         """Execute a task on the pool.
 
         Args:
             prompt: Task prompt/instruction
             context: Optional execution context
-            timeout: Maximum time to wait for result
+            timeout: Maximum time to wait for result; the task is cancelled
+                when it runs out
+            priority: Lower numbers are executed first
+            deadline: Event loop time by which the task must finish
 
         Returns:
             Task execution result
 
         Raises:
             RuntimeError: If pool is not running
-            asyncio.TimeoutError: If task execution times out
+            PoolSaturatedError: If the pool's queue is full
+            asyncio.TimeoutError: If task execution times out or misses its
+                deadline
             Exception: If task execution fails
         """
         if not self.running:
             raise RuntimeError(f"Pool {self.pool_id} is not running")
+        self._check_capacity()
 
         # Create task
         task_id = f"{self.pool_id}-task-{self.tasks_submitted}"
-        task = Task(task_id=task_id, prompt=prompt, context=context)
+        task = Task(
+            task_id=task_id,
+            prompt=prompt,
+            context=context,
+            priority=priority,
+            deadline=deadline,
+        )
 
         self.tasks_submitted += 1
 
         logger.info(f"Submitting task {task_id} to pool {self.pool_id}")
 
         # Add task to queue (workers will pick it up)
+        task.enqueued_at = self._enqueue_time()
         await self.task_queue.put(task)
+        await self._maybe_scale_up()
 
         # Wait for result
         try:
@@ -139,8 +337,12 @@ class WorkerPool:
             logger.info(f"Task {task_id} completed successfully")
             return result
 
+        except asyncio.CancelledError as e:
+            self._settle(task, e)
+            raise
         except Exception as e:
             self.tasks_failed += 1
+            self._settle(task, e)
             logger.error(f"Task {task_id} failed: {e}")
             raise
 
@@ -149,43 +351,71 @@ class WorkerPool:
         prompts: list[str],
         context: dict[str, Any] | None = None,
         timeout: float | None = None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
     ) -> list[Any]:
         """Execute multiple tasks in parallel.
 
+        The batch is admitted as a whole: if it does not fit in the queue
+        none of its tasks are submitted.
+
         Args:
             prompts: List of task prompts
             context: Optional shared execution context
             timeout: Maximum time to wait for each result
+            priority: Lower numbers are executed first
+            deadline: Event loop time by which every task must finish
 
         Returns:
             List of task results in same order as prompts
+
+        Raises:
+            RuntimeError: If pool is not running
+            PoolSaturatedError: If the batch does not fit in the queue
         """
         if not self.running:
             raise RuntimeError(f"Pool {self.pool_id} is not running")
+        self._check_capacity(len(prompts))
 
         # Create tasks
         tasks = []
         for i, prompt in enumerate(prompts):
             task_id = f"{self.pool_id}-batch-{self.tasks_submitted + i}"
-            task = Task(task_id=task_id, prompt=prompt, context=context)
+            task = Task(
+                task_id=task_id,
+                prompt=prompt,
+                context=context,
+                priority=priority,
+                deadline=deadline,
+            )
             tasks.append(task)
 
         self.tasks_submitted += len(tasks)
 
         # Submit all tasks to queue
+        enqueued_at = self._enqueue_time()
         for task in tasks:
+            task.enqueued_at = enqueued_at
             await self.task_queue.put(task)
+        await self._maybe_scale_up()
 
         # Wait for all results
-        results = await asyncio.gather(
-            *[task.wait_for_result(timeout=timeout) for task in tasks],
-            return_exceptions=True,
-        )
+        try:
+            results = await asyncio.gather(
+                *[task.wait_for_result(timeout=timeout) for task in tasks],
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError as e:
+            for task in tasks:
+                self._settle(task, e)
+            raise
 
         # Update statistics
-        for result in results:
+        for task, result in zip(tasks, results, strict=True):
             if isinstance(result, Exception):
                 self.tasks_failed += 1
+                self._settle(task, result)
             else:
                 self.tasks_completed += 1
 
@@ -229,10 +459,21 @@ class WorkerPool:
             "pool_id": self.pool_id,
             "running": self.running,
             "workers_count": len(self.workers),
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "workers_started": self.workers_started,
+            "workers_retired": self.workers_retired,
             "queue_size": self.task_queue.qsize(),
+            "max_queue_size": self.max_queue_size,
             "tasks_submitted": self.tasks_submitted,
             "tasks_completed": self.tasks_completed,
             "tasks_failed": self.tasks_failed,
+            "tasks_rejected": self.tasks_rejected,
+            "tasks_cancelled": self.tasks_cancelled,
+            "tasks_expired": self.tasks_expired,
+            "ewma_service_time": self.ewma_service_time,
+            "queue_wait": self.queue_wait.snapshot(),
+            "execution_time": self.execution_time.snapshot(),
             "success_rate": (
                 self.tasks_completed / self.tasks_submitted
                 if self.tasks_submitted > 0
@@ -263,6 +504,7 @@ class PoolManager:
         self.pools: dict[str, WorkerPool] = {}
         self._lock = asyncio.Lock()
         self.running = False
+        self._round_robin = 0
 
         logger.info("Pool manager initialized")
 
@@ -291,11 +533,15 @@ class PoolManager:
         self.running = False
         logger.info("Pool manager stopped")
 
-    async def create_pool(self, pool_id: str | None = None) -> WorkerPool:
+    async def create_pool(
+        self, pool_id: str | None = None, **pool_options: Any
+    ) -> WorkerPool:
         """Create a new worker pool.
 
         Args:
             pool_id: Optional pool identifier (auto-generated if not provided)
+            **pool_options: ``WorkerPool`` sizing options (``min_workers``,
+                ``max_workers``, ``max_queue_size``, ``idle_timeout``)
 
         Returns:
             Created pool
@@ -304,7 +550,7 @@ class PoolManager:
             if pool_id and pool_id in self.pools:
                 raise ValueError(f"Pool {pool_id} already exists")
 
-            pool = WorkerPool(pool_id=pool_id)
+            pool = WorkerPool(pool_id=pool_id, **pool_options)
             await pool.initialize()
 
             self.pools[pool.pool_id] = pool
@@ -357,6 +603,9 @@ class PoolManager:
         prompt: str,
         context: dict[str, Any] | None = None,
         timeout: float | None = None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
     ) -> Any:
         """Execute a task on a specific pool.
 
@@ -365,18 +614,44 @@ class PoolManager:
             prompt: Task prompt
             context: Optional execution context
             timeout: Maximum time to wait for result
+            priority: Lower numbers are executed first
+            deadline: Event loop time by which the task must finish
 
         Returns:
             Task result
 
         Raises:
             ValueError: If pool not found
+            PoolSaturatedError: If the pool's queue is full
         """
         pool = await self.get_pool(pool_id)
         if not pool:
             raise ValueError(f"Pool {pool_id} not found")
 
-        return await pool.execute(prompt=prompt, context=context, timeout=timeout)
+        return await pool.execute(
+            prompt=prompt,
+            context=context,
+            timeout=timeout,
+            priority=priority,
+            deadline=deadline,
+        )
+
+    def _rank_pools(self, selector: str) -> list[WorkerPool]:
+        """Order pools by preference for the given selection strategy."""
+        pools = list(self.pools.values())
+        if selector == "least_loaded":
+            # Smallest queue first
+            return sorted(pools, key=lambda p: p.task_queue.qsize())
+        if selector == "round_robin":
+            start = self._round_robin % len(pools)
+            self._round_robin += 1
+            return pools[start:] + pools[:start]
+        if selector == "random":
+            return random.sample(pools, len(pools))
+        if selector == "latency":
+            # Lowest expected completion time from the EWMA of service time
+            return sorted(pools, key=lambda p: p.estimated_wait())
+        raise ValueError(f"Unknown selector strategy: {selector}")
 
     async def route_task(
         self,
@@ -384,45 +659,54 @@ class PoolManager:
         context: dict[str, Any] | None = None,
         selector: str = "least_loaded",
         timeout: float | None = None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
     ) -> tuple[str, Any]:
         """Route task to best available pool.
 
+        A saturated pool is skipped in favour of the next one in the
+        strategy's order.
+
         Args:
             prompt: Task prompt
             context: Optional execution context
-            selector: Pool selection strategy (round_robin, least_loaded, random)
+            selector: Pool selection strategy (least_loaded, round_robin,
+                random, latency)
             timeout: Maximum time to wait for result
+            priority: Lower numbers are executed first
+            deadline: Event loop time by which the task must finish
 
         Returns:
             Tuple of (pool_id, task_result)
 
         Raises:
             ValueError: If no pools available
+            PoolSaturatedError: If every pool's queue is full
         """
         async with self._lock:
             if not self.pools:
                 raise ValueError("No pools available for routing")
 
-            # Select pool based on strategy
-            if selector == "least_loaded":
-                # Select pool with smallest queue
-                pool = min(self.pools.values(), key=lambda p: p.task_queue.qsize())
-            elif selector == "round_robin":
-                # Select first pool (could be enhanced with counter)
-                pool = next(iter(self.pools.values()))
-            elif selector == "random":
-                import random
-
-                pool = random.choice(list(self.pools.values()))
-            else:
-                raise ValueError(f"Unknown selector strategy: {selector}")
-
-            pool_id = pool.pool_id
+            # Rank pools based on strategy
+            candidates = self._rank_pools(selector)
 
         # Execute on selected pool (outside lock)
-        result = await pool.execute(prompt=prompt, context=context, timeout=timeout)
-
-        return pool_id, result
+        for pool in candidates:
+            try:
+                result = await pool.execute(
+                    prompt=prompt,
+                    context=context,
+                    timeout=timeout,
+                    priority=priority,
+                    deadline=deadline,
+                )
+            except PoolSaturatedError:
+                logger.warning(f"Pool {pool.pool_id} saturated, trying next pool")
+                continue
+            return pool.pool_id, result
+
+        raise PoolSaturatedError("All pools are saturated")
 
     async def get_health_status(self) -> dict[str, Any]:
         """Get health status of all pools.
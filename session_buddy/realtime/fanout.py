@@ -0,0 +1,216 @@
+"""Per-client fan-out of metrics frames for the WebSocket server.
+
+Each connected client gets a bounded outbound queue drained by its own
+sender task, so a slow consumer only delays itself. Frames are encoded once
+per topic and tick and shared by every client subscribed to that topic.
+
+Topics are ``None`` (all skills) or a skill name. After a client has
+received a topic's full ``metrics_update`` snapshot it is sent
+``metrics_delta`` messages carrying only what changed since the previous
+frame. A client whose queue fills up has its backlog replaced by the latest
+snapshot, which is all it needs to catch up.
+
+Example:
+    >>> frames = TopicFrames(topic=None, seq=2, base_seq=1,
+    ...                      snapshot_message=snapshot, delta_message=delta)
+    >>> channel = ClientChannel(websocket, on_close=server.unregister_client)
+    >>> channel.offer(frames)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from websockets.exceptions import ConnectionClosed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from websockets.asyncio.server import ServerConnection
+
+logger = logging.getLogger(__name__)
+
+# Frames queued per client before its backlog is coalesced into a snapshot
+DEFAULT_QUEUE_SIZE = 8
+
+
+class TopicFrames:
+    """Frames of one topic for one broadcast tick, encoded on first use.
+
+    Attributes:
+        topic: Skill name, or None for the all-skills topic
+        seq: Sequence number of this frame (the broadcast tick)
+        base_seq: Sequence number of the topic's previous frame, if any
+    """
+
+    def __init__(
+        self,
+        topic: str | None,
+        seq: int,
+        base_seq: int | None,
+        snapshot_message: dict[str, Any],
+        delta_message: dict[str, Any] | None,
+    ) -> None:
+        self.topic = topic
+        self.seq = seq
+        self.base_seq = base_seq
+        self._snapshot_message = snapshot_message
+        self._delta_message = delta_message
+
+    @cached_property
+    def snapshot(self) -> str:
+        """Full ``metrics_update`` message as JSON."""
+        return json.dumps(self._snapshot_message)
+
+    @cached_property
+    def delta(self) -> str | None:
+        """``metrics_delta`` message as JSON, None if nothing changed."""
+        if self._delta_message is None:
+            return None
+        return json.dumps(self._delta_message)
+
+
+def diff_metrics(
+    previous: dict[str, Any], current: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Describe how a metrics payload changed.
+
+    Args:
+        previous: ``data`` of the topic's previous frame
+        current: ``data`` of the new frame
+
+    Returns:
+        Delta with ``top_skills`` changes (``changed`` entries hold the skill
+        name and the fields that differ; ``removed`` and ``order`` are
+        present when skills left or moved) and ``anomalies`` when they
+        changed, or None if nothing changed
+
+    Example:
+        >>> diff_metrics({"top_skills": [a], "anomalies": []},
+        ...              {"top_skills": [a_updated], "anomalies": []})
+        {'top_skills': {'changed': [{'skill_name': ..., 'completion_rate': ...}]}}
+    """
+    delta: dict[str, Any] = {}
+
+    old_skills = {skill["skill_name"]: skill for skill in previous["top_skills"]}
+    new_order = [skill["skill_name"] for skill in current["top_skills"]]
+    new_names = set(new_order)
+
+    changed: list[dict[str, Any]] = []
+    for skill in current["top_skills"]:
+        old = old_skills.get(skill["skill_name"], {})
+        fields = {key: value for key, value in skill.items() if old.get(key) != value}
+        if fields:
+            changed.append({"skill_name": skill["skill_name"], **fields})
+
+    skills: dict[str, Any] = {}
+    if changed:
+        skills["changed"] = changed
+    removed = [name for name in old_skills if name not in new_names]
+    if removed:
+        skills["removed"] = removed
+    if new_order != list(old_skills):
+        skills["order"] = new_order
+    if skills:
+        delta["top_skills"] = skills
+
+    if current["anomalies"] != previous["anomalies"]:
+        delta["anomalies"] = current["anomalies"]
+
+    return delta or None
+
+
+class ClientChannel:
+    """Bounded outbound queue and sender task of one WebSocket client.
+
+    Attributes:
+        websocket: Client connection
+        dropped: Number of frames discarded by coalescing
+    """
+
+    def __init__(
+        self,
+        websocket: ServerConnection,
+        *,
+        on_close: Callable[[ServerConnection], None],
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self.websocket = websocket
+        self.dropped = 0
+        self._on_close = on_close
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        # (topic, seq) of the last frame queued, to know if a delta applies
+        self._position: tuple[str | None, int] | None = None
+
+    def offer(self, frames: TopicFrames) -> None:
+        """Queue the topic's frame for this tick without waiting.
+
+        Sends the delta when the client already has the previous frame of
+        the same topic, otherwise the full snapshot.
+        """
+        if self._closed:
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+        if self._position == (frames.topic, frames.base_seq):
+            frame = frames.delta
+            if frame is None:
+                self._position = (frames.topic, frames.seq)
+                return
+        else:
+            frame = frames.snapshot
+
+        if self._queue.full():
+            # Coalesce: the snapshot supersedes everything still queued
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped += 1
+            frame = frames.snapshot
+            logger.debug(
+                f"Coalesced backlog for slow client {self.websocket.remote_address}, "  # type: ignore[attr-defined]
+                f"dropped {self.dropped} frames so far"
+            )
+
+        self._queue.put_nowait(frame)
+        self._position = (frames.topic, frames.seq)
+
+    async def _run(self) -> None:
+        """Send queued frames in order until the connection fails."""
+        try:
+            while True:
+                frame = await self._queue.get()
+                await self.websocket.send(frame)  # type: ignore[attr-defined]
+        except ConnectionClosed:
+            logger.debug(f"Client disconnected: {self.websocket.remote_address}")  # type: ignore[attr-defined]
+        except Exception:
+            logger.exception("Error sending to client")
+        self._closed = True
+        self._on_close(self.websocket)
+
+    def close(self) -> asyncio.Task[None] | None:
+        """Stop the sender task and drop queued frames.
+
+        Returns:
+            The cancelled sender task, for callers that want to await it
+        """
+        self._closed = True
+        task, self._task = self._task, None
+        if task is None or task is asyncio.current_task():
+            return None
+        task.cancel()
+        return task
+
+
+__all__ = [
+    "DEFAULT_QUEUE_SIZE",
+    "ClientChannel",
+    "TopicFrames",
+    "diff_metrics",
+]
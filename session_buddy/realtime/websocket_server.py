@@ -35,6 +35,12 @@ from session_buddy.realtime.auth import (
     AUTH_ENABLED,
     get_authenticator,
 )
+from session_buddy.realtime.fanout import (
+    DEFAULT_QUEUE_SIZE,
+    ClientChannel,
+    TopicFrames,
+    diff_metrics,
+)
 from session_buddy.storage.skills_storage import SkillsStorage
 
 logger = logging.getLogger(__name__)
@@ -46,6 +52,12 @@ class RealTimeMetricsServer:
     Broadcasts skill metrics every second to all connected clients.
     Supports subscription to all skills or specific skill monitoring.
 
+    Each client has its own bounded send queue and sender task, so a slow
+    client never delays the broadcast loop or other clients. A client first
+    receives a full ``metrics_update`` for its topic, then ``metrics_delta``
+    messages with only the changed fields (see
+    :mod:`session_buddy.realtime.fanout`).
+
     Attributes:
         host: Server host address
         port: Server port number
@@ -73,6 +85,7 @@ class RealTimeMetricsServer:
         db_path: Path | None = None,
         update_interval: float = 1.0,
         require_auth: bool = False,
+        send_queue_size: int = DEFAULT_QUEUE_SIZE,
     ) -> None:
         """Initialize WebSocket server.
 
@@ -82,11 +95,14 @@ class RealTimeMetricsServer:
             db_path: Path to SQLite database (default: .session-buddy/skills.db)
             update_interval: Seconds between metric broadcasts (default: 1.0)
             require_auth: Require JWT authentication for connections
+            send_queue_size: Metric frames queued per client before its
+                backlog is replaced by the latest snapshot (default: 8)
         """
         self.host = host
         self.port = port
         self.update_interval = update_interval
         self.require_auth = require_auth and AUTH_ENABLED
+        self.send_queue_size = send_queue_size
 
         # Set default database path
         if db_path is None:
@@ -96,6 +112,11 @@ class RealTimeMetricsServer:
         # Client management
         self.clients: set[ServerConnection] = set()
         self.metrics_subscribers: list[Any] = []
+        self._channels: dict[ServerConnection, ClientChannel] = {}
+
+        # Last frame per topic (None = all skills): (seq, data)
+        self._topic_state: dict[str | None, tuple[int, dict[str, Any]]] = {}
+        self._tick = 0
 
         # Storage backend
         self.storage = SkillsStorage(db_path=self.db_path)
@@ -124,6 +145,11 @@ class RealTimeMetricsServer:
             >>> server.register_client(websocket)
         """
         self.clients.add(websocket)
+        self._channels[websocket] = ClientChannel(
+            websocket,
+            on_close=self.unregister_client,
+            max_queue=self.send_queue_size,
+        )
         # Initialize subscription to all skills
         websocket.subscription_skill = None  # ty: ignore[unresolved-attribute]
         logger.info(
@@ -140,7 +166,12 @@ class RealTimeMetricsServer:
         Example:
             >>> server.unregister_client(websocket)
         """
+        if websocket not in self.clients:
+            return
         self.clients.discard(websocket)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
         logger.info(
             f"Client unregistered: {websocket.remote_address}, "  # type: ignore[attr-defined]
             f"remaining clients: {len(self.clients)}"
@@ -239,6 +270,8 @@ class RealTimeMetricsServer:
             >>> await server.broadcast_metrics()
         """
         logger.info("Metrics broadcaster started")
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
 
         while self._running:
             try:
@@ -271,56 +304,79 @@ class RealTimeMetricsServer:
 
                 await self._publish_metrics_snapshot(message)
 
-                # Broadcast to all clients
-                if self.clients:
-                    disconnected: set[ServerConnection] = set()
-                    for client in self.clients:
-                        try:
-                            # Filter by subscription if set
-                            client_subscription: str | None = getattr(
-                                client, "subscription_skill", None
-                            )
-                            if client_subscription:
-                                # Client subscribed to specific skill
-                                top_skills_list = message["data"]["top_skills"]  # type: ignore[index]
-                                skill_data = [
-                                    s
-                                    for s in top_skills_list
-                                    if s["skill_name"] == client_subscription
-                                ]
-                                if skill_data:
-                                    filtered_message = message.copy()
-                                    filtered_message["data"] = {
-                                        "top_skills": skill_data,
-                                        "anomalies": [],
-                                    }
-                                    await client.send(json.dumps(filtered_message))  # type: ignore[attr-defined]
-                            else:
-                                # Client subscribed to all skills
-                                await client.send(json.dumps(message))  # type: ignore[attr-defined]
-
-                        except ConnectionClosed:
-                            logger.debug(
-                                f"Client disconnected: {client.remote_address}"  # type: ignore[attr-defined]
-                            )
-                            disconnected.add(client)
-                        except Exception:
-                            logger.exception("Error sending to client")
-                            disconnected.add(client)
-
-                    # Clean up disconnected clients
-                    for client in disconnected:
-                        self.unregister_client(client)
-
-                # Wait for next interval
-                await asyncio.sleep(self.update_interval)
+                # Queue frames for all clients; sending happens per client
+                self._fan_out(message)
 
             except Exception:
                 logger.exception("Error in broadcast_metrics")
-                await asyncio.sleep(self.update_interval)
+
+            # Wait for next interval, keeping a fixed rate
+            next_tick = max(next_tick + self.update_interval, loop.time())
+            await asyncio.sleep(next_tick - loop.time())
 
         logger.info("Metrics broadcaster stopped")
 
+    def _fan_out(self, message: dict[str, Any]) -> None:
+        """Queue this tick's frame for every client without waiting.
+
+        Each subscribed topic's frames are built and encoded once and shared
+        by all clients on that topic. Skill topics only get a frame while the
+        skill is among the top skills.
+
+        Args:
+            message: Full ``metrics_update`` message of this tick
+        """
+        self._tick += 1
+        data: dict[str, Any] = message["data"]
+        skills_by_name = {skill["skill_name"]: skill for skill in data["top_skills"]}
+
+        subscribers: dict[str | None, list[ClientChannel]] = {}
+        for client, channel in self._channels.items():
+            topic: str | None = getattr(client, "subscription_skill", None) or None
+            subscribers.setdefault(topic, []).append(channel)
+
+        # Forget topics nobody subscribes to any more
+        for topic in self._topic_state.keys() - subscribers.keys():
+            del self._topic_state[topic]
+
+        for topic, channels in subscribers.items():
+            if topic is None:
+                topic_data = data
+            elif topic in skills_by_name:
+                topic_data = {"top_skills": [skills_by_name[topic]], "anomalies": []}
+            else:
+                continue
+
+            seq = self._tick
+            base_seq = None
+            delta_message = None
+            previous = self._topic_state.get(topic)
+            if previous is not None:
+                base_seq, previous_data = previous
+                changes = diff_metrics(previous_data, topic_data)
+                if changes is None:
+                    # Unchanged: clients up to date get nothing
+                    seq = base_seq
+                else:
+                    delta_message = {
+                        "type": "metrics_delta",
+                        "timestamp": message["timestamp"],
+                        "seq": seq,
+                        "base_seq": base_seq,
+                        "data": changes,
+                    }
+            self._topic_state[topic] = (seq, topic_data)
+
+            frames = TopicFrames(
+                topic=topic,
+                seq=seq,
+                base_seq=base_seq,
+                snapshot_message=message | {"seq": seq, "data": topic_data},
+                delta_message=delta_message,
+            )
+            for channel in channels:
+                channel.offer(frames)
+
     def _detect_anomalies(self, threshold: float = 2.0) -> list[dict[str, object]]:
         """Detect skill performance anomalies.
 
@@ -556,10 +612,16 @@ class RealTimeMetricsServer:
             await self._server.wait_closed()
             self._server = None
 
-        # Close all client connections
+        # Stop sender tasks and close all client connections
+        senders = [channel.close() for channel in self._channels.values()]
+        await asyncio.gather(
+            *(task for task in senders if task is not None), return_exceptions=True
+        )
+        self._channels.clear()
         for client in list(self.clients):
             await client.close()  # type: ignore[attr-defined]
         self.clients.clear()
+        self._topic_state.clear()
 
         # Close storage
         self.storage.close()
@@ -9,6 +9,7 @@ This module provides the core reflection database functionality with:
 Module Structure:
     - database.py: Core ReflectionDatabase class
     - embeddings.py: Embedding generation (ONNX, local)
+    - quantization.py: uint8 scalar quantization and first-pass vector scan
     - search.py: Semantic and text search operations
     - storage.py: CRUD operations
     - schema.py: Database schema definitions
@@ -35,6 +36,7 @@ from session_buddy.reflection.database import (
 from session_buddy.reflection.embeddings import (
     clear_embedding_cache,
     generate_embedding,
+    generate_embeddings,
     initialize_embedding_system,
 )
 
@@ -55,6 +57,7 @@ __all__ = [
     "ReflectionDatabase",
     "clear_embedding_cache",
     "generate_embedding",
+    "generate_embeddings",
     "get_reflection_database",
     "initialize_embedding_system",
     "search_conversations",
@@ -1,16 +1,29 @@
 """Embedding generation for semantic search via HTTP providers.
 
 Provides async embedding generation using llama-server (preferred) or Ollama
-with graceful degradation when no providers are available.
+with graceful degradation when no providers are available. Requests share one
+pooled HTTP client that micro-batches concurrent texts into a single provider
+call and coalesces identical in-flight texts. Results are cached in two
+tiers: a byte-bounded in-process LRU of float32 vectors and a DuckDB file
+that survives restarts, both keyed by model id + dimension + content hash.
 
 Phase 5: ONNX path removed — HTTP-only embedding via llama-server → Ollama → None.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Any
+import threading
+import typing as t
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+
+import httpx
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -32,93 +45,480 @@ def _get_llama_server_url() -> str:
 EMBEDDING_DIM = 384  # all-MiniLM-L6-v2 / nomic-embed-text dimension
 
 
-async def _try_llama_server(text: str) -> list[float] | None:
-    """Try llama-server embedding, return embedding or None."""
-    import httpx
+# Micro-batching knobs for the pooled embedding client. Both providers accept
+# ``input`` as a list, so concurrent requests are coalesced into one POST.
+EMBEDDING_MAX_BATCH_SIZE = int(
+    os.environ.get("SESSION_BUDDY_EMBEDDING_MAX_BATCH_SIZE", "32")
+)
+EMBEDDING_MAX_WAIT_MS = float(
+    os.environ.get("SESSION_BUDDY_EMBEDDING_MAX_WAIT_MS", "5")
+)
+EMBEDDING_MAX_CONNECTIONS = 8
+
+
+def _is_valid_embedding(embedding: t.Any) -> bool:
+    """Return True if ``embedding`` is a 384-dim list of numbers."""
+    return (
+        isinstance(embedding, list)
+        and len(embedding) == EMBEDDING_DIM
+        and all(isinstance(x, (int, float)) for x in embedding)
+    )
+
+
+async def _try_llama_server(
+    client: httpx.AsyncClient, texts: list[str]
+) -> list[list[float] | None] | None:
+    """Try llama-server for a batch of texts.
 
+    Returns one entry per input text (None for items that came back
+    malformed), or None if the provider is unavailable.
+    """
     try:
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, connect=5.0)
-        ) as client:
-            resp = await client.post(
-                _get_llama_server_url(),
-                json={"input": [text]},
-            )
-            if resp.status_code != 200:
-                return None
-            data = resp.json()
-            if not isinstance(data, dict) or "data" not in data:
-                return None
-            embedding_data = data["data"]
-            if not isinstance(embedding_data, list) or not embedding_data:
-                return None
-            embedding = embedding_data[0].get("embedding")
+        resp = await client.post(_get_llama_server_url(), json={"input": texts})
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        if not isinstance(data, dict) or "data" not in data:
+            return None
+        embedding_data = data["data"]
+        if not isinstance(embedding_data, list) or not embedding_data:
+            return None
+        results: list[list[float] | None] = [None] * len(texts)
+        for position, item in enumerate(embedding_data):
+            if not isinstance(item, dict):
+                continue
+            # OpenAI-compatible responses carry an explicit index; fall back
+            # to response order for servers that omit it.
+            index = item.get("index", position)
+            embedding = item.get("embedding")
             if (
-                embedding
-                and isinstance(embedding, list)
-                and len(embedding) == 384
-                and all(isinstance(x, (int, float)) for x in embedding)
+                isinstance(index, int)
+                and 0 <= index < len(texts)
+                and _is_valid_embedding(embedding)
             ):
-                return embedding
+                results[index] = embedding
+        return results
     except Exception as e:  # noqa: BLE001 - embedding probe: any HTTP/JSON/network failure is logged and yields None so the next provider can be tried
         logger.debug(f"llama-server embedding failed: {e}")
     return None
 
 
-async def _try_ollama(text: str) -> list[float] | None:
-    """Try Ollama embedding, return embedding or None."""
-    import httpx
+async def _try_ollama(
+    client: httpx.AsyncClient, texts: list[str]
+) -> list[list[float] | None] | None:
+    """Try Ollama for a batch of texts.
 
+    Returns one entry per input text (None for items that came back
+    malformed), or None if the provider is unavailable.
+    """
     try:
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, connect=5.0)
-        ) as client:
-            resp = await client.post(
-                f"{OLLAMA_URL}/api/embed",
-                json={"model": "nomic-embed-text", "input": [text]},
-            )
-            if resp.status_code != 200:
-                return None
-            data = resp.json()
-            embeddings = data.get("embeddings")
-            if isinstance(embeddings, list) and embeddings:
-                embedding = embeddings[0]
-            else:
-                embedding = data.get("embedding", [])
-            if (
-                embedding
-                and isinstance(embedding, list)
-                and len(embedding) == 384
-                and all(isinstance(x, (int, float)) for x in embedding)
-            ):
-                return embedding
+        resp = await client.post(
+            f"{OLLAMA_URL}/api/embed",
+            json={"model": "nomic-embed-text", "input": texts},
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        embeddings = data.get("embeddings")
+        if not isinstance(embeddings, list) or not embeddings:
+            # Legacy single-embedding response shape.
+            embeddings = [data.get("embedding", [])]
+        results: list[list[float] | None] = [None] * len(texts)
+        for index, embedding in enumerate(embeddings[: len(texts)]):
+            if _is_valid_embedding(embedding):
+                results[index] = embedding
+        if any(result is not None for result in results):
+            return results
     except Exception as e:  # noqa: BLE001 - embedding probe: any HTTP/JSON/network failure is logged and yields None so the next provider can be tried
         logger.debug(f"Ollama embedding failed: {e}")
     return None
 
 
-async def _try_http_embedding_providers(text: str) -> list[float] | None:
-    """Try llama-server first, then Ollama, return embedding or None.
+async def _embed_batch(
+    client: httpx.AsyncClient, texts: list[str]
+) -> list[list[float] | None]:
+    """Embed a batch via llama-server first, then Ollama.
 
     llama-server: OpenAI-compatible /v1/embeddings endpoint.
     Ollama: /api/embed endpoint with nomic-embed-text model.
 
     Both providers return pre-normalized 384d vectors.
     """
-    if (embedding := await _try_llama_server(text)) is not None:
-        return embedding
-    if (embedding := await _try_ollama(text)) is not None:
-        return embedding
-    return None
+    if (results := await _try_llama_server(client, texts)) is not None:
+        return results
+    if (results := await _try_ollama(client, texts)) is not None:
+        return results
+    return [None] * len(texts)
+
+
+class EmbeddingClient:
+    """Long-lived, pooled embedding client with request coalescing.
+
+    A single ``httpx.AsyncClient`` (keep-alive connection pool) is shared by
+    every caller on the event loop. Requests are queued and flushed as one
+    provider call when either ``max_batch_size`` texts are pending or
+    ``max_wait_ms`` has elapsed since the first queued text. Identical texts
+    that are already in flight share one future instead of being sent twice.
+
+    The client is bound to the event loop it was created on; use
+    :func:`get_embedding_client` rather than constructing one directly.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = EMBEDDING_MAX_BATCH_SIZE,
+        max_wait_ms: float = EMBEDDING_MAX_WAIT_MS,
+    ) -> None:
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self._loop = asyncio.get_running_loop()
+        self._client: httpx.AsyncClient | None = None
+        self._pending: dict[str, asyncio.Future[list[float] | None]] = {}
+        self._queue: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self.batches_sent = 0
+        self.texts_sent = 0
+        self.coalesced = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop this client (and its connection pool) is bound to."""
+        return self._loop
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=EMBEDDING_MAX_CONNECTIONS,
+                    max_keepalive_connections=EMBEDDING_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Queue ``text`` for the next batch and wait for its embedding."""
+        future = self._pending.get(text)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = self._loop.create_future()
+            self._pending[text] = future
+            self._queue.append(text)
+            if len(self._queue) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = self._loop.call_later(
+                    self.max_wait_ms / 1000.0, self._flush
+                )
+        # Shield so one cancelled waiter does not cancel the shared future.
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: list[str]) -> list[list[float] | None]:
+        """Embed several texts, letting the batcher group them into few calls."""
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._queue:
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            task = self._loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: list[str]) -> None:
+        self.batches_sent += 1
+        self.texts_sent += len(batch)
+        try:
+            results = await _embed_batch(self._get_http_client(), batch)
+        except Exception:
+            # A failed batch resolves every waiter to None (graceful
+            # degradation), never an exception.
+            logger.debug("Embedding batch failed", exc_info=True)
+            results = [None] * len(batch)
+        for text, result in zip(batch, results, strict=False):
+            future = self._pending.pop(text, None)
+            if future is not None and not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> dict[str, t.Any]:
+        """Return batching counters for diagnostics."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "batches_sent": self.batches_sent,
+            "texts_sent": self.texts_sent,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._pending),
+        }
+
+    async def aclose(self) -> None:
+        """Flush queued texts, wait for in-flight batches and close the pool."""
+        self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_embedding_client: EmbeddingClient | None = None
+
+
+def get_embedding_client() -> EmbeddingClient:
+    """Return the shared embedding client for the running event loop.
+
+    A new client is created when none exists yet or when the previous one
+    belongs to a different (typically closed) event loop, since pooled
+    connections cannot be reused across loops.
+    """
+    global _embedding_client
+    loop = asyncio.get_running_loop()
+    if _embedding_client is None or _embedding_client.loop is not loop:
+        _embedding_client = EmbeddingClient()
+    return _embedding_client
+
 
+async def close_embedding_client() -> None:
+    """Close the shared embedding client, if it belongs to the running loop."""
+    global _embedding_client
+    client, _embedding_client = _embedding_client, None
+    if client is not None and client.loop is asyncio.get_running_loop():
+        await client.aclose()
 
-# Thread-safe embedding cache (simple dict + lock)
-_embedding_cache: dict[str, list[float]] = {}
-_embedding_cache_lock = __import__("threading").RLock()
+
+async def _try_http_embedding_providers(text: str) -> list[float] | None:
+    """Embed ``text`` through the shared pooled, batching client.
+
+    Concurrent calls are micro-batched into a single provider request
+    (llama-server first, then Ollama); identical in-flight texts are
+    coalesced. Returns None if all providers fail.
+    """
+    return await get_embedding_client().embed(text)
+
+
+# Cache identity: vectors from different models or dimensions never collide.
+EMBEDDING_MODEL_ID = os.environ.get("SESSION_BUDDY_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+# In-process tier budget (float32 vectors: 384 dims * 4 bytes = 1.5 KiB each).
+EMBEDDING_CACHE_MAX_BYTES = int(
+    os.environ.get("SESSION_BUDDY_EMBEDDING_CACHE_MAX_BYTES", str(16 * 1024 * 1024))
+)
+# On-disk tier: set SESSION_BUDDY_EMBEDDING_DISK_CACHE=0 to disable.
+EMBEDDING_DISK_CACHE_ENABLED = (
+    os.environ.get("SESSION_BUDDY_EMBEDDING_DISK_CACHE", "1") != "0"
+)
+EMBEDDING_DISK_CACHE_MAX_ENTRIES = int(
+    os.environ.get("SESSION_BUDDY_EMBEDDING_DISK_CACHE_MAX_ENTRIES", "100000")
+)
+_DISK_PRUNE_EVERY = 1024
+
+
+def _cache_key(text: str) -> str:
+    """Return the cache key for ``text``: model id + dimension + content hash."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{EMBEDDING_MODEL_ID}:{EMBEDDING_DIM}:{digest}"
+
+
+class _EmbeddingLRUCache:
+    """In-process LRU of float32 vectors bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> np.ndarray | None:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def put(self, key: str, vector: np.ndarray) -> int:
+        """Insert ``vector`` and return how many entries were evicted."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = vector
+        self._bytes += vector.nbytes
+        evicted = 0
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, oldest = self._entries.popitem(last=False)
+            self._bytes -= oldest.nbytes
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+class _EmbeddingDiskCache:
+    """DuckDB-backed embedding tier that survives server restarts.
+
+    Vectors are stored as raw float32 bytes keyed by :func:`_cache_key`.
+    The table is capped at ``max_entries`` rows; the oldest rows (by
+    insertion time) are pruned periodically. Any failure to open the file
+    (e.g. another process holds the DuckDB lock) disables the tier for the
+    rest of the process instead of failing the embedding path.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._conn: t.Any = None
+        self._disabled = not EMBEDDING_DISK_CACHE_ENABLED
+        self._puts_since_prune = 0
+
+    @staticmethod
+    def _resolve_path() -> Path:
+        override = os.environ.get("SESSION_BUDDY_EMBEDDING_CACHE_PATH")
+        if override:
+            return Path(override).expanduser()
+        from session_buddy.adapters.settings import _resolve_data_dir
+
+        return _resolve_data_dir() / "embedding_cache.duckdb"
+
+    def _get_conn(self) -> t.Any:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            import duckdb
+
+            path = self._resolve_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = duckdb.connect(str(path))
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    cache_key VARCHAR PRIMARY KEY,
+                    model_id VARCHAR NOT NULL,
+                    dim INTEGER NOT NULL,
+                    embedding BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            self._conn = conn
+        except Exception as e:  # noqa: BLE001 - the disk tier is optional; lock contention or a bad path must not break embedding
+            logger.debug(f"Embedding disk cache unavailable: {e}")
+            self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> np.ndarray | None:
+        conn = self._get_conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT embedding FROM embedding_cache WHERE cache_key = ?", [key]
+            ).fetchone()
+        except Exception as e:  # noqa: BLE001 - a failed disk read is a cache miss
+            logger.debug(f"Embedding disk cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def put_many(self, items: list[tuple[str, np.ndarray]]) -> None:
+        conn = self._get_conn()
+        if conn is None or not items:
+            return
+        try:
+            conn.executemany(
+                """
+                INSERT INTO embedding_cache (cache_key, model_id, dim, embedding)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (cache_key) DO NOTHING
+                """,
+                [
+                    [key, EMBEDDING_MODEL_ID, int(vector.shape[0]), vector.tobytes()]
+                    for key, vector in items
+                ],
+            )
+            self._puts_since_prune += len(items)
+            if self._puts_since_prune >= _DISK_PRUNE_EVERY:
+                self._puts_since_prune = 0
+                self._prune()
+        except Exception as e:  # noqa: BLE001 - a failed disk write only costs a future re-embed
+            logger.debug(f"Embedding disk cache write failed: {e}")
+
+    def _prune(self) -> int:
+        """Drop the oldest rows above ``max_entries``; return rows removed."""
+        count = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        excess = int(count) - self.max_entries
+        if excess <= 0:
+            return 0
+        self._conn.execute(
+            """
+            DELETE FROM embedding_cache WHERE cache_key IN (
+                SELECT cache_key FROM embedding_cache
+                ORDER BY created_at ASC LIMIT ?
+            )
+            """,
+            [excess],
+        )
+        return excess
+
+    def __len__(self) -> int:
+        conn = self._get_conn()
+        if conn is None:
+            return 0
+        return int(conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0])
+
+    def close(self, *, clear: bool = False) -> None:
+        """Release the DuckDB handle, optionally deleting all rows first."""
+        if self._conn is not None:
+            with suppress(Exception):
+                if clear:
+                    self._conn.execute("DELETE FROM embedding_cache")
+                self._conn.close()
+        self._conn = None
+        self._disabled = not EMBEDDING_DISK_CACHE_ENABLED
+        self._puts_since_prune = 0
+
+
+# Thread-safe two-tier embedding cache (memory LRU + DuckDB, one lock)
+_embedding_cache = _EmbeddingLRUCache(EMBEDDING_CACHE_MAX_BYTES)
+_embedding_disk_cache = _EmbeddingDiskCache(EMBEDDING_DISK_CACHE_MAX_ENTRIES)
+_embedding_cache_lock = threading.RLock()
+_cache_stats: dict[str, int] = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "misses": 0,
+    "evictions": 0,
+}
+
+
+def _record_cache_event(tier: str, event: str, count: int = 1) -> None:
+    """Update local counters and the Prometheus embedding cache metrics."""
+    if count <= 0:
+        return
+    stat = {"hit": f"{tier}_hits", "miss": "misses", "eviction": "evictions"}[event]
+    _cache_stats[stat] += count
+    with suppress(Exception):
+        from session_buddy.mcp.metrics import get_metrics
+
+        get_metrics().record_embedding_cache_event(tier, event, count)
+
+
+def _promote(key: str, vector: np.ndarray) -> None:
+    """Insert into the memory tier, accounting for evictions."""
+    evicted = _embedding_cache.put(key, vector)
+    _record_cache_event("memory", "eviction", evicted)
 
 
 def _embedding_cache_get(text: str) -> list[float] | None:
-    """Get embedding from cache.
+    """Get embedding from cache (memory tier first, then disk).
 
     Args:
         text: Input text
@@ -126,19 +526,41 @@ def _embedding_cache_get(text: str) -> list[float] | None:
     Returns:
         Cached embedding or None if not found
     """
+    key = _cache_key(text)
+    with _embedding_cache_lock:
+        vector = _embedding_cache.get(key)
+        if vector is not None:
+            _record_cache_event("memory", "hit")
+            return vector.tolist()
+        vector = _embedding_disk_cache.get(key)
+        if vector is not None:
+            _record_cache_event("disk", "hit")
+            _promote(key, vector)
+            return vector.tolist()
+        _record_cache_event("disk", "miss")
+        return None
+
+
+def _embedding_cache_put_many(
+    items: list[tuple[str, list[float]]],
+) -> list[list[float]]:
+    """Store embeddings in both tiers; return them as cached (float32) values."""
+    stored: list[list[float]] = []
+    disk_items: list[tuple[str, np.ndarray]] = []
     with _embedding_cache_lock:
-        return _embedding_cache.get(text)
+        for text, embedding in items:
+            key = _cache_key(text)
+            vector = np.asarray(embedding, dtype=np.float32)
+            _promote(key, vector)
+            disk_items.append((key, vector))
+            stored.append(vector.tolist())
+        _embedding_disk_cache.put_many(disk_items)
+    return stored
 
 
-def _embedding_cache_put(text: str, embedding: list[float]) -> None:
-    """Store embedding in cache."""
-    with _embedding_cache_lock:
-        _embedding_cache[text] = embedding
-        # Simple eviction: if cache too large, remove oldest 10%
-        if len(_embedding_cache) > 1024:
-            oldest = list(_embedding_cache.keys())[: int(len(_embedding_cache) * 0.1)]
-            for k in oldest:
-                del _embedding_cache[k]
+def _embedding_cache_put(text: str, embedding: list[float]) -> list[float]:
+    """Store embedding in cache and return the cached (float32) value."""
+    return _embedding_cache_put_many([(text, embedding)])[0]
 
 
 async def generate_embedding(text: str) -> list[float] | None:
@@ -166,20 +588,69 @@ async def generate_embedding(text: str) -> list[float] | None:
     # Try HTTP providers
     result = await _try_http_embedding_providers(text)
     if result is not None:
-        _embedding_cache_put(text, result)
-        return result
+        # Return the cached float32 form so hits and misses are identical.
+        return _embedding_cache_put(text, result)
 
     return None
 
 
+async def generate_embeddings(texts: list[str]) -> list[list[float] | None]:
+    """Generate embeddings for many texts with as few provider calls as possible.
+
+    Cached texts are served from the cache; the remaining unique texts are
+    submitted together to the pooled client, which groups them into batches
+    of up to ``EMBEDDING_MAX_BATCH_SIZE``.
+
+    Args:
+        texts: Input texts to embed
+
+    Returns:
+        One entry per input text: a 384-dim vector, or None where every
+        provider failed for that text
+
+    """
+    results: list[list[float] | None] = [_embedding_cache_get(text) for text in texts]
+    missing = list(
+        dict.fromkeys(
+            text for text, cached in zip(texts, results, strict=True) if cached is None
+        )
+    )
+    if not missing:
+        return results
+
+    fetched = await asyncio.gather(
+        *(_try_http_embedding_providers(text) for text in missing)
+    )
+    found = [
+        (text, embedding)
+        for text, embedding in zip(missing, fetched, strict=True)
+        if embedding is not None
+    ]
+    by_text: dict[str, list[float] | None] = dict(
+        zip(
+            (text for text, _ in found),
+            _embedding_cache_put_many(found),
+            strict=True,
+        )
+    )
+
+    return [
+        cached if cached is not None else by_text.get(text)
+        for text, cached in zip(texts, results, strict=True)
+    ]
+
+
 def clear_embedding_cache() -> None:
-    """Clear the embedding cache."""
+    """Clear both embedding cache tiers and release the disk handle."""
     with _embedding_cache_lock:
         _embedding_cache.clear()
+        _embedding_disk_cache.close(clear=True)
+        for stat in _cache_stats:
+            _cache_stats[stat] = 0
     logger.info("Embedding cache cleared")
 
 
-def get_embedding_system_info() -> dict[str, Any]:
+def get_embedding_system_info() -> dict[str, t.Any]:
     """Get information about the embedding system.
 
     Returns:
@@ -187,20 +658,33 @@ def get_embedding_system_info() -> dict[str, Any]:
         - available: Always True (HTTP providers handle failures gracefully)
         - initialized: Always True (HTTP is stateless)
         - model_dim: Embedding dimension (384)
-        - cache_size: Current cache size
+        - cache_size: Current cache size (memory tier entries)
+        - cache: Memory tier bytes/limit, disk tier state and hit/miss/eviction
+          counters
         - http_providers: Dict with llama_server and ollama URLs
+        - batching: Pooled client batching counters (None before first use)
     """
     with _embedding_cache_lock:
         cache_size = len(_embedding_cache)
+        cache_info = {
+            "model_id": EMBEDDING_MODEL_ID,
+            "memory_bytes": _embedding_cache.nbytes,
+            "memory_max_bytes": _embedding_cache.max_bytes,
+            "disk_enabled": _embedding_disk_cache._conn is not None,
+            **_cache_stats,
+        }
+    client = _embedding_client
     return {
         "available": True,
         "initialized": True,
         "model_dim": EMBEDDING_DIM,
         "cache_size": cache_size,
+        "cache": cache_info,
         "http_providers": {
             "llama_server": _get_llama_server_url(),
             "ollama": OLLAMA_URL,
         },
+        "batching": client.get_stats() if client is not None else None,
     }
 
 
@@ -220,8 +704,12 @@ def initialize_embedding_system(
 
 
 __all__ = [
+    "EmbeddingClient",
     "clear_embedding_cache",
+    "close_embedding_client",
     "generate_embedding",
+    "generate_embeddings",
+    "get_embedding_client",
     "get_embedding_system_info",
     "initialize_embedding_system",  # backward compat
 ]
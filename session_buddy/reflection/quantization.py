@@ -0,0 +1,229 @@
+"""Scalar (uint8) quantization for embedding storage and first-pass search.
+
+Each dimension is mapped onto 256 levels between a calibrated ``lo``/``hi``
+pair: ``code = round((x - lo) / scale)`` with ``scale = (hi - lo) / 255``.
+Stored codes take 1 byte per dimension instead of 4.
+
+Search runs in two passes:
+
+1. An approximate scan over the in-memory code matrix. With
+   ``x_hat = lo + scale * code`` the dot product ``x_hat . y`` is
+   ``lo . y + code . (scale * y)``, so one matrix-vector product over the
+   codes (converted to float32 a chunk at a time) scores every row. That
+   score is divided by precomputed ``||x_hat||`` norms to approximate cosine.
+2. The top ``k * rerank_factor`` candidates are re-scored against their
+   float32 embeddings by the caller.
+
+Calibration is computed inside DuckDB with per-dimension streaming
+aggregates (min/max/mean/stddev), so it never loads the embeddings into
+Python. Ranges are clipped to ``mean +/- sigma * stddev`` to keep a few
+outliers from wasting most of the 256 levels.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+QUANTIZATION_LEVELS = 255
+DEFAULT_CALIBRATION_SIGMA = 4.0
+# Rows converted to float32 per matrix-vector product during the scan
+_SCAN_CHUNK_ROWS = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class Calibration:
+    """Per-dimension quantization range."""
+
+    lo: np.ndarray
+    hi: np.ndarray
+    sample_count: int = 0
+
+    @property
+    def scale(self) -> np.ndarray:
+        span = self.hi - self.lo
+        return np.where(span > 0, span, 1.0).astype(np.float32) / QUANTIZATION_LEVELS
+
+    @classmethod
+    def fixed(cls, dim: int, bound: float = 0.15) -> Calibration:
+        """Symmetric fallback range used before the table is calibrated."""
+        return cls(
+            lo=np.full((dim,), -bound, dtype=np.float32),
+            hi=np.full((dim,), bound, dtype=np.float32),
+        )
+
+
+def calibrate_from_table(
+    conn: t.Any,
+    table: str,
+    dim: int,
+    sigma: float = DEFAULT_CALIBRATION_SIGMA,
+) -> Calibration | None:
+    """Compute per-dimension ranges from ``table.embedding`` inside DuckDB.
+
+    Args:
+        conn: DuckDB connection
+        table: Table with an ``embedding FLOAT[dim]`` column
+        dim: Embedding dimension
+        sigma: Clip ranges to ``mean +/- sigma * stddev`` (0 disables)
+
+    Returns:
+        Calibration, or None if the table has no embeddings
+
+    """
+    rows = conn.execute(
+        f"""
+        SELECT dim_index, min(v), max(v), avg(v), stddev_pop(v), count(*)
+        FROM (
+            SELECT
+                unnest(range({dim})) AS dim_index,
+                unnest(embedding::FLOAT[]) AS v
+            FROM {table}
+            WHERE embedding IS NOT NULL
+        )
+        GROUP BY dim_index
+        ORDER BY dim_index
+        """
+    ).fetchall()
+    if len(rows) != dim:
+        return None
+
+    stats = np.asarray([row[1:5] for row in rows], dtype=np.float64)
+    lo, hi, mean, std = stats.T
+    if sigma > 0:
+        lo = np.maximum(lo, mean - sigma * std)
+        hi = np.minimum(hi, mean + sigma * std)
+    return Calibration(
+        lo=lo.astype(np.float32),
+        hi=hi.astype(np.float32),
+        sample_count=int(rows[0][5]),
+    )
+
+
+def quantize(vectors: np.ndarray | Sequence[float], calibration: Calibration) -> np.ndarray:
+    """Encode float vectors (``(dim,)`` or ``(n, dim)``) as uint8 codes."""
+    values = np.asarray(vectors, dtype=np.float32)
+    codes = np.rint((values - calibration.lo) / calibration.scale)
+    return np.clip(codes, 0, QUANTIZATION_LEVELS).astype(np.uint8)
+
+
+def dequantize(codes: np.ndarray | Sequence[int], calibration: Calibration) -> np.ndarray:
+    """Decode uint8 codes back to approximate float32 vectors."""
+    values = np.asarray(codes, dtype=np.float32)
+    return values * calibration.scale + calibration.lo
+
+
+class QuantizedIndex:
+    """In-memory uint8 code matrix with an approximate cosine scan.
+
+    Rows can be appended and removed as memories are written and deleted;
+    removal masks the row and the matrix is compacted on the next append
+    batch once more than a quarter of the rows are dead.
+    """
+
+    def __init__(self, calibration: Calibration) -> None:
+        self.calibration = calibration
+        dim = calibration.lo.shape[0]
+        self._ids: list[str] = []
+        self._projects: list[str | None] = []
+        self._codes = np.empty((0, dim), dtype=np.uint8)
+        self._norms = np.empty((0,), dtype=np.float32)
+        self._alive = np.empty((0,), dtype=bool)
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the code matrix and per-row norms."""
+        return int(self._codes.nbytes + self._norms.nbytes)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        codes: np.ndarray,
+        projects: Sequence[str | None],
+    ) -> None:
+        """Append (or replace) rows."""
+        if not len(ids):
+            return
+        self.remove(ids)
+        if len(self._alive) and (~self._alive).sum() * 4 > len(self._alive):
+            self._compact()
+        codes = np.asarray(codes, dtype=np.uint8).reshape(len(ids), -1)
+        norms = np.linalg.norm(dequantize(codes, self.calibration), axis=1)
+        start = len(self._ids)
+        self._ids.extend(ids)
+        self._projects.extend(projects)
+        self._codes = np.concatenate([self._codes, codes])
+        self._norms = np.concatenate([self._norms, norms.astype(np.float32)])
+        self._alive = np.concatenate([self._alive, np.ones(len(ids), dtype=bool)])
+        for offset, memory_id in enumerate(ids):
+            self._positions[memory_id] = start + offset
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """Mask rows for deleted memories."""
+        for memory_id in ids:
+            position = self._positions.pop(memory_id, None)
+            if position is not None:
+                self._alive[position] = False
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive)
+        self._ids = [self._ids[i] for i in keep]
+        self._projects = [self._projects[i] for i in keep]
+        self._codes = self._codes[keep]
+        self._norms = self._norms[keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._positions = {memory_id: i for i, memory_id in enumerate(self._ids)}
+
+    def search(
+        self,
+        query: np.ndarray | Sequence[float],
+        k: int,
+        project: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(id, approximate cosine)`` pairs, best first."""
+        if k <= 0 or not self._positions:
+            return []
+        y = np.asarray(query, dtype=np.float32)
+        y_norm = float(np.linalg.norm(y)) or 1.0
+        scaled = self.calibration.scale * y
+        offset = float(self.calibration.lo @ y)
+
+        scores = np.empty(len(self._ids), dtype=np.float32)
+        for start in range(0, len(self._ids), _SCAN_CHUNK_ROWS):
+            chunk = self._codes[start : start + _SCAN_CHUNK_ROWS]
+            scores[start : start + len(chunk)] = chunk.astype(np.float32) @ scaled
+        scores += offset
+        scores /= np.where(self._norms > 0, self._norms, 1.0) * y_norm
+
+        mask = self._alive
+        if project is not None:
+            mask = mask & np.fromiter(
+                (p == project for p in self._projects), bool, len(self._projects)
+            )
+        candidates = np.flatnonzero(mask)
+        if not candidates.size:
+            return []
+        if candidates.size > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._ids[i], float(scores[i])) for i in order]
+
+
+__all__ = [
+    "DEFAULT_CALIBRATION_SIGMA",
+    "Calibration",
+    "QuantizedIndex",
+    "calibrate_from_table",
+    "dequantize",
+    "quantize",
+]
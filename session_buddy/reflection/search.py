@@ -19,6 +19,13 @@ logger = logging.getLogger(__name__)
 
 # Import encoding/decoding utilities
 from session_buddy.reflection.storage import _decode_text_from_db
+from session_buddy.utils.fulltext import FullTextIndex, normalize_scores
+
+# Text indexed per table for the BM25 fallback (content, then tags)
+_FULLTEXT_SQL = {
+    "conversations": "content",
+    "reflections": "concat_ws(' ', content, array_to_string(tags, ' '))",
+}
 
 
 async def search_conversations(
@@ -160,7 +167,7 @@ async def _text_search_conversations(
     is_temp_db: bool,
     lock: Any,
 ) -> list[dict[str, Any]]:
-    """Fallback text search using LIKE pattern matching.
+    """Fallback text search ranked by BM25 over the full-text index.
 
     Args:
         conn: Database connection
@@ -171,63 +178,89 @@ async def _text_search_conversations(
         lock: Thread safety lock
 
     Returns:
-        List of search results with similarity=0 (no score available)
+        List of search results, best first, scored relative to the best (1.0)
     """
-    search_terms = query.lower().split()
-
-    # Return empty list when query is empty
-    if not search_terms:
-        return []
-
-    sql = "SELECT id, content, project, timestamp, metadata FROM conversations"
-    params = []
+    results = await _run_query(
+        lambda: _fulltext_search(
+            conn,
+            "conversations",
+            "id, content, project, timestamp, metadata",
+            query,
+            limit,
+            project,
+        ),
+        is_temp_db,
+        lock,
+    )
 
-    if project:
-        sql += " WHERE project = ?"
-        params.append(project)
+    return normalize_scores(
+        [
+            {
+                "id": str(row[0]),
+                "content": _decode_text_from_db(row[1]),
+                "score": float(row[5]),
+                "timestamp": row[3],
+                "project": row[2],
+                "metadata": json.loads(row[4]) if row[4] else {},
+            }
+            for row in results
+        ]
+    )
 
-    sql += " ORDER BY timestamp DESC"
 
-    # Execute query
+async def _run_query(
+    query: typing.Callable[[], list[tuple[Any, ...]]],
+    is_temp_db: bool,
+    lock: Any,
+) -> list[tuple[Any, ...]]:
     if is_temp_db:
         with lock:
-            results = conn.execute(sql, params).fetchall()
-    else:
-        results = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: conn.execute(sql, params).fetchall(),
-        )
+            return query()
+    return await asyncio.get_event_loop().run_in_executor(None, query)
 
-    # Filter results by search terms (search both content and tags for reflections)
-    filtered = []
-    for row in results:
-        content = _decode_text_from_db(row[1]).lower()
-        # Check if this is reflections (has tags column) or conversations (no tags)
-        if len(row) >= 4 and isinstance(row[3], (list, tuple)):
-            # Reflections - search both content and tags
-            tags = [tag.lower() for tag in row[3]]
-            if any(
-                term in content or any(term in tag for tag in tags)
-                for term in search_terms
-            ):
-                filtered.append(row)
-        else:
-            # Conversations - only search content
-            if any(term in content for term in search_terms):
-                filtered.append(row)
-
-    # Return top results with no similarity score
-    return [
-        {
-            "id": str(row[0]),
-            "content": _decode_text_from_db(row[1]),
-            "score": 0.0,  # No similarity score for text search
-            "timestamp": row[3],
-            "project": row[2],
-            "metadata": json.loads(row[4]) if row[4] else {},
-        }
-        for row in filtered[:limit]
-    ]
+
+def _fulltext_search(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: str,
+    query: str,
+    limit: int,
+    project: str | None,
+    list_blank: bool = False,
+) -> list[tuple[Any, ...]]:
+    """Return ``columns`` plus a BM25 ``score`` for the best matching rows.
+
+    The index is first caught up with rows written since the last search.
+    A query without indexable terms matches nothing, or every row newest
+    first (score 0.0) when ``list_blank`` is set and the query is blank.
+    """
+    index = FullTextIndex(conn)
+    index.ensure_schema()
+    index.sync(table, table, _FULLTEXT_SQL[table], decode=_decode_text_from_db)
+    match = index.match(table, query)
+
+    project_clause = " AND project = ?" if project else ""
+    if match is None:
+        if not (list_blank and not query.strip()):
+            return []
+        sql = f"""
+            SELECT {columns}, 0.0 FROM {table}
+            WHERE TRUE{project_clause}
+            ORDER BY timestamp DESC LIMIT ?
+        """
+        params: list[Any] = []
+    else:
+        sql = f"""
+            SELECT {columns}, m.score
+            FROM ({match.sql}) m JOIN {table} ON {table}.id = m.doc_id
+            WHERE TRUE{project_clause}
+            ORDER BY m.score DESC, timestamp DESC LIMIT ?
+        """
+        params = list(match.params)
+    if project:
+        params.append(project)
+    params.append(max(limit, 0))
+    return conn.execute(sql, params).fetchall()
 
 
 async def search_reflections(
@@ -367,7 +400,7 @@ async def _text_search_reflections(
     is_temp_db: bool,
     lock: Any,
 ) -> list[dict[str, Any]]:
-    """Fallback text search for reflections using LIKE pattern matching.
+    """Fallback text search for reflections ranked by BM25 (content and tags).
 
     Args:
         conn: Database connection
@@ -378,60 +411,34 @@ async def _text_search_reflections(
         lock: Thread safety lock
 
     Returns:
-        List of search results with similarity=0 (no score available)
+        List of search results, best first, scored relative to the best
+        (1.0); a blank query lists reflections newest first with score 0.0
     """
-    search_terms = query.lower().split()
-
-    sql = "SELECT id, content, project, tags, timestamp, metadata FROM reflections"
-    params = []
-
-    if project:
-        sql += " WHERE project = ?"
-        params.append(project)
-
-    sql += " ORDER BY timestamp DESC"
-
-    # Execute query
-    if is_temp_db:
-        with lock:
-            results = conn.execute(sql, params).fetchall()
-    else:
-        results = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: conn.execute(sql, params).fetchall(),
-        )
+    results = await _run_query(
+        lambda: _fulltext_search(
+            conn,
+            "reflections",
+            "id, content, project, tags, timestamp, metadata",
+            query,
+            limit,
+            project,
+            list_blank=True,
+        ),
+        is_temp_db,
+        lock,
+    )
 
-    if not search_terms:
-        filtered = results
-    else:
-        # Filter results by search terms (search both content and tags for reflections)
-        filtered = []
-        for row in results:
-            content = _decode_text_from_db(row[1]).lower()
-            # Check if this is reflections (has tags column) or conversations (no tags)
-            if len(row) >= 4 and isinstance(row[3], (list, tuple)):
-                # Reflections - search both content and tags
-                tags = [tag.lower() for tag in row[3]]
-                if any(
-                    term in content or any(term in tag for tag in tags)
-                    for term in search_terms
-                ):
-                    filtered.append(row)
-            else:
-                # Conversations - only search content
-                if any(term in content for term in search_terms):
-                    filtered.append(row)
-
-    # Return top results with no similarity score
-    return [
-        {
-            "id": str(row[0]),
-            "content": _decode_text_from_db(row[1]),
-            "score": 0.0,  # No similarity score for text search
-            "timestamp": row[4],
-            "project": row[2],
-            "tags": row[3] or [],
-            "metadata": json.loads(row[5]) if row[5] else {},
-        }
-        for row in filtered[:limit]
-    ]
+    return normalize_scores(
+        [
+            {
+                "id": str(row[0]),
+                "content": _decode_text_from_db(row[1]),
+                "score": float(row[6]),
+                "timestamp": row[4],
+                "project": row[2],
+                "tags": row[3] or [],
+                "metadata": json.loads(row[5]) if row[5] else {},
+            }
+            for row in results
+        ]
+    )
@@ -93,6 +93,12 @@ async def cleanup_http_clients() -> None:
     logger = _get_logger()
     logger.info("Cleaning up HTTP client connections")
 
+    # Pooled embedding client (keep-alive connections to llama-server/Ollama).
+    with suppress(Exception):
+        from session_buddy.reflection.embeddings import close_embedding_client
+
+        await close_embedding_client()
+
     try:
         from mcp_common.adapters.http.client import (  # ty: ignore[unresolved-import]
             HTTPClientAdapter,
@@ -326,6 +332,17 @@ def register_all_cleanup_handlers(
 
     # Register cleanup tasks in priority order (highest first)
 
+    # Priority 110: Buffered writes, while database connections are open
+    from session_buddy.memory.access_log import flush_all_access_logs
+
+    shutdown_manager.register_cleanup(
+        name="access_log_flush",
+        callback=flush_all_access_logs,
+        priority=110,
+        timeout_seconds=5.0,
+        critical=False,
+    )
+
     # Priority 100: Critical database and connection cleanup
     shutdown_manager.register_cleanup(
         name="database_connections",
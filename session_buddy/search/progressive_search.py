@@ -9,6 +9,11 @@ Architecture:
          ↓              ↓            ↓             ↓
     Fastest         Faster        Slower        Slowest
 
+In concurrent mode every tier is launched at once. Results are still
+consumed in tier order, so early stopping picks the same tiers as the
+sequential mode; tiers after the stopping point are cancelled (or
+discarded if they already finished) and counted as wasted work.
+
 Usage:
     >>> from session_buddy.search.progressive_search import ProgressiveSearchEngine
     >>> engine = ProgressiveSearchEngine()
@@ -21,7 +26,9 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
@@ -144,6 +151,7 @@ class SufficiencyConfig:
     # Progressive search tier limits
     max_tiers: int = 4  # Maximum tiers to search (0-4)
     tier_timeout_ms: float = 5000  # Maximum time per tier (5 seconds)
+    concurrent_tiers: bool = False  # Launch all tiers at once (see search_progressive)
 
     # Quality-weighted scoring
     quality_weight: float = 0.7  # Weight for quality score in sufficiency (0.0-1.0)
@@ -289,6 +297,54 @@ class SufficiencyEvaluator:
         return min(sufficiency_score, 1.0)  # type: ignore[no-any-return]
 
 
+@dataclass
+class _SearchStats:
+    """Running totals reported by ``ProgressiveSearchEngine.get_search_stats``."""
+
+    total_searches: int = 0
+    concurrent_searches: int = 0
+    tiers_searched: int = 0
+    early_stops: int = 0
+    total_latency_ms: float = 0.0
+    tier_latency_ms: dict[str, float] = field(default_factory=dict)
+    tier_counts: dict[str, int] = field(default_factory=dict)
+    tiers_cancelled: int = 0
+    tiers_discarded: int = 0
+    wasted_ms: float = 0.0
+
+
+class _SharedReflectionSearch:
+    """Adapter proxy that runs each distinct ``search_reflections`` call once.
+
+    The CATEGORIES, INSIGHTS and REFLECTIONS tiers issue the same reflection
+    search and differ only in score filtering. Launched together they would
+    all miss the query cache and scan the table three times. Each caller gets
+    shallow copies, since tiers annotate results in place.
+    """
+
+    def __init__(self, db: ReflectionDatabaseAdapter) -> None:
+        self._db = db
+        self._calls: dict[Any, asyncio.Future[list[dict[str, Any]]]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._db, name)
+
+    async def search_reflections(
+        self, *args: Any, **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        key = (args, tuple(sorted(kwargs.items())))
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(self._db.search_reflections(*args, **kwargs))
+            self._calls[key] = call
+        results = await asyncio.shield(call)
+        return [dict(result) for result in results]
+
+    def cancel_pending(self) -> None:
+        for call in self._calls.values():
+            call.cancel()
+
+
 class ProgressiveSearchEngine:
     """Multi-tier search engine with early stopping optimization.
 
@@ -320,6 +376,7 @@ class ProgressiveSearchEngine:
         self.config = config or SufficiencyConfig()
         self.evaluator = SufficiencyEvaluator(config)
         self._db = db_adapter
+        self._stats = _SearchStats()
 
         logger.info(
             "ProgressiveSearchEngine initialized with %d tiers", len(SearchTier)
@@ -333,6 +390,7 @@ class ProgressiveSearchEngine:
         max_results: int = 30,
         max_tiers: int = 4,
         enable_early_stop: bool = True,
+        concurrent: bool | None = None,
     ) -> ProgressiveSearchResult:
         """Execute progressive search across multiple tiers.
 
@@ -346,6 +404,9 @@ class ProgressiveSearchEngine:
             max_results: Maximum total results across all tiers
             max_tiers: Maximum number of tiers to search (1-4)
             enable_early_stop: Whether to enable early stopping optimization
+            concurrent: Launch all tiers at once and cancel the remainder on
+                early stop, so latency tracks the slowest tier needed rather
+                than the sum (defaults to ``config.concurrent_tiers``)
 
         Returns:
             ProgressiveSearchResult with all tier results and metadata
@@ -355,14 +416,10 @@ class ProgressiveSearchEngine:
         """
         if not 1 <= max_tiers <= 4:
             raise ValueError(f"max_tiers must be 1-4, got {max_tiers}")
-
-        import time
+        if concurrent is None:
+            concurrent = self.config.concurrent_tiers
 
         start_time = time.perf_counter()
-        tiers_searched: list[SearchTier] = []
-        all_results: list[dict[str, Any]] = []
-        tier_results: list[TierSearchResult] = []
-        early_stop = False
 
         # Define tier search order
         search_order = [
@@ -372,54 +429,28 @@ class ProgressiveSearchEngine:
             SearchTier.CONVERSATIONS,
         ][:max_tiers]
 
-        for i, tier in enumerate(search_order):
-            tier_start = time.perf_counter()
-
-            logger.info(
-                "Searching tier %d/%d: %s (min_score: %.2f)",
-                i + 1,
-                len(search_order),
-                SearchTier.get_tier_name(tier),
-                SearchTier.get_min_score(tier),
+        wasted: dict[str, Any] = {}
+        if concurrent:
+            tier_results, early_stop = await self._search_tiers_concurrently(
+                query,
+                project,
+                search_order,
+                min_score,
+                max_results,
+                enable_early_stop,
+                wasted,
             )
-
-            # Search this tier
-            tier_result = await self._search_tier(
-                query, project, tier, min_score, max_results
+        else:
+            tier_results, early_stop = await self._search_tiers_sequentially(
+                query, project, search_order, min_score, max_results, enable_early_stop
             )
-
-            tier_latency = (time.perf_counter() - tier_start) * 1000
-            tiers_searched.append(tier)
-            tier_results.append(tier_result)
-
-            # Collect results
-            if tier_result.searched and tier_result.results:
-                all_results.extend(tier_result.results)
-
-                # Log tier completion
-                logger.info(
-                    "Tier %s: %d results (latency: %.2fms, avg score: %.2f)",
-                    SearchTier.get_tier_name(tier),
-                    len(tier_result.results),
-                    tier_latency,
-                    tier_result.avg_score,
-                )
-
-            # Check for early stopping
-            if (
-                enable_early_stop and i < len(search_order) - 1
-            ):  # Don't stop on last tier
-                is_sufficient, reason = self.evaluator.is_sufficient(all_results, tier)
-
-                if is_sufficient:
-                    early_stop = True
-                    logger.info(
-                        "Early stopping at tier %s: %s (total results: %d)",
-                        SearchTier.get_tier_name(tier),
-                        reason,
-                        len(all_results),
-                    )
-                    break
+        tiers_searched = [tier_result.tier for tier_result in tier_results]
+        all_results = [
+            result
+            for tier_result in tier_results
+            if tier_result.searched
+            for result in tier_result.results
+        ]
 
         total_latency = (time.perf_counter() - start_time) * 1000
 
@@ -428,6 +459,8 @@ class ProgressiveSearchEngine:
             "avg_tiers_searched": len(tiers_searched),
             "max_tiers_allowed": max_tiers,
             "early_stop_reason": None,
+            "mode": "concurrent" if concurrent else "sequential",
+            **wasted,
         }
 
         if early_stop:
@@ -437,6 +470,8 @@ class ProgressiveSearchEngine:
             )
             metadata["early_stop_reason"] = reason  # type: ignore[assignment]
 
+        self._record_search(tier_results, total_latency, early_stop, concurrent, wasted)
+
         # Build final result
         result = ProgressiveSearchResult(
             query=query,
@@ -452,6 +487,201 @@ class ProgressiveSearchEngine:
 
         return result
 
+    async def _search_tiers_sequentially(
+        self,
+        query: str,
+        project: str | None,
+        search_order: list[SearchTier],
+        min_score: float,
+        max_results: int,
+        enable_early_stop: bool,
+    ) -> tuple[list[TierSearchResult], bool]:
+        """Search tiers one after another, stopping once results suffice."""
+        all_results: list[dict[str, Any]] = []
+        tier_results: list[TierSearchResult] = []
+
+        for i, tier in enumerate(search_order):
+            logger.info(
+                "Searching tier %d/%d: %s (min_score: %.2f)",
+                i + 1,
+                len(search_order),
+                SearchTier.get_tier_name(tier),
+                SearchTier.get_min_score(tier),
+            )
+
+            # Search this tier
+            tier_result = await self._search_tier(
+                query, project, tier, min_score, max_results
+            )
+            tier_results.append(tier_result)
+
+            if self._accept_tier_result(
+                tier_result,
+                all_results,
+                enable_early_stop and i < len(search_order) - 1,
+            ):
+                return tier_results, True
+
+        return tier_results, False
+
+    async def _search_tiers_concurrently(
+        self,
+        query: str,
+        project: str | None,
+        search_order: list[SearchTier],
+        min_score: float,
+        max_results: int,
+        enable_early_stop: bool,
+        wasted: dict[str, Any],
+    ) -> tuple[list[TierSearchResult], bool]:
+        """Launch every tier at once and consume results in tier order.
+
+        Tiers after the early-stop point are cancelled, or discarded if they
+        already finished; both are reported in ``wasted``.
+        """
+        db = await self._get_db()
+        await self._embed_query_once(db, query)
+        shared = _SharedReflectionSearch(db)
+
+        launched = time.perf_counter()
+        tasks = [
+            asyncio.create_task(
+                self._search_tier(
+                    query, project, tier, min_score, max_results, db=shared
+                )
+            )
+            for tier in search_order
+        ]
+        all_results: list[dict[str, Any]] = []
+        tier_results: list[TierSearchResult] = []
+        early_stop = False
+        try:
+            for i, task in enumerate(tasks):
+                tier_result = await task
+                tier_results.append(tier_result)
+                if self._accept_tier_result(
+                    tier_result,
+                    all_results,
+                    enable_early_stop and i < len(tasks) - 1,
+                ):
+                    early_stop = True
+                    break
+        finally:
+            leftover = tasks[len(tier_results) :]
+            cancelled = 0
+            wasted_ms = 0.0
+            for task in leftover:
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    wasted_ms += task.result().latency_ms
+                else:
+                    task.cancel()
+                    cancelled += 1
+                    wasted_ms += (time.perf_counter() - launched) * 1000
+            await asyncio.gather(*leftover, return_exceptions=True)
+            shared.cancel_pending()
+            wasted.update(
+                tiers_cancelled=cancelled,
+                tiers_discarded=len(leftover) - cancelled,
+                wasted_ms=wasted_ms,
+            )
+
+        return tier_results, early_stop
+
+    def _accept_tier_result(
+        self,
+        tier_result: TierSearchResult,
+        all_results: list[dict[str, Any]],
+        check_early_stop: bool,
+    ) -> bool:
+        """Collect a tier's results; return True if searching can stop."""
+        tier = tier_result.tier
+        if tier_result.searched and tier_result.results:
+            all_results.extend(tier_result.results)
+
+            # Log tier completion
+            logger.info(
+                "Tier %s: %d results (latency: %.2fms, avg score: %.2f)",
+                SearchTier.get_tier_name(tier),
+                len(tier_result.results),
+                tier_result.latency_ms,
+                tier_result.avg_score,
+            )
+
+        # Check for early stopping (never on the last tier)
+        if not check_early_stop:
+            return False
+        is_sufficient, reason = self.evaluator.is_sufficient(all_results, tier)
+        if is_sufficient:
+            logger.info(
+                "Early stopping at tier %s: %s (total results: %d)",
+                SearchTier.get_tier_name(tier),
+                reason,
+                len(all_results),
+            )
+        return is_sufficient
+
+    def _record_search(
+        self,
+        tier_results: list[TierSearchResult],
+        total_latency_ms: float,
+        early_stop: bool,
+        concurrent: bool,
+        wasted: dict[str, Any],
+    ) -> None:
+        stats = self._stats
+        stats.total_searches += 1
+        stats.concurrent_searches += int(concurrent)
+        stats.tiers_searched += len(tier_results)
+        stats.early_stops += int(early_stop)
+        stats.total_latency_ms += total_latency_ms
+        for tier_result in tier_results:
+            tier = tier_result.tier.value
+            stats.tier_latency_ms[tier] = (
+                stats.tier_latency_ms.get(tier, 0.0) + tier_result.latency_ms
+            )
+            stats.tier_counts[tier] = stats.tier_counts.get(tier, 0) + 1
+        stats.tiers_cancelled += wasted.get("tiers_cancelled", 0)
+        stats.tiers_discarded += wasted.get("tiers_discarded", 0)
+        stats.wasted_ms += wasted.get("wasted_ms", 0.0)
+
+    async def _get_db(self) -> ReflectionDatabaseAdapter:
+        # Use the canonical resolver from ``utils.database_tools`` so the
+        # lookup key matches what ``adapters/lifecycle.init_reflection_adapter``
+        # registers under (the fully-qualified class name). The previous
+        # bare-string key ``"ReflectionDatabaseAdapter"`` never matched the
+        # class key and raised ``KeyError: 'Service not registered'`` at runtime.
+        if self._db is not None:
+            return self._db
+
+        from session_buddy.utils.database_tools import require_reflection_database
+
+        return await require_reflection_database()
+
+    async def _embed_query_once(
+        self, db: ReflectionDatabaseAdapter, query: str
+    ) -> None:
+        """Generate the query embedding before tiers are launched.
+
+        Tier searches embed the query themselves; doing it first means they
+        all read it from the shared embedding cache instead of racing to
+        request it.
+        """
+        from session_buddy.adapters.reflection_adapter_oneiric import (
+            ReflectionDatabaseAdapterOneiric,
+        )
+
+        if not (
+            isinstance(db, ReflectionDatabaseAdapterOneiric)
+            and db.settings.enable_embeddings
+        ):
+            return
+        from session_buddy.reflection.embeddings import generate_embedding
+
+        try:
+            await generate_embedding(query)
+        except Exception:
+            logger.debug("Query embedding warm-up failed", exc_info=True)
+
     async def _search_tier(
         self,
         query: str,
@@ -459,6 +689,7 @@ class ProgressiveSearchEngine:
         tier: SearchTier,
         min_score: float,
         max_results: int,
+        db: Any = None,
     ) -> TierSearchResult:
         """Search a single tier.
 
@@ -468,27 +699,15 @@ class ProgressiveSearchEngine:
             tier: Tier to search
             min_score: Minimum similarity score
             max_results: Maximum results to return
+            db: Database adapter to use (resolved if None)
 
         Returns:
             TierSearchResult with tier-specific results
         """
-        import time
-
         start_time = time.perf_counter()
 
-        # Get database adapter. Use the canonical resolver from
-        # ``utils.database_tools`` so the lookup key matches what
-        # ``adapters/lifecycle.init_reflection_adapter`` registers under
-        # (the fully-qualified class name). The previous bare-string key
-        # ``"ReflectionDatabaseAdapter"`` never matched the class key and
-        # raised ``KeyError: 'Service not registered'`` at runtime.
-        db = self._db
         if db is None:
-            from session_buddy.utils.database_tools import (
-                require_reflection_database,
-            )
-
-            db = await require_reflection_database()
+            db = await self._get_db()
 
         # Search based on tier type
         if tier == SearchTier.CATEGORIES:
@@ -721,13 +940,24 @@ class ProgressiveSearchEngine:
         """Get progressive search statistics.
 
         Returns:
-            Dictionary with search statistics
+            Dictionary with search statistics, per-tier average latency and
+            the work wasted by concurrent searches that stopped early
         """
-        # Statistics would be tracked during search operations
-        # For now, return basic info
+        stats = self._stats
+        searches = stats.total_searches
         return {
-            "total_searches": 0,  # Would be incremented during searches
-            "avg_tiers_searched": 0.0,
-            "early_stop_rate": 0.0,
-            "avg_latency_ms": 0.0,
+            "total_searches": searches,
+            "avg_tiers_searched": stats.tiers_searched / searches if searches else 0.0,
+            "early_stop_rate": stats.early_stops / searches if searches else 0.0,
+            "avg_latency_ms": stats.total_latency_ms / searches if searches else 0.0,
+            "concurrent_searches": stats.concurrent_searches,
+            "tier_latency_ms": {
+                tier: total / stats.tier_counts[tier]
+                for tier, total in stats.tier_latency_ms.items()
+            },
+            "wasted_work": {
+                "tiers_cancelled": stats.tiers_cancelled,
+                "tiers_discarded": stats.tiers_discarded,
+                "wasted_ms": stats.wasted_ms,
+            },
         }
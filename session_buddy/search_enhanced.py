@@ -7,9 +7,14 @@ Provides multi-modal search including code snippets, error patterns, and time-ba
 
 import ast
 import contextlib
+import json
+import re
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
+import duckdb
+
 from session_buddy.utils.time import utc_now
 
 if TYPE_CHECKING:
@@ -100,16 +105,18 @@ class CodeSearcher:
                         patterns.append(pattern_info)
         return patterns
 
-    def extract_code_patterns(self, content: str) -> list[dict[str, Any]]:
-        """Extract code patterns from conversation content."""
-        patterns = []
-
+    def extract_code_blocks(self, content: str) -> list[str]:
+        """Extract fenced code blocks, Python blocks first."""
         # Extract Python code blocks using validated patterns
         python_code_blocks = SAFE_PATTERNS["python_code_block"].findall(content)
         generic_code_blocks = SAFE_PATTERNS["generic_code_block"].findall(content)
-        code_blocks = python_code_blocks + generic_code_blocks
+        return cast("list[str]", python_code_blocks + generic_code_blocks)
+
+    def extract_code_patterns(self, content: str) -> list[dict[str, Any]]:
+        """Extract code patterns from conversation content."""
+        patterns = []
 
-        for i, code in enumerate(code_blocks):
+        for i, code in enumerate(self.extract_code_blocks(content)):
             block_patterns = self._process_code_block(code, i)
             patterns.extend(block_patterns)
 
@@ -327,6 +334,403 @@ class TemporalSearchParser:
         return TimeRange()
 
 
+# Conversations extracted and written per statement during sync
+_PATTERN_BATCH_SIZE = 500
+
+# Pattern fields stored in their own columns rather than in ``details``
+_PATTERN_COLUMN_FIELDS = frozenset(
+    {"type", "subtype", "content", "block_index", "line_number", "start", "end"}
+)
+
+_QUOTED_RE = re.compile(r"(['\"]).*?\1")
+_NUMBER_RE = re.compile(r"\d+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _error_signature(text: str) -> str:
+    """Normalize an error message so repeats of the same failure group together.
+
+    Quoted values become ``?`` and numbers become ``#``, so
+    ``ImportError: cannot import 'x' (line 12)`` and the same error for
+    ``'y'`` on line 40 share one signature.
+    """
+    signature = _QUOTED_RE.sub("?", text.lower())
+    signature = _NUMBER_RE.sub("#", signature)
+    return _SPACE_RE.sub(" ", signature).strip()[:200]
+
+
+class PatternIndex:
+    """Code and error patterns extracted once per conversation and stored.
+
+    ``search_code_patterns`` and ``search_error_patterns`` used to re-parse
+    every conversation on every query. Extraction now happens when a
+    conversation is stored (or on the first search after it was written
+    some other way) into three tables:
+
+        conversation_patterns          one row per extracted pattern
+        conversation_code_blocks       fenced code blocks, stored once
+        pattern_indexed_conversations  conversations already extracted
+
+    Queries pre-filter candidates in SQL and only score those in Python.
+    """
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        code_searcher: CodeSearcher | None = None,
+        error_matcher: ErrorPatternMatcher | None = None,
+    ) -> None:
+        self.conn = conn
+        self.code_searcher = code_searcher or CodeSearcher()
+        self.error_matcher = error_matcher or ErrorPatternMatcher()
+
+    def ensure_schema(self) -> None:
+        """Create the pattern tables and their indexes if missing."""
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversation_patterns (
+                conversation_id VARCHAR NOT NULL,
+                ordinal INTEGER NOT NULL,
+                pattern_kind VARCHAR NOT NULL,  -- 'code' or 'error'
+                pattern_type VARCHAR NOT NULL,  -- node type, or 'error'/'context'
+                subtype VARCHAR,
+                signature VARCHAR,
+                name VARCHAR,
+                modules VARCHAR[],
+                content VARCHAR,  -- matched error text
+                block_index INTEGER,
+                line_number INTEGER,
+                start_offset INTEGER,
+                end_offset INTEGER,
+                details VARCHAR
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversation_code_blocks (
+                conversation_id VARCHAR NOT NULL,
+                block_index INTEGER NOT NULL,
+                code VARCHAR NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pattern_indexed_conversations (
+                conversation_id VARCHAR PRIMARY KEY,
+                indexed_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        for name, table, columns in (
+            (
+                "idx_patterns_type",
+                "conversation_patterns",
+                "pattern_kind, pattern_type",
+            ),
+            ("idx_patterns_subtype", "conversation_patterns", "pattern_kind, subtype"),
+            ("idx_patterns_signature", "conversation_patterns", "signature"),
+            ("idx_patterns_conversation", "conversation_patterns", "conversation_id"),
+            (
+                "idx_code_blocks_conversation",
+                "conversation_code_blocks",
+                "conversation_id",
+            ),
+        ):
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+            )
+
+    def index_conversations(self, conversations: Iterable[tuple[str, str]]) -> int:
+        """Extract and store the patterns of ``(id, content)`` pairs.
+
+        Conversations already indexed are replaced.
+
+        Returns:
+            Number of conversations indexed
+        """
+        conv_ids: list[str] = []
+        blocks: list[tuple[str, int, str]] = []
+        rows: list[tuple[Any, ...]] = []
+        for conv_id, content in conversations:
+            conv_id = str(conv_id)
+            conv_ids.append(conv_id)
+            rows.extend(self._extract_rows(conv_id, content or "", blocks))
+
+        if not conv_ids:
+            return 0
+
+        self.remove_conversations(conv_ids)
+        if blocks:
+            self.conn.execute(
+                """
+                INSERT INTO conversation_code_blocks
+                SELECT unnest(?::VARCHAR[]), unnest(?::INTEGER[]),
+                       unnest(?::VARCHAR[])
+                """,
+                [list(column) for column in zip(*blocks, strict=True)],
+            )
+        if rows:
+            self.conn.execute(
+                """
+                INSERT INTO conversation_patterns
+                SELECT unnest(?::VARCHAR[]), unnest(?::INTEGER[]),
+                       unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::VARCHAR[]), unnest(?::VARCHAR[][]),
+                       unnest(?::VARCHAR[]), unnest(?::INTEGER[]),
+                       unnest(?::INTEGER[]), unnest(?::INTEGER[]),
+                       unnest(?::INTEGER[]), unnest(?::VARCHAR[])
+                """,
+                [list(column) for column in zip(*rows, strict=True)],
+            )
+        self.conn.execute(
+            """
+            INSERT INTO pattern_indexed_conversations (conversation_id, indexed_at)
+            SELECT unnest(?::VARCHAR[]), ?
+            ON CONFLICT (conversation_id) DO UPDATE SET
+            indexed_at = EXCLUDED.indexed_at
+            """,
+            [conv_ids, utc_now()],
+        )
+        return len(conv_ids)
+
+    def remove_conversations(self, conv_ids: list[str]) -> None:
+        """Drop the stored patterns of ``conv_ids``."""
+        if not conv_ids:
+            return
+        for table in (
+            "conversation_patterns",
+            "conversation_code_blocks",
+            "pattern_indexed_conversations",
+        ):
+            self.conn.execute(
+                f"""
+                DELETE FROM {table}
+                WHERE conversation_id IN (SELECT unnest(?::VARCHAR[]))
+                """,
+                [conv_ids],
+            )
+
+    def sync(self, table: str) -> int:
+        """Index conversations of ``table`` not extracted yet; drop deleted ones.
+
+        Cheap when nothing changed: the row count and an id checksum of
+        ``table`` are compared with the indexed set first.
+
+        Returns:
+            Number of conversations indexed or removed
+        """
+        table_probe = self.conn.execute(
+            f"SELECT COUNT(*), BIT_XOR(HASH(CAST(id AS VARCHAR))) FROM {table}"
+        ).fetchone()
+        index_probe = self.conn.execute(
+            """
+            SELECT COUNT(*), BIT_XOR(HASH(conversation_id))
+            FROM pattern_indexed_conversations
+            """
+        ).fetchone()
+        if table_probe == index_probe:
+            return 0
+
+        stale = [
+            row[0]
+            for row in self.conn.execute(
+                f"""
+                SELECT i.conversation_id FROM pattern_indexed_conversations i
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table} c
+                    WHERE CAST(c.id AS VARCHAR) = i.conversation_id
+                )
+                """
+            ).fetchall()
+        ]
+        self.remove_conversations(stale)
+
+        indexed = 0
+        missing_sql = f"""
+            SELECT CAST(c.id AS VARCHAR) AS conv_id, c.content FROM {table} c
+            WHERE CAST(c.id AS VARCHAR) > ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM pattern_indexed_conversations i
+                  WHERE i.conversation_id = CAST(c.id AS VARCHAR)
+              )
+            ORDER BY conv_id
+            LIMIT ?
+        """
+        cursor = ""
+        while True:
+            batch = self.conn.execute(
+                missing_sql, [cursor, _PATTERN_BATCH_SIZE]
+            ).fetchall()
+            if not batch:
+                break
+            indexed += self.index_conversations(batch)
+            cursor = batch[-1][0]
+        return len(stale) + indexed
+
+    def rebuild(self, table: str) -> int:
+        """Re-extract every conversation of ``table``.
+
+        Needed after changing the extractors; ``sync`` only picks up
+        conversations that were never indexed.
+
+        Returns:
+            Number of conversations indexed
+        """
+        for index_table in (
+            "conversation_patterns",
+            "conversation_code_blocks",
+            "pattern_indexed_conversations",
+        ):
+            self.conn.execute(f"DELETE FROM {index_table}")
+        return self.sync(table)
+
+    def code_candidates(
+        self, table: str, query: str, pattern_type: str | None = None
+    ) -> list[tuple[Any, ...]]:
+        """Return code patterns that can score above zero for ``query``.
+
+        A pattern qualifies when its type, name or a module appears in the
+        query, or the query appears in its code block - the terms
+        ``_calculate_code_relevance`` scores.
+
+        Returns:
+            Rows of (conversation id, project, timestamp, conversation
+            content, pattern type, code, block index, line number, details),
+            newest conversation first
+        """
+        query_lower = query.lower()
+        type_clause = "AND p.pattern_type = ?" if pattern_type else ""
+        sql = f"""
+            SELECT p.conversation_id, c.project, c.timestamp, c.content,
+                   p.pattern_type, b.code, p.block_index, p.line_number, p.details
+            FROM conversation_patterns p
+            JOIN conversation_code_blocks b
+              ON b.conversation_id = p.conversation_id
+             AND b.block_index = p.block_index
+            JOIN {table} c ON CAST(c.id AS VARCHAR) = p.conversation_id
+            WHERE p.pattern_kind = 'code' {type_clause}
+              AND (
+                strpos(?, p.pattern_type) > 0
+                OR (p.name <> '' AND strpos(?, lower(p.name)) > 0)
+                OR strpos(lower(b.code), ?) > 0
+                OR EXISTS (
+                    SELECT 1 FROM (SELECT unnest(p.modules) AS module)
+                    WHERE module <> '' AND strpos(?, lower(module)) > 0
+                )
+              )
+            ORDER BY c.timestamp DESC, p.conversation_id, p.ordinal
+        """
+        params: list[Any] = [pattern_type] if pattern_type else []
+        params.extend([query_lower] * 4)
+        return self.conn.execute(sql, params).fetchall()
+
+    def error_candidates(
+        self, table: str, query: str, error_type: str | None = None
+    ) -> list[tuple[Any, ...]]:
+        """Return error and context patterns that can score above zero.
+
+        A pattern qualifies when its subtype appears in the query, the query
+        appears in its text (the whole conversation for context patterns),
+        or it is a high-relevance context - the terms
+        ``_calculate_error_relevance`` scores.
+
+        Returns:
+            Rows of (conversation id, project, timestamp, conversation
+            content, pattern type, subtype, matched text, start, end,
+            details), newest conversation first
+        """
+        query_lower = query.lower()
+        subtype_clause = "AND p.subtype = ?" if error_type else ""
+        sql = f"""
+            SELECT p.conversation_id, c.project, c.timestamp, c.content,
+                   p.pattern_type, p.subtype, p.content, p.start_offset,
+                   p.end_offset, p.details
+            FROM conversation_patterns p
+            JOIN {table} c ON CAST(c.id AS VARCHAR) = p.conversation_id
+            WHERE p.pattern_kind = 'error' {subtype_clause}
+              AND (
+                strpos(?, p.subtype) > 0
+                OR strpos(lower(COALESCE(p.content, c.content)), ?) > 0
+                OR json_extract_string(p.details, '$.relevance') = 'high'
+              )
+            ORDER BY c.timestamp DESC, p.conversation_id, p.ordinal
+        """
+        params: list[Any] = [error_type] if error_type else []
+        params.extend([query_lower] * 2)
+        return self.conn.execute(sql, params).fetchall()
+
+    def _extract_rows(
+        self, conv_id: str, content: str, blocks: list[tuple[str, int, str]]
+    ) -> list[tuple[Any, ...]]:
+        """Extract one conversation's pattern rows, appending its code blocks."""
+        rows: list[tuple[Any, ...]] = []
+        for block_index, code in enumerate(
+            self.code_searcher.extract_code_blocks(content)
+        ):
+            blocks.append((conv_id, block_index, code))
+            start = content.find(code)
+            end = start + len(code) if start >= 0 else None
+            for pattern in self.code_searcher._process_code_block(code, block_index):
+                name = pattern.get("name")
+                modules = pattern.get("modules")
+                signature = name or pattern.get("module") or ",".join(modules or [])
+                rows.append(
+                    (
+                        conv_id,
+                        len(rows),
+                        "code",
+                        pattern["type"],
+                        None,
+                        signature.lower() or None,
+                        name,
+                        modules,
+                        None,
+                        block_index,
+                        pattern["line_number"],
+                        start if start >= 0 else None,
+                        end,
+                        self._details(pattern),
+                    )
+                )
+
+        for pattern in self.error_matcher.extract_error_patterns(content):
+            is_error = pattern["type"] == "error"
+            rows.append(
+                (
+                    conv_id,
+                    len(rows),
+                    "error",
+                    pattern["type"],
+                    pattern["subtype"],
+                    _error_signature(pattern["content"])
+                    if is_error
+                    else pattern["subtype"],
+                    None,
+                    None,
+                    pattern["content"] if is_error else None,
+                    None,
+                    None,
+                    pattern.get("start"),
+                    pattern.get("end"),
+                    self._details(pattern),
+                )
+            )
+        return rows
+
+    @staticmethod
+    def _details(pattern: dict[str, Any]) -> str:
+        return json.dumps(
+            {
+                key: value
+                for key, value in pattern.items()
+                if key not in _PATTERN_COLUMN_FIELDS
+            }
+        )
+
+
 class EnhancedSearchEngine:
     """Main search engine that combines all enhanced search capabilities."""
 
@@ -335,6 +739,40 @@ class EnhancedSearchEngine:
         self.code_searcher = CodeSearcher()
         self.error_matcher = ErrorPatternMatcher()
         self.temporal_parser = TemporalSearchParser()
+        self._pattern_index: PatternIndex | None = None
+
+    def _get_pattern_index(self) -> PatternIndex | None:
+        """Return the pattern index caught up with the conversations table.
+
+        None when the database is not DuckDB; searches then fall back to
+        extracting patterns from every conversation.
+        """
+        conn = getattr(self.reflection_db, "conn", None)
+        if not isinstance(conn, duckdb.DuckDBPyConnection):
+            return None
+        if self._pattern_index is None or self._pattern_index.conn is not conn:
+            self._pattern_index = PatternIndex(
+                conn, self.code_searcher, self.error_matcher
+            )
+            self._pattern_index.ensure_schema()
+        self._pattern_index.sync(self._conversation_table())
+        return self._pattern_index
+
+    def _conversation_table(self) -> str:
+        """Resolve the conversations table through the adapter when it has one."""
+        resolve = getattr(self.reflection_db, "_table", None)
+        return resolve("conversations") if callable(resolve) else "conversations"
+
+    def rebuild_pattern_index(self) -> int:
+        """Re-extract code and error patterns for every stored conversation.
+
+        Returns:
+            Number of conversations indexed (0 without a DuckDB connection)
+        """
+        index = self._get_pattern_index()
+        if index is None:
+            return 0
+        return index.rebuild(self._conversation_table())
 
     async def search_code_patterns(
         self,
@@ -343,6 +781,18 @@ class EnhancedSearchEngine:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """Search for code patterns in conversations."""
+        index = self._get_pattern_index()
+        if index is not None:
+            rows = index.code_candidates(
+                self._conversation_table(), query, pattern_type
+            )
+            results = [
+                result
+                for row in rows
+                if (result := self._code_result_from_row(row, query)) is not None
+            ]
+            return self._sort_and_limit_results(results, limit)
+
         conversations = self._get_all_conversations()
         if not conversations:
             return []
@@ -364,7 +814,8 @@ class EnhancedSearchEngine:
             return []
 
         cursor = self.reflection_db.conn.execute(
-            "SELECT id, content, project, timestamp, metadata FROM conversations",
+            "SELECT id, content, project, timestamp, metadata "
+            f"FROM {self._conversation_table()}",
         )
         return cast("list[tuple[str, str, str, str, str]]", cursor.fetchall())
 
@@ -400,6 +851,73 @@ class EnhancedSearchEngine:
 
         return results
 
+    def _code_result_from_row(
+        self, row: tuple[Any, ...], query: str
+    ) -> dict[str, Any] | None:
+        """Score one ``PatternIndex.code_candidates`` row like a scanned match."""
+        (
+            conv_id,
+            project,
+            timestamp,
+            content,
+            pattern_type,
+            code,
+            block_index,
+            line_number,
+            details,
+        ) = row
+        pattern = {
+            "type": pattern_type,
+            "content": code,
+            "block_index": block_index,
+            "line_number": line_number,
+        } | json.loads(details or "{}")
+        relevance = self._calculate_code_relevance(pattern, query)
+        if relevance <= 0.3:
+            return None
+        return {
+            "conversation_id": conv_id,
+            "project": project,
+            "timestamp": timestamp,
+            "pattern": pattern,
+            "relevance": relevance,
+            "snippet": content[:500] + "..." if len(content) > 500 else content,
+        }
+
+    def _error_result_from_row(
+        self, row: tuple[Any, ...], query: str
+    ) -> dict[str, Any] | None:
+        """Score one ``PatternIndex.error_candidates`` row like a scanned match."""
+        (
+            conv_id,
+            project,
+            timestamp,
+            content,
+            pattern_type,
+            subtype,
+            matched,
+            start,
+            end,
+            details,
+        ) = row
+        pattern: dict[str, Any] = {"type": pattern_type, "subtype": subtype}
+        if pattern_type == "error":
+            pattern |= {"content": matched, "start": start, "end": end}
+        else:
+            pattern["content"] = content
+        pattern |= json.loads(details or "{}")
+        relevance = self._calculate_error_relevance(pattern, query)
+        if relevance <= 0.2:
+            return None
+        return {
+            "conversation_id": conv_id,
+            "project": project,
+            "timestamp": timestamp,
+            "pattern": pattern,
+            "relevance": relevance,
+            "snippet": content[:500] + "..." if len(content) > 500 else content,
+        }
+
     def _sort_and_limit_results(
         self,
         results: list[dict[str, Any]],
@@ -416,6 +934,16 @@ class EnhancedSearchEngine:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """Search for error patterns and debugging contexts."""
+        index = self._get_pattern_index()
+        if index is not None:
+            rows = index.error_candidates(self._conversation_table(), query, error_type)
+            results = [
+                result
+                for row in rows
+                if (result := self._error_result_from_row(row, query)) is not None
+            ]
+            return self._sort_and_limit_results(results, limit)
+
         conversations = self._get_all_conversations()
         if not conversations:
             return []
@@ -57,8 +57,8 @@ class AkoshaSyncConfig:
 
         # Feature flags
         enable_compression: Compress databases before upload
-        enable_deduplication: Skip unchanged uploads
-        chunk_size_mb: Upload chunk size for large files
+        enable_deduplication: Skip uploading chunks already stored
+        chunk_size_mb: Maximum database chunk size
     """
 
     # ==========================================================================
@@ -158,17 +158,19 @@ class AkoshaSyncConfig:
     """
 
     enable_deduplication: bool = True
-    """Skip uploads if database hasn't changed.
+    """Skip uploading chunks that are already stored.
 
-    Computes SHA-256 hash of local database and compares with last upload.
-    Avoids redundant uploads and bandwidth usage.
+    Each database chunk is identified by its SHA-256 hash; chunks uploaded by
+    an earlier sync are not sent again, so an unchanged database only costs
+    a manifest upload.
     """
 
     chunk_size_mb: int = 5
-    """Upload chunk size in MB for files > 10MB.
+    """Maximum size in MB of a database chunk.
 
-    Larger chunks = fewer requests but more memory usage.
-    Smaller chunks = better progress tracking but more overhead.
+    Chunk boundaries depend on content and average a quarter of this size.
+    Larger chunks = fewer requests but more data re-uploaded per change.
+    Smaller chunks = finer deduplication but more objects and overhead.
     """
 
     def __getattribute__(self, name: str) -> dict[str, Any]:
@@ -26,11 +26,22 @@ import json
 import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 
 from session_buddy.storage.akosha_config import AkoshaSyncConfig
+from session_buddy.storage.akosha_export import (
+    EMBEDDING_ENCODING,
+    BatchOutcome,
+    ExportBatch,
+    ExportStream,
+    PipelineResult,
+    Watermark,
+    encode_embedding,
+    read_page,
+    run_pipelined,
+)
 from session_buddy.storage.cloud_sync import CloudSyncMethod
 from session_buddy.storage.sync_protocol import (
     HTTPSyncError,
@@ -39,6 +50,9 @@ from session_buddy.storage.sync_protocol import (
 )
 from session_buddy.utils.error_management import _get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
 logger = _get_logger()
 
 # Default batch size for batch_store_memories
@@ -50,6 +64,93 @@ MAX_RETRIES = 3
 # Base delay for exponential backoff (seconds)
 BASE_BACKOFF_DELAY = 1.0
 
+# Batches uploaded at the same time by HTTP sync
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
+# Tables exported by HTTP sync, walked in (timestamp, id) order
+CONVERSATION_STREAM = ExportStream(
+    name="conversations",
+    table="conversations_v2",
+    columns=(
+        "id",
+        "content",
+        "embedding",
+        "category",
+        "subcategory",
+        "importance_score",
+        "memory_tier",
+        "access_count",
+        "last_accessed",
+        "project",
+        "namespace",
+        "timestamp",
+        "session_id",
+        "user_id",
+        "searchable_content",
+        "reasoning",
+        "source_type",
+    ),
+)
+REFLECTION_STREAM = ExportStream(
+    name="reflections",
+    table="reflections_v2",
+    columns=(
+        "id",
+        "content",
+        "embedding",
+        "category",
+        "importance_score",
+        "memory_tier",
+        "tags",
+        "related_entities",
+        "timestamp",
+        "project",
+        "namespace",
+        "access_count",
+        "last_accessed",
+    ),
+)
+ENTITY_STREAM = ExportStream(
+    name="entities",
+    table="kg_entities",
+    columns=(
+        "id",
+        "name",
+        "entity_type",
+        "observations",
+        "properties",
+        "created_at",
+        "updated_at",
+        "metadata",
+    ),
+    order_column="updated_at",
+)
+RELATIONSHIP_STREAM = ExportStream(
+    name="relationships",
+    table="kg_relationships",
+    columns=(
+        "id",
+        "from_entity",
+        "to_entity",
+        "relation_type",
+        "properties",
+        "created_at",
+        "updated_at",
+        "metadata",
+    ),
+    order_column="updated_at",
+)
+
+
+def _json_object(value: Any) -> dict[str, Any]:
+    """Decode a JSON column holding an object; empty values become ``{}``."""
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return value
+    decoded = json.loads(value)
+    return decoded if isinstance(decoded, dict) else {}
+
 
 class HttpSyncMethod(SyncMethod):
     """HTTP sync method for direct upload to Akosha.
@@ -63,9 +164,10 @@ class HttpSyncMethod(SyncMethod):
     Features:
         - Batch upload of conversations, reflections, and entities
         - Knowledge graph entity/relationship sync
-        - Incremental sync with change detection via timestamps
-        - Retry logic with exponential backoff
-        - Configurable batch size
+        - Streaming keyset export with a watermark persisted per batch
+        - Several batches in flight, each retried with exponential backoff
+        - Embeddings sent as base64 float16
+        - Configurable batch size and upload concurrency
     """
 
     AKOSHA_DEFAULT_URL = "http://localhost:8682/mcp"
@@ -143,7 +245,8 @@ class HttpSyncMethod(SyncMethod):
         Args:
             upload_reflections: Whether to upload reflections
             upload_knowledge_graph: Whether to upload knowledge graph
-            **kwargs: Additional parameters (batch_size, incremental)
+            **kwargs: Additional parameters (batch_size, incremental,
+                concurrency)
 
         Returns:
             Sync result dictionary with:
@@ -164,6 +267,7 @@ class HttpSyncMethod(SyncMethod):
         akosha_url = self.config.cloud_endpoint or self.AKOSHA_DEFAULT_URL
         batch_size = kwargs.get("batch_size", DEFAULT_BATCH_SIZE)
         incremental = kwargs.get("incremental", True)
+        concurrency = kwargs.get("concurrency", DEFAULT_UPLOAD_CONCURRENCY)
 
         logger.info(f"Starting HTTP sync to Akosha: {akosha_url}")
 
@@ -186,6 +290,7 @@ class HttpSyncMethod(SyncMethod):
                     upload_reflections,
                     upload_knowledge_graph,
                     stats,
+                    concurrency=concurrency,
                 )
 
             self._update_sync_state()
@@ -245,6 +350,7 @@ class HttpSyncMethod(SyncMethod):
         upload_reflections: bool,
         upload_knowledge_graph: bool,
         stats: dict[str, Any],
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> None:
         """Execute all sync operations with HTTP client."""
         memories_result = await self._sync_conversations(
@@ -252,6 +358,7 @@ class HttpSyncMethod(SyncMethod):
             akosha_url=akosha_url,
             batch_size=batch_size,
             incremental=incremental,
+            concurrency=concurrency,
         )
         stats["memories_uploaded"] = memories_result["count"]
         stats["bytes_transferred"] += memories_result["bytes"]
@@ -263,6 +370,7 @@ class HttpSyncMethod(SyncMethod):
                 akosha_url=akosha_url,
                 batch_size=batch_size,
                 incremental=incremental,
+                concurrency=concurrency,
             )
             stats["reflections_uploaded"] = reflections_result["count"]
             stats["bytes_transferred"] += reflections_result["bytes"]
@@ -274,6 +382,7 @@ class HttpSyncMethod(SyncMethod):
                 akosha_url=akosha_url,
                 batch_size=batch_size,
                 incremental=incremental,
+                concurrency=concurrency,
             )
             stats["entities_uploaded"] = kg_result["entities_count"]
             stats["relationships_uploaded"] = kg_result["relationships_count"]
@@ -308,6 +417,7 @@ class HttpSyncMethod(SyncMethod):
         akosha_url: str,
         batch_size: int,
         incremental: bool,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> dict[str, Any]:
         """Sync conversations from DuckDB to Akosha.
 
@@ -315,111 +425,24 @@ class HttpSyncMethod(SyncMethod):
             client: HTTP client instance
             akosha_url: Akosha MCP endpoint URL
             batch_size: Number of records per batch
-            incremental: Only sync records modified since last sync
+            incremental: Resume after the last acknowledged conversation
+            concurrency: Batches uploaded at the same time
 
         Returns:
             Dict with count, bytes, and errors
         """
-        conversations = await self._fetch_conversations(
-            incremental=incremental, batch_size=batch_size
-        )
-
-        if not conversations:
-            logger.debug("No conversations to sync")
-            return {"count": 0, "bytes": 0, "errors": []}
-
-        # Convert to Akosha format
-        memories = [self._serialize_conversation(conv) for conv in conversations]
-
-        # Batch upload
-        result = await self._batch_upload_memories(
+        result = await self._export_stream(
             client=client,
             akosha_url=akosha_url,
-            memories=memories,
+            stream=CONVERSATION_STREAM,
+            db_path=self.reflection_db_path,
             batch_size=batch_size,
+            incremental=incremental,
+            concurrency=concurrency,
+            serialize=self._serialize_conversation,
+            tool_name="batch_store_memories",
         )
-
-        return result
-
-    async def _fetch_conversations(
-        self,
-        incremental: bool,
-        batch_size: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch conversations from DuckDB.
-
-        Args:
-            incremental: Only fetch records modified since last sync
-            batch_size: Maximum number of records to fetch
-
-        Returns:
-            List of conversation dictionaries
-        """
-        try:
-            import duckdb
-        except ImportError:
-            return []
-
-        if not self.reflection_db_path.exists():
-            logger.debug(f"Reflection database not found: {self.reflection_db_path}")
-            return []
-
-        try:
-            conn = duckdb.connect(str(self.reflection_db_path), read_only=True)
-
-            # Build query with optional incremental filter
-            where_clause = ""
-            params: list[Any] = []
-
-            if incremental and "conversations" in self._last_sync_timestamp:
-                where_clause = "WHERE updated_at > ? OR timestamp > ?"
-                last_sync = self._last_sync_timestamp["conversations"]
-                params = [last_sync, last_sync]
-
-            query = f"""
-                SELECT
-                    id, content, embedding, category, subcategory,
-                    importance_score, memory_tier, access_count, last_accessed,
-                    project, namespace, timestamp, session_id, user_id,
-                    searchable_content, reasoning, source_type
-                FROM conversations_v2
-                {where_clause}
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            params.append(batch_size * 10)  # Allow larger fetch for batching
-
-            results = conn.execute(query, params).fetchall()
-            conn.close()
-
-            conversations = [
-                {
-                    "id": row[0],
-                    "content": row[1],
-                    "embedding": list(row[2]) if row[2] else None,
-                    "category": row[3],
-                    "subcategory": row[4],
-                    "importance_score": row[5],
-                    "memory_tier": row[6],
-                    "access_count": row[7],
-                    "last_accessed": row[8],
-                    "project": row[9],
-                    "namespace": row[10],
-                    "timestamp": row[11],
-                    "session_id": row[12],
-                    "user_id": row[13],
-                    "searchable_content": row[14],
-                    "reasoning": row[15],
-                    "source_type": row[16],
-                }
-                for row in results
-            ]
-
-            return conversations
-
-        except (duckdb.Error, OSError, ValueError) as e:
-            logger.error(f"Failed to fetch conversations: {e}")
-            return []
+        return {"count": result.stored, "bytes": result.bytes, "errors": result.errors}
 
     def _serialize_conversation(self, conv: dict[str, Any]) -> dict[str, Any]:
         """Serialize a conversation for Akosha ingestion.
@@ -466,16 +489,24 @@ class HttpSyncMethod(SyncMethod):
         return {
             "memory_id": conv["id"],
             "text": text,
-            "embedding": conv.get("embedding"),
+            **self._serialize_embedding(conv.get("embedding")),
             "metadata": metadata,
         }
 
+    def _serialize_embedding(self, embedding: Any) -> dict[str, Any]:
+        """Return the embedding fields of an upload payload."""
+        encoded = encode_embedding(embedding)
+        if encoded is None:
+            return {"embedding": None}
+        return {"embedding": encoded, "embedding_encoding": EMBEDDING_ENCODING}
+
     async def _sync_reflections(
         self,
         client: httpx.AsyncClient,
         akosha_url: str,
         batch_size: int,
         incremental: bool,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> dict[str, Any]:
         """Sync reflections from DuckDB to Akosha.
 
@@ -483,121 +514,27 @@ class HttpSyncMethod(SyncMethod):
             client: HTTP client instance
             akosha_url: Akosha MCP endpoint URL
             batch_size: Number of records per batch
-            incremental: Only sync records modified since last sync
+            incremental: Resume after the last acknowledged reflection
+            concurrency: Batches uploaded at the same time
 
         Returns:
             Dict with count, bytes, and errors
         """
-        reflections = await self._fetch_reflections(
-            incremental=incremental, batch_size=batch_size
+        # No batch endpoint for reflections: each batch is sent record by
+        # record, with several batches in flight
+        result = await self._export_stream(
+            client=client,
+            akosha_url=akosha_url,
+            stream=REFLECTION_STREAM,
+            db_path=self.reflection_db_path,
+            batch_size=batch_size,
+            incremental=incremental,
+            concurrency=concurrency,
+            serialize=self._serialize_reflection,
+            tool_name="store_reflection",
+            accepted=lambda result: result.get("status") == "stored",
         )
-
-        if not reflections:
-            logger.debug("No reflections to sync")
-            return {"count": 0, "bytes": 0, "errors": []}
-
-        # Upload reflections one at a time (no batch endpoint for reflections)
-        uploaded = 0
-        total_bytes = 0
-        errors: list[dict[str, Any]] = []
-
-        for reflection in reflections:
-            try:
-                serialized = self._serialize_reflection(reflection)
-                result = await self._call_mcp_tool(
-                    client=client,
-                    akosha_url=akosha_url,
-                    tool_name="store_reflection",
-                    arguments=serialized,
-                )
-
-                if result.get("status") == "stored":
-                    uploaded += 1
-                    total_bytes += len(json.dumps(serialized))
-                else:
-                    errors.append(
-                        {
-                            "id": reflection["id"],
-                            "error": result.get("error", "Unknown error"),
-                        }
-                    )
-
-            except (httpx.HTTPError, json.JSONDecodeError) as e:
-                errors.append({"id": reflection["id"], "error": str(e)})
-
-        return {"count": uploaded, "bytes": total_bytes, "errors": errors}
-
-    async def _fetch_reflections(
-        self,
-        incremental: bool,
-        batch_size: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch reflections from DuckDB.
-
-        Args:
-            incremental: Only fetch records modified since last sync
-            batch_size: Maximum number of records to fetch
-
-        Returns:
-            List of reflection dictionaries
-        """
-        try:
-            import duckdb
-        except ImportError:
-            return []
-
-        if not self.reflection_db_path.exists():
-            return []
-
-        try:
-            conn = duckdb.connect(str(self.reflection_db_path), read_only=True)
-
-            where_clause = ""
-            params: list[Any] = []
-
-            if incremental and "reflections" in self._last_sync_timestamp:
-                where_clause = "WHERE timestamp > ?"
-                params = [self._last_sync_timestamp["reflections"]]
-
-            query = f"""
-                SELECT
-                    id, content, embedding, category, importance_score,
-                    memory_tier, tags, related_entities, timestamp,
-                    project, namespace, access_count, last_accessed
-                FROM reflections_v2
-                {where_clause}
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            params.append(batch_size * 5)
-
-            results = conn.execute(query, params).fetchall()
-            conn.close()
-
-            reflections = [
-                {
-                    "id": row[0],
-                    "content": row[1],
-                    "embedding": list(row[2]) if row[2] else None,
-                    "category": row[3],
-                    "importance_score": row[4],
-                    "memory_tier": row[5],
-                    "tags": list(row[6]) if row[6] else [],
-                    "related_entities": list(row[7]) if row[7] else [],
-                    "timestamp": row[8],
-                    "project": row[9],
-                    "namespace": row[10],
-                    "access_count": row[11],
-                    "last_accessed": row[12],
-                }
-                for row in results
-            ]
-
-            return reflections
-
-        except (duckdb.Error, OSError, ValueError) as e:
-            logger.error(f"Failed to fetch reflections: {e}")
-            return []
+        return {"count": result.stored, "bytes": result.bytes, "errors": result.errors}
 
     def _serialize_reflection(self, reflection: dict[str, Any]) -> dict[str, Any]:
         """Serialize a reflection for Akosha ingestion.
@@ -611,7 +548,7 @@ class HttpSyncMethod(SyncMethod):
         return {
             "reflection_id": reflection["id"],
             "content": reflection.get("content", ""),
-            "embedding": reflection.get("embedding"),
+            **self._serialize_embedding(reflection.get("embedding")),
             "metadata": {
                 "source": self.config.system_id_resolved,
                 "original_id": reflection["id"],
@@ -619,8 +556,8 @@ class HttpSyncMethod(SyncMethod):
                 "category": reflection.get("category", "context"),
                 "importance_score": reflection.get("importance_score", 0.5),
                 "memory_tier": reflection.get("memory_tier", "long_term"),
-                "tags": reflection.get("tags", []),
-                "related_entities": reflection.get("related_entities", []),
+                "tags": list(reflection.get("tags") or []),
+                "related_entities": list(reflection.get("related_entities") or []),
                 "project": reflection.get("project"),
                 "namespace": reflection.get("namespace", "default"),
                 "created_at": (
@@ -638,6 +575,7 @@ class HttpSyncMethod(SyncMethod):
         akosha_url: str,
         batch_size: int,
         incremental: bool,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> dict[str, Any]:
         """Sync knowledge graph entities and relationships to Akosha.
 
@@ -645,218 +583,48 @@ class HttpSyncMethod(SyncMethod):
             client: HTTP client instance
             akosha_url: Akosha MCP endpoint URL
             batch_size: Number of records per batch
-            incremental: Only sync records modified since last sync
+            incremental: Resume after the last acknowledged entity/relationship
+            concurrency: Batches uploaded at the same time
 
         Returns:
             Dict with entities_count, relationships_count, bytes, and errors
         """
-        # Sync entities first
-        entities = await self._fetch_entities(
-            incremental=incremental, batch_size=batch_size
+        # Entities first: relationships refer to them
+        entities = await self._export_stream(
+            client=client,
+            akosha_url=akosha_url,
+            stream=ENTITY_STREAM,
+            db_path=self.knowledge_graph_db_path,
+            batch_size=batch_size,
+            incremental=incremental,
+            concurrency=concurrency,
+            serialize=self._serialize_entity,
+            tool_name="create_entity",
+            accepted=lambda result: bool(result.get("id")),
         )
-        entities_uploaded = 0
-        entities_bytes = 0
-        errors: list[dict[str, Any]] = []
-
-        for entity in entities:
-            try:
-                serialized = self._serialize_entity(entity)
-                result = await self._call_mcp_tool(
-                    client=client,
-                    akosha_url=akosha_url,
-                    tool_name="create_entity",
-                    arguments=serialized,
-                )
-
-                if result.get("id"):
-                    entities_uploaded += 1
-                    entities_bytes += len(json.dumps(serialized))
-                else:
-                    errors.append(
-                        {
-                            "type": "entity",
-                            "id": entity["id"],
-                            "error": result.get("error", "Unknown error"),
-                        }
-                    )
-
-            except (httpx.HTTPError, json.JSONDecodeError) as e:
-                errors.append({"type": "entity", "id": entity["id"], "error": str(e)})
-
-        # Sync relationships
-        relationships = await self._fetch_relationships(
-            incremental=incremental, batch_size=batch_size
+        relationships = await self._export_stream(
+            client=client,
+            akosha_url=akosha_url,
+            stream=RELATIONSHIP_STREAM,
+            db_path=self.knowledge_graph_db_path,
+            batch_size=batch_size,
+            incremental=incremental,
+            concurrency=concurrency,
+            serialize=self._serialize_relationship,
+            tool_name="create_relation",
+            accepted=lambda result: bool(result.get("id")),
         )
-        relationships_uploaded = 0
-        relationships_bytes = 0
-
-        for rel in relationships:
-            try:
-                serialized = self._serialize_relationship(rel)
-                result = await self._call_mcp_tool(
-                    client=client,
-                    akosha_url=akosha_url,
-                    tool_name="create_relation",
-                    arguments=serialized,
-                )
-
-                if result.get("id"):
-                    relationships_uploaded += 1
-                    relationships_bytes += len(json.dumps(serialized))
-                else:
-                    errors.append(
-                        {
-                            "type": "relationship",
-                            "id": rel["id"],
-                            "error": result.get("error", "Unknown error"),
-                        }
-                    )
-
-            except (httpx.HTTPError, json.JSONDecodeError) as e:
-                errors.append(
-                    {"type": "relationship", "id": rel["id"], "error": str(e)}
-                )
 
         return {
-            "entities_count": entities_uploaded,
-            "relationships_count": relationships_uploaded,
-            "bytes": entities_bytes + relationships_bytes,
-            "errors": errors,
+            "entities_count": entities.stored,
+            "relationships_count": relationships.stored,
+            "bytes": entities.bytes + relationships.bytes,
+            "errors": [
+                *({"type": "entity", **error} for error in entities.errors),
+                *({"type": "relationship", **error} for error in relationships.errors),
+            ],
         }
 
-    async def _fetch_entities(
-        self,
-        incremental: bool,
-        batch_size: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch entities from knowledge graph DuckDB.
-
-        Args:
-            incremental: Only fetch records modified since last sync
-            batch_size: Maximum number of records to fetch
-
-        Returns:
-            List of entity dictionaries
-        """
-        try:
-            import duckdb
-        except ImportError:
-            return []
-
-        if not self.knowledge_graph_db_path.exists():
-            return []
-
-        try:
-            conn = duckdb.connect(str(self.knowledge_graph_db_path), read_only=True)
-
-            where_clause = ""
-            params: list[Any] = []
-
-            if incremental and "entities" in self._last_sync_timestamp:
-                where_clause = "WHERE updated_at > ?"
-                params = [self._last_sync_timestamp["entities"]]
-
-            query = f"""
-                SELECT
-                    id, name, entity_type, observations, properties,
-                    created_at, updated_at, metadata, embedding
-                FROM kg_entities
-                {where_clause}
-                ORDER BY updated_at DESC
-                LIMIT ?
-            """
-            params.append(batch_size * 5)
-
-            results = conn.execute(query, params).fetchall()
-            conn.close()
-
-            entities = [
-                {
-                    "id": row[0],
-                    "name": row[1],
-                    "entity_type": row[2],
-                    "observations": list(row[3]) if row[3] else [],
-                    "properties": json.loads(row[4]) if row[4] else {},
-                    "created_at": row[5],
-                    "updated_at": row[6],
-                    "metadata": json.loads(row[7]) if row[7] else {},
-                    "embedding": list(row[8]) if row[8] else None,
-                }
-                for row in results
-            ]
-
-            return entities
-
-        except (duckdb.Error, OSError, ValueError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to fetch entities: {e}")
-            return []
-
-    async def _fetch_relationships(
-        self,
-        incremental: bool,
-        batch_size: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch relationships from knowledge graph DuckDB.
-
-        Args:
-            incremental: Only fetch records modified since last sync
-            batch_size: Maximum number of records to fetch
-
-        Returns:
-            List of relationship dictionaries
-        """
-        try:
-            import duckdb
-        except ImportError:
-            return []
-
-        if not self.knowledge_graph_db_path.exists():
-            return []
-
-        try:
-            conn = duckdb.connect(str(self.knowledge_graph_db_path), read_only=True)
-
-            where_clause = ""
-            params: list[Any] = []
-
-            if incremental and "relationships" in self._last_sync_timestamp:
-                where_clause = "WHERE updated_at > ?"
-                params = [self._last_sync_timestamp["relationships"]]
-
-            query = f"""
-                SELECT
-                    id, from_entity, to_entity, relation_type,
-                    properties, created_at, updated_at, metadata
-                FROM kg_relationships
-                {where_clause}
-                ORDER BY updated_at DESC
-                LIMIT ?
-            """
-            params.append(batch_size * 5)
-
-            results = conn.execute(query, params).fetchall()
-            conn.close()
-
-            relationships = [
-                {
-                    "id": row[0],
-                    "from_entity": row[1],
-                    "to_entity": row[2],
-                    "relation_type": row[3],
-                    "properties": json.loads(row[4]) if row[4] else {},
-                    "created_at": row[5],
-                    "updated_at": row[6],
-                    "metadata": json.loads(row[7]) if row[7] else {},
-                }
-                for row in results
-            ]
-
-            return relationships
-
-        except (duckdb.Error, OSError, ValueError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to fetch relationships: {e}")
-            return []
-
     def _serialize_entity(self, entity: dict[str, Any]) -> dict[str, Any]:
         """Serialize an entity for Akosha create_entity tool.
 
@@ -869,9 +637,9 @@ class HttpSyncMethod(SyncMethod):
         return {
             "name": entity["name"],
             "entity_type": entity["entity_type"],
-            "observations": entity.get("observations", []),
+            "observations": list(entity.get("observations") or []),
             "properties": {
-                **entity.get("properties", {}),
+                **_json_object(entity.get("properties")),
                 "source_system": self.config.system_id_resolved,
                 "original_id": entity["id"],
                 "created_at": (
@@ -881,7 +649,7 @@ class HttpSyncMethod(SyncMethod):
                 ),
                 "ingestion_method": "http_push",
             },
-            "metadata": entity.get("metadata", {}),
+            "metadata": _json_object(entity.get("metadata")),
         }
 
     def _serialize_relationship(self, rel: dict[str, Any]) -> dict[str, Any]:
@@ -898,7 +666,7 @@ class HttpSyncMethod(SyncMethod):
             "to_entity": rel["to_entity"],
             "relation_type": rel["relation_type"],
             "properties": {
-                **rel.get("properties", {}),
+                **_json_object(rel.get("properties")),
                 "source_system": self.config.system_id_resolved,
                 "original_id": rel["id"],
                 "created_at": (
@@ -908,114 +676,252 @@ class HttpSyncMethod(SyncMethod):
                 ),
                 "ingestion_method": "http_push",
             },
-            "metadata": rel.get("metadata", {}),
+            "metadata": _json_object(rel.get("metadata")),
         }
 
-    async def _batch_upload_memories(
+    async def _export_stream(
         self,
         client: httpx.AsyncClient,
         akosha_url: str,
-        memories: list[dict[str, Any]],
+        stream: ExportStream,
+        db_path: Path,
         batch_size: int,
-    ) -> dict[str, Any]:
-        """Upload memories in batches to Akosha.
+        incremental: bool,
+        concurrency: int,
+        serialize: Callable[[dict[str, Any]], dict[str, Any]],
+        tool_name: str,
+        accepted: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> PipelineResult:
+        """Upload one table in keyset order, advancing its watermark per batch.
 
         Args:
             client: HTTP client instance
             akosha_url: Akosha MCP endpoint URL
-            memories: List of serialized memories
-            batch_size: Number of memories per batch
+            stream: Table to export
+            db_path: DuckDB file holding the table
+            batch_size: Rows per batch
+            incremental: Start after the stream's persisted watermark
+            concurrency: Batches uploaded at the same time
+            serialize: Converts a row into the tool arguments
+            tool_name: MCP tool storing the rows
+            accepted: Per-record success check; when None the whole batch is
+                sent in one ``batch_store_memories`` call
 
         Returns:
-            Dict with count, bytes, and errors
+            Totals of the export
         """
-        total_uploaded = 0
-        total_bytes = 0
-        all_errors: list[dict[str, Any]] = []
-
-        # Process in batches
-        for i in range(0, len(memories), batch_size):
-            batch = memories[i : i + batch_size]
-            batch_json = json.dumps(batch)
-            batch_bytes = len(batch_json)
-
-            # Retry logic with exponential backoff
-            for attempt in range(MAX_RETRIES):
-                try:
-                    result = await self._call_mcp_tool(
-                        client=client,
-                        akosha_url=akosha_url,
-                        tool_name="batch_store_memories",
-                        arguments={"memories": batch},
-                    )
+        if not db_path.exists():
+            logger.debug(f"Database not found for {stream.name}: {db_path}")
+            return PipelineResult()
+
+        after = self._get_watermark(stream) if incremental else None
+        batches = self._read_batches(
+            db_path,
+            stream,
+            after,
+            batch_size,
+            serialize=serialize,
+            tool_name=tool_name,
+            batched=accepted is None,
+        )
+        result = await run_pipelined(
+            batches,
+            lambda batch: self._upload_batch(client, akosha_url, batch, accepted),
+            concurrency=concurrency,
+            on_commit=lambda watermark: self._commit_watermark(stream, watermark),
+        )
+        if not result.complete:
+            logger.warning(
+                f"Akosha sync of {stream.name} stopped after a failed batch; "
+                "the next sync resumes from the last acknowledged batch"
+            )
+        return result
 
-                    if result.get("status") in ("completed", "partial"):
-                        total_uploaded += result.get("stored", 0)
-                        total_bytes += batch_bytes
-
-                        # Collect errors from partial success
-                        if result.get("errors"):
-                            all_errors.extend(result["errors"])
-                        break
-
-                    # Complete failure
-                    all_errors.append(
-                        {
-                            "batch": i // batch_size,
-                            "error": result.get("error", "Unknown error"),
-                        }
-                    )
-                    break
-
-                except httpx.HTTPStatusError as e:
-                    if attempt < MAX_RETRIES - 1:
-                        delay = BASE_BACKOFF_DELAY * (2**attempt)
-                        logger.warning(
-                            f"Batch upload attempt {attempt + 1} failed, "
-                            f"retrying in {delay}s: {e}"
-                        )
-                        await asyncio.sleep(delay)
-                    else:
-                        all_errors.append(
-                            {
-                                "batch": i // batch_size,
-                                "error": f"HTTP {e.response.status_code}: {e}",
-                            }
-                        )
+    async def _read_batches(
+        self,
+        db_path: Path,
+        stream: ExportStream,
+        after: Watermark | None,
+        batch_size: int,
+        *,
+        serialize: Callable[[dict[str, Any]], dict[str, Any]],
+        tool_name: str,
+        batched: bool,
+    ) -> AsyncIterator[ExportBatch]:
+        """Yield serialized batches of ``stream`` read in a worker thread."""
+        try:
+            import duckdb
+        except ImportError:
+            return
 
-                except (httpx.HTTPError, json.JSONDecodeError) as e:
-                    all_errors.append(
-                        {
-                            "batch": i // batch_size,
-                            "error": str(e),
-                        }
-                    )
-                    break
+        try:
+            conn = await asyncio.to_thread(duckdb.connect, str(db_path), read_only=True)
+        except (duckdb.Error, OSError) as e:
+            logger.error(f"Failed to open {db_path} for {stream.name}: {e}")
+            return
 
-        return {"count": total_uploaded, "bytes": total_bytes, "errors": all_errors}
+        try:
+            index = 0
+            while True:
+                try:
+                    batch = await asyncio.to_thread(
+                        self._prepare_batch,
+                        conn,
+                        stream,
+                        after,
+                        batch_size,
+                        index,
+                        serialize,
+                        tool_name,
+                        batched,
+                    )
+                except (duckdb.Error, ValueError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to read {stream.name}: {e}")
+                    return
+                if batch is None:
+                    return
+                yield batch
+                after = batch.watermark
+                index += 1
+        finally:
+            await asyncio.to_thread(conn.close)
+
+    def _prepare_batch(
+        self,
+        conn: Any,
+        stream: ExportStream,
+        after: Watermark | None,
+        batch_size: int,
+        index: int,
+        serialize: Callable[[dict[str, Any]], dict[str, Any]],
+        tool_name: str,
+        batched: bool,
+    ) -> ExportBatch | None:
+        """Read, serialize and encode the batch after ``after``."""
+        rows, watermark = read_page(conn, stream, after, batch_size)
+        if watermark is None:
+            return None
+
+        records = [serialize(row) for row in rows]
+        if batched:
+            bodies = [self._encode_mcp_call(tool_name, {"memories": records})]
+        else:
+            bodies = [self._encode_mcp_call(tool_name, record) for record in records]
+        return ExportBatch(
+            index=index,
+            bodies=bodies,
+            ids=[str(row["id"]) for row in rows],
+            watermark=watermark,
+        )
 
-    async def _call_mcp_tool(
+    async def _upload_batch(
         self,
         client: httpx.AsyncClient,
         akosha_url: str,
-        tool_name: str,
-        arguments: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Call an MCP tool on Akosha server.
+        batch: ExportBatch,
+        accepted: Callable[[dict[str, Any]], bool] | None,
+    ) -> BatchOutcome:
+        """Upload one batch, retrying it on transport errors.
 
         Args:
             client: HTTP client instance
             akosha_url: Akosha MCP endpoint URL
-            tool_name: Name of the MCP tool to call
-            arguments: Tool arguments
+            batch: Batch to upload
+            accepted: Per-record success check, None for a batch call
 
         Returns:
-            Tool result dictionary
-
-        Raises:
-            httpx.HTTPStatusError: On HTTP errors
-            httpx.RequestError: On request failures
+            Whether the batch was stored, with the per-record errors
         """
+        outcome = BatchOutcome(ok=True)
+        # Records sent before a retry are not sent again
+        next_body = 0
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                if accepted is None:
+                    result = await self._post_mcp(client, akosha_url, batch.bodies[0])
+                    return self._memory_batch_outcome(batch, result)
+
+                while next_body < len(batch.bodies):
+                    result = await self._post_mcp(
+                        client, akosha_url, batch.bodies[next_body]
+                    )
+                    if accepted(result):
+                        outcome.stored += 1
+                    else:
+                        outcome.errors.append(
+                            {
+                                "id": batch.ids[next_body],
+                                "error": result.get("error", "Unknown error"),
+                            }
+                        )
+                    next_body += 1
+                return outcome
+
+            except httpx.TransportError as e:
+                if attempt >= MAX_RETRIES - 1:
+                    return self._failed_batch(batch, outcome, str(e))
+                delay = BASE_BACKOFF_DELAY * (2**attempt)
+                logger.warning(
+                    f"Batch {batch.index} upload attempt {attempt + 1} failed, "
+                    f"retrying in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+            except httpx.HTTPStatusError as e:
+                return self._failed_batch(
+                    batch, outcome, f"HTTP {e.response.status_code}: {e}"
+                )
+
+            except (httpx.HTTPError, json.JSONDecodeError) as e:
+                return self._failed_batch(batch, outcome, str(e))
+
+        return self._failed_batch(batch, outcome, "Max retries exceeded")
+
+    @staticmethod
+    def _memory_batch_outcome(
+        batch: ExportBatch, result: dict[str, Any]
+    ) -> BatchOutcome:
+        """Interpret the ``batch_store_memories`` response."""
+        if result.get("status") in ("completed", "partial"):
+            return BatchOutcome(
+                ok=True,
+                stored=result.get("stored", 0),
+                errors=list(result.get("errors") or []),
+            )
+        return BatchOutcome(
+            ok=False,
+            errors=[
+                {"batch": batch.index, "error": result.get("error", "Unknown error")}
+            ],
+        )
+
+    @staticmethod
+    def _failed_batch(
+        batch: ExportBatch, outcome: BatchOutcome, error: str
+    ) -> BatchOutcome:
+        outcome.ok = False
+        outcome.errors.append({"batch": batch.index, "error": error})
+        return outcome
+
+    def _get_watermark(self, stream: ExportStream) -> Watermark | None:
+        """Return the persisted position of ``stream``, if any."""
+        timestamp = self._last_sync_timestamp.get(stream.name)
+        if not timestamp:
+            return None
+        return Watermark(
+            timestamp=timestamp,
+            id=self._last_sync_timestamp.get(f"{stream.name}_id", ""),
+        )
+
+    def _commit_watermark(self, stream: ExportStream, watermark: Watermark) -> None:
+        """Persist the position after an acknowledged batch."""
+        self._last_sync_timestamp[stream.name] = watermark.timestamp
+        self._last_sync_timestamp[f"{stream.name}_id"] = watermark.id
+        self._save_sync_state()
+
+    def _encode_mcp_call(self, tool_name: str, arguments: dict[str, Any]) -> bytes:
+        """Encode an MCP ``tools/call`` request body."""
         # MCP protocol format for tools/call
         payload = {
             "jsonrpc": "2.0",
@@ -1026,13 +932,26 @@ class HttpSyncMethod(SyncMethod):
                 "arguments": arguments,
             },
         }
+        return json.dumps(payload).encode()
 
+    async def _post_mcp(
+        self,
+        client: httpx.AsyncClient,
+        akosha_url: str,
+        body: bytes,
+    ) -> dict[str, Any]:
+        """Post an encoded MCP request and return the tool result.
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors
+            httpx.RequestError: On request failures
+        """
         # Retry logic
         for attempt in range(MAX_RETRIES):
             try:
                 response = await client.post(
                     f"{akosha_url}/mcp/v1",
-                    json=payload,
+                    content=body,
                     headers={"Content-Type": "application/json"},
                 )
                 response.raise_for_status()
@@ -0,0 +1,202 @@
+"""Content-defined chunking for incremental database backups.
+
+Cloud sync used to read a whole DuckDB file into memory, gzip it in one shot
+and upload the full blob whenever a single page changed. Here a database is
+instead cut into chunks whose boundaries depend on the bytes around them
+(a gear rolling hash, as in FastCDC), so an edit only changes the chunks it
+touches and the rest keep their hashes. Chunks are stored once under their
+SHA-256 and each backup is described by the ordered list of its chunk
+hashes.
+
+The file is streamed from disk in blocks; memory use is bounded by the block
+size plus one maximum-size chunk. The rolling hash is vectorised with numpy:
+a 32-byte gear window is built in five shift-and-add passes over a block
+instead of a Python loop per byte.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import typing as t
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Bytes read from disk per hashing pass
+READ_SIZE = 8 * 1024 * 1024
+
+# Width of the rolling hash window in bytes (one uint32 of shifted gear values)
+_WINDOW = 32
+
+# Gear table: 256 pseudo-random 32-bit values. Derived from SHA-256 rather
+# than a seeded RNG so chunk boundaries never change with the numpy version.
+_GEAR = np.frombuffer(
+    b"".join(hashlib.sha256(bytes([value])).digest()[:4] for value in range(256)),
+    dtype="<u4",
+).astype(np.uint32)
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkParams:
+    """Chunk size bounds in bytes; ``avg_size`` must be a power of two."""
+
+    min_size: int
+    avg_size: int
+    max_size: int
+
+    @classmethod
+    def from_max_size(cls, max_size: int) -> ChunkParams:
+        """Derive bounds aiming at a quarter of ``max_size`` per chunk."""
+        avg_size = 1 << max(0, (max(1, max_size // 4)).bit_length() - 1)
+        return cls(min_size=max(1, avg_size // 4), avg_size=avg_size, max_size=max_size)
+
+    @property
+    def threshold(self) -> int:
+        """Hash values below this end a chunk (probability ``1 / avg_size``)."""
+        return (1 << 32) // self.avg_size
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    """A chunk of a backed-up file, prepared for upload.
+
+    Attributes:
+        digest: SHA-256 of the raw chunk bytes
+        size: Raw size in bytes
+        data: Bytes to store (compressed when compression is on), or None
+            when the chunk is already stored
+
+    """
+
+    digest: str
+    size: int
+    data: bytes | None = None
+
+
+def gear_hashes(data: np.ndarray) -> np.ndarray:
+    """Return the rolling gear hash ending at every byte of ``data``.
+
+    The hash at ``i`` is ``sum(GEAR[data[i - k]] << k for k < 32)`` modulo
+    2**32, so it only depends on the 32 bytes ending at ``i``.
+    """
+    hashes = _GEAR.take(data)
+    shifted = np.empty_like(hashes)
+    size = len(hashes)
+    # Doubling: the window covering 2w bytes is the w-byte window plus the
+    # w-byte window ending w bytes earlier, shifted left by w
+    shift = 1
+    while shift < _WINDOW:
+        np.left_shift(hashes[:-shift], shift, out=shifted[: size - shift])
+        hashes[shift:] += shifted[: size - shift]
+        shift *= 2
+    return hashes
+
+
+def iter_chunks(
+    path: Path, params: ChunkParams, *, read_size: int = READ_SIZE
+) -> Iterator[bytes]:
+    """Yield the content-defined chunks of the file at ``path``, in order."""
+    threshold = np.uint32(params.threshold)
+    # Bytes before ``pending`` that the next block's hashes depend on
+    context = b""
+    pending = b""
+    with path.open("rb") as f:
+        while block := f.read(read_size):
+            data = context + pending + block
+            offset = len(context)
+            hashes = gear_hashes(np.frombuffer(data, dtype=np.uint8))
+            view = memoryview(data)[offset:]
+
+            start = 0
+            for candidate in np.flatnonzero(hashes[offset:] < threshold).tolist():
+                end = candidate + 1
+                while end - start > params.max_size:
+                    yield bytes(view[start : start + params.max_size])
+                    start += params.max_size
+                if end - start >= params.min_size:
+                    yield bytes(view[start:end])
+                    start = end
+            while len(view) - start > params.max_size:
+                yield bytes(view[start : start + params.max_size])
+                start += params.max_size
+
+            pending = bytes(view[start:])
+            cut = offset + start
+            context = data[max(0, cut - _WINDOW + 1) : cut]
+    if pending:
+        yield pending
+
+
+def prepare_chunk(raw: bytes, *, known: set[str], compress: bool) -> Chunk:
+    """Hash ``raw`` and compress it unless a chunk with its hash is stored."""
+    digest = hashlib.sha256(raw).hexdigest()
+    if digest in known:
+        return Chunk(digest=digest, size=len(raw))
+    data = gzip.compress(raw, compresslevel=6) if compress else raw
+    return Chunk(digest=digest, size=len(raw), data=data)
+
+
+def decode_chunk(data: bytes, *, digest: str, compressed: bool) -> bytes:
+    """Decompress a stored chunk and check it against its hash.
+
+    Raises:
+        ValueError: If the chunk does not match ``digest``
+
+    """
+    raw = gzip.decompress(data) if compressed else data
+    if hashlib.sha256(raw).hexdigest() != digest:
+        msg = f"Chunk {digest} is corrupt"
+        raise ValueError(msg)
+    return raw
+
+
+class LocalChunkBackend:
+    """Filesystem stand-in for the S3 adapter, storing objects under a root.
+
+    Implements the ``upload``/``download`` calls cloud sync makes, for tests
+    and for backing up to a mounted drive.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _resolve(self, path: str) -> Path:
+        target = (self.root / path).resolve()
+        if not target.is_relative_to(self.root.resolve()):
+            msg = f"Path escapes backend root: {path}"
+            raise ValueError(msg)
+        return target
+
+    async def upload(self, path: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, self._resolve(path), data)
+
+    async def download(self, path: str) -> bytes | None:
+        target = self._resolve(path)
+        return await asyncio.to_thread(
+            lambda: target.read_bytes() if target.exists() else None
+        )
+
+    @staticmethod
+    def _write(target: Path, data: bytes) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(target)
+
+
+__all__ = [
+    "Chunk",
+    "ChunkParams",
+    "LocalChunkBackend",
+    "decode_chunk",
+    "gear_hashes",
+    "iter_chunks",
+    "prepare_chunk",
+]
@@ -5,9 +5,10 @@ to S3-compatible cloud storage (Cloudflare R2, AWS S3, MinIO) using Oneiric
 storage adapters.
 
 Key Features:
-- Streaming upload with configurable chunking (5MB default)
-- Gzip compression for 65% size reduction
-- Upload deduplication via SHA-256 checksums
+- Content-defined chunking streamed from disk (5MB maximum chunk)
+- Gzip compression per chunk for 65% size reduction
+- Only chunks not already stored are uploaded (SHA-256 per chunk)
+- Restore by reassembling a database from its manifest's chunks
 - Retry logic with exponential backoff (3 retries)
 - Manifest.json creation for Akosha's IngestionWorker
 - Graceful degradation with error handling
@@ -22,15 +23,26 @@ Example:
 from __future__ import annotations
 
 import asyncio
-import gzip
 import hashlib
 import json
+from collections import deque
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from session_buddy.storage.akosha_config import AkoshaSyncConfig
-from session_buddy.storage.sync_protocol import CloudUploadError, SyncMethod
+from session_buddy.storage.chunked_backup import (
+    Chunk,
+    ChunkParams,
+    decode_chunk,
+    iter_chunks,
+    prepare_chunk,
+)
+from session_buddy.storage.sync_protocol import (
+    CloudRestoreError,
+    CloudUploadError,
+    SyncMethod,
+)
 from session_buddy.utils.error_management import _get_logger
 
 logger = _get_logger()
@@ -69,12 +81,16 @@ class CloudSyncMethod(SyncMethod):
     Uploads DuckDB databases to S3-compatible storage (R2, S3, MinIO).
 
     Architecture:
-        1. Compute SHA-256 checksums for deduplication
-        2. Optionally compress with gzip
-        3. Upload to systems/{system_id}/uploads/{upload_id}/
-        4. Create manifest.json for Akosha's IngestionWorker
+        1. Stream each database from disk in content-defined chunks
+        2. Skip chunks already stored (SHA-256 per chunk)
+        3. Gzip and upload new chunks to systems/{system_id}/chunks/,
+           several at a time
+        4. Create manifest.json listing each database's chunks under
+           systems/{system_id}/uploads/{upload_id}/
         5. Retry failed uploads with exponential backoff
 
+    ``restore_database`` reassembles a database from an upload's manifest.
+
     Example:
         >>> config = AkoshaSyncConfig.from_settings(settings)
         >>> cloud_sync = CloudSyncMethod(config)
@@ -91,6 +107,9 @@ class CloudSyncMethod(SyncMethod):
     # Chunk size for large file uploads (5MB)
     CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
 
+    # Chunks uploaded (or downloaded on restore) at the same time
+    UPLOAD_CONCURRENCY = 4
+
     def __init__(self, config: AkoshaSyncConfig) -> None:
         """Initialize cloud sync method.
 
@@ -108,6 +127,15 @@ class CloudSyncMethod(SyncMethod):
         self.config = config
         self._s3_adapter: Any = None
 
+        # Size, checksum and chunk list of each database uploaded, for the
+        # manifest
+        self._uploaded_files: dict[str, dict[str, Any]] = {}
+        # Digests of chunks already in the bucket, persisted between syncs
+        self._known_chunks: set[str] | None = None
+        self._chunk_index_file = (
+            Path.home() / ".claude" / "data" / "akosha_chunk_index.json"
+        )
+
         # Database paths
         self.reflection_db_path = Path.home() / ".claude" / "data" / "reflection.duckdb"
         self.knowledge_graph_db_path = (
@@ -203,7 +231,9 @@ class CloudSyncMethod(SyncMethod):
                     upload_id=upload_id,
                 )
                 files_uploaded.append(reflection_path)
-                bytes_transferred += self.reflection_db_path.stat().st_size
+                bytes_transferred += self._bytes_uploaded(
+                    reflection_path, self.reflection_db_path
+                )
 
             # Upload knowledge graph database
             if upload_knowledge_graph and self.knowledge_graph_db_path.exists():
@@ -213,7 +243,9 @@ class CloudSyncMethod(SyncMethod):
                     upload_id=upload_id,
                 )
                 files_uploaded.append(kg_path)
-                bytes_transferred += self.knowledge_graph_db_path.stat().st_size
+                bytes_transferred += self._bytes_uploaded(
+                    kg_path, self.knowledge_graph_db_path
+                )
 
             # Create and upload manifest
             if files_uploaded:
@@ -250,6 +282,13 @@ class CloudSyncMethod(SyncMethod):
                 original=e,
             ) from e
 
+    def _bytes_uploaded(self, cloud_path: str, db_path: Path) -> int:
+        """Return the bytes sent for a database upload."""
+        uploaded = self._uploaded_files.get(cloud_path)
+        if uploaded is None:
+            return db_path.stat().st_size
+        return int(uploaded["uploaded_bytes"])
+
     async def _create_s3_adapter(self) -> Any:
         """Create Oneiric S3 adapter instance.
 
@@ -311,7 +350,11 @@ class CloudSyncMethod(SyncMethod):
         db_name: str,
         upload_id: str,
     ) -> str:
-        """Upload database file to cloud storage.
+        """Upload database file to cloud storage as content-defined chunks.
+
+        The file is streamed from disk and cut into chunks; only chunks not
+        stored by an earlier sync are compressed and uploaded, several at a
+        time. The chunk list is recorded for the manifest.
 
         Args:
             db_path: Local path to database file
@@ -322,91 +365,239 @@ class CloudSyncMethod(SyncMethod):
             Cloud storage path (s3://bucket/systems/.../db_name)
 
         Raises:
-            CloudUploadError: If upload fails after retries
+            CloudUploadError: If a chunk upload fails after retries
         """
-        # Check for deduplication
-        if self.config.enable_deduplication:
-            local_checksum = await self._compute_sha256(db_path)
-
-            # Check if file already exists in cloud with same checksum
-            cloud_path = self._get_cloud_path(db_name, upload_id)
-
-            if await self._file_exists_with_checksum(cloud_path, local_checksum):
-                logger.info(f"Skipping upload (unchanged): {db_name}")
-                return cloud_path
+        cloud_path = self._get_cloud_path(db_name, upload_id)
+        known = self._load_known_chunks()
+        # Chunks already stored, or scheduled during this upload
+        skip = set(known) if self.config.enable_deduplication else set()
+        params = ChunkParams.from_max_size(self.config.chunk_size_mb * 1024 * 1024)
+        compress = self.config.enable_compression
+        file_hash = hashlib.sha256()
+        reader = iter_chunks(db_path, params)
+
+        def _next_chunk() -> Chunk | None:
+            raw = next(reader, None)
+            if raw is None:
+                return None
+            file_hash.update(raw)
+            return prepare_chunk(raw, known=skip, compress=compress)
+
+        chunks: list[dict[str, Any]] = []
+        in_flight: set[asyncio.Task[int]] = set()
+        uploaded_bytes = 0
+        new_chunks = 0
 
-        # Read and optionally compress
-        file_data = await self._read_database(db_path)
+        try:
+            # Reading and compressing the next chunk overlaps the uploads
+            while (chunk := await asyncio.to_thread(_next_chunk)) is not None:
+                chunks.append({"sha256": chunk.digest, "size": chunk.size})
+                if chunk.data is None:
+                    continue
+                skip.add(chunk.digest)
+                new_chunks += 1
+                while len(in_flight) >= self.UPLOAD_CONCURRENCY:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    uploaded_bytes += sum(task.result() for task in done)
+                in_flight.add(asyncio.create_task(self._upload_chunk(chunk)))
+
+            if in_flight:
+                done, in_flight = await asyncio.wait(in_flight)
+                uploaded_bytes += sum(task.result() for task in done)
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            raise
+        finally:
+            await asyncio.to_thread(reader.close)
+            # Chunks stored before a failure are not uploaded again
+            await asyncio.to_thread(self._save_known_chunks)
+
+        self._uploaded_files[cloud_path] = {
+            "size_bytes": sum(chunk["size"] for chunk in chunks),
+            "checksum": file_hash.hexdigest(),
+            "chunks": chunks,
+            "uploaded_bytes": uploaded_bytes,
+        }
 
-        # Upload with retry logic
-        cloud_path = await self._upload_with_retry(
-            data=file_data,
-            db_name=db_name,
-            upload_id=upload_id,
+        logger.info(
+            f"Uploaded database: {db_name} -> {cloud_path} "
+            f"({new_chunks}/{len(chunks)} new chunks, {uploaded_bytes:,} bytes)"
         )
 
-        logger.info(f"Uploaded database: {db_name} -> {cloud_path}")
-
         return cloud_path
 
-    async def _read_database(self, db_path: Path) -> bytes:
-        """Read database file, optionally compressing.
-
-        Args:
-            db_path: Path to database file
+    async def _upload_chunk(self, chunk: Chunk) -> int:
+        """Upload one chunk and remember it as stored.
 
         Returns:
-            File data (compressed or raw)
+            Number of bytes uploaded
         """
-        loop = asyncio.get_event_loop()
+        data = chunk.data or b""
+        await self._upload_path_with_retry(self._get_chunk_path(chunk.digest), data)
+        self._load_known_chunks().add(chunk.digest)
+        return len(data)
 
-        def _read_sync() -> bytes:
-            data = db_path.read_bytes()
+    def _get_chunk_path(self, digest: str) -> str:
+        """Get cloud storage path of a chunk.
 
-            if self.config.enable_compression:
-                return gzip.compress(data)
+        Chunks are shared by all uploads of a system, so an unchanged chunk
+        is stored once.
 
-            return data
+        Format: systems/{system_id}/chunks/{digest[:2]}/{digest}[.gz]
+        """
+        system_id = self.config.system_id_resolved
+        suffix = ".gz" if self.config.enable_compression else ""
+        return f"systems/{system_id}/chunks/{digest[:2]}/{digest}{suffix}"
+
+    @property
+    def _chunk_namespace(self) -> str:
+        """Key of this bucket, system and compression in the chunk index."""
+        compression = "gzip" if self.config.enable_compression else "none"
+        return (
+            f"{self.config.cloud_bucket}/{self.config.system_id_resolved}/{compression}"
+        )
 
-        return await loop.run_in_executor(None, _read_sync)
+    def _load_known_chunks(self) -> set[str]:
+        """Return the digests of chunks already stored in the bucket."""
+        if self._known_chunks is None:
+            state: dict[str, Any] = {}
+            try:
+                if self._chunk_index_file.exists():
+                    state = json.loads(self._chunk_index_file.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Could not load chunk index: {e}")
+            self._known_chunks = set(state.get(self._chunk_namespace, []))
+        return self._known_chunks
+
+    def _save_known_chunks(self) -> None:
+        """Persist the stored chunk digests for later syncs."""
+        if self._known_chunks is None:
+            return
+        try:
+            state: dict[str, Any] = {}
+            if self._chunk_index_file.exists():
+                state = json.loads(self._chunk_index_file.read_text())
+            state[self._chunk_namespace] = sorted(self._known_chunks)
+            self._chunk_index_file.parent.mkdir(parents=True, exist_ok=True)
+            self._chunk_index_file.write_text(json.dumps(state))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not save chunk index: {e}")
+
+    async def restore_database(
+        self,
+        upload_id: str,
+        db_name: str,
+        dest_path: Path,
+    ) -> Path:
+        """Rebuild a database from the chunks listed in an upload's manifest.
 
-    async def _compute_sha256(self, file_path: Path) -> str:
-        """Compute SHA-256 checksum of file.
+        Chunks are downloaded a few at a time ahead of the one being written,
+        verified against their hashes and appended in order. The result only
+        replaces ``dest_path`` once the whole-file checksum matches.
 
         Args:
-            file_path: Path to file
+            upload_id: Upload whose manifest describes the database
+            db_name: Database filename in the manifest
+            dest_path: Where to write the restored database
 
         Returns:
-            Hexadecimal checksum string
-        """
-        loop = asyncio.get_event_loop()
+            ``dest_path``
 
-        def _compute_sync() -> str:
-            sha256 = hashlib.sha256()
-            with file_path.open("rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+        Raises:
+            CloudRestoreError: If the manifest or a chunk is missing or corrupt
+        """
+        if self._s3_adapter is None:
+            self._s3_adapter = await self._create_s3_adapter()
 
-        return await loop.run_in_executor(None, _compute_sync)
+        manifest_path = self._get_cloud_path(self.MANIFEST_FILENAME, upload_id)
+        manifest_data = await self._download_path(manifest_path)
+        if manifest_data is None:
+            raise CloudRestoreError(
+                message=f"Manifest not found: {manifest_path}", method="cloud"
+            )
+        manifest = json.loads(manifest_data)
+        entry = next(
+            (
+                file
+                for file in manifest.get("files", [])
+                if file.get("name") == db_name and "chunks" in file
+            ),
+            None,
+        )
+        if entry is None:
+            raise CloudRestoreError(
+                message=f"{db_name} is not a chunked backup in upload {upload_id}",
+                method="cloud",
+            )
 
-    async def _file_exists_with_checksum(
-        self,
-        cloud_path: str,
-        expected_checksum: str,
-    ) -> bool:
-        """Check if file exists in cloud with matching checksum.
+        compressed = entry.get("compression") == "gzip"
+        tmp_path = dest_path.with_name(f"{dest_path.name}.restore")
+        file_hash = hashlib.sha256()
+        pending: deque[asyncio.Task[bytes]] = deque()
 
-        Args:
-            cloud_path: Cloud storage path
-            expected_checksum: Expected SHA-256 checksum
+        try:
+            with tmp_path.open("wb") as out:
+                for chunk in entry["chunks"]:
+                    pending.append(
+                        asyncio.create_task(
+                            self._download_chunk(
+                                entry["chunk_prefix"], chunk["sha256"], compressed
+                            )
+                        )
+                    )
+                    if len(pending) >= self.UPLOAD_CONCURRENCY:
+                        raw = await pending.popleft()
+                        file_hash.update(raw)
+                        await asyncio.to_thread(out.write, raw)
+                while pending:
+                    raw = await pending.popleft()
+                    file_hash.update(raw)
+                    await asyncio.to_thread(out.write, raw)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if file_hash.hexdigest() != entry.get("checksum"):
+            tmp_path.unlink(missing_ok=True)
+            raise CloudRestoreError(
+                message=f"Checksum mismatch restoring {db_name} from {upload_id}",
+                method="cloud",
+            )
+        tmp_path.replace(dest_path)
+        logger.info(f"Restored database: {manifest_path} -> {dest_path}")
+        return dest_path
+
+    async def _download_chunk(
+        self, prefix: str, digest: str, compressed: bool
+    ) -> bytes:
+        """Download, decompress and verify one chunk."""
+        suffix = ".gz" if compressed else ""
+        path = f"{prefix}{digest[:2]}/{digest}{suffix}"
+        data = await self._download_path(path)
+        if data is None:
+            raise CloudRestoreError(message=f"Chunk missing: {path}", method="cloud")
+        try:
+            return await asyncio.to_thread(
+                decode_chunk, data, digest=digest, compressed=compressed
+            )
+        except (ValueError, OSError, EOFError) as e:
+            raise CloudRestoreError(
+                message=f"Chunk corrupt: {path}", method="cloud", original=e
+            ) from e
 
-        Returns:
-            True if file exists with matching checksum
-        """
-        # For now, skip this check (would require HEAD request or metadata)
-        # TODO: Implement metadata-based checksum verification
-        return False
+    async def _download_path(self, cloud_path: str) -> bytes | None:
+        """Download an object via the storage adapter, None if missing."""
+        if self._s3_adapter is None:
+            raise RuntimeError("S3 adapter not initialized")
+        data: bytes | None = await self._s3_adapter.download(cloud_path)
+        return data
 
     def _get_cloud_path(self, db_name: str, upload_id: str) -> str:
         """Get cloud storage path for database.
@@ -447,12 +638,21 @@ class CloudSyncMethod(SyncMethod):
             CloudUploadError: If all retries exhausted
         """
         cloud_path = self._get_cloud_path(db_name, upload_id)
+        await self._upload_path_with_retry(cloud_path, data)
+        return cloud_path
+
+    async def _upload_path_with_retry(self, cloud_path: str, data: bytes) -> None:
+        """Upload ``data`` to ``cloud_path`` with exponential backoff retry.
+
+        Raises:
+            CloudUploadError: If all retries exhausted
+        """
         last_error: Exception | None = None
 
         for attempt in range(self.config.max_retries):
             try:
                 await self._upload_to_s3(cloud_path, data)
-                return cloud_path
+                return
 
             except Exception as e:
                 last_error = e
@@ -524,16 +724,7 @@ class CloudSyncMethod(SyncMethod):
             "upload_id": upload_id,
             "system_id": self.config.system_id_resolved,
             "timestamp": datetime.now(UTC).isoformat(),
-            "files": [
-                {
-                    "name": Path(f).name,
-                    "path": f,
-                    "size_bytes": 0,  # TODO: Get actual size
-                    "compression": "gzip" if self.config.enable_compression else "none",
-                    "checksum": "",  # TODO: Add checksum
-                }
-                for f in files_uploaded
-            ],
+            "files": [self._manifest_file_entry(f) for f in files_uploaded],
             "metadata": {
                 "uploader": "session-buddy",
                 "version": "1.0.0",
@@ -554,6 +745,32 @@ class CloudSyncMethod(SyncMethod):
 
         return manifest_path
 
+    def _manifest_file_entry(self, cloud_path: str) -> dict[str, Any]:
+        """Describe an uploaded file in the manifest.
+
+        Chunked databases list their chunks in file order; each chunk is
+        stored at ``chunk_prefix + sha256[:2] + "/" + sha256`` (plus ``.gz``
+        when compressed).
+        """
+        entry: dict[str, Any] = {
+            "name": Path(cloud_path).name,
+            "path": cloud_path,
+            "size_bytes": 0,
+            "compression": "gzip" if self.config.enable_compression else "none",
+            "checksum": "",
+        }
+        uploaded = self._uploaded_files.get(cloud_path)
+        if uploaded is not None:
+            system_id = self.config.system_id_resolved
+            entry.update(
+                size_bytes=uploaded["size_bytes"],
+                checksum=uploaded["checksum"],
+                format="chunked",
+                chunk_prefix=f"systems/{system_id}/chunks/",
+                chunks=uploaded["chunks"],
+            )
+        return entry
+
 
 __all__ = [
     "CloudSyncMethod",
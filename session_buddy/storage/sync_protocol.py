@@ -146,6 +146,22 @@ class CloudUploadError(SyncError):
     """
 
 
+class CloudRestoreError(SyncError):
+    """Restoring a database from cloud storage failed.
+
+    Raised when:
+    - The upload's manifest or one of its chunks is missing
+    - A downloaded chunk does not match its checksum
+    - The reassembled file does not match the manifest checksum
+
+    Example:
+        >>> raise CloudRestoreError(
+        ...     "Chunk missing: systems/mac/chunks/ab/ab12...",
+        ...     method="cloud",
+        ... )
+    """
+
+
 class HTTPSyncError(SyncError):
     """HTTP sync to Akosha failed.
 
@@ -190,6 +206,7 @@ class HybridSyncError(SyncError):
 
 
 __all__ = [
+    "CloudRestoreError",
     "CloudUploadError",
     "HTTPSyncError",
     "HybridSyncError",
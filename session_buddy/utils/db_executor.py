@@ -0,0 +1,305 @@
+"""Run DuckDB work off the asyncio event loop.
+
+A DuckDB call holds its thread for the whole query. Issued from an
+``async def`` it stalls every coroutine on the loop, so one slow vector scan
+delays every concurrent MCP tool call. :class:`DuckDBExecutor` moves that
+work onto threads:
+
+* reads run on a small pool of worker threads, each with its own
+  ``conn.cursor()`` (a separate connection to the same database), so
+  concurrent searches overlap instead of queueing behind each other;
+* mutations are queued to a single writer thread with its own cursor, so
+  they apply in submission order and a multi-statement write never
+  interleaves with another one;
+* every call is timed into a per-label latency histogram, and the number of
+  waiting and running calls is tracked per pool.
+
+Callables receive the worker's connection and must use only that one: a
+DuckDB connection is not safe to share between threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Upper bounds (ms) of the latency histogram buckets; slower calls land in
+# an overflow bucket
+LATENCY_BUCKETS_MS: t.Final[tuple[float, ...]] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    __slots__ = ("count", "counts", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Record one call that took ``elapsed_ms``."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding ``fraction`` of calls."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(LATENCY_BUCKETS_MS, self.counts, strict=False):
+            seen += bucket
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, t.Any]:
+        """Return the histogram as plain numbers for stats reporting."""
+        labels = [f"le_{bound:g}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class _PoolStats:
+    """Queue depth and wait time of one worker pool."""
+
+    __slots__ = ("completed", "failed", "max_queued", "queued", "running", "wait")
+
+    def __init__(self) -> None:
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait = LatencyHistogram()
+
+    def snapshot(self) -> dict[str, t.Any]:
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait": self.wait.snapshot(),
+        }
+
+
+class DuckDBExecutor:
+    """Thread pools for reading and writing one DuckDB database."""
+
+    def __init__(
+        self,
+        conn: t.Any,
+        *,
+        read_workers: int = 4,
+        on_connect: Callable[[t.Any], None] | None = None,
+        name: str = "duckdb",
+    ) -> None:
+        """Serve reads and writes from cursors of ``conn``.
+
+        Args:
+            conn: Connection whose database the workers open cursors on
+            read_workers: Threads serving reads concurrently
+            on_connect: Called with each worker cursor when it is opened,
+                e.g. to apply session settings
+            name: Prefix of the worker thread names
+
+        """
+        self.conn = conn
+        self.on_connect = on_connect
+        self.read_workers = max(1, read_workers)
+        self._readers = ThreadPoolExecutor(
+            max_workers=self.read_workers, thread_name_prefix=f"{name}-read"
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{name}-write"
+        )
+        self._local = threading.local()
+        self._cursors: list[t.Any] = []
+        self._lock = threading.Lock()
+        self._pools = {"read": _PoolStats(), "write": _PoolStats()}
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._closed = False
+
+    async def read[T](self, fn: Callable[[t.Any], T], *, label: str = "read") -> T:
+        """Run ``fn(cursor)`` on a read worker and return its result."""
+        return await self._submit("read", self._readers, fn, label)
+
+    async def write[T](
+        self,
+        fn: Callable[[t.Any], T],
+        *,
+        label: str = "write",
+        transaction: bool = False,
+    ) -> T:
+        """Run ``fn(cursor)`` on the writer thread and return its result.
+
+        Args:
+            fn: Mutation to run
+            label: Name the call is timed under
+            transaction: Wrap ``fn`` in ``BEGIN``/``COMMIT``, rolling back
+                when it raises
+
+        """
+        if transaction:
+            fn = _in_transaction(fn)
+        return await self._submit("write", self._writer, fn, label)
+
+    async def fetchall(
+        self, sql: str, params: t.Any = None, *, label: str = "read"
+    ) -> list[tuple[t.Any, ...]]:
+        """Run a query on a read worker and return all rows."""
+        return await self.read(
+            lambda conn: conn.execute(sql, params).fetchall(), label=label
+        )
+
+    async def fetchone(
+        self, sql: str, params: t.Any = None, *, label: str = "read"
+    ) -> tuple[t.Any, ...] | None:
+        """Run a query on a read worker and return its first row."""
+        return await self.read(
+            lambda conn: conn.execute(sql, params).fetchone(), label=label
+        )
+
+    async def execute(
+        self, sql: str, params: t.Any = None, *, label: str = "write"
+    ) -> None:
+        """Run a single mutation on the writer thread."""
+        await self.write(lambda conn: conn.execute(sql, params), label=label)
+
+    def get_stats(self) -> dict[str, t.Any]:
+        """Return queue depth per pool and latency per call label."""
+        with self._lock:
+            return {
+                "read_workers": self.read_workers,
+                "pools": {kind: pool.snapshot() for kind, pool in self._pools.items()},
+                "latency": {
+                    label: histogram.snapshot()
+                    for label, histogram in sorted(self._latency.items())
+                },
+            }
+
+    def close(self) -> None:
+        """Wait for submitted work, then close the worker cursors."""
+        if self._closed:
+            return
+        self._closed = True
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            cursors, self._cursors = self._cursors, []
+        for cursor in cursors:
+            # The parent connection may already be closed
+            with suppress(Exception):
+                cursor.close()
+
+    async def _submit[T](
+        self,
+        kind: str,
+        pool: ThreadPoolExecutor,
+        fn: Callable[[t.Any], T],
+        label: str,
+    ) -> T:
+        if self._closed:
+            msg = "DuckDB executor is closed"
+            raise RuntimeError(msg)
+        stats = self._pools[kind]
+        with self._lock:
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool, self._run, stats, fn, label, time.perf_counter()
+        )
+
+    def _run[T](
+        self,
+        stats: _PoolStats,
+        fn: Callable[[t.Any], T],
+        label: str,
+        submitted: float,
+    ) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            stats.queued -= 1
+            stats.running += 1
+            stats.wait.observe((started - submitted) * 1000)
+        failed = False
+        try:
+            return fn(self._cursor())
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                stats.running -= 1
+                if failed:
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+                histogram = self._latency.get(label)
+                if histogram is None:
+                    histogram = self._latency[label] = LatencyHistogram()
+                histogram.observe(elapsed_ms)
+
+    def _cursor(self) -> t.Any:
+        """Return this worker thread's cursor, opening it on first use."""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self.conn.cursor()
+            if self.on_connect is not None:
+                self.on_connect(cursor)
+            self._local.cursor = cursor
+            with self._lock:
+                self._cursors.append(cursor)
+        return cursor
+
+
+def _in_transaction[T](fn: Callable[[t.Any], T]) -> Callable[[t.Any], T]:
+    def _run(conn: t.Any) -> T:
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            result = fn(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    return _run
+
+
+__all__ = ["LATENCY_BUCKETS_MS", "DuckDBExecutor", "LatencyHistogram"]
@@ -7,8 +7,19 @@ and improving search quality.
 Algorithm:
     1. Normalize content (lowercase, remove extra whitespace)
     2. Extract n-grams (n=3 character sequences)
-    3. Generate MinHash signature (128 min-hash values)
-    4. Estimate Jaccard similarity via signature comparison
+    3. Hash each distinct n-gram once to 32 bits (BLAKE2b)
+    4. Apply 128 universal hash permutations ``(a*x + b) mod p`` as NumPy
+       array ops and keep the column-wise minima (128 min-hash values)
+    5. Estimate Jaccard similarity via signature comparison
+
+Storage format:
+    Signatures serialize to a 4-byte header (``b"MH"``, format version,
+    value width) followed by little-endian values - 516 bytes for the
+    current uint32 signatures. Blobs written before the vectorized engine
+    (exactly ``NUM_HASH_FUNCTIONS * 8`` bytes, SHA-256 based, no header) are
+    still readable; they load with ``version == LEGACY_SIGNATURE_VERSION`` and
+    must be recomputed from content before they can be compared with current
+    signatures (see ``MinHashSignature.needs_migration``).
 
 Usage:
     >>> from session_buddy.utils.fingerprint import MinHashSignature, extract_ngrams
@@ -26,6 +37,8 @@ import logging
 import re
 from dataclasses import dataclass
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # MinHash configuration
@@ -33,6 +46,94 @@ NUM_HASH_FUNCTIONS = 128  # Number of hash functions for MinHash signature
 NGRAM_SIZE = 3  # Character n-gram size
 MAX_NGRAMS_FOR_FULL_MINHASH = 2048
 
+# LSH banding: signatures are split into BANDS bands of ROWS values; two
+# signatures become duplicate candidates when any band hashes identically.
+# The similarity at which candidacy probability crosses 50% is roughly
+# (1 / bands) ** (1 / rows): 32x4 ~ 0.42 (high recall), 16x8 ~ 0.71 (fewer
+# candidates).
+DEFAULT_LSH_BANDS = 32
+DEFAULT_LSH_ROWS = 4
+
+# Signature formats: version 1 is the original per-hash SHA-256 engine
+# (headerless 8-byte values), version 2 the vectorized universal-hash engine.
+LEGACY_SIGNATURE_VERSION = 1
+SIGNATURE_VERSION = 2
+_SIGNATURE_MAGIC = b"MH"
+_HEADER_SIZE = 4
+
+# Universal hashing modulo the Mersenne prime 2^61 - 1. Coefficients stay
+# below 2^32 so ``a * x + b`` never overflows uint64 for 32-bit ``x``.
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_PERMUTATION_CACHE: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _permutations(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``(a, b)`` coefficient columns for ``seed``."""
+    cached = _PERMUTATION_CACHE.get(seed)
+    if cached is None:
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, 1 << 32, size=(NUM_HASH_FUNCTIONS, 1), dtype=np.uint64)
+        b = rng.integers(0, 1 << 32, size=(NUM_HASH_FUNCTIONS, 1), dtype=np.uint64)
+        cached = _PERMUTATION_CACHE[seed] = (a, b)
+    return cached
+
+
+def lsh_band_keys(
+    signatures: np.ndarray,
+    bands: int = DEFAULT_LSH_BANDS,
+    rows: int = DEFAULT_LSH_ROWS,
+) -> np.ndarray:
+    """Compute LSH band keys for a batch of MinHash signatures.
+
+    Each band's ``rows`` values are folded with fixed odd multipliers, salted
+    with the band number and passed through a SplitMix64 finalizer, so keys
+    from different bands never need a separate band column to stay distinct.
+
+    Args:
+        signatures: ``(n, num_hashes)`` array of signature values
+        bands: Number of bands
+        rows: Signature values per band
+
+    Returns:
+        ``(n, bands)`` int64 array (signed, to fit a DuckDB BIGINT column)
+
+    Raises:
+        ValueError: If ``bands * rows`` exceeds the signature length
+    """
+    values = np.asarray(signatures, dtype=np.uint64)
+    if values.ndim == 1:
+        values = values[np.newaxis, :]
+    if bands < 1 or rows < 1 or bands * rows > values.shape[1]:
+        raise ValueError(
+            f"LSH bands*rows ({bands}*{rows}) must be between 1 and the "
+            f"signature length ({values.shape[1]})"
+        )
+
+    banded = values[:, : bands * rows].reshape(len(values), bands, rows)
+    multipliers = np.random.default_rng(rows).integers(
+        1, 1 << 63, size=rows, dtype=np.uint64
+    ) | np.uint64(1)
+    salts = np.arange(1, bands + 1, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+
+    # uint64 arithmetic wraps modulo 2^64, which is what the mix wants.
+    h = (banded * multipliers).sum(axis=2, dtype=np.uint64) + salts
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return h.view(np.int64)
+
+
+def _hash_ngrams(ngrams: list[str]) -> np.ndarray:
+    """Hash each distinct n-gram once to a 32-bit value (as uint64)."""
+    digests = b"".join(
+        hashlib.blake2b(gram.encode(), digest_size=4).digest()
+        for gram in dict.fromkeys(ngrams)
+    )
+    return np.frombuffer(digests, dtype="<u4").astype(np.uint64)
+
 
 def normalize_for_fingerprint(text: str) -> str:
     """Normalize text for fingerprinting.
@@ -111,6 +212,7 @@ class MinHashSignature:
     Attributes:
         signature: List of NUM_HASH_FUNCTIONS minimum hash values
         num_hashes: Number of hash functions used (for validation)
+        version: Engine version that produced the signature
 
     Example:
         >>> ngrams = extract_ngrams("python async patterns")
@@ -120,6 +222,7 @@ class MinHashSignature:
 
     signature: list[int]
     num_hashes: int = NUM_HASH_FUNCTIONS
+    version: int = SIGNATURE_VERSION
 
     def __post_init__(self) -> None:
         """Validate signature after initialization."""
@@ -132,6 +235,15 @@ class MinHashSignature:
                 f"num_hashes {self.num_hashes}"
             )
 
+    @property
+    def needs_migration(self) -> bool:
+        """Whether this signature was produced by an older engine.
+
+        Such signatures cannot be compared with current ones; recompute them
+        with :meth:`from_text` on the original content.
+        """
+        return self.version != SIGNATURE_VERSION
+
     @classmethod
     def from_text(cls, text: str, n: int = NGRAM_SIZE) -> MinHashSignature:
         """Create MinHash signature directly from text.
@@ -154,9 +266,10 @@ class MinHashSignature:
     def from_ngrams(cls, ngrams: list[str], seed: int = 42) -> MinHashSignature:
         """Generate MinHash signature from n-grams.
 
-        Uses NUM_HASH_FUNCTIONS different hash functions (simulated via
-        seeded hashing) to generate the signature. For each hash function,
-        we compute the hash of every n-gram and keep the minimum value.
+        Each distinct n-gram is hashed once to 32 bits; the
+        NUM_HASH_FUNCTIONS hash functions are universal-hash permutations
+        ``h_i(x) = (a_i * x + b_i) mod p`` applied to all n-grams at once as
+        a ``(NUM_HASH_FUNCTIONS, n)`` array, keeping the minimum per row.
 
         Args:
             ngrams: List of n-gram strings
@@ -167,7 +280,7 @@ class MinHashSignature:
 
         Algorithm:
             For i in 0..NUM_HASH_FUNCTIONS-1:
-                signature[i] = min(hash_i(gram) for gram in ngrams)
+                signature[i] = min(h_i(hash32(gram)) for gram in ngrams)
         """
         if not ngrams:
             # Empty signature if no n-grams
@@ -177,21 +290,12 @@ class MinHashSignature:
             step = max(1, len(ngrams) // MAX_NGRAMS_FOR_FULL_MINHASH)
             ngrams = ngrams[::step][:MAX_NGRAMS_FOR_FULL_MINHASH]
 
-        # Generate signature with NUM_HASH_FUNCTIONS hash functions
-        signature = []
-
-        for i in range(NUM_HASH_FUNCTIONS):
-            # Create hash function i by combining seed with function index
-            # This simulates having different hash functions
-            def _hash_func(x: str, s: int = seed, idx: int = i) -> int:
-                """Hash function for MinHash signature generation."""
-                return int(hashlib.sha256(f"{s}:{idx}:{x}".encode()).hexdigest(), 16)
-
-            # Find minimum hash value for this hash function across all n-grams
-            min_hash = min(_hash_func(gram) for gram in ngrams)
-            signature.append(min_hash)
+        hashes = _hash_ngrams(ngrams)
+        a, b = _permutations(seed)
+        permuted = ((a * hashes + b) % _MERSENNE_PRIME) & _MAX_HASH
+        signature = permuted.min(axis=1)
 
-        return cls(signature=signature, num_hashes=NUM_HASH_FUNCTIONS)
+        return cls(signature=signature.tolist(), num_hashes=NUM_HASH_FUNCTIONS)
 
     def estimate_jaccard_similarity(self, other: MinHashSignature) -> float:
         """Estimate Jaccard similarity using MinHash signatures.
@@ -210,17 +314,26 @@ class MinHashSignature:
             Estimated Jaccard similarity (0.0 to 1.0)
 
         Raises:
-            ValueError: If signatures have different num_hashes
+            ValueError: If signatures have different num_hashes or were
+                produced by different engine versions
         """
         if self.num_hashes != other.num_hashes:
             raise ValueError(
                 f"Cannot compare signatures with different num_hashes: "
                 f"{self.num_hashes} vs {other.num_hashes}"
             )
+        if self.version != other.version:
+            raise ValueError(
+                f"Cannot compare signatures from different engine versions: "
+                f"{self.version} vs {other.version}"
+            )
 
         # Count matching minimum hash values
-        matches = sum(
-            1 for i in range(self.num_hashes) if self.signature[i] == other.signature[i]
+        matches = int(
+            np.count_nonzero(
+                np.asarray(self.signature, dtype=np.uint64)
+                == np.asarray(other.signature, dtype=np.uint64)
+            )
         )
 
         # Estimate Jaccard similarity as fraction of matches
@@ -229,8 +342,9 @@ class MinHashSignature:
     def to_bytes(self) -> bytes:
         """Convert signature to bytes for database storage.
 
-        Packs each integer hash value into 8 bytes (little-endian),
-        resulting in NUM_HASH_FUNCTIONS * 8 bytes total.
+        Writes a 4-byte header (magic, version, value width) followed by the
+        hash values as little-endian uint32 when they all fit, otherwise
+        uint64. Current signatures take 4 + NUM_HASH_FUNCTIONS * 4 bytes.
 
         Returns:
             Bytes representation suitable for BLOB storage
@@ -238,22 +352,22 @@ class MinHashSignature:
         Example:
             >>> sig = MinHashSignature.from_text("test")
             >>> blob = sig.to_bytes()
-            >>> len(blob) == NUM_HASH_FUNCTIONS * 8
+            >>> len(blob) == 4 + NUM_HASH_FUNCTIONS * 4
             True
         """
-        import struct
-
-        # Pack each int into 8 bytes (little-endian) using unsigned long long
-        # Using 'Q' format for unsigned long long (8 bytes)
-        # Modulo 2^64 to ensure values fit in unsigned long long
-        signature_64bit = [h % (2**64) for h in self.signature]
-        byte_data = struct.pack(f"{self.num_hashes}Q", *signature_64bit)
-        return byte_data
+        values = np.asarray(self.signature, dtype=np.uint64)
+        width = 4 if not values.size or int(values.max()) <= 0xFFFFFFFF else 8
+        header = _SIGNATURE_MAGIC + bytes((self.version, width))
+        return header + values.astype(f"<u{width}").tobytes()
 
     @classmethod
     def from_bytes(cls, data: bytes) -> MinHashSignature:
         """Reconstruct MinHash signature from bytes.
 
+        Accepts both the current headered format and legacy headerless
+        blobs of NUM_HASH_FUNCTIONS uint64 values, which load with
+        ``version == LEGACY_SIGNATURE_VERSION``.
+
         Args:
             data: Bytes representation from to_bytes()
 
@@ -263,18 +377,38 @@ class MinHashSignature:
         Raises:
             ValueError: If data length doesn't match expected size
         """
-        import struct
-
-        expected_size = NUM_HASH_FUNCTIONS * 8  # 8 bytes per int
-        if len(data) != expected_size:
-            raise ValueError(
-                f"Expected {expected_size} bytes, got {len(data)}. "
-                f"Data may be corrupted or from different configuration."
+        data = bytes(data)
+        legacy_size = NUM_HASH_FUNCTIONS * 8
+        if len(data) == legacy_size and not data.startswith(_SIGNATURE_MAGIC):
+            values = np.frombuffer(data, dtype="<u8")
+            return cls(
+                signature=values.tolist(),
+                num_hashes=NUM_HASH_FUNCTIONS,
+                version=LEGACY_SIGNATURE_VERSION,
             )
 
-        # Unpack NUM_HASH_FUNCTIONS unsigned long longs (little-endian)
-        signature = list(struct.unpack(f"{NUM_HASH_FUNCTIONS}Q", data))
-        return cls(signature=signature, num_hashes=NUM_HASH_FUNCTIONS)
+        if len(data) >= _HEADER_SIZE and data.startswith(_SIGNATURE_MAGIC):
+            version, width = data[2], data[3]
+            expected_size = _HEADER_SIZE + NUM_HASH_FUNCTIONS * width
+            if width in (4, 8) and len(data) == expected_size:
+                values = np.frombuffer(data[_HEADER_SIZE:], dtype=f"<u{width}")
+                return cls(
+                    signature=values.tolist(),
+                    num_hashes=NUM_HASH_FUNCTIONS,
+                    version=version,
+                )
+
+        raise ValueError(
+            f"Expected {_HEADER_SIZE + NUM_HASH_FUNCTIONS * 4} or {legacy_size} "
+            f"bytes, got {len(data)}. "
+            f"Data may be corrupted or from different configuration."
+        )
+
+    def band_keys(
+        self, bands: int = DEFAULT_LSH_BANDS, rows: int = DEFAULT_LSH_ROWS
+    ) -> list[int]:
+        """Return this signature's LSH band keys (see :func:`lsh_band_keys`)."""
+        return lsh_band_keys(np.asarray(self.signature), bands, rows)[0].tolist()
 
     def __repr__(self) -> str:
         """Return string representation for debugging."""
@@ -0,0 +1,454 @@
+"""Inverted-index full-text search with BM25 ranking on DuckDB.
+
+Text fallbacks used to run ``content LIKE '%query%'`` over whole tables and
+return the newest matches with a constant score. This module keeps a posting
+list per source table instead:
+
+    fts_documents(source, doc_id, length)        one row per indexed document
+    fts_postings(source, term, doc_id, tf)       one row per (term, document)
+
+Queries touch only the postings of their own terms and are ranked with Okapi
+BM25 (k1=1.2, b=0.75), computed in a single SQL statement that callers join
+back to the source table for filtering.
+
+DuckDB's ``fts`` extension was considered, but its index has to be rebuilt
+wholesale after every insert or delete, which does not suit a store written
+one memory at a time. The posting tables here are updated per document.
+
+Tokenization understands code identifiers: ``getUserName`` and
+``get_user_name`` both index as the whole identifier plus ``get``, ``user``
+and ``name``, so either spelling finds the other.
+
+Usage:
+    >>> from session_buddy.utils.fulltext import FullTextIndex
+    >>> index = FullTextIndex(conn)
+    >>> index.ensure_schema()
+    >>> index.index_documents("conversations", [("c1", "async DuckDB pool")])
+    >>> index.search("conversations", "duckdb", limit=10)
+    [('c1', 0.28...)]
+"""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from collections import Counter
+from dataclasses import dataclass
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    import duckdb
+
+# Okapi BM25 parameters (the common defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Conventional constant for reciprocal rank fusion
+RRF_K = 60
+
+# Documents tokenized and written per statement during sync
+_SYNC_BATCH_SIZE = 1000
+
+_WORD_RE = re.compile(r"\w+")
+_IDENTIFIER_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+# Scripts written without spaces between words (kana, CJK ideographs, hangul)
+_UNSPACED_CHAR_RE = re.compile(
+    r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]"
+)
+_STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "if",
+        "in", "into", "is", "it", "no", "not", "of", "on", "or", "such",
+        "that", "the", "their", "then", "there", "these", "they", "this",
+        "to", "was", "will", "with",
+    }
+)  # fmt: skip
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase index terms.
+
+    Each word is kept whole; identifiers written in camelCase, PascalCase or
+    snake_case also contribute their parts, and runs of CJK, kana or hangul
+    contribute each character since those scripts do not separate words with
+    spaces. Other single characters and common English stop words are
+    dropped.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in document order, with repeats
+    """
+    terms: list[str] = []
+    for word in _WORD_RE.findall(text):
+        whole, parts = _word_terms(word)
+        if whole:
+            terms.append(whole)
+        terms.extend(parts)
+    return terms
+
+
+def _required_terms(query: str) -> list[str]:
+    """Terms a document must contain to match every word of ``query``.
+
+    A compound word is satisfied by its parts, so ``getUserName`` matches
+    text that spells it ``get_user_name``.
+    """
+    required: list[str] = []
+    for word in _WORD_RE.findall(query):
+        whole, parts = _word_terms(word)
+        required.extend(parts or ([whole] if whole else []))
+    return required
+
+
+def _word_terms(word: str) -> tuple[str | None, list[str]]:
+    """Split one word into its whole term and its part terms."""
+    whole = word.strip("_").lower()
+    unspaced = _UNSPACED_CHAR_RE.findall(word)
+    if len(unspaced) == 1 and whole == unspaced[0]:
+        return whole, []
+    if len(whole) < 2 or whole in _STOP_WORDS:
+        return None, []
+
+    parts = [
+        part.lower()
+        for piece in word.split("_")
+        for part in _IDENTIFIER_PART_RE.findall(piece)
+    ]
+    if len(parts) > 1:
+        return whole, [
+            *unspaced,
+            *(part for part in parts if len(part) > 1 and part not in _STOP_WORDS),
+        ]
+    return whole, unspaced
+
+
+@dataclass(frozen=True)
+class MatchQuery:
+    """A BM25 subquery yielding ``(doc_id, score)`` rows.
+
+    ``params`` are all strings, so the subquery can be embedded in SQL whose
+    other parameters are also bound as strings.
+    """
+
+    sql: str
+    params: list[str]
+
+
+class FullTextIndex:
+    """Posting-list full-text index stored next to the data it covers.
+
+    One index serves several sources; each source is a table whose rows are
+    the documents, keyed by the table's id.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        self.conn = conn
+
+    def ensure_schema(self) -> None:
+        """Create the index tables if they do not exist yet."""
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fts_documents (
+                source VARCHAR NOT NULL,
+                doc_id VARCHAR NOT NULL,
+                length INTEGER NOT NULL,
+                PRIMARY KEY (source, doc_id)
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fts_postings (
+                source VARCHAR NOT NULL,
+                term VARCHAR NOT NULL,
+                doc_id VARCHAR NOT NULL,
+                tf INTEGER NOT NULL
+            )
+            """
+        )
+
+    def index_documents(self, source: str, documents: Iterable[tuple[str, str]]) -> int:
+        """Add or replace documents in one batch.
+
+        Args:
+            source: Source the documents belong to
+            documents: ``(doc_id, text)`` pairs
+
+        Returns:
+            Number of documents written
+        """
+        doc_ids: list[str] = []
+        lengths: list[int] = []
+        posting_docs: list[str] = []
+        posting_terms: list[str] = []
+        posting_tfs: list[int] = []
+        for doc_id, text in documents:
+            terms = tokenize(text or "")
+            doc_ids.append(str(doc_id))
+            lengths.append(len(terms))
+            for term, tf in Counter(terms).items():
+                posting_docs.append(str(doc_id))
+                posting_terms.append(term)
+                posting_tfs.append(tf)
+
+        if not doc_ids:
+            return 0
+
+        self._delete_postings(source, doc_ids)
+        if posting_docs:
+            self.conn.execute(
+                """
+                INSERT INTO fts_postings (source, term, doc_id, tf)
+                SELECT ?, unnest(?::VARCHAR[]), unnest(?::VARCHAR[]),
+                       unnest(?::INTEGER[])
+                """,
+                [source, posting_terms, posting_docs, posting_tfs],
+            )
+        self.conn.execute(
+            """
+            INSERT INTO fts_documents (source, doc_id, length)
+            SELECT ?, unnest(?::VARCHAR[]), unnest(?::INTEGER[])
+            ON CONFLICT (source, doc_id) DO UPDATE SET length = EXCLUDED.length
+            """,
+            [source, doc_ids, lengths],
+        )
+        return len(doc_ids)
+
+    def remove_documents(self, source: str, doc_ids: Sequence[str]) -> None:
+        """Drop documents from the index."""
+        if not doc_ids:
+            return
+        ids = [str(doc_id) for doc_id in doc_ids]
+        self._delete_postings(source, ids)
+        self.conn.execute(
+            """
+            DELETE FROM fts_documents
+            WHERE source = ? AND doc_id IN (SELECT unnest(?::VARCHAR[]))
+            """,
+            [source, ids],
+        )
+
+    def clear(self, source: str) -> None:
+        """Drop every document of ``source``."""
+        self.conn.execute("DELETE FROM fts_postings WHERE source = ?", [source])
+        self.conn.execute("DELETE FROM fts_documents WHERE source = ?", [source])
+
+    def sync(
+        self,
+        source: str,
+        table: str,
+        text_sql: str,
+        decode: Callable[[str], str] | None = None,
+    ) -> int:
+        """Catch the index up with rows written or deleted behind its back.
+
+        Writers that go through the index keep it current. This covers the
+        rest (older databases, bulk imports, raw SQL) by comparing the row
+        count and an id checksum of ``table`` with the indexed documents,
+        and indexing or dropping only the ids that differ. Content updated
+        in place without going through the index is not detected.
+
+        Args:
+            source: Source name used for ``table``'s documents
+            table: Table holding the documents, keyed by ``id``
+            text_sql: SQL expression over ``table`` giving the text to index
+            decode: Optional transform applied to fetched text
+
+        Returns:
+            Number of documents indexed or removed
+        """
+        table_probe = self.conn.execute(
+            f"SELECT COUNT(*), BIT_XOR(HASH(CAST(id AS VARCHAR))) FROM {table}"
+        ).fetchone()
+        index_probe = self.conn.execute(
+            """
+            SELECT COUNT(*), BIT_XOR(HASH(doc_id))
+            FROM fts_documents WHERE source = ?
+            """,
+            [source],
+        ).fetchone()
+        if table_probe == index_probe:
+            return 0
+
+        stale = [
+            row[0]
+            for row in self.conn.execute(
+                f"""
+                SELECT d.doc_id FROM fts_documents d
+                WHERE d.source = ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM {table} s WHERE CAST(s.id AS VARCHAR) = d.doc_id
+                  )
+                """,
+                [source],
+            ).fetchall()
+        ]
+        self.remove_documents(source, stale)
+
+        missing = self.conn.execute(
+            f"""
+            SELECT CAST(s.id AS VARCHAR), {text_sql} FROM {table} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM fts_documents d
+                WHERE d.source = ? AND d.doc_id = CAST(s.id AS VARCHAR)
+            )
+            """,
+            [source],
+        ).fetchall()
+        for start in range(0, len(missing), _SYNC_BATCH_SIZE):
+            batch = missing[start : start + _SYNC_BATCH_SIZE]
+            self.index_documents(
+                source,
+                (
+                    (doc_id, decode(text) if decode and text else text)
+                    for doc_id, text in batch
+                ),
+            )
+        return len(stale) + len(missing)
+
+    def match(
+        self, source: str, query: str, require_all: bool = True
+    ) -> MatchQuery | None:
+        """Build the BM25 subquery for ``query``.
+
+        Matching documents are returned with their summed BM25 term weights
+        as ``score``.
+
+        Args:
+            source: Source to search
+            query: Free-text query
+            require_all: Match only documents containing every query term,
+                like the substring filters this replaces; otherwise any term
+
+        Returns:
+            The subquery, or None when the query has no indexable terms
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return None
+
+        required = sorted(set(_required_terms(query))) if require_all else []
+        having = (
+            f"HAVING COUNT(*) FILTER (WHERE h.required) = {len(required)}"
+            if required
+            else ""
+        )
+        sql = f"""
+            WITH query_terms AS (
+                SELECT DISTINCT unnest(string_split(?, ' ')) AS term
+            ),
+            required_terms AS (
+                SELECT DISTINCT unnest(string_split(?, ' ')) AS term
+            ),
+            corpus AS (
+                SELECT COUNT(*) AS n, GREATEST(AVG(length), 1) AS avgdl
+                FROM fts_documents WHERE source = ?
+            ),
+            hits AS (
+                SELECT doc_id, term, tf,
+                       term IN (SELECT term FROM required_terms) AS required
+                FROM fts_postings
+                WHERE source = ? AND term IN (SELECT term FROM query_terms)
+            ),
+            df AS (
+                SELECT term, COUNT(*) AS df FROM hits GROUP BY term
+            )
+            SELECT h.doc_id,
+                   SUM(
+                       ln(1 + (c.n - df.df + 0.5) / (df.df + 0.5))
+                       * h.tf * {BM25_K1 + 1}
+                       / (h.tf + {BM25_K1} * (1 - {BM25_B} + {BM25_B} * d.length / c.avgdl))
+                   ) AS score
+            FROM hits h
+            JOIN df ON df.term = h.term
+            JOIN fts_documents d ON d.source = ? AND d.doc_id = h.doc_id
+            CROSS JOIN corpus c
+            GROUP BY h.doc_id
+            {having}
+        """
+        return MatchQuery(
+            sql=sql,
+            params=[" ".join(terms), " ".join(required), source, source, source],
+        )
+
+    def search(
+        self, source: str, query: str, limit: int, require_all: bool = True
+    ) -> list[tuple[str, float]]:
+        """Return the ``limit`` best ``(doc_id, score)`` pairs for ``query``."""
+        match = self.match(source, query, require_all)
+        if match is None:
+            return []
+        rows = self.conn.execute(
+            f"SELECT doc_id, score FROM ({match.sql}) ORDER BY score DESC LIMIT ?",
+            [*match.params, limit],
+        ).fetchall()
+        return [(str(doc_id), float(score)) for doc_id, score in rows]
+
+    def _delete_postings(self, source: str, doc_ids: list[str]) -> None:
+        self.conn.execute(
+            """
+            DELETE FROM fts_postings
+            WHERE source = ? AND doc_id IN (SELECT unnest(?::VARCHAR[]))
+            """,
+            [source, doc_ids],
+        )
+
+
+def normalize_scores(
+    results: list[dict[str, t.Any]], key: str = "score"
+) -> list[dict[str, t.Any]]:
+    """Scale ``key`` in place so the best result scores 1.0.
+
+    BM25 scores are unbounded; callers that filter on a 0-1 similarity
+    threshold see the top text match at 1.0 and the rest relative to it.
+    """
+    best = max((float(result[key]) for result in results), default=0.0)
+    if best > 0:
+        for result in results:
+            result[key] = float(result[key]) / best
+    return results
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[dict[str, t.Any]]],
+    key: str = "id",
+    k: int = RRF_K,
+) -> list[dict[str, t.Any]]:
+    """Merge ranked result lists by reciprocal rank fusion.
+
+    Each result earns ``1 / (k + rank)`` from every list it appears in;
+    results are returned best first with the total as ``rrf_score``. The
+    first list's copy of a result wins, so put the list whose fields (e.g.
+    similarity scores) should be kept first.
+
+    Args:
+        rankings: Result lists, each ordered best first
+        key: Field identifying the same result across lists
+        k: Rank offset damping the weight of top positions
+
+    Returns:
+        Fused results (shallow copies)
+    """
+    fused: dict[t.Any, dict[str, t.Any]] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, start=1):
+            entry = fused.get(result[key])
+            if entry is None:
+                entry = fused[result[key]] = dict(result, rrf_score=0.0)
+            entry["rrf_score"] += 1.0 / (k + rank)
+    return sorted(fused.values(), key=lambda result: -result["rrf_score"])
+
+
+__all__ = [
+    "BM25_B",
+    "BM25_K1",
+    "RRF_K",
+    "FullTextIndex",
+    "MatchQuery",
+    "normalize_scores",
+    "reciprocal_rank_fusion",
+    "tokenize",
+]
@@ -0,0 +1,405 @@
+"""In-memory adjacency index for knowledge graph path queries.
+
+Entity ids are mapped to dense integers and edges are held in CSR form:
+``offsets[n] .. offsets[n + 1]`` slices ``targets``/``relations`` for node
+``n``. Both directions are kept so a path search can expand forwards from
+the source and backwards from the target.
+
+The CSR arrays are built once from ``kg_relationships`` inside DuckDB.
+Later writes go to small per-node delta lists (inserts) and tombstone
+counters (deletes), which are folded back into the arrays once they grow
+past a fraction of the base edge count.
+
+Path search is a level-synchronised bidirectional BFS with parent pointers,
+expanding whichever frontier is smaller. ``k_shortest_paths`` runs Yen's
+algorithm on top of it for loopless alternatives.
+"""
+
+from __future__ import annotations
+
+import heapq
+import typing as t
+from collections import Counter, defaultdict
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+# Fold deltas and tombstones into the CSR arrays once they exceed this share
+# of the base edge count (plus a floor so small graphs don't churn).
+_COMPACT_RATIO = 0.1
+_COMPACT_MIN_EDGES = 1024
+
+Edge = tuple[int, int, int]  # (from node, to node, relation type)
+
+
+class _Direction:
+    """CSR arrays plus pending changes for one edge direction."""
+
+    __slots__ = ("dead", "delta", "offsets", "relations", "targets")
+
+    def __init__(
+        self,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        relations: np.ndarray,
+        node_count: int,
+    ) -> None:
+        order = np.argsort(sources, kind="stable")
+        self.targets = targets[order].astype(np.int32)
+        self.relations = relations[order].astype(np.int32)
+        self.offsets = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=self.offsets[1:])
+        self.delta: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        self.dead: dict[int, Counter[tuple[int, int]]] = {}
+
+    def neighbours(self, node: int) -> Iterator[tuple[int, int]]:
+        """Yield live ``(other node, relation)`` pairs for ``node``."""
+        dead = self.dead.get(node)
+        if dead is not None:
+            dead = dead.copy()
+        if node + 1 < len(self.offsets):
+            start, end = self.offsets[node], self.offsets[node + 1]
+            pairs = zip(
+                self.targets[start:end].tolist(),
+                self.relations[start:end].tolist(),
+                strict=True,
+            )
+            for pair in pairs:
+                if dead and dead[pair] > 0:
+                    dead[pair] -= 1
+                    continue
+                yield pair
+        yield from self.delta.get(node, ())
+
+    def add(self, node: int, other: int, relation: int) -> None:
+        self.delta[node].append((other, relation))
+
+    def remove(self, node: int, other: int, relation: int) -> None:
+        pending = self.delta.get(node)
+        if pending and (other, relation) in pending:
+            pending.remove((other, relation))
+            return
+        self.dead.setdefault(node, Counter())[other, relation] += 1
+
+
+class AdjacencyIndex:
+    """Bidirectional CSR adjacency over string entity ids.
+
+    Args:
+        sources: Source node index per edge
+        targets: Target node index per edge
+        relations: Relation type index per edge
+        nodes: Entity id for each node index
+        relation_types: Relation type name for each relation index
+
+    """
+
+    def __init__(
+        self,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        relations: np.ndarray,
+        nodes: list[str],
+        relation_types: list[str],
+    ) -> None:
+        self._nodes = list(nodes)
+        self._node_index = {node: i for i, node in enumerate(self._nodes)}
+        self._relation_types = list(relation_types)
+        self._relation_index = {name: i for i, name in enumerate(self._relation_types)}
+        self._build(
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            np.asarray(relations, dtype=np.int64),
+        )
+
+    def _build(
+        self, sources: np.ndarray, targets: np.ndarray, relations: np.ndarray
+    ) -> None:
+        node_count = len(self._nodes)
+        self._out = _Direction(sources, targets, relations, node_count)
+        self._in = _Direction(targets, sources, relations, node_count)
+        self._base_edges = len(sources)
+        self._pending = 0
+        self.edge_count = len(sources)
+
+    @classmethod
+    def from_duckdb(
+        cls, conn: t.Any, table: str = "kg_relationships"
+    ) -> AdjacencyIndex:
+        """Build the index from an edge table without materialising rows.
+
+        Node and relation ids are assigned inside DuckDB and the edge list is
+        fetched as three integer columns.
+        """
+        node_sql = f"""
+            SELECT id, row_number() OVER (ORDER BY id) - 1 AS idx
+            FROM (SELECT from_entity AS id FROM {table}
+                  UNION SELECT to_entity FROM {table})
+        """
+        nodes = [
+            row[0]
+            for row in conn.execute(
+                f"SELECT id FROM ({node_sql}) ORDER BY idx"
+            ).fetchall()
+        ]
+        relation_types = [
+            row[0]
+            for row in conn.execute(
+                f"SELECT DISTINCT relation_type FROM {table} ORDER BY relation_type"
+            ).fetchall()
+        ]
+        columns = conn.execute(
+            f"""
+            WITH nodes AS ({node_sql})
+            SELECT f.idx AS src, d.idx AS dst,
+                   dense_rank() OVER (ORDER BY r.relation_type) - 1 AS rel
+            FROM {table} r
+            JOIN nodes f ON r.from_entity = f.id
+            JOIN nodes d ON r.to_entity = d.id
+            """
+        ).fetchnumpy()
+        return cls(
+            columns["src"], columns["dst"], columns["rel"], nodes, relation_types
+        )
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _intern_node(self, entity_id: str) -> int:
+        index = self._node_index.get(entity_id)
+        if index is None:
+            index = len(self._nodes)
+            self._nodes.append(entity_id)
+            self._node_index[entity_id] = index
+        return index
+
+    def _intern_relation(self, relation_type: str) -> int:
+        index = self._relation_index.get(relation_type)
+        if index is None:
+            index = len(self._relation_types)
+            self._relation_types.append(relation_type)
+            self._relation_index[relation_type] = index
+        return index
+
+    def add_edge(self, from_entity: str, to_entity: str, relation_type: str) -> None:
+        """Record a new relationship."""
+        src = self._intern_node(from_entity)
+        dst = self._intern_node(to_entity)
+        rel = self._intern_relation(relation_type)
+        self._out.add(src, dst, rel)
+        self._in.add(dst, src, rel)
+        self.edge_count += 1
+        self._changed()
+
+    def remove_edge(self, from_entity: str, to_entity: str, relation_type: str) -> None:
+        """Forget one copy of a relationship."""
+        src = self._node_index.get(from_entity)
+        dst = self._node_index.get(to_entity)
+        rel = self._relation_index.get(relation_type)
+        if src is None or dst is None or rel is None:
+            return
+        self._out.remove(src, dst, rel)
+        self._in.remove(dst, src, rel)
+        self.edge_count -= 1
+        self._changed()
+
+    def _changed(self) -> None:
+        self._pending += 1
+        if self._pending > max(_COMPACT_MIN_EDGES, self._base_edges * _COMPACT_RATIO):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold pending inserts and deletes into the CSR arrays."""
+        sources: list[int] = []
+        targets: list[int] = []
+        relations: list[int] = []
+        for node in range(len(self._nodes)):
+            for other, rel in self._out.neighbours(node):
+                sources.append(node)
+                targets.append(other)
+                relations.append(rel)
+        self._build(
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            np.asarray(relations, dtype=np.int64),
+        )
+
+    def _allowed(self, relation_types: Collection[str] | None) -> frozenset[int] | None:
+        if relation_types is None:
+            return None
+        return frozenset(
+            index
+            for name in relation_types
+            if (index := self._relation_index.get(name)) is not None
+        )
+
+    def _bfs(
+        self,
+        source: int,
+        target: int,
+        max_depth: int,
+        allowed: frozenset[int] | None,
+        banned_nodes: Collection[int] = (),
+        banned_edges: Collection[Edge] = (),
+    ) -> tuple[list[int], list[int]] | None:
+        """Shortest path from ``source`` to ``target`` as (nodes, relations)."""
+        if max_depth < 1 or source in banned_nodes or target in banned_nodes:
+            return None
+        # parent pointers: node -> (neighbour towards the search origin, relation)
+        forward: dict[int, tuple[int, int] | None] = {source: None}
+        backward: dict[int, tuple[int, int] | None] = {target: None}
+        forward_frontier = [source]
+        backward_frontier = [target]
+        depth = 0
+
+        while forward_frontier and backward_frontier and depth < max_depth:
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            if expand_forward:
+                direction, seen, other_seen, frontier = (
+                    self._out,
+                    forward,
+                    backward,
+                    forward_frontier,
+                )
+            else:
+                direction, seen, other_seen, frontier = (
+                    self._in,
+                    backward,
+                    forward,
+                    backward_frontier,
+                )
+
+            next_frontier: list[int] = []
+            meeting: int | None = None
+            for node in frontier:
+                for neighbour, rel in direction.neighbours(node):
+                    if allowed is not None and rel not in allowed:
+                        continue
+                    if neighbour in banned_nodes or neighbour in seen:
+                        continue
+                    edge = (
+                        (node, neighbour, rel)
+                        if expand_forward
+                        else (neighbour, node, rel)
+                    )
+                    if edge in banned_edges:
+                        continue
+                    seen[neighbour] = (node, rel)
+                    if neighbour in other_seen:
+                        meeting = neighbour
+                        break
+                    next_frontier.append(neighbour)
+                if meeting is not None:
+                    break
+            depth += 1
+
+            if meeting is not None:
+                return self._join(meeting, forward, backward)
+            if expand_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        return None
+
+    @staticmethod
+    def _join(
+        meeting: int,
+        forward: dict[int, tuple[int, int] | None],
+        backward: dict[int, tuple[int, int] | None],
+    ) -> tuple[list[int], list[int]]:
+        nodes = [meeting]
+        relations: list[int] = []
+        step = forward[meeting]
+        while step is not None:
+            node, rel = step
+            nodes.append(node)
+            relations.append(rel)
+            step = forward[node]
+        nodes.reverse()
+        relations.reverse()
+        step = backward[meeting]
+        while step is not None:
+            node, rel = step
+            nodes.append(node)
+            relations.append(rel)
+            step = backward[node]
+        return nodes, relations
+
+    def shortest_path(
+        self,
+        from_entity: str,
+        to_entity: str,
+        max_depth: int,
+        relation_types: Collection[str] | None = None,
+    ) -> tuple[list[str], list[str]] | None:
+        """Return the shortest ``(entity ids, relation types)`` path, or None."""
+        paths = self.k_shortest_paths(
+            from_entity, to_entity, max_depth, k=1, relation_types=relation_types
+        )
+        return paths[0] if paths else None
+
+    def k_shortest_paths(
+        self,
+        from_entity: str,
+        to_entity: str,
+        max_depth: int,
+        k: int = 1,
+        relation_types: Collection[str] | None = None,
+    ) -> list[tuple[list[str], list[str]]]:
+        """Return up to ``k`` loopless paths in order of hop count (Yen)."""
+        source = self._node_index.get(from_entity)
+        target = self._node_index.get(to_entity)
+        if source is None or target is None or source == target or k < 1:
+            return []
+        allowed = self._allowed(relation_types)
+
+        first = self._bfs(source, target, max_depth, allowed)
+        if first is None:
+            return []
+        found = [first]
+        candidates: list[tuple[int, int, list[int], list[int]]] = []
+        seen_paths = {(tuple(first[0]), tuple(first[1]))}
+        tiebreak = 0
+
+        while len(found) < k:
+            prev_nodes, prev_rels = found[-1]
+            for i in range(len(prev_nodes) - 1):
+                root_nodes = prev_nodes[: i + 1]
+                root_rels = prev_rels[:i]
+                banned_edges = {
+                    (nodes[i], nodes[i + 1], rels[i])
+                    for nodes, rels in found
+                    if nodes[: i + 1] == root_nodes and rels[:i] == root_rels
+                }
+                spur = self._bfs(
+                    root_nodes[-1],
+                    target,
+                    max_depth - i,
+                    allowed,
+                    banned_nodes=set(root_nodes[:-1]),
+                    banned_edges=banned_edges,
+                )
+                if spur is None:
+                    continue
+                nodes = root_nodes[:-1] + spur[0]
+                rels = root_rels + spur[1]
+                key = (tuple(nodes), tuple(rels))
+                if key in seen_paths:
+                    continue
+                seen_paths.add(key)
+                tiebreak += 1
+                heapq.heappush(candidates, (len(rels), tiebreak, nodes, rels))
+            if not candidates:
+                break
+            _, _, nodes, rels = heapq.heappop(candidates)
+            found.append((nodes, rels))
+
+        return [
+            ([self._nodes[n] for n in nodes], [self._relation_types[r] for r in rels])
+            for nodes, rels in found
+        ]
+
+
+__all__ = ["AdjacencyIndex"]
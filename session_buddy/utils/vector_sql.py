@@ -0,0 +1,85 @@
+"""Helpers for passing query vectors to DuckDB vector searches.
+
+DuckDB folds a typed array literal (``'[...]'::FLOAT[384]``) into a
+constant vector at bind time. That constant is what lets
+``array_cosine_similarity`` run its constant-argument fast path and what the
+VSS extension needs to rewrite ``ORDER BY ... LIMIT`` into an HNSW index scan.
+A bound parameter (``?::FLOAT[384]``) is re-evaluated per row instead: on a
+20k-row brute-force scan with DuckDB 1.5 it measured ~3.5x slower (117 ms vs
+33 ms), regardless of whether it was bound as a list, a numpy array or a
+typed ``FLOAT[384]`` value.
+
+These helpers therefore build the literal, from a validated float32 array
+with a compact, exactly round-tripping text form. They also provide a
+columnar fetch that converts only the rows that pass a score threshold.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def vector_literal(embedding: Sequence[float] | np.ndarray, dim: int) -> str:
+    """Return ``embedding`` as a DuckDB ``FLOAT[dim]`` constant expression.
+
+    Values are formatted with 9 significant digits, which round-trips
+    float32 exactly and is about half the length of ``str(float)``.
+
+    Args:
+        embedding: Query vector
+        dim: Expected dimension (the column's array size)
+
+    Returns:
+        SQL expression such as ``'[0.1,-0.2,...]'::FLOAT[384]``
+
+    Raises:
+        ValueError: If the vector has the wrong shape or non-finite values
+
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if vector.shape != (dim,):
+        msg = f"Expected a {dim}-dimensional vector, got shape {vector.shape}"
+        raise ValueError(msg)
+    if not np.isfinite(vector).all():
+        msg = "Query vector contains NaN or infinite values"
+        raise ValueError(msg)
+    body = ",".join(f"{value:.9g}" for value in vector.tolist())
+    return f"'[{body}]'::FLOAT[{dim}]"
+
+
+def fetch_scored_rows(
+    result: t.Any,
+    score_column: str,
+    threshold: float,
+) -> list[dict[str, t.Any]]:
+    """Fetch a DuckDB result columnar and keep rows scoring >= ``threshold``.
+
+    The whole result is read with ``fetchnumpy()``; the threshold is applied
+    as an array mask and only surviving rows are converted to Python
+    objects, so per-row post-processing (e.g. JSON decoding) is skipped for
+    rows that would be discarded.
+
+    Args:
+        result: DuckDB relation/cursor returned by ``execute()``
+        score_column: Name of the similarity column
+        threshold: Minimum score to keep
+
+    Returns:
+        Row dicts keyed by column name, in result order
+
+    """
+    columns = result.fetchnumpy()
+    scores = np.ma.filled(columns[score_column].astype(np.float64), -np.inf)
+    keep = np.flatnonzero(scores >= threshold)
+    if not keep.size:
+        return []
+    picked = {name: values[keep].tolist() for name, values in columns.items()}
+    return [dict(zip(picked, row, strict=True)) for row in zip(*picked.values())]
+
+
+__all__ = ["fetch_scored_rows", "vector_literal"]
@@ -1,24 +1,46 @@
 """Worker implementation for Session-Buddy pool execution.
 
 This module provides the Worker class that processes tasks from a queue
-as part of a 3-worker pool for delegated execution.
+as part of an elastic worker pool for delegated execution.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import math
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+# Tie-breaker keeping tasks of equal priority and deadline in FIFO order
+_task_sequence = itertools.count()
+
+
+class TaskCancelledError(Exception):
+    """Raised to waiters of a task that was cancelled before it finished."""
+
 
 class Task:
-    """Represents a task to be executed by a worker."""
+    """Represents a task to be executed by a worker.
+
+    Tasks order by priority (lower first), then earliest deadline, then
+    submission order, so a priority queue of tasks serves urgent work first.
+    """
 
     def __init__(
-        self, task_id: str, prompt: str, context: dict[str, Any] | None = None
+        self,
+        task_id: str,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
     ) -> None:
         """Initialize a new task.
 
@@ -26,17 +48,71 @@ class Task:
             task_id: Unique task identifier
             prompt: Task prompt/instruction
             context: Optional context for task execution
+            priority: Lower numbers are executed first
+            deadline: Event loop time (``loop.time()``) by which the task
+                must finish; it is dropped if not started by then and
+                cancelled if still running
         """
         self.task_id = task_id
         self.prompt = prompt
         self.context = context or {}
+        self.priority = priority
+        self.deadline = deadline
+        self.sequence = next(_task_sequence)
         self.created_at = datetime.now(UTC)
         self.started_at: datetime | None = None
         self.completed_at: datetime | None = None
         self.result: Any = None
         self.error: Exception | None = None
-        self.status: str = "pending"  # pending, running, completed, failed
+        # pending, running, completed, failed, cancelled, expired
+        self.status: str = "pending"
+        # Loop times and durations (seconds) for queue metrics
+        self.enqueued_at: float | None = None
+        self.queue_wait: float | None = None
+        self.execution_time: float | None = None
         self._result_event = asyncio.Event()
+        self._execution: asyncio.Future[Any] | None = None
+
+    def __lt__(self, other: Task) -> bool:
+        """Order tasks for the pool's priority queue."""
+        return self._sort_key() < other._sort_key()
+
+    def _sort_key(self) -> tuple[int, float, int]:
+        deadline = math.inf if self.deadline is None else self.deadline
+        return (self.priority, deadline, self.sequence)
+
+    @property
+    def done(self) -> bool:
+        """Whether the task has a result, an error or was cancelled."""
+        return self._result_event.is_set()
+
+    def expired(self, now: float) -> bool:
+        """Whether the task's deadline has passed at loop time ``now``."""
+        return self.deadline is not None and now >= self.deadline
+
+    def cancel(self) -> bool:
+        """Cancel the task if it has not finished.
+
+        A queued task is skipped by the worker that dequeues it; a running
+        task has its execution cancelled. Waiters get TaskCancelledError.
+
+        Returns:
+            True if the task was cancelled, False if it had already finished
+        """
+        if self.done:
+            return False
+        self._finish_with_error(
+            TaskCancelledError(f"Task {self.task_id} was cancelled"), "cancelled"
+        )
+        if self._execution is not None:
+            self._execution.cancel()
+        return True
+
+    def _finish_with_error(self, error: Exception, status: str) -> None:
+        self.error = error
+        self.status = status
+        self.completed_at = datetime.now(UTC)
+        self._result_event.set()
 
     async def wait_for_result(self, timeout: float | None = None) -> Any:
         """Wait for task result with optional timeout.
@@ -79,10 +155,7 @@ class Task:
         Args:
             error: Exception that occurred during execution
         """
-        self.error = error
-        self.status = "failed"
-        self.completed_at = datetime.now(UTC)
-        self._result_event.set()
+        self._finish_with_error(error, "failed")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert task to dictionary representation.
@@ -95,6 +168,7 @@ class Task:
             "prompt": self.prompt,
             "context": self.context,
             "status": self.status,
+            "priority": self.priority,
             "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat()
@@ -106,14 +180,21 @@ class Task:
 
 
 class Worker:
-    """Single worker in a 3-worker pool.
+    """Single worker in an elastic worker pool.
 
     Each worker processes tasks from a shared queue asynchronously,
     maintaining its own state and health status.
     """
 
     def __init__(
-        self, worker_id: str, queue: asyncio.Queue[Task], pool_id: str
+        self,
+        worker_id: str,
+        queue: asyncio.Queue[Task],
+        pool_id: str,
+        *,
+        idle_timeout: float | None = 1.0,
+        on_idle: Callable[[Worker], bool] | None = None,
+        on_task_done: Callable[[Task], None] | None = None,
     ) -> None:
         """Initialize a new worker.
 
@@ -121,12 +202,23 @@ class Worker:
             worker_id: Unique worker identifier
             queue: Task queue to pull from
             pool_id: ID of the parent pool
+            idle_timeout: Seconds without a task before ``on_idle`` is asked
+                whether the worker should exit (None = wait indefinitely)
+            on_idle: Called after ``idle_timeout``; returning True stops the
+                worker (used by the pool to scale down)
+            on_task_done: Called with every task this worker finished,
+                failed, or dropped because its deadline had passed
         """
         self.worker_id = worker_id
         self.queue = queue
         self.pool_id = pool_id
+        self.idle_timeout = idle_timeout
+        self.on_idle = on_idle
+        self.on_task_done = on_task_done
         self.running = False
         self._task: asyncio.Task[None] | None = None
+        # True while waiting on the queue, so stop() need not wait
+        self.idle = False
 
         # Worker statistics
         self.tasks_processed = 0
@@ -165,6 +257,9 @@ class Worker:
         self.running = False
 
         if self._task:
+            if self.idle:
+                # Nothing in progress: don't wait for the idle timeout
+                self._task.cancel()
             try:
                 await asyncio.wait_for(self._task, timeout=timeout)
             except TimeoutError:
@@ -185,14 +280,22 @@ class Worker:
 
         while self.running:
             try:
-                # Get task from queue with timeout to allow checking running flag
-                task = await asyncio.wait_for(self.queue.get(), timeout=1.0)
+                self.idle = True
+                try:
+                    task = await asyncio.wait_for(
+                        self.queue.get(), timeout=self.idle_timeout
+                    )
+                finally:
+                    self.idle = False
 
                 # Process the task
                 await self._execute_task(task)
 
             except TimeoutError:
-                # No task available, continue loop
+                # No task available; the pool may retire idle workers
+                if self.on_idle is not None and self.on_idle(self):
+                    logger.info(f"Worker {self.worker_id} retiring after idling")
+                    self.running = False
                 continue
             except asyncio.CancelledError:
                 logger.info(f"Worker {self.worker_id} task processing cancelled")
@@ -212,9 +315,40 @@ class Worker:
     async def _execute_task(self, task: Task) -> None:
         """Execute a single task.
 
+        Tasks cancelled while queued are skipped, tasks whose deadline
+        passed in the queue are failed with TimeoutError without running,
+        and running tasks are cancelled when their deadline passes.
+
         Args:
             task: Task to execute
         """
+        if task.done:
+            logger.debug(
+                f"Worker {self.worker_id} skipping cancelled task {task.task_id}"
+            )
+            # Queue.get() does not yield when items are ready; don't let a
+            # run of skipped tasks starve the event loop
+            await asyncio.sleep(0)
+            return
+
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        if task.enqueued_at is not None:
+            task.queue_wait = start_time - task.enqueued_at
+
+        if task.expired(start_time):
+            logger.warning(
+                f"Worker {self.worker_id} dropping task {task.task_id}: "
+                "deadline passed while queued"
+            )
+            task._finish_with_error(
+                TimeoutError(f"Task {task.task_id} missed its deadline in the queue"),
+                "expired",
+            )
+            self._report(task)
+            await asyncio.sleep(0)
+            return
+
         task.status = "running"
         task.started_at = datetime.now(UTC)
         self.last_activity = task.started_at
@@ -222,14 +356,26 @@ class Worker:
         logger.info(f"Worker {self.worker_id} executing task {task.task_id}")
 
         try:
-            start_time = asyncio.get_event_loop().time()
-
             # Execute the task (delegate to actual execution logic)
-            result = await self._execute_task_logic(task)
-
-            end_time = asyncio.get_event_loop().time()
+            execution = asyncio.ensure_future(self._execute_task_logic(task))
+            task._execution = execution
+            try:
+                async with asyncio.timeout_at(task.deadline):
+                    result = await execution
+            except asyncio.CancelledError:
+                if task.status != "cancelled":
+                    raise
+                logger.info(f"Worker {self.worker_id} task {task.task_id} cancelled")
+                task.execution_time = loop.time() - start_time
+                self._report(task)
+                return
+            finally:
+                task._execution = None
+
+            end_time = loop.time()
             processing_time = end_time - start_time
             self.total_processing_time += processing_time
+            task.execution_time = processing_time
 
             # Mark task as completed
             await task.set_result(result)
@@ -251,11 +397,26 @@ class Worker:
             logger.exception(f"Worker {self.worker_id} failed task {task.task_id}")
 
             # Mark task as failed
-            await task.set_error(e)
+            task.execution_time = loop.time() - start_time
+            if not task.done:
+                await task.set_error(e)
+                if isinstance(e, TimeoutError) and task.expired(loop.time()):
+                    task.status = "expired"
 
             self.tasks_processed += 1
             self.tasks_failed += 1
 
+        self._report(task)
+
+    def _report(self, task: Task) -> None:
+        """Pass a finished task to the pool's metrics callback."""
+        if self.on_task_done is None:
+            return
+        try:
+            self.on_task_done(task)
+        except Exception:
+            logger.exception(f"Worker {self.worker_id} task callback failed")
+
     async def _execute_task_logic(self, task: Task) -> Any:
         """Execute the actual task logic.
 
@@ -73,6 +73,7 @@ class TestCloudSyncMethodIntegration:
         self,
         sample_config: AkoshaSyncConfig,
         temp_databases: tuple[Path, Path],
+        tmp_path: Path,
     ) -> None:
         """Test complete upload workflow with compression and manifest creation."""
         reflection_db, _ = temp_databases
@@ -82,6 +83,7 @@ class TestCloudSyncMethodIntegration:
             cloud_sync = CloudSyncMethod(sample_config)
             cloud_sync.reflection_db_path = reflection_db
             cloud_sync.knowledge_graph_db_path = temp_databases[1]
+            cloud_sync._chunk_index_file = tmp_path / "chunk_index.json"
 
             # Mock S3 adapter
             mock_adapter = AsyncMock()
@@ -99,7 +101,7 @@ class TestCloudSyncMethodIntegration:
             assert len(result["files_uploaded"]) == 2  # DB + manifest
             assert "upload_id" in result
 
-            # Verify S3 upload was called
+            # Verify S3 upload was called (one chunk + manifest)
             assert mock_adapter.upload.call_count == 2
 
     @pytest.mark.asyncio
@@ -107,6 +109,7 @@ class TestCloudSyncMethodIntegration:
         self,
         sample_config: AkoshaSyncConfig,
         temp_databases: tuple[Path, Path],
+        tmp_path: Path,
     ) -> None:
         """Test that compression is applied when enabled."""
         reflection_db, _ = temp_databases
@@ -119,10 +122,18 @@ class TestCloudSyncMethodIntegration:
 
             cloud_sync = CloudSyncMethod(config_compression)
             cloud_sync.reflection_db_path = reflection_db
+            cloud_sync._chunk_index_file = tmp_path / "chunk_index.json"
             cloud_sync._s3_adapter = AsyncMock()
 
-            # Read database with compression
-            file_data = await cloud_sync._read_database(reflection_db)
+            # Upload database chunks with compression
+            await cloud_sync._upload_database(
+                db_path=reflection_db,
+                db_name="reflection.duckdb",
+                upload_id="test_upload",
+            )
+            upload_call = cloud_sync._s3_adapter.upload.call_args_list[-1]
+            file_data = upload_call[1]["data"]
+            assert upload_call[1]["path"].endswith(".gz")
 
             # Verify compression was applied
             assert file_data.startswith(b"\x1f\x8b")  # Gzip magic bytes
@@ -136,6 +147,7 @@ class TestCloudSyncMethodIntegration:
         self,
         sample_config: AkoshaSyncConfig,
         temp_databases: tuple[Path, Path],
+        tmp_path: Path,
     ) -> None:
         """Test that unchanged files are skipped when deduplication enabled."""
         reflection_db, _ = temp_databases
@@ -148,21 +160,31 @@ class TestCloudSyncMethodIntegration:
 
             cloud_sync = CloudSyncMethod(config_dedupe)
             cloud_sync.reflection_db_path = reflection_db
+            cloud_sync._chunk_index_file = tmp_path / "chunk_index.json"
+            cloud_sync._s3_adapter = AsyncMock()
 
-            with patch.object(
-                cloud_sync,
-                "_file_exists_with_checksum",
-                return_value=True,
-            ):
-                # Upload should be skipped
-                cloud_path = await cloud_sync._upload_database(
-                    db_path=reflection_db,
-                    db_name="reflection.duckdb",
-                    upload_id="test_upload",
-                )
+            await cloud_sync._upload_database(
+                db_path=reflection_db,
+                db_name="reflection.duckdb",
+                upload_id="first_upload",
+            )
+            assert cloud_sync._s3_adapter.upload.call_count == 1
 
-                # Verify path was returned but no upload occurred
-                assert cloud_path == "systems/test-system/uploads/test_upload/reflection.duckdb"
+            # A fresh instance reads the stored chunks from the index
+            cloud_sync = CloudSyncMethod(config_dedupe)
+            cloud_sync._chunk_index_file = tmp_path / "chunk_index.json"
+            cloud_sync._s3_adapter = AsyncMock()
+
+            # Upload should be skipped
+            cloud_path = await cloud_sync._upload_database(
+                db_path=reflection_db,
+                db_name="reflection.duckdb",
+                upload_id="test_upload",
+            )
+
+            # Verify path was returned but no upload occurred
+            assert cloud_path == "systems/test-system/uploads/test_upload/reflection.duckdb"
+            cloud_sync._s3_adapter.upload.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_retry_with_backoff(
@@ -211,17 +233,12 @@ class TestCloudSyncMethodIntegration:
                             # Simulate success
                             pass
 
-                        with patch.object(
-                            cloud_sync,
-                            "_file_exists_with_checksum",
-                            return_value=False,
-                        ):
-                            file_data = await cloud_sync._read_database(reflection_db)
-                            await cloud_sync._upload_with_retry(
-                                data=file_data,
-                                db_name="reflection.duckdb",
-                                upload_id="test",
-                            )
+                        file_data = gzip.compress(reflection_db.read_bytes())
+                        await cloud_sync._upload_with_retry(
+                            data=file_data,
+                            db_name="reflection.duckdb",
+                            upload_id="test",
+                        )
 
     @pytest.mark.asyncio
     async def test_manifest_creation(
@@ -509,7 +526,7 @@ def _seed_conversations_v2(reflection_db: Path) -> None:
     """Seed a minimal conversations_v2 table in DuckDB for round-trip tests.
 
     The table mirrors the v2 schema column subset that
-    ``_fetch_conversations`` selects. We avoid running the real schema
+    ``CONVERSATION_STREAM`` selects. We avoid running the real schema
     bootstrap to keep this test self-contained.
     """
     import duckdb
@@ -601,7 +618,14 @@ class TestSourceTypeRoundTrip:
         http_sync.reflection_db_path = reflection_db
 
         # Fetch the row.
-        rows = await http_sync._fetch_conversations(incremental=False, batch_size=10)
+        from session_buddy.storage.akosha_export import read_page
+        from session_buddy.storage.akosha_sync import CONVERSATION_STREAM
+
+        read_conn = duckdb.connect(str(reflection_db), read_only=True)
+        try:
+            rows, _ = read_page(read_conn, CONVERSATION_STREAM, None, 10)
+        finally:
+            read_conn.close()
         assert len(rows) == 1
         assert rows[0]["id"] == "mem-1"
 
@@ -46,8 +46,9 @@ def _count_access_rows(db: object) -> int:
 
     The adapter's DuckDB connection is exposed as ``db.conn``; we read the
     table directly so the assertion does not depend on the adapter
-    growing a public accessor.
+    growing a public accessor. Buffered access events are flushed first.
     """
+    db._access_log.flush()  # type: ignore[attr-defined]
     row = db.conn.execute("SELECT COUNT(*) FROM memory_access_log").fetchone()  # type: ignore[attr-defined]
     return int(row[0])
 
@@ -247,7 +247,7 @@ class TestPhase4DuplicateDetectionAccuracy:
             assert result is not None, "Conversation should be stored"
             fingerprint_blob = result[0]
             assert fingerprint_blob is not None, "Fingerprint should be generated and stored"
-            assert len(fingerprint_blob) == 1024, "Fingerprint should be 1024 bytes"
+            assert len(fingerprint_blob) == 516, "Fingerprint should be 516 bytes"
 
     async def test_reflection_fingerprinting(
         self, tmp_path, collection_name=None
@@ -275,7 +275,7 @@ class TestPhase4DuplicateDetectionAccuracy:
             assert result is not None, "Reflection should be stored"
             fingerprint_blob = result[0]
             assert fingerprint_blob is not None, "Fingerprint should be generated for reflections"
-            assert len(fingerprint_blob) == 1024, "Fingerprint should be 1024 bytes"
+            assert len(fingerprint_blob) == 516, "Fingerprint should be 516 bytes"
 
     async def test_deduplicate_parameter_conversations(
         self, tmp_path, collection_name=None
@@ -0,0 +1,91 @@
+"""Benchmark knowledge graph path queries on a 1M-edge graph.
+
+Compares the cached adjacency index (bidirectional BFS) with the previous
+approach of loading every edge into a dict and running a path-copying BFS
+per query.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections import deque
+
+import duckdb
+import pytest
+
+from session_buddy.utils.graph_index import AdjacencyIndex
+
+NODES = 200_000
+EDGES = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def graph_conn() -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect()
+    conn.execute(
+        f"""
+        CREATE TABLE kg_relationships AS
+        SELECT
+            'e' || (hash(i) % {NODES}) AS from_entity,
+            'e' || (hash(i * 7 + 1) % {NODES}) AS to_entity,
+            ['uses', 'extends', 'cites'][1 + i % 3] AS relation_type
+        FROM range({EDGES}) t(i)
+        """
+    )
+    return conn
+
+
+def _dict_bfs(conn: duckdb.DuckDBPyConnection, source: str, target: str) -> int | None:
+    """The pre-index implementation: full edge load plus path-copying BFS."""
+    graph: dict[str, list[tuple[str, str]]] = {}
+    for from_e, to_e, rel in conn.execute(
+        "SELECT from_entity, to_entity, relation_type FROM kg_relationships"
+    ).fetchall():
+        graph.setdefault(from_e, []).append((to_e, rel))
+    queue = deque([(source, [source], [])])
+    visited = {source}
+    while queue:
+        current, path, relations = queue.popleft()
+        if current == target and len(path) > 1:
+            return len(path) - 1
+        for neighbour, rel in graph.get(current, []):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                queue.append((neighbour, [*path, neighbour], [*relations, rel]))
+    return None
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_path_queries_on_million_edge_graph(
+    graph_conn: duckdb.DuckDBPyConnection,
+) -> None:
+    started = time.perf_counter()
+    index = AdjacencyIndex.from_duckdb(graph_conn)
+    build_s = time.perf_counter() - started
+    assert index.edge_count == EDGES
+
+    rng = random.Random(0)
+    pairs = [
+        (f"e{rng.randrange(NODES)}", f"e{rng.randrange(NODES)}") for _ in range(50)
+    ]
+    latencies_ms = []
+    for source, target in pairs:
+        started = time.perf_counter()
+        index.k_shortest_paths(source, target, max_depth=8, k=1)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    baseline_hops = _dict_bfs(graph_conn, *pairs[0])
+    baseline_s = time.perf_counter() - started
+    indexed = index.shortest_path(*pairs[0], max_depth=50)
+    assert (len(indexed[1]) if indexed else None) == baseline_hops
+
+    p50 = statistics.median(latencies_ms)
+    print(
+        f"\nindex build: {build_s:.2f}s, query p50: {p50:.2f}ms, "
+        f"max: {max(latencies_ms):.2f}ms, previous per-query: {baseline_s:.2f}s"
+    )
+    assert p50 * 10 < baseline_s * 1000
@@ -0,0 +1,115 @@
+"""Tests for the buffered ``memory_access_log`` writer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import duckdb
+import pytest
+
+from session_buddy.memory.access_log import AccessLogWriter, flush_all_access_logs
+
+
+@pytest.fixture
+def conn() -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect()
+    conn.execute(
+        """
+        CREATE TABLE memory_access_log (
+            id VARCHAR PRIMARY KEY,
+            memory_id VARCHAR,
+            access_type VARCHAR,
+            query_text VARCHAR,
+            timestamp TIMESTAMP
+        )
+        """
+    )
+    return conn
+
+
+def _rows(conn: duckdb.DuckDBPyConnection) -> list[tuple]:
+    return conn.execute(
+        "SELECT memory_id, access_type, query_text FROM memory_access_log "
+        "ORDER BY timestamp, memory_id"
+    ).fetchall()
+
+
+class TestAccessLogWriter:
+    def test_buffers_until_flushed(self, conn: duckdb.DuckDBPyConnection) -> None:
+        writer = AccessLogWriter(conn, batch_size=10)
+        writer.record("m1", "search", "query")
+        writer.record(None, "search", "empty")
+
+        assert _rows(conn) == []
+        assert writer.flush() == 2
+        assert _rows(conn) == [("m1", "search", "query"), (None, "search", "empty")]
+        assert writer.get_stats()["written"] == 2
+
+    def test_full_batch_flushes_without_a_loop(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        writer = AccessLogWriter(conn, batch_size=3)
+        for i in range(3):
+            writer.record(f"m{i}", "retrieve")
+
+        assert len(_rows(conn)) == 3
+        assert writer.get_stats()["buffered"] == 0
+
+    def test_overflow_drops_oldest(self, conn: duckdb.DuckDBPyConnection) -> None:
+        writer = AccessLogWriter(conn, capacity=2, batch_size=10)
+        for i in range(5):
+            writer.record(f"m{i}", "retrieve")
+        writer.flush()
+
+        assert [row[0] for row in _rows(conn)] == ["m3", "m4"]
+        stats = writer.get_stats()
+        assert stats["dropped"] == 3
+        assert stats["recorded"] == 5
+
+    @pytest.mark.asyncio
+    async def test_background_flush_after_interval(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        writer = AccessLogWriter(conn, batch_size=100, flush_interval=0.01)
+        writer.record("m1", "search")
+
+        for _ in range(100):
+            if writer.get_stats()["written"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert _rows(conn) == [("m1", "search", None)]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_writes_pending_events(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        writer = AccessLogWriter(conn, batch_size=100, flush_interval=60.0)
+        writer.record("m1", "search")
+
+        await writer.aclose()
+
+        assert _rows(conn) == [("m1", "search", None)]
+
+    @pytest.mark.asyncio
+    async def test_flush_all_access_logs(self, conn: duckdb.DuckDBPyConnection) -> None:
+        writers = [
+            AccessLogWriter(conn, batch_size=100, flush_interval=60.0) for _ in range(2)
+        ]
+        writers[0].record("m1", "search")
+        writers[1].record("m2", "search")
+
+        await flush_all_access_logs()
+
+        assert [row[0] for row in _rows(conn)] == ["m1", "m2"]
+        for writer in writers:
+            await writer.aclose()
+
+    def test_write_failure_is_counted(self, conn: duckdb.DuckDBPyConnection) -> None:
+        conn.execute("DROP TABLE memory_access_log")
+        writer = AccessLogWriter(conn, batch_size=10)
+        writer.record("m1", "search")
+
+        assert writer.flush() == 1
+        assert writer.get_stats()["write_errors"] == 1
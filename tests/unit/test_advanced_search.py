@@ -1467,24 +1467,117 @@ class TestIndexing:
         assert "project" in queries
         assert "content_type" in queries
 
-    def test_should_process_facet_value(self, search_engine):
-        """Test facet value filtering."""
-        assert search_engine._should_process_facet_value("valid") is True
-        assert search_engine._should_process_facet_value("") is False
-        assert search_engine._should_process_facet_value(123) is False
-        assert search_engine._should_process_facet_value(None) is False
-
-    def test_insert_facet_value(self, search_engine, fully_populated_db):
-        """Test inserting facet value."""
-        search_engine._insert_facet_value("test_facet", "test_value")
-
-        # Should complete without error
-
     def test_process_facet_query(self, search_engine, fully_populated_db):
         """Test processing facet query."""
         sql = "SELECT 'test_value' as facet_value, 1 as count"
         search_engine._process_facet_query("test_facet", sql)
 
+        rows = search_engine.reflection_db.conn.execute(
+            "SELECT facet_value FROM search_facets WHERE facet_name = 'test_facet'"
+        ).fetchall()
+        assert rows == [("test_value",)]
+
+    @pytest.mark.asyncio
+    async def test_update_search_index_is_incremental(
+        self, search_engine, fully_populated_db
+    ):
+        """Only rows changed since the last pass are re-indexed."""
+        first = await search_engine.update_search_index()
+        assert first == {"indexed": 8, "deleted": 0}
+
+        # Nothing changed: the probe short-circuits both sources
+        assert await search_engine.update_search_index() == {
+            "indexed": 0,
+            "deleted": 0,
+        }
+
+        conv_id = await fully_populated_db.store_conversation(
+            content="New conversation about pytest fixtures",
+            metadata={"project": "webapp-backend"},
+        )
+        assert await search_engine.update_search_index() == {
+            "indexed": 1,
+            "deleted": 0,
+        }
+
+        await fully_populated_db.delete_conversation(conv_id)
+        assert await search_engine.update_search_index() == {
+            "indexed": 0,
+            "deleted": 1,
+        }
+        count = fully_populated_db.conn.execute(
+            "SELECT COUNT(*) FROM search_index"
+        ).fetchone()[0]
+        assert count == 8
+
+    @pytest.mark.asyncio
+    async def test_update_search_index_writes_in_batches(
+        self, search_engine, fully_populated_db
+    ):
+        """Changed rows are paged and written one batch per statement."""
+        with (
+            patch("session_buddy.advanced_search._INDEX_BATCH_SIZE", 2),
+            patch.object(
+                search_engine,
+                "_upsert_index_rows",
+                wraps=search_engine._upsert_index_rows,
+            ) as upsert,
+        ):
+            result = await search_engine.update_search_index()
+
+        assert result["indexed"] == 8
+        # 5 conversations -> 3 batches, 3 reflections -> 2 batches
+        assert upsert.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_background_indexing(self, search_engine, fully_populated_db):
+        """The background task indexes without a search triggering it."""
+        search_engine.start_background_indexing(interval_seconds=0.01)
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if fully_populated_db.conn.execute(
+                    "SELECT COUNT(*) FROM search_index_state"
+                ).fetchone()[0]:
+                    break
+        finally:
+            await search_engine.stop_background_indexing()
+
+        assert search_engine._index_task is None
+        count = fully_populated_db.conn.execute(
+            "SELECT COUNT(*) FROM search_index"
+        ).fetchone()[0]
+        assert count == 8
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_bm25(self, search_engine, fully_populated_db):
+        """Relevance ordering and scores come from the full-text index."""
+        dense = await fully_populated_db.store_conversation(
+            content="tokenizer tokenizer tokenizer benchmarks",
+            metadata={"project": "webapp-backend"},
+        )
+        sparse = await fully_populated_db.store_conversation(
+            content="A long discussion that mentions the tokenizer only once "
+            "among many unrelated words about deployment and caching",
+            metadata={"project": "webapp-backend"},
+        )
+        await search_engine.update_search_index()
+
+        results = await search_engine._execute_search(
+            "tokenizer", "relevance", limit=10, offset=0
+        )
+
+        assert [r.content_id for r in results] == [dense, sparse]
+        assert results[0].score == 1.0
+        assert 0 < results[1].score < 1.0
+
+        await fully_populated_db.delete_conversation(dense)
+        await search_engine.update_search_index()
+        results = await search_engine._execute_search(
+            "tokenizer", "relevance", limit=10, offset=0
+        )
+        assert [r.content_id for r in results] == [sparse]
+
 
 # =====================================
 # Test Build Methods
@@ -0,0 +1,244 @@
+"""Tests for the streaming Akosha export pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import duckdb
+import httpx
+import pytest
+
+from session_buddy.storage.akosha_config import AkoshaSyncConfig
+from session_buddy.storage.akosha_export import (
+    BatchOutcome,
+    ExportBatch,
+    ExportStream,
+    Watermark,
+    decode_embedding,
+    encode_embedding,
+    read_page,
+    run_pipelined,
+)
+from session_buddy.storage.akosha_sync import HttpSyncMethod
+
+STREAM = ExportStream(name="items", table="items", columns=("id", "body", "timestamp"))
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)  # noqa: DTZ001 - TIMESTAMP columns are naive
+
+
+@pytest.fixture
+def conn() -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE items (id TEXT PRIMARY KEY, body TEXT, timestamp TIMESTAMP)"
+    )
+    # Two rows share a timestamp; one has none
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?, ?)",
+        [
+            ("b", "second", BASE_TIME + timedelta(seconds=1)),
+            ("a", "first", BASE_TIME + timedelta(seconds=1)),
+            ("c", "third", BASE_TIME + timedelta(seconds=2)),
+            ("z", "undated", None),
+        ],
+    )
+    return conn
+
+
+def _batch(index: int) -> ExportBatch:
+    return ExportBatch(
+        index=index,
+        bodies=[b"{}"],
+        ids=[str(index)],
+        watermark=Watermark(timestamp=f"t{index}", id=str(index)),
+    )
+
+
+async def _batches(count: int):
+    for index in range(count):
+        yield _batch(index)
+
+
+class TestEmbeddingEncoding:
+    def test_round_trip(self) -> None:
+        values = [0.25, -1.5, 0.0, 3.0]
+        encoded = encode_embedding(values)
+
+        assert isinstance(encoded, str)
+        assert decode_embedding(encoded) == values
+
+    def test_float16_is_smaller_than_json(self) -> None:
+        values = [0.123456789] * 384
+        assert len(encode_embedding(values)) * 4 < len(json.dumps(values))
+
+    def test_missing_embedding(self) -> None:
+        assert encode_embedding(None) is None
+        assert encode_embedding([]) is None
+
+
+class TestReadPage:
+    def test_keyset_pages_cover_every_row_once(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        seen: list[str] = []
+        after = None
+        while True:
+            rows, watermark = read_page(conn, STREAM, after, 2)
+            if watermark is None:
+                break
+            seen.extend(row["id"] for row in rows)
+            after = watermark
+
+        # NULL timestamps sort first, ties are broken by id
+        assert seen == ["z", "a", "b", "c"]
+
+    def test_resumes_after_watermark(self, conn: duckdb.DuckDBPyConnection) -> None:
+        after = Watermark(
+            timestamp=(BASE_TIME + timedelta(seconds=1)).isoformat(), id="a"
+        )
+
+        rows, watermark = read_page(conn, STREAM, after, 10)
+
+        assert [row["id"] for row in rows] == ["b", "c"]
+        assert watermark == Watermark(
+            timestamp=(BASE_TIME + timedelta(seconds=2)).isoformat(), id="c"
+        )
+
+
+class TestRunPipelined:
+    @pytest.mark.asyncio
+    async def test_commits_in_order_with_bounded_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+        committed: list[str] = []
+
+        async def _upload(batch: ExportBatch) -> BatchOutcome:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (5 - batch.index))
+            in_flight -= 1
+            return BatchOutcome(ok=True, stored=1)
+
+        result = await run_pipelined(
+            _batches(5),
+            _upload,
+            concurrency=3,
+            on_commit=lambda watermark: committed.append(watermark.id),
+        )
+
+        assert peak == 3
+        assert committed == ["0", "1", "2", "3", "4"]
+        assert result.stored == 5
+        assert result.complete
+        assert result.watermark == _batch(4).watermark
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_stops_watermark(self) -> None:
+        committed: list[str] = []
+
+        async def _upload(batch: ExportBatch) -> BatchOutcome:
+            if batch.index == 1:
+                return BatchOutcome(ok=False, errors=[{"batch": 1, "error": "boom"}])
+            return BatchOutcome(ok=True, stored=1)
+
+        result = await run_pipelined(
+            _batches(10),
+            _upload,
+            concurrency=2,
+            on_commit=lambda watermark: committed.append(watermark.id),
+        )
+
+        assert committed == ["0"]
+        assert not result.complete
+        assert result.errors == [{"batch": 1, "error": "boom"}]
+        # No new batches are started once one failed
+        assert result.batches < 10
+
+
+class TestHttpSyncExport:
+    @pytest.fixture
+    def http_sync(self, tmp_path: Path) -> HttpSyncMethod:
+        sync = HttpSyncMethod(AkoshaSyncConfig(system_id="test-system"))
+        sync._last_sync_timestamp = {}
+        sync._sync_state_file = tmp_path / "state.json"
+        sync.reflection_db_path = tmp_path / "reflection.duckdb"
+        db = duckdb.connect(str(sync.reflection_db_path))
+        db.execute(
+            """
+            CREATE TABLE conversations_v2 (
+                id TEXT PRIMARY KEY, content TEXT, embedding FLOAT[4],
+                category TEXT, subcategory TEXT, importance_score REAL,
+                memory_tier TEXT, access_count INTEGER, last_accessed TIMESTAMP,
+                project TEXT, namespace TEXT, timestamp TIMESTAMP, session_id TEXT,
+                user_id TEXT, searchable_content TEXT, reasoning TEXT,
+                source_type TEXT
+            )
+            """
+        )
+        for i in range(5):
+            db.execute(
+                "INSERT INTO conversations_v2 (id, content, embedding, timestamp) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    f"c{i}",
+                    f"content {i}",
+                    [0.5, 1.0, -2.0, 0.0],
+                    BASE_TIME + timedelta(seconds=i),
+                ],
+            )
+        db.close()
+        return sync
+
+    @pytest.mark.asyncio
+    async def test_sync_resumes_after_failed_batch(
+        self, http_sync: HttpSyncMethod
+    ) -> None:
+        sent: list[list[str]] = []
+        fail_batch = {"c2"}
+
+        async def _post(client, akosha_url, body: bytes) -> dict:
+            memories = json.loads(body)["params"]["arguments"]["memories"]
+            ids = [memory["memory_id"] for memory in memories]
+            sent.append(ids)
+            assert memories[0]["embedding_encoding"] == "float16-le-base64"
+            assert decode_embedding(memories[0]["embedding"]) == [0.5, 1.0, -2.0, 0.0]
+            if fail_batch & set(ids):
+                raise httpx.HTTPStatusError(
+                    "server error", request=Mock(), response=Mock(status_code=500)
+                )
+            return {"status": "completed", "stored": len(ids)}
+
+        http_sync._post_mcp = _post  # type: ignore[method-assign]
+
+        first = await http_sync._sync_conversations(
+            client=Mock(),
+            akosha_url="http://akosha",
+            batch_size=2,
+            incremental=True,
+            concurrency=1,
+        )
+        assert first["count"] == 2
+        assert first["errors"]
+        assert http_sync._last_sync_timestamp["conversations_id"] == "c1"
+        assert (
+            json.loads(http_sync._sync_state_file.read_text())["conversations_id"]
+            == "c1"
+        )
+
+        fail_batch.clear()
+        sent.clear()
+        second = await http_sync._sync_conversations(
+            client=Mock(),
+            akosha_url="http://akosha",
+            batch_size=2,
+            incremental=True,
+            concurrency=2,
+        )
+        assert sent == [["c2", "c3"], ["c4"]]
+        assert second == {"count": 3, "bytes": second["bytes"], "errors": []}
+        assert http_sync._last_sync_timestamp["conversations_id"] == "c4"
@@ -308,22 +308,13 @@ class TestHttpSyncMethod:
 
         http_sync = HttpSyncMethod(sample_config)
 
-        # Mock _batch_upload_memories to raise an exception,
-        # simulating an HTTP failure during upload
+        # Mock _export_stream to raise an exception,
+        # simulating an unexpected failure during upload
         with patch.object(
             http_sync,
-            "_batch_upload_memories",
+            "_export_stream",
             new_callable=AsyncMock,
             side_effect=Exception("Connection refused"),
-        ), patch.object(
-            http_sync,
-            "_fetch_conversations",
-            new_callable=AsyncMock,
-            return_value=[{
-                "id": "test-1",
-                "content": "test content",
-                "timestamp": "2026-01-01T00:00:00Z",
-            }],
         ):
             with pytest.raises(HTTPSyncError):
                 await http_sync.sync()
@@ -0,0 +1,157 @@
+"""Tests for content-defined chunked database backups."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from session_buddy.storage.akosha_config import AkoshaSyncConfig
+from session_buddy.storage.chunked_backup import (
+    ChunkParams,
+    LocalChunkBackend,
+    decode_chunk,
+    iter_chunks,
+    prepare_chunk,
+)
+from session_buddy.storage.cloud_sync import CloudSyncMethod
+from session_buddy.storage.sync_protocol import CloudRestoreError
+
+PARAMS = ChunkParams(min_size=256, avg_size=1024, max_size=4096)
+
+
+def _random_bytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+class TestChunking:
+    def test_chunks_reassemble_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.bin"
+        data = _random_bytes(200_000)
+        path.write_bytes(data)
+
+        chunks = list(iter_chunks(path, PARAMS, read_size=10_000))
+
+        assert b"".join(chunks) == data
+        assert all(len(chunk) <= PARAMS.max_size for chunk in chunks)
+        assert all(len(chunk) >= PARAMS.min_size for chunk in chunks[:-1])
+
+    def test_boundaries_do_not_depend_on_read_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(_random_bytes(100_000))
+
+        small = list(iter_chunks(path, PARAMS, read_size=777))
+        large = list(iter_chunks(path, PARAMS, read_size=1 << 20))
+
+        assert small == large
+
+    def test_insert_only_changes_nearby_chunks(self, tmp_path: Path) -> None:
+        data = _random_bytes(200_000)
+        before = tmp_path / "before.bin"
+        after = tmp_path / "after.bin"
+        before.write_bytes(data)
+        after.write_bytes(data[:100_000] + b"inserted" + data[100_000:])
+
+        old = set(iter_chunks(before, PARAMS))
+        new = list(iter_chunks(after, PARAMS))
+
+        changed = [chunk for chunk in new if chunk not in old]
+        assert 1 <= len(changed) <= 2
+
+    def test_prepare_and_decode_round_trip(self) -> None:
+        raw = b"page" * 1000
+        chunk = prepare_chunk(raw, known=set(), compress=True)
+
+        assert chunk.data is not None
+        assert len(chunk.data) < len(raw)
+        assert decode_chunk(chunk.data, digest=chunk.digest, compressed=True) == raw
+        assert prepare_chunk(raw, known={chunk.digest}, compress=True).data is None
+
+    def test_decode_rejects_corrupt_chunk(self) -> None:
+        chunk = prepare_chunk(b"page", known=set(), compress=False)
+
+        with pytest.raises(ValueError, match="corrupt"):
+            decode_chunk(b"pagf", digest=chunk.digest, compressed=False)
+
+
+class TestCloudChunkedUpload:
+    @pytest.fixture
+    def cloud_sync(self, tmp_path: Path) -> CloudSyncMethod:
+        config = AkoshaSyncConfig(
+            cloud_bucket="test-bucket",
+            system_id="test-system",
+            chunk_size_mb=1,
+        )
+        with patch("session_buddy.storage.cloud_sync._get_s3_adapter_class"):
+            sync = CloudSyncMethod(config)
+        sync._s3_adapter = LocalChunkBackend(tmp_path / "bucket")
+        sync._chunk_index_file = tmp_path / "chunk_index.json"
+        sync.reflection_db_path = tmp_path / "reflection.duckdb"
+        sync.knowledge_graph_db_path = tmp_path / "missing.duckdb"
+        return sync
+
+    @staticmethod
+    def _stored_chunks(root: Path) -> set[Path]:
+        return set((root / "bucket" / "systems").glob("*/chunks/*/*"))
+
+    @pytest.mark.asyncio
+    async def test_second_sync_uploads_only_changed_chunks(
+        self, cloud_sync: CloudSyncMethod, tmp_path: Path
+    ) -> None:
+        data = _random_bytes(3 * 1024 * 1024)
+        cloud_sync.reflection_db_path.write_bytes(data)
+
+        first = await cloud_sync.sync(upload_knowledge_graph=False)
+        first_chunks = self._stored_chunks(tmp_path)
+        assert first["success"] is True
+        assert len(first_chunks) > 3
+
+        # Overwrite one 4 KiB page in the middle
+        page = 1024 * 1024
+        cloud_sync.reflection_db_path.write_bytes(
+            data[:page] + b"\0" * 4096 + data[page + 4096 :]
+        )
+        second = await cloud_sync.sync(upload_knowledge_graph=False)
+        new_chunks = self._stored_chunks(tmp_path) - first_chunks
+
+        assert second["success"] is True
+        assert 1 <= len(new_chunks) <= 2
+        assert second["bytes_transferred"] < first["bytes_transferred"] / 2
+
+    @pytest.mark.asyncio
+    async def test_restore_round_trip(
+        self, cloud_sync: CloudSyncMethod, tmp_path: Path
+    ) -> None:
+        data = _random_bytes(2 * 1024 * 1024, seed=1)
+        cloud_sync.reflection_db_path.write_bytes(data)
+        result = await cloud_sync.sync(upload_knowledge_graph=False)
+
+        restored = await cloud_sync.restore_database(
+            result["upload_id"], "reflection.duckdb", tmp_path / "restored.duckdb"
+        )
+
+        assert restored.read_bytes() == data
+        manifest_path = next((tmp_path / "bucket").rglob("manifest.json"))
+        entry = json.loads(manifest_path.read_text())["files"][0]
+        assert entry["format"] == "chunked"
+        assert entry["size_bytes"] == len(data)
+        assert sum(chunk["size"] for chunk in entry["chunks"]) == len(data)
+
+    @pytest.mark.asyncio
+    async def test_restore_rejects_corrupt_chunk(
+        self, cloud_sync: CloudSyncMethod, tmp_path: Path
+    ) -> None:
+        cloud_sync.reflection_db_path.write_bytes(_random_bytes(100_000, seed=2))
+        result = await cloud_sync.sync(upload_knowledge_graph=False)
+        next(iter(self._stored_chunks(tmp_path))).write_bytes(b"garbage")
+        dest = tmp_path / "restored.duckdb"
+
+        with pytest.raises(CloudRestoreError):
+            await cloud_sync.restore_database(
+                result["upload_id"], "reflection.duckdb", dest
+            )
+        assert not dest.exists()
+        assert not dest.with_name(f"{dest.name}.restore").exists()
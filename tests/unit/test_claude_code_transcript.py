@@ -8,16 +8,19 @@ Covers:
   provenance columns, links assistant turns to user turns, skips disallowed
   types / oversized payloads / malformed lines.
 - ClaudeCodeTranscriptIngester.ingest_directory: glob over *.jsonl.
+- Checkpointed re-runs, chunked writes, persisted parent ids and watch mode.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import types
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import duckdb
 import pytest
 
 from session_buddy.ingesters import claude_code_transcript as module
@@ -45,12 +48,28 @@ class TestIterJsonlLines:
     def test_reads_non_empty_lines(self, tmp_path: Path) -> None:
         p = tmp_path / "sample.jsonl"
         p.write_text('{"a":1}\n{"b":2}\n\n   \n{"c":3}\n')
-        assert _iter_jsonl_lines(p) == ['{"a":1}', '{"b":2}', '{"c":3}']
+        lines = [line for line, _ in _iter_jsonl_lines(p) if line]
+        assert lines == ['{"a":1}', '{"b":2}', '{"c":3}']
+
+    def test_yields_end_offsets_and_resumes(self, tmp_path: Path) -> None:
+        p = tmp_path / "sample.jsonl"
+        p.write_text('{"a":1}\n{"b":2}\n')
+        first = next(_iter_jsonl_lines(p))
+        assert first == ('{"a":1}', 8)
+        assert list(_iter_jsonl_lines(p, 8)) == [('{"b":2}', 16)]
+
+    def test_holds_back_partially_written_tail(self, tmp_path: Path) -> None:
+        p = tmp_path / "sample.jsonl"
+        p.write_text('{"a":1}\n{"b":')
+        assert list(_iter_jsonl_lines(p)) == [('{"a":1}', 8)]
+        # A complete record without a trailing newline is consumed
+        p.write_text('{"a":1}\n{"b":2}')
+        assert list(_iter_jsonl_lines(p))[-1] == ('{"b":2}', 15)
 
     def test_empty_file_returns_empty_list(self, tmp_path: Path) -> None:
         p = tmp_path / "empty.jsonl"
         p.write_text("")
-        assert _iter_jsonl_lines(p) == []
+        assert list(_iter_jsonl_lines(p)) == []
 
 
 class TestSafeParse:
@@ -268,13 +287,17 @@ def _make_record(
 def mock_db() -> MagicMock:
     """Mock for ReflectionDatabaseAdapterOneiric."""
     db = MagicMock()
-    counter = {"n": 0}
+    db.conn = duckdb.connect()
+    db.stored = []
 
-    async def _store(**kwargs: Any) -> str:
-        counter["n"] += 1
-        return f"row-{counter['n']:04d}-{kwargs['content'][:8]}"
+    async def _store(records: list[dict[str, Any]]) -> list[str]:
+        ids = []
+        for record in records:
+            db.stored.append(record)
+            ids.append(f"row-{len(db.stored):04d}-{record['content'][:8]}")
+        return ids
 
-    db.store_conversation = AsyncMock(side_effect=_store)
+    db.store_conversations_bulk = AsyncMock(side_effect=_store)
     return db
 
 
@@ -291,8 +314,8 @@ class TestIngestFile:
         n = await ingester.ingest_file(path)
 
         assert n == 1
-        mock_db.store_conversation.assert_awaited_once()
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        mock_db.store_conversations_bulk.assert_awaited_once()
+        [kwargs] = mock_db.stored
         assert kwargs["content"] == "first turn"
         assert kwargs["source_type"] == SOURCE_TYPE == "claude_code"
         assert kwargs["turn_parent_id"] is None  # user turns have no parent
@@ -325,19 +348,43 @@ class TestIngestFile:
 
         assert n == 2
 
-        # First call (user) — no turn parent
-        first_call = mock_db.store_conversation.await_args_list[0]
-        first_kwargs = first_call.kwargs
+        # Both turns go out in one bulk write
+        mock_db.store_conversations_bulk.assert_awaited_once()
+        first_kwargs, second_kwargs = mock_db.stored
         assert first_kwargs["turn_parent_id"] is None
 
-        # Second call (assistant) — must reference the user row id
-        second_kwargs = mock_db.store_conversation.await_args_list[1].kwargs
-        # Reconstruct the user row id from the mock side effect:
-        # the first call content is "ask" → row id was "row-0001-ask"
-        user_row_id = f"row-0001-{first_kwargs['content'][:8]}"
-        assert second_kwargs["turn_parent_id"] == user_row_id
+        # The assistant turn references the user row by its position
+        assert second_kwargs["turn_parent_index"] == 0
+        assert second_kwargs["turn_parent_id"] is None
         # And the assistant record kept its own uuid chain in metadata
         assert second_kwargs["metadata"]["parent_uuid_chain"] == ["user-uuid-1"]
+        # The user row id resolves parents in later files
+        assert ingester._parent_id_by_uuid["user-uuid-1"] == "row-0001-ask"
+
+    async def test_parent_from_earlier_file_is_linked_by_id(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        first = tmp_path / "a.jsonl"
+        first.write_text(
+            _write_record(
+                _make_record(type_="user", content="ask", record_uuid="user-uuid-2")
+            )
+        )
+        second = tmp_path / "b.jsonl"
+        second.write_text(
+            _write_record(
+                _make_record(
+                    type_="assistant", content="answer", parent_uuid="user-uuid-2"
+                )
+            )
+        )
+
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        await ingester.ingest_file(first)
+        await ingester.ingest_file(second)
+
+        assert mock_db.stored[-1]["turn_parent_id"] == "row-0001-ask"
+        assert "turn_parent_index" not in mock_db.stored[-1]
 
     async def test_assistant_with_unknown_parent_uuid_gets_none(
         self, mock_db: MagicMock, tmp_path: Path
@@ -354,7 +401,7 @@ class TestIngestFile:
         ingester = ClaudeCodeTranscriptIngester(db=mock_db)
         await ingester.ingest_file(path)
 
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert kwargs["turn_parent_id"] is None
 
     async def test_skips_unknown_record_types(
@@ -373,7 +420,7 @@ class TestIngestFile:
 
         assert n == 1
         # only the user record made it through
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert kwargs["content"] == "keep me"
 
     async def test_skips_malformed_jsonl_lines(
@@ -392,7 +439,7 @@ class TestIngestFile:
         n = await ingester.ingest_file(path)
 
         assert n == 1
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert kwargs["content"] == "survive"
 
     async def test_skips_records_without_content(
@@ -440,7 +487,7 @@ class TestIngestFile:
         n = await ingester.ingest_file(path, since_timestamp="2026-01-01T00:00:00Z")
 
         assert n == 1
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert kwargs["content"] == "new"
 
     async def test_metadata_marks_redaction_applied(
@@ -460,7 +507,7 @@ class TestIngestFile:
         ingester = ClaudeCodeTranscriptIngester(db=mock_db)
         await ingester.ingest_file(path)
 
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert "AKIA" not in kwargs["content"]
         assert "[REDACTED]" in kwargs["content"]
         assert kwargs["metadata"]["redaction_applied"] is True
@@ -474,7 +521,7 @@ class TestIngestFile:
         ingester = ClaudeCodeTranscriptIngester(db=mock_db)
         await ingester.ingest_file(path)
 
-        kwargs = mock_db.store_conversation.await_args.kwargs
+        kwargs = mock_db.stored[-1]
         assert kwargs["metadata"].get("redaction_applied") is None or (
             kwargs["metadata"].get("redaction_applied") is False
         )
@@ -507,7 +554,103 @@ class TestIngestDirectory:
         ingester = ClaudeCodeTranscriptIngester(db=mock_db)
         n = await ingester.ingest_directory(tmp_path)
         assert n == 0
-        mock_db.store_conversation.assert_not_called()
+        mock_db.store_conversations_bulk.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestResumableIngest:
+    async def test_rerun_reads_only_appended_records(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "transcript.jsonl"
+        path.write_text(_write_record(_make_record(type_="user", content="one")) + "\n")
+
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        assert await ingester.ingest_file(path) == 1
+        assert await ingester.ingest_file(path) == 0
+        mock_db.store_conversations_bulk.assert_awaited_once()
+
+        with path.open("a") as fh:
+            fh.write(_write_record(_make_record(type_="user", content="two")) + "\n")
+
+        # A fresh instance resumes from the persisted checkpoint
+        assert await ClaudeCodeTranscriptIngester(db=mock_db).ingest_file(path) == 1
+        assert [row["content"] for row in mock_db.stored] == ["one", "two"]
+
+    async def test_truncated_file_starts_over(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "transcript.jsonl"
+        path.write_text(
+            _write_record(_make_record(type_="user", content="a long first turn"))
+            + "\n"
+        )
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        await ingester.ingest_file(path)
+
+        path.write_text(_write_record(_make_record(type_="user", content="b")) + "\n")
+
+        assert await ingester.ingest_file(path) == 1
+        assert mock_db.stored[-1]["content"] == "b"
+
+    async def test_resume_false_rereads_file(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "transcript.jsonl"
+        path.write_text(_write_record(_make_record(type_="user", content="one")))
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        await ingester.ingest_file(path)
+
+        assert await ingester.ingest_file(path, resume=False) == 1
+
+    async def test_parents_link_across_chunks_and_instances(
+        self, mock_db: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(module, "_CHUNK_RECORDS", 1)
+        path = tmp_path / "transcript.jsonl"
+        path.write_text(
+            _write_record(_make_record(type_="user", content="ask", record_uuid="u-1"))
+            + "\n"
+            + _write_record(
+                _make_record(type_="assistant", content="answer", parent_uuid="u-1")
+            )
+            + "\n"
+        )
+
+        await ClaudeCodeTranscriptIngester(db=mock_db).ingest_file(path)
+
+        assert mock_db.store_conversations_bulk.await_count == 2
+        assert mock_db.stored[1]["turn_parent_id"] == "row-0001-ask"
+        # The mapping is persisted, not only held by the instance
+        fresh = ClaudeCodeTranscriptIngester(db=mock_db)
+        assert fresh._resolve_turn_parent({"parentUuid": "u-1"}) == "row-0001-ask"
+
+    async def test_parent_cache_is_bounded(
+        self, mock_db: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(module, "_MAX_TRACKED_PARENTS", 2)
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        for i in range(3):
+            ingester._track_parent(f"u-{i}", f"row-{i}")
+
+        assert list(ingester._parent_id_by_uuid) == ["u-1", "u-2"]
+
+    async def test_watch_tails_project_directories(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        project = tmp_path / "-home-user-repo"
+        project.mkdir()
+        (project / "s.jsonl").write_text(
+            _write_record(_make_record(type_="user", content="live")) + "\n"
+        )
+        stop = asyncio.Event()
+        stop.set()
+
+        ingester = ClaudeCodeTranscriptIngester(db=mock_db)
+        n = await ingester.watch(tmp_path, poll_interval=0.01, stop_event=stop)
+
+        assert n == 1
+        assert mock_db.stored[0]["content"] == "live"
 
 
 # ============================================================================
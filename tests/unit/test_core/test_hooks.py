@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from session_buddy.core.hooks import (
+    NO_CONTEXT_KEYS,
     DefaultCodeFormatter,
     Hook,
     HookContext,
@@ -955,5 +956,177 @@ class TestHooksManagerListHooks:
         assert result == {}
 
 
+class TestHooksManagerConcurrency:
+    """Test dependency-aware concurrent hook execution."""
+
+    @staticmethod
+    def _tracking_handler(name: str, events: list[str], delay: float = 0.02, **modified):
+        async def handler(ctx: HookContext) -> HookResult:
+            events.append(f"start:{name}")
+            await asyncio.sleep(delay)
+            events.append(f"end:{name}")
+            return HookResult(success=True, modified_context=modified or None)
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_independent_hooks_run_concurrently(self):
+        """Hooks with disjoint declared keys overlap."""
+        manager = HooksManager()
+        events: list[str] = []
+        for priority, name in enumerate(["a", "b", "c"]):
+            await manager.register_hook(
+                Hook(
+                    name=name,
+                    hook_type=HookType.POST_CHECKPOINT,
+                    priority=priority,
+                    handler=self._tracking_handler(name, events, **{name: priority}),
+                    reads=NO_CONTEXT_KEYS,
+                    writes=frozenset({name}),
+                )
+            )
+
+        context = _make_context()
+        results = await manager.execute_hooks(HookType.POST_CHECKPOINT, context)
+
+        assert events[:3] == ["start:a", "start:b", "start:c"]
+        assert [r.modified_context for r in results] == [{"a": 0}, {"b": 1}, {"c": 2}]
+        assert context.metadata == {"a": 0, "b": 1, "c": 2}
+
+    @pytest.mark.asyncio
+    async def test_reader_waits_for_writer_and_undeclared_hooks_serialize(self):
+        """Conflicting and undeclared hooks keep priority order."""
+        manager = HooksManager()
+        events: list[str] = []
+        seen: dict[str, object] = {}
+
+        async def reader(ctx: HookContext) -> HookResult:
+            seen["score"] = ctx.metadata.get("score")
+            events.append("reader")
+            return HookResult(success=True)
+
+        await manager.register_hook(
+            Hook(
+                name="writer",
+                hook_type=HookType.POST_CHECKPOINT,
+                priority=1,
+                handler=self._tracking_handler("writer", events, score=90),
+                reads=NO_CONTEXT_KEYS,
+                writes=frozenset({"score"}),
+            )
+        )
+        await manager.register_hook(
+            Hook(
+                name="reader",
+                hook_type=HookType.POST_CHECKPOINT,
+                priority=2,
+                handler=reader,
+                reads=frozenset({"score"}),
+                writes=NO_CONTEXT_KEYS,
+            )
+        )
+        await manager.register_hook(
+            Hook(
+                name="legacy",
+                hook_type=HookType.POST_CHECKPOINT,
+                priority=3,
+                handler=self._tracking_handler("legacy", events, delay=0),
+            )
+        )
+
+        await manager.execute_hooks(HookType.POST_CHECKPOINT, _make_context())
+
+        assert seen == {"score": 90}
+        assert events == ["start:writer", "end:writer", "reader", "start:legacy", "end:legacy"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_dependency_is_respected(self):
+        """depends_on orders otherwise independent hooks."""
+        manager = HooksManager()
+        events: list[str] = []
+        for priority, name in enumerate(["first", "second"]):
+            await manager.register_hook(
+                Hook(
+                    name=name,
+                    hook_type=HookType.POST_CHECKPOINT,
+                    priority=priority,
+                    handler=self._tracking_handler(name, events),
+                    reads=NO_CONTEXT_KEYS,
+                    writes=NO_CONTEXT_KEYS,
+                    depends_on=("first",) if name == "second" else (),
+                )
+            )
+
+        await manager.execute_hooks(HookType.POST_CHECKPOINT, _make_context())
+
+        assert events == ["start:first", "end:first", "start:second", "end:second"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_hook_and_records_latency(self):
+        """A hook exceeding its timeout is cancelled and reported as failed."""
+        manager = HooksManager()
+        events: list[str] = []
+        error_handler = AsyncMock()
+        await manager.register_hook(
+            Hook(
+                name="slow",
+                hook_type=HookType.POST_CHECKPOINT,
+                priority=1,
+                handler=self._tracking_handler("slow", events, delay=5),
+                error_handler=error_handler,
+                timeout=0.01,
+            )
+        )
+
+        results = await manager.execute_hooks(HookType.POST_CHECKPOINT, _make_context())
+
+        assert results[0].success is False
+        assert "timed out" in results[0].error
+        assert events == ["start:slow"]
+        error_handler.assert_awaited_once()
+        stats = manager.get_latency_stats()[HookType.POST_CHECKPOINT]["slow"]
+        assert stats["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_hook_is_not_awaited(self):
+        """Background post hooks run after execute_hooks returns."""
+        manager = HooksManager()
+        events: list[str] = []
+        await manager.register_hook(
+            Hook(
+                name="background",
+                hook_type=HookType.POST_CHECKPOINT,
+                priority=1,
+                handler=self._tracking_handler("background", events, extra=True),
+                background=True,
+            )
+        )
+
+        context = _make_context()
+        results = await manager.execute_hooks(HookType.POST_CHECKPOINT, context)
+
+        assert results == []
+        assert "end:background" not in events
+        await manager.wait_for_background_hooks()
+        assert events == ["start:background", "end:background"]
+        assert "extra" not in context.metadata
+
+    @pytest.mark.asyncio
+    async def test_background_pre_hook_is_rejected(self):
+        """Pre-operation hooks cannot be fire-and-forget."""
+        manager = HooksManager()
+
+        with pytest.raises(ValueError, match="background"):
+            await manager.register_hook(
+                Hook(
+                    name="bad",
+                    hook_type=HookType.PRE_CHECKPOINT,
+                    priority=1,
+                    handler=AsyncMock(),
+                    background=True,
+                )
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
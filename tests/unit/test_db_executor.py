@@ -0,0 +1,135 @@
+"""Tests for the DuckDB read/write executor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import duckdb
+import pytest
+
+from session_buddy.utils.db_executor import DuckDBExecutor, LatencyHistogram
+
+
+@pytest.fixture
+def executor():
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR)")
+    executor = DuckDBExecutor(conn, read_workers=2, name="test")
+    yield executor
+    executor.close()
+    conn.close()
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_percentiles(self) -> None:
+        histogram = LatencyHistogram()
+        for elapsed_ms in (0.5, 0.7, 3.0, 40.0, 5000.0):
+            histogram.observe(elapsed_ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"]["le_1ms"] == 2
+        assert snapshot["buckets"]["le_5ms"] == 1
+        assert snapshot["buckets"]["le_50ms"] == 1
+        assert snapshot["buckets"]["inf"] == 1
+        assert snapshot["p50_ms"] == 5.0
+        assert snapshot["p99_ms"] == 5000.0
+        assert snapshot["max_ms"] == 5000.0
+
+    def test_empty(self) -> None:
+        snapshot = LatencyHistogram().snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["p95_ms"] == 0.0
+
+
+class TestDuckDBExecutor:
+    @pytest.mark.asyncio
+    async def test_write_then_read(self, executor: DuckDBExecutor) -> None:
+        await executor.execute(
+            "INSERT INTO items VALUES (?, ?)", [1, "one"], label="insert"
+        )
+
+        rows = await executor.fetchall("SELECT id, name FROM items", label="select")
+        assert rows == [(1, "one")]
+        assert await executor.fetchone("SELECT count(*) FROM items") == (1,)
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back(self, executor: DuckDBExecutor) -> None:
+        def _insert_twice(conn) -> None:
+            conn.execute("INSERT INTO items VALUES (1, 'one')")
+            conn.execute("INSERT INTO items VALUES (1, 'again')")
+
+        with pytest.raises(duckdb.ConstraintException):
+            await executor.write(_insert_twice, transaction=True)
+
+        assert await executor.fetchone("SELECT count(*) FROM items") == (0,)
+        assert executor.get_stats()["pools"]["write"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently_on_separate_cursors(
+        self, executor: DuckDBExecutor
+    ) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        cursors: list[object] = []
+
+        def _wait(conn) -> None:
+            cursors.append(conn)
+            barrier.wait()
+
+        await asyncio.gather(executor.read(_wait), executor.read(_wait))
+
+        assert len({id(cursor) for cursor in cursors}) == 2
+        assert all(cursor is not executor.conn for cursor in cursors)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, executor: DuckDBExecutor) -> None:
+        ticks = 0
+
+        async def _tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(_tick())
+        await executor.read(lambda _conn: time.sleep(0.1))
+        ticker.cancel()
+
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_on_connect_runs_once_per_worker(self) -> None:
+        conn = duckdb.connect()
+        configured: list[object] = []
+        executor = DuckDBExecutor(conn, read_workers=1, on_connect=configured.append)
+
+        for _ in range(3):
+            await executor.fetchone("SELECT 1")
+        await executor.execute("CREATE TABLE t (x INTEGER)")
+
+        assert len(configured) == 2
+        executor.close()
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_labels(self, executor: DuckDBExecutor) -> None:
+        await executor.fetchone("SELECT 1", label="ping")
+        await executor.fetchone("SELECT 1", label="ping")
+
+        stats = executor.get_stats()
+        assert stats["read_workers"] == 2
+        assert stats["latency"]["ping"]["count"] == 2
+        read_pool = stats["pools"]["read"]
+        assert read_pool["completed"] == 2
+        assert read_pool["queued"] == 0
+        assert read_pool["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_executor_rejects_work(self, executor: DuckDBExecutor) -> None:
+        await executor.fetchone("SELECT 1")
+        executor.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await executor.fetchone("SELECT 1")
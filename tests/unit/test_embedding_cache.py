@@ -253,3 +253,78 @@ class TestEmbeddingCache:
         print(f"\nTotal cached queries: {len(common_queries)}")
         print(f"Total time for {len(common_queries)} cached queries: {cached_time:.2f}ms")
         print(f"Average time per cached query: {cached_time / len(common_queries):.3f}ms")
+
+
+class TestTwoTierEmbeddingCache:
+    """Byte-bounded memory LRU plus the persistent DuckDB tier."""
+
+    def test_lru_evicts_by_bytes_in_recency_order(self) -> None:
+        import numpy as np
+
+        cache = embeddings_module._EmbeddingLRUCache(max_bytes=3 * 16)
+        for key in ("a", "b", "c"):
+            cache.put(key, np.zeros(4, dtype=np.float32))
+        cache.get("a")  # "b" is now least recently used
+
+        evicted = cache.put("d", np.zeros(4, dtype=np.float32))
+
+        assert evicted == 1
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.nbytes == 3 * 16
+
+    def test_cache_key_includes_model_and_dimension(self) -> None:
+        key = embeddings_module._cache_key("hello")
+
+        assert key.startswith(
+            f"{embeddings_module.EMBEDDING_MODEL_ID}:{embeddings_module.EMBEDDING_DIM}:"
+        )
+        assert "hello" not in key
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_memory_eviction(
+        self, stub_embedding_provider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clear_embedding_cache()
+        first = await embeddings_module.generate_embedding("persisted text")
+
+        # Simulate a restart: the in-process tier is empty, the file is not.
+        with embeddings_module._embedding_cache_lock:
+            embeddings_module._embedding_cache.clear()
+
+        calls: list[str] = []
+
+        async def failing_try(text: str) -> None:
+            calls.append(text)
+
+        monkeypatch.setattr(
+            embeddings_module, "_try_http_embedding_providers", failing_try
+        )
+        second = await embeddings_module.generate_embedding("persisted text")
+
+        assert calls == []
+        assert second == first
+        info = get_embedding_system_info()
+        assert info["cache_size"] == 1
+        assert info["cache"]["disk_hits"] == 1
+        assert info["cache"]["disk_enabled"] is True
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counters_exported_to_metrics(
+        self, stub_embedding_provider
+    ) -> None:
+        from session_buddy.mcp.metrics import get_metrics
+
+        clear_embedding_cache()
+        counter = get_metrics().embedding_cache_events_total
+        hits_before = counter.labels(tier="memory", event="hit")._value.get()
+        misses_before = counter.labels(tier="disk", event="miss")._value.get()
+
+        await embeddings_module.generate_embedding("metrics text")
+        await embeddings_module.generate_embedding("metrics text")
+
+        info = get_embedding_system_info()["cache"]
+        assert info["misses"] == 1
+        assert info["memory_hits"] == 1
+        assert counter.labels(tier="memory", event="hit")._value.get() == hits_before + 1
+        assert counter.labels(tier="disk", event="miss")._value.get() == misses_before + 1
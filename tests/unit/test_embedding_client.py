@@ -0,0 +1,174 @@
+"""Tests for the pooled, batching embedding client.
+
+Covers:
+1. Concurrent requests are micro-batched into one provider call
+2. Identical in-flight texts are coalesced onto a single future
+3. ``max_batch_size`` splits large bursts into multiple batches
+4. ``generate_embeddings`` serves cache hits and de-duplicates misses
+5. Provider response parsing for batched llama-server / Ollama payloads
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import httpx
+import pytest
+
+from session_buddy.reflection import embeddings as embeddings_module
+from session_buddy.reflection.embeddings import (
+    EmbeddingClient,
+    clear_embedding_cache,
+    generate_embeddings,
+    get_embedding_client,
+    get_embedding_system_info,
+)
+
+
+def _vector(seed: float) -> list[float]:
+    return [seed] * 384
+
+
+@pytest.fixture
+def recorded_batches(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Replace the provider call with a recorder returning fake vectors."""
+    batches: list[list[str]] = []
+
+    async def fake_embed_batch(
+        client: t.Any, texts: list[str]
+    ) -> list[list[float] | None]:
+        batches.append(list(texts))
+        return [_vector(float(len(text))) for text in texts]
+
+    monkeypatch.setattr(embeddings_module, "_embed_batch", fake_embed_batch)
+    return batches
+
+
+class TestEmbeddingClientBatching:
+    """Micro-batching and request coalescing."""
+
+    async def test_concurrent_requests_share_one_batch(
+        self, recorded_batches: list[list[str]]
+    ) -> None:
+        client = EmbeddingClient(max_batch_size=16, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            client.embed("a"), client.embed("bb"), client.embed("ccc")
+        )
+
+        assert recorded_batches == [["a", "bb", "ccc"]]
+        assert [r[0] for r in results if r] == [1.0, 2.0, 3.0]
+        await client.aclose()
+
+    async def test_identical_texts_are_coalesced(
+        self, recorded_batches: list[list[str]]
+    ) -> None:
+        client = EmbeddingClient(max_batch_size=16, max_wait_ms=5)
+
+        results = await client.embed_many(["same", "same", "same"])
+
+        assert recorded_batches == [["same"]]
+        assert results[0] == results[1] == results[2]
+        assert client.get_stats()["coalesced"] == 2
+        await client.aclose()
+
+    async def test_max_batch_size_splits_bursts(
+        self, recorded_batches: list[list[str]]
+    ) -> None:
+        client = EmbeddingClient(max_batch_size=4, max_wait_ms=50)
+
+        texts = [f"text-{i}" for i in range(10)]
+        results = await client.embed_many(texts)
+
+        assert [len(batch) for batch in recorded_batches] == [4, 4, 2]
+        assert all(result is not None for result in results)
+        stats = client.get_stats()
+        assert stats["batches_sent"] == 3
+        assert stats["texts_sent"] == 10
+        assert stats["in_flight"] == 0
+        await client.aclose()
+
+    async def test_failed_batch_resolves_to_none(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def broken_embed_batch(client: t.Any, texts: list[str]) -> t.Any:
+            raise RuntimeError("provider exploded")
+
+        monkeypatch.setattr(embeddings_module, "_embed_batch", broken_embed_batch)
+        client = EmbeddingClient(max_batch_size=8, max_wait_ms=1)
+
+        assert await client.embed_many(["x", "y"]) == [None, None]
+        await client.aclose()
+
+    async def test_shared_client_is_reused_on_same_loop(self) -> None:
+        assert get_embedding_client() is get_embedding_client()
+
+
+class TestGenerateEmbeddings:
+    """``generate_embeddings`` on top of the cache + pooled client."""
+
+    async def test_returns_one_entry_per_text_and_caches(self) -> None:
+        clear_embedding_cache()
+
+        results = await generate_embeddings(["alpha", "beta", "alpha"])
+
+        assert len(results) == 3
+        assert all(r is not None and len(r) == 384 for r in results)
+        assert results[0] == results[2]
+        assert get_embedding_system_info()["cache_size"] == 2
+
+    async def test_only_misses_reach_the_provider(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clear_embedding_cache()
+        seen: list[str] = []
+
+        async def fake_try(text: str) -> list[float]:
+            seen.append(text)
+            return _vector(0.5)
+
+        monkeypatch.setattr(embeddings_module, "_try_http_embedding_providers", fake_try)
+
+        await generate_embeddings(["cached"])
+        seen.clear()
+        await generate_embeddings(["cached", "fresh", "fresh"])
+
+        assert seen == ["fresh"]
+
+
+class TestProviderParsing:
+    """Batched request/response handling for each HTTP provider."""
+
+    async def test_llama_server_orders_results_by_index(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"index": 1, "embedding": _vector(0.2)},
+                        {"index": 0, "embedding": _vector(0.1)},
+                    ]
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await embeddings_module._try_llama_server(client, ["a", "b"])
+
+        assert results is not None
+        assert results[0] == _vector(0.1)
+        assert results[1] == _vector(0.2)
+
+    async def test_falls_back_to_ollama(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/api/embed"):
+                return httpx.Response(
+                    200, json={"embeddings": [_vector(0.3), [1.0, 2.0]]}
+                )
+            return httpx.Response(503)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await embeddings_module._embed_batch(client, ["a", "b"])
+
+        # Malformed second vector is rejected per item, not per batch.
+        assert results == [_vector(0.3), None]
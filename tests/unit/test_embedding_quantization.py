@@ -158,7 +158,7 @@ class TestEmbeddingQuantization:
     def test_quantization_with_cache(self, quantized_settings: ReflectionAdapterSettings) -> None:
         """Test that quantization works correctly with the embedding cache."""
         from session_buddy.reflection.embeddings import (
-            _embedding_cache,
+            _embedding_cache_get,
             _embedding_cache_put,
         )
 
@@ -172,9 +172,13 @@ class TestEmbeddingQuantization:
         # attribute to module scope). Use the module-level cache API.
         _embedding_cache_put(query, embedding)
 
-        # Retrieve from cache (should get original, not quantized)
-        cached = _embedding_cache.get(query)
-        assert cached == embedding, "Cache should store original embedding"
+        # Retrieve from cache (should get original, not quantized). The cache
+        # stores float32 vectors keyed by content hash, so compare approximately.
+        cached = _embedding_cache_get(query)
+        assert cached is not None
+        assert np.allclose(cached, embedding, atol=1e-7), (
+            "Cache should store original embedding"
+        )
 
         # Quantization should work on cached embedding
         quantized = adapter._quantize_embedding(cached)
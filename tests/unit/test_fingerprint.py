@@ -29,6 +29,8 @@ _FINGERPRINT_SPEC.loader.exec_module(_fingerprint)
 MinHashSignature = _fingerprint.MinHashSignature
 extract_ngrams = _fingerprint.extract_ngrams
 normalize_for_fingerprint = _fingerprint.normalize_for_fingerprint
+LEGACY_SIGNATURE_VERSION = _fingerprint.LEGACY_SIGNATURE_VERSION
+lsh_band_keys = _fingerprint.lsh_band_keys
 
 
 class TestNormalizeForFingerprint:
@@ -147,8 +149,8 @@ class TestMinHashSignature:
         sig1 = MinHashSignature.from_text("python async patterns")
         bytes_data = sig1.to_bytes()
 
-        # Check byte length: 128 integers × 8 bytes each = 1024 bytes
-        assert len(bytes_data) == 1024
+        # Check byte length: 4-byte header + 128 uint32 values = 516 bytes
+        assert len(bytes_data) == 516
 
         # Deserialize
         sig2 = MinHashSignature.from_bytes(bytes_data)
@@ -157,6 +159,36 @@ class TestMinHashSignature:
         sig1_modulo = [h % (2**64) for h in sig1.signature]
         assert sig1_modulo == sig2.signature
 
+    def test_from_bytes_reads_legacy_blobs(self):
+        """Test that headerless 128 x uint64 blobs still load, flagged legacy."""
+        import struct
+
+        legacy_blob = struct.pack("128Q", *range(128))
+        sig = MinHashSignature.from_bytes(legacy_blob)
+
+        assert sig.signature == list(range(128))
+        assert sig.version == LEGACY_SIGNATURE_VERSION
+        assert sig.needs_migration
+        assert not MinHashSignature.from_text("python").needs_migration
+
+    def test_compare_across_versions_raises(self):
+        """Test that legacy and current signatures are not silently compared."""
+        import struct
+
+        legacy = MinHashSignature.from_bytes(struct.pack("128Q", *range(128)))
+        current = MinHashSignature.from_text("python async patterns")
+
+        with pytest.raises(ValueError, match="engine versions"):
+            current.estimate_jaccard_similarity(legacy)
+
+    def test_wide_values_roundtrip_as_uint64(self):
+        """Test that values above 32 bits use the 8-byte payload width."""
+        sig = MinHashSignature(signature=[2**40 + i for i in range(128)])
+        data = sig.to_bytes()
+
+        assert len(data) == 4 + 128 * 8
+        assert MinHashSignature.from_bytes(data).signature == sig.signature
+
     def test_from_bytes_invalid_length(self):
         """Test that invalid byte length raises error."""
         invalid_bytes = b"too short"
@@ -398,3 +430,38 @@ class TestFromTextConvenience:
         sig2 = MinHashSignature.from_text("test", n=4)
         # Different n-gram size should produce different signature
         assert sig1.signature != sig2.signature
+
+
+class TestLSHBandKeys:
+    """Test LSH band key generation."""
+
+    def test_one_key_per_band(self):
+        """Test that each signature yields one key per band."""
+        sig = MinHashSignature.from_text("python async patterns")
+        assert len(sig.band_keys(bands=16, rows=8)) == 16
+
+    def test_identical_bands_share_keys(self):
+        """Test that identical signatures produce identical keys."""
+        sig1 = MinHashSignature.from_text("python async patterns")
+        sig2 = MinHashSignature.from_text("Python   async patterns")
+        assert sig1.band_keys() == sig2.band_keys()
+
+    def test_keys_are_salted_per_band(self):
+        """Test that equal values in different bands hash differently."""
+        sig = MinHashSignature(signature=[7] * 128)
+        keys = sig.band_keys(bands=32, rows=4)
+        assert len(set(keys)) == 32
+
+    def test_batch_matches_single(self):
+        """Test that batched computation matches per-signature keys."""
+        import numpy as np
+
+        sigs = [MinHashSignature.from_text(text) for text in ("alpha", "beta")]
+        batch = lsh_band_keys(np.asarray([s.signature for s in sigs]))
+        assert batch.tolist() == [s.band_keys() for s in sigs]
+
+    def test_rejects_oversized_banding(self):
+        """Test that bands * rows may not exceed the signature length."""
+        sig = MinHashSignature.from_text("python")
+        with pytest.raises(ValueError, match="bands"):
+            sig.band_keys(bands=64, rows=4)
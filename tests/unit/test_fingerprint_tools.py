@@ -34,7 +34,22 @@ from session_buddy.mcp.tools.advanced.fingerprint_tools import (
 )
 
 # Import MinHashSignature for direct testing
-from session_buddy.utils.fingerprint import MinHashSignature
+from session_buddy.utils.fingerprint import (
+    MinHashSignature,
+    extract_ngrams,
+    normalize_for_fingerprint,
+)
+
+
+def _exact_jaccard(text1: str, text2: str) -> float:
+    """Exact Jaccard similarity of the two texts' n-gram sets."""
+    a = set(extract_ngrams(normalize_for_fingerprint(text1)))
+    b = set(extract_ngrams(normalize_for_fingerprint(text2)))
+    return len(a & b) / len(a | b)
+
+
+# Three standard deviations of a 128-permutation MinHash estimate (p=0.5).
+MINHASH_TOLERANCE = 3 * (0.25 / 128) ** 0.5
 
 
 # =====================================
@@ -798,11 +813,14 @@ class TestJaccardSimilarityBoundaries:
 
     def test_near_identical_content_similarity_0_95_threshold(self):
         """Test content that's near-identical passes 0.95 threshold."""
-        sig1 = MinHashSignature.from_text("Python async programming patterns")
-        sig2 = MinHashSignature.from_text("Python async programming patterns in web development")
+        text1 = "Python async programming patterns"
+        text2 = "Python async programming patterns in web development"
+        sig1 = MinHashSignature.from_text(text1)
+        sig2 = MinHashSignature.from_text(text2)
         similarity = sig1.estimate_jaccard_similarity(sig2)
-        # Near-identical should be above 0.60
-        assert similarity > 0.60
+        # Estimate tracks the exact n-gram Jaccard (0.62) within sampling error
+        assert abs(similarity - _exact_jaccard(text1, text2)) < MINHASH_TOLERANCE
+        assert similarity > 0.5
 
     def test_completely_different_content_low_similarity(self):
         """Test that completely different content has low similarity."""
@@ -820,11 +838,14 @@ class TestJaccardSimilarityBoundaries:
 
     def test_threshold_0_85_classification(self):
         """Test that 0.85 threshold correctly classifies near-duplicates."""
-        sig1 = MinHashSignature.from_text("Web development with Django REST API")
-        sig2 = MinHashSignature.from_text("Web development with Django REST framework")
+        text1 = "Web development with Django REST API"
+        text2 = "Web development with Django REST framework"
+        sig1 = MinHashSignature.from_text(text1)
+        sig2 = MinHashSignature.from_text(text2)
         similarity = sig1.estimate_jaccard_similarity(sig2)
-        # These should be similar enough for 0.85 threshold
-        assert similarity >= 0.70
+        # Estimate tracks the exact n-gram Jaccard (0.72) within sampling error
+        assert abs(similarity - _exact_jaccard(text1, text2)) < MINHASH_TOLERANCE
+        assert similarity >= 0.6
 
     def test_threshold_0_95_perfect_duplicates(self):
         """Test that 0.95 threshold catches perfect duplicates."""
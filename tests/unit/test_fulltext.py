@@ -0,0 +1,133 @@
+"""Tests for the BM25 posting-list full-text index."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+from session_buddy.utils.fulltext import (
+    FullTextIndex,
+    normalize_scores,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+@pytest.fixture
+def index() -> FullTextIndex:
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE docs (id VARCHAR PRIMARY KEY, body VARCHAR)")
+    index = FullTextIndex(conn)
+    index.ensure_schema()
+    return index
+
+
+class TestTokenize:
+    def test_drops_stop_words_and_single_characters(self) -> None:
+        assert tokenize("The cache is a hot path x") == ["cache", "hot", "path"]
+
+    def test_splits_code_identifiers(self) -> None:
+        assert tokenize("getUserName") == ["getusername", "get", "user", "name"]
+        assert tokenize("get_user_name") == ["get_user_name", "get", "user", "name"]
+
+    def test_acronyms_stay_together(self) -> None:
+        assert tokenize("parseHTTPResponse") == [
+            "parsehttpresponse",
+            "parse",
+            "http",
+            "response",
+        ]
+
+    def test_unspaced_scripts_index_each_character(self) -> None:
+        assert tokenize("Unicode 中文") == ["unicode", "中文", "中", "文"]
+        assert tokenize("中") == ["中"]
+
+
+class TestFullTextIndex:
+    def test_ranks_by_bm25(self, index: FullTextIndex) -> None:
+        index.index_documents(
+            "docs",
+            [
+                ("a", "duckdb duckdb connection pool"),
+                ("b", "duckdb appears once among many other unrelated words here"),
+                ("c", "gardening notes"),
+            ],
+        )
+
+        results = index.search("docs", "duckdb", limit=10)
+
+        assert [doc_id for doc_id, _ in results] == ["a", "b"]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_rare_terms_weigh_more(self, index: FullTextIndex) -> None:
+        index.index_documents(
+            "docs",
+            [("a", "python python"), ("b", "python hnsw"), ("c", "python")],
+        )
+
+        results = index.search("docs", "python hnsw", limit=10, require_all=False)
+
+        assert [doc_id for doc_id, _ in results][0] == "b"
+        assert len(results) == 3
+
+    def test_all_terms_required_by_default(self, index: FullTextIndex) -> None:
+        index.index_documents("docs", [("a", "insight content"), ("b", "content")])
+
+        assert [d for d, _ in index.search("docs", "insight content", limit=5)] == [
+            "a"
+        ]
+
+    def test_identifier_spellings_find_each_other(self, index: FullTextIndex) -> None:
+        index.index_documents("docs", [("a", "call get_user_name first")])
+
+        assert [d for d, _ in index.search("docs", "getUserName", limit=5)] == ["a"]
+
+    def test_reindex_replaces_and_remove_drops(self, index: FullTextIndex) -> None:
+        index.index_documents("docs", [("a", "alpha"), ("b", "alpha")])
+        index.index_documents("docs", [("a", "beta")])
+        index.remove_documents("docs", ["b"])
+
+        assert index.search("docs", "alpha", limit=5) == []
+        assert [d for d, _ in index.search("docs", "beta", limit=5)] == ["a"]
+
+    def test_sources_are_isolated(self, index: FullTextIndex) -> None:
+        index.index_documents("docs", [("a", "shared term")])
+        index.index_documents("other", [("a", "shared term")])
+        index.clear("other")
+
+        assert len(index.search("docs", "shared", limit=5)) == 1
+        assert index.search("other", "shared", limit=5) == []
+
+    def test_query_without_terms_has_no_match(self, index: FullTextIndex) -> None:
+        assert index.match("docs", "the of a") is None
+
+    def test_sync_catches_up_with_table(self, index: FullTextIndex) -> None:
+        conn = index.conn
+        conn.execute("INSERT INTO docs VALUES ('a', 'alpha'), ('b', 'beta')")
+
+        assert index.sync("docs", "docs", "body") == 2
+        assert index.sync("docs", "docs", "body") == 0
+
+        conn.execute("DELETE FROM docs WHERE id = 'a'")
+        conn.execute("INSERT INTO docs VALUES ('c', 'gamma')")
+
+        assert index.sync("docs", "docs", "body", decode=str.upper) == 2
+        assert index.search("docs", "alpha", limit=5) == []
+        assert [d for d, _ in index.search("docs", "gamma", limit=5)] == ["c"]
+
+
+class TestScoreHelpers:
+    def test_normalize_scores(self) -> None:
+        results = normalize_scores([{"score": 4.0}, {"score": 1.0}])
+
+        assert [r["score"] for r in results] == [1.0, 0.25]
+
+    def test_reciprocal_rank_fusion_rewards_agreement(self) -> None:
+        vector = [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}]
+        text = [{"id": "b", "score": 1.0}, {"id": "c", "score": 0.5}]
+
+        fused = reciprocal_rank_fusion([vector, text])
+
+        assert [r["id"] for r in fused] == ["b", "a", "c"]
+        # The first list's copy of a shared result is kept
+        assert fused[0]["score"] == 0.8
@@ -0,0 +1,140 @@
+"""Tests for the CSR adjacency index used by knowledge graph path queries."""
+
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pytest
+
+from session_buddy.utils.graph_index import AdjacencyIndex
+
+
+def _index(edges: list[tuple[str, str, str]]) -> AdjacencyIndex:
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE kg_relationships "
+        "(from_entity VARCHAR, to_entity VARCHAR, relation_type VARCHAR)"
+    )
+    if edges:
+        conn.executemany("INSERT INTO kg_relationships VALUES (?, ?, ?)", edges)
+    return AdjacencyIndex.from_duckdb(conn)
+
+
+@pytest.fixture
+def diamond() -> AdjacencyIndex:
+    # a -> b -> d, a -> c -> d, a -> d (cites), d -> e
+    return _index(
+        [
+            ("a", "b", "uses"),
+            ("b", "d", "uses"),
+            ("a", "c", "uses"),
+            ("c", "d", "extends"),
+            ("a", "d", "cites"),
+            ("d", "e", "uses"),
+        ]
+    )
+
+
+class TestShortestPath:
+    def test_direct_edge_wins(self, diamond: AdjacencyIndex) -> None:
+        assert diamond.shortest_path("a", "d", max_depth=5) == (["a", "d"], ["cites"])
+
+    def test_edges_are_directed(self, diamond: AdjacencyIndex) -> None:
+        assert diamond.shortest_path("e", "a", max_depth=5) is None
+
+    def test_relation_filter(self, diamond: AdjacencyIndex) -> None:
+        path = diamond.shortest_path("a", "e", max_depth=5, relation_types=["uses"])
+
+        assert path == (["a", "b", "d", "e"], ["uses", "uses", "uses"])
+
+    def test_max_depth(self, diamond: AdjacencyIndex) -> None:
+        assert diamond.shortest_path("a", "e", max_depth=1) is None
+        assert diamond.shortest_path("a", "e", max_depth=2) is not None
+
+    def test_unknown_or_same_node(self, diamond: AdjacencyIndex) -> None:
+        assert diamond.shortest_path("a", "zzz", max_depth=5) is None
+        assert diamond.shortest_path("a", "a", max_depth=5) is None
+
+    def test_matches_plain_bfs_on_random_graph(self) -> None:
+        rng = np.random.default_rng(3)
+        edges = [
+            (f"n{s}", f"n{d}", "r")
+            for s, d in rng.integers(0, 300, size=(900, 2))
+            if s != d
+        ]
+        index = _index(edges)
+        adjacency: dict[str, set[str]] = {}
+        for s, d, _ in edges:
+            adjacency.setdefault(s, set()).add(d)
+
+        def bfs_hops(source: str, target: str) -> int | None:
+            frontier, seen, hops = {source}, {source}, 0
+            while frontier:
+                hops += 1
+                frontier = {
+                    n for f in frontier for n in adjacency.get(f, ()) if n not in seen
+                }
+                if target in frontier:
+                    return hops
+                seen |= frontier
+            return None
+
+        for source, target in rng.integers(0, 300, size=(50, 2)):
+            if source == target:
+                continue
+            expected = bfs_hops(f"n{source}", f"n{target}")
+            found = index.shortest_path(f"n{source}", f"n{target}", max_depth=50)
+            assert (len(found[1]) if found else None) == expected
+
+
+class TestKShortestPaths:
+    def test_paths_in_hop_order_without_duplicates(
+        self, diamond: AdjacencyIndex
+    ) -> None:
+        paths = diamond.k_shortest_paths("a", "d", max_depth=5, k=5)
+
+        assert paths[0] == (["a", "d"], ["cites"])
+        assert sorted(paths[1:]) == [
+            (["a", "b", "d"], ["uses", "uses"]),
+            (["a", "c", "d"], ["uses", "extends"]),
+        ]
+
+
+class TestIncrementalUpdates:
+    def test_add_and_remove_edges(self, diamond: AdjacencyIndex) -> None:
+        diamond.add_edge("e", "f", "uses")
+        assert diamond.shortest_path("a", "f", max_depth=5) == (
+            ["a", "d", "e", "f"],
+            ["cites", "uses", "uses"],
+        )
+
+        diamond.remove_edge("a", "d", "cites")
+        path = diamond.shortest_path("a", "d", max_depth=5)
+        assert path is not None and path[0] in (["a", "b", "d"], ["a", "c", "d"])
+        assert diamond.edge_count == 6
+
+    def test_removing_one_parallel_edge_keeps_the_other(self) -> None:
+        index = _index([("a", "b", "uses"), ("a", "b", "uses")])
+
+        index.remove_edge("a", "b", "uses")
+        assert index.shortest_path("a", "b", max_depth=1) is not None
+
+        index.remove_edge("a", "b", "uses")
+        assert index.shortest_path("a", "b", max_depth=1) is None
+
+    def test_compact_preserves_paths(self, diamond: AdjacencyIndex) -> None:
+        diamond.add_edge("e", "f", "uses")
+        diamond.remove_edge("a", "d", "cites")
+
+        diamond.compact()
+
+        assert sorted(diamond.k_shortest_paths("a", "f", max_depth=5, k=3)) == [
+            (["a", "b", "d", "e", "f"], ["uses"] * 4),
+            (["a", "c", "d", "e", "f"], ["uses", "extends", "uses", "uses"]),
+        ]
+
+    def test_empty_table(self) -> None:
+        index = _index([])
+        index.add_edge("a", "b", "uses")
+
+        assert index.shortest_path("a", "b", max_depth=1) == (["a", "b"], ["uses"])
@@ -832,6 +832,67 @@ class TestGraphTraversal:
         # Should not find path to self (no cycles)
         assert paths == []
 
+    @pytest.mark.asyncio
+    async def test_find_path_k_paths_and_relation_filter(self, kg_adapter) -> None:
+        """Should return alternative paths and honour relation filters."""
+        suffix = int(time.time() * 1000000)
+        names = [f"k-{i}-{suffix}" for i in range(4)]
+        for name in names:
+            await kg_adapter.create_entity(
+                name=name, entity_type="test", observations=["test"]
+            )
+        a, b, c, d = names
+        await kg_adapter.create_relation(a, d, "cites")
+        await kg_adapter.create_relation(a, b, "uses")
+        await kg_adapter.create_relation(b, c, "uses")
+        await kg_adapter.create_relation(c, d, "uses")
+
+        paths = await kg_adapter.find_path(a, d, k=3)
+        assert [p["hops"] for p in paths] == [1, 3]
+
+        filtered = await kg_adapter.find_path(a, d, relation_types=["uses"])
+        assert filtered[0]["relations"] == ["uses", "uses", "uses"]
+
+    @pytest.mark.asyncio
+    async def test_delete_relation_updates_paths(self, kg_adapter) -> None:
+        """Deleting a relation should remove it from subsequent path queries."""
+        suffix = int(time.time() * 1000000)
+        e1 = await kg_adapter.create_entity(
+            name=f"del-e1-{suffix}", entity_type="test", observations=["test"]
+        )
+        e2 = await kg_adapter.create_entity(
+            name=f"del-e2-{suffix}", entity_type="test", observations=["test"]
+        )
+        relation = await kg_adapter.create_relation(
+            from_entity=e1["name"], to_entity=e2["name"], relation_type="next"
+        )
+        assert await kg_adapter.find_path(e1["name"], e2["name"])
+
+        assert await kg_adapter.delete_relation(relation["id"]) is True
+        assert await kg_adapter.delete_relation(relation["id"]) is False
+        assert await kg_adapter.find_path(e1["name"], e2["name"]) == []
+
+    @pytest.mark.asyncio
+    async def test_find_path_sees_external_writes(self, kg_adapter) -> None:
+        """Rows written outside the adapter should trigger an index rebuild."""
+        suffix = int(time.time() * 1000000)
+        e1 = await kg_adapter.create_entity(
+            name=f"ext-e1-{suffix}", entity_type="test", observations=["test"]
+        )
+        e2 = await kg_adapter.create_entity(
+            name=f"ext-e2-{suffix}", entity_type="test", observations=["test"]
+        )
+        assert await kg_adapter.find_path(e1["name"], e2["name"]) == []
+
+        kg_adapter.conn.execute(
+            "INSERT INTO kg_relationships (id, from_entity, to_entity, relation_type) "
+            "VALUES ('ext', ?, ?, 'next')",
+            (e1["id"], e2["id"]),
+        )
+
+        paths = await kg_adapter.find_path(e1["name"], e2["name"])
+        assert paths[0]["path"] == [e1["id"], e2["id"]]
+
 
 # ============================================================================
 # Test Class: Statistics
@@ -1249,6 +1310,64 @@ class TestEmbeddingGeneration:
         assert "generated" in result
         assert "failed" in result
 
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_pages_through_all_entities(
+        self, kg_adapter
+    ) -> None:
+        """Should backfill every entity in bulk batches and report a cursor."""
+        for i in range(7):
+            await kg_adapter.create_entity(
+                name=f"backfill-{i}", entity_type="test", observations=[]
+            )
+        kg_adapter.conn.execute("UPDATE kg_entities SET embedding = NULL")
+        calls: list[int] = []
+
+        async def _embed(entities):
+            calls.append(len(entities))
+            return [[0.5] * 384 if name != "backfill-3" else None for name, *_ in entities]
+
+        with patch.object(kg_adapter, "_generate_entity_embeddings", _embed):
+            result = await kg_adapter.generate_embeddings_for_entities(
+                batch_size=3, concurrency=2
+            )
+
+        assert calls == [3, 3, 1]
+        assert result["generated"] == 6
+        assert result["failed"] == 1
+        assert result["batches"] == 3
+        assert result["cursor"] == max(
+            row[0] for row in kg_adapter.conn.execute("SELECT id FROM kg_entities").fetchall()
+        )
+        missing = kg_adapter.conn.execute(
+            "SELECT name FROM kg_entities WHERE embedding IS NULL"
+        ).fetchall()
+        assert missing == [("backfill-3",)]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_resumes_from_cursor(self, kg_adapter) -> None:
+        """Should stop at limit and continue after the returned cursor."""
+        for i in range(5):
+            await kg_adapter.create_entity(
+                name=f"resume-{i}", entity_type="test", observations=[]
+            )
+        seen: list[str] = []
+
+        async def _embed(entities):
+            seen.extend(name for name, *_ in entities)
+            return [[0.1] * 384 for _ in entities]
+
+        with patch.object(kg_adapter, "_generate_entity_embeddings", _embed):
+            first = await kg_adapter.generate_embeddings_for_entities(
+                batch_size=2, limit=3, overwrite=True
+            )
+            second = await kg_adapter.generate_embeddings_for_entities(
+                batch_size=2, overwrite=True, cursor=first["cursor"]
+            )
+
+        assert first["total_processed"] == 3
+        assert second["total_processed"] == 2
+        assert sorted(seen) == [f"resume-{i}" for i in range(5)]
+
     @pytest.mark.asyncio
     async def test_batch_discover_relationships_empty(self, kg_adapter) -> None:
         """Should handle empty graph in batch discover."""
@@ -1259,6 +1378,78 @@ class TestEmbeddingGeneration:
         assert result["entities_processed"] == 0
         assert result["relationships_created"] == 0
 
+    @pytest.mark.asyncio
+    async def test_batch_discover_relationships_bulk(self, kg_adapter) -> None:
+        """Should link similar pairs once and skip already-connected pairs."""
+        import numpy as np
+
+        vectors = {
+            "a": [1.0, 0.0],
+            "b": [0.95, 0.05],
+            "c": [0.9, 0.1],
+            "d": [0.0, 1.0],
+        }
+        ids = {}
+        for name in vectors:
+            entity = await kg_adapter.create_entity(
+                name=f"bulk-{name}", entity_type="test", observations=[]
+            )
+            ids[name] = entity["id"]
+        for name, head in vectors.items():
+            embedding = np.zeros(384, dtype=np.float32)
+            embedding[:2] = head
+            kg_adapter.conn.execute(
+                "UPDATE kg_entities SET embedding = ? WHERE id = ?",
+                (embedding.tolist(), ids[name]),
+            )
+        await kg_adapter.create_relation(ids["c"], ids["a"], "related_to")
+
+        result = await kg_adapter.batch_discover_relationships(
+            threshold=0.9, limit=10, batch_size=5
+        )
+
+        pairs = kg_adapter.conn.execute(
+            "SELECT from_entity, to_entity, relation_type, properties "
+            "FROM kg_relationships"
+        ).fetchall()
+        unordered = {frozenset(row[:2]) for row in pairs}
+        assert result["entities_processed"] == 4
+        assert result["relationships_created"] == 2
+        assert len(pairs) == 3 == len(unordered)
+        assert unordered == {
+            frozenset((ids["a"], ids["b"])),
+            frozenset((ids["a"], ids["c"])),
+            frozenset((ids["b"], ids["c"])),
+        }
+        discovered = [row for row in pairs if row[2] != "related_to"]
+        assert all(json.loads(row[3])["auto_discovered"] for row in discovered)
+
+    def test_top_similar_pairs_matches_brute_force(self) -> None:
+        """Tiled top-k should match a full similarity matrix."""
+        import numpy as np
+
+        from session_buddy.adapters import knowledge_graph_adapter_oneiric as kg_mod
+
+        rng = np.random.default_rng(5)
+        embeddings = rng.standard_normal((60, 8)).astype(np.float32)
+        sources = np.arange(0, 60, 2)
+        unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        full = unit @ unit.T
+        np.fill_diagonal(full, -np.inf)
+
+        with patch.object(kg_mod, "_SIMILARITY_TILE_ROWS", 7):
+            pairs = kg_mod.KnowledgeGraphDatabaseAdapterOneiric._top_similar_pairs(
+                embeddings, sources, threshold=0.2, k=3
+            )
+
+        expected = [
+            (int(s), int(j), float(full[s, j]))
+            for s in sources
+            for j in np.argsort(-full[s])[:3]
+            if full[s, j] > 0.2
+        ]
+        assert [(s, j) for s, j, _ in pairs] == [(s, j) for s, j, _ in expected]
+
 
 # ============================================================================
 # Test Class: Create Entity with Patterns
@@ -0,0 +1,219 @@
+"""Tests for elastic worker pools: priorities, deadlines, scaling and routing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from session_buddy.pools import PoolManager, PoolSaturatedError, WorkerPool
+from session_buddy.worker import Task, TaskCancelledError, Worker
+
+
+def _fake_logic(
+    started: list[str], release: asyncio.Event | None = None, delay: float = 0.0
+) -> Any:
+    async def execute(self: Worker, task: Task) -> str:
+        started.append(task.prompt)
+        if release is not None:
+            await release.wait()
+        await asyncio.sleep(delay)
+        return task.prompt
+
+    return execute
+
+
+class TestTask:
+    def test_orders_by_priority_then_deadline_then_submission(self) -> None:
+        first = Task("a", "a")
+        second = Task("b", "b")
+        urgent = Task("c", "c", priority=-1)
+        due_soon = Task("d", "d", deadline=1.0)
+
+        assert sorted([second, first, due_soon, urgent]) == [
+            urgent,
+            due_soon,
+            first,
+            second,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_waiter(self) -> None:
+        task = Task("a", "a")
+
+        assert task.cancel() is True
+        assert task.cancel() is False
+        assert task.status == "cancelled"
+        with pytest.raises(TaskCancelledError):
+            await task.wait_for_result(timeout=1.0)
+
+
+class TestWorkerPoolScheduling:
+    @pytest.mark.asyncio
+    async def test_higher_priority_runs_first(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+        pool = WorkerPool(min_workers=1, max_workers=1)
+        with patch.object(Worker, "_execute_task_logic", _fake_logic(started, release)):
+            await pool.initialize()
+            blocker = asyncio.create_task(pool.execute("blocker"))
+            await asyncio.sleep(0.01)
+            low = asyncio.create_task(pool.execute("low", priority=5))
+            high = asyncio.create_task(pool.execute("high", priority=0))
+            await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.gather(blocker, low, high)
+            await pool.shutdown()
+
+        assert started == ["blocker", "high", "low"]
+        status = pool.get_status()
+        assert status["queue_wait"]["count"] == 3
+        assert status["execution_time"]["count"] == 3
+        assert status["ewma_service_time"] is not None
+
+    @pytest.mark.asyncio
+    async def test_task_past_deadline_is_dropped_from_queue(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+        pool = WorkerPool(min_workers=1, max_workers=1)
+        with patch.object(Worker, "_execute_task_logic", _fake_logic(started, release)):
+            await pool.initialize()
+            blocker = asyncio.create_task(pool.execute("blocker"))
+            await asyncio.sleep(0.01)
+            deadline = asyncio.get_running_loop().time() + 0.02
+            late = asyncio.create_task(pool.execute("late", deadline=deadline))
+            await asyncio.sleep(0.05)
+            release.set()
+
+            with pytest.raises(TimeoutError):
+                await late
+            await blocker
+            await pool.shutdown()
+
+        assert started == ["blocker"]
+        assert pool.tasks_expired == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_timeout_cancels_running_task(self) -> None:
+        started: list[str] = []
+        pool = WorkerPool(min_workers=1, max_workers=1)
+        with patch.object(
+            Worker, "_execute_task_logic", _fake_logic(started, delay=10.0)
+        ):
+            await pool.initialize()
+            with pytest.raises(TimeoutError):
+                await pool.execute("slow", timeout=0.05)
+            await asyncio.sleep(0.01)
+
+            assert pool.tasks_cancelled == 1
+            # The worker was freed and picks up the next task
+            assert pool.workers[0].idle is True
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_submissions(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+        pool = WorkerPool(min_workers=1, max_workers=1, max_queue_size=1)
+        with patch.object(Worker, "_execute_task_logic", _fake_logic(started, release)):
+            await pool.initialize()
+            running = asyncio.create_task(pool.execute("running"))
+            await asyncio.sleep(0.01)
+            queued = asyncio.create_task(pool.execute("queued"))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(PoolSaturatedError):
+                await pool.execute("rejected")
+            release.set()
+            await asyncio.gather(running, queued)
+            await pool.shutdown()
+
+        assert pool.tasks_rejected == 1
+        assert started == ["running", "queued"]
+
+    @pytest.mark.asyncio
+    async def test_scales_up_with_backlog_and_back_down_when_idle(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+        pool = WorkerPool(min_workers=1, max_workers=3, idle_timeout=0.05)
+        with patch.object(Worker, "_execute_task_logic", _fake_logic(started, release)):
+            await pool.initialize()
+            tasks = [asyncio.create_task(pool.execute(f"task-{i}")) for i in range(4)]
+            await asyncio.sleep(0.01)
+
+            assert len(pool.workers) == 3
+            assert len(started) == 3
+
+            release.set()
+            await asyncio.gather(*tasks)
+            await asyncio.sleep(0.3)
+
+            assert len(pool.workers) == 1
+            assert pool.workers_retired == 2
+            await pool.shutdown()
+
+    def test_rejects_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            WorkerPool(min_workers=4, max_workers=2)
+
+
+def _mock_pool(pool_id: str, *, queued: int = 0, wait: float = 0.0) -> MagicMock:
+    pool = MagicMock()
+    pool.pool_id = pool_id
+    pool.task_queue.qsize = MagicMock(return_value=queued)
+    pool.estimated_wait = MagicMock(return_value=wait)
+    pool.execute = AsyncMock(return_value=f"{pool_id}-result")
+    return pool
+
+
+class TestPoolManagerRouting:
+    @pytest.mark.asyncio
+    async def test_round_robin_cycles_through_pools(self) -> None:
+        manager = PoolManager()
+        manager.pools = {
+            "pool1": _mock_pool("pool1"),
+            "pool2": _mock_pool("pool2"),
+            "pool3": _mock_pool("pool3"),
+        }
+
+        chosen = [
+            (await manager.route_task("prompt", selector="round_robin"))[0]
+            for _ in range(4)
+        ]
+
+        assert chosen == ["pool1", "pool2", "pool3", "pool1"]
+
+    @pytest.mark.asyncio
+    async def test_latency_selector_prefers_lowest_expected_wait(self) -> None:
+        manager = PoolManager()
+        manager.pools = {
+            "slow": _mock_pool("slow", queued=1, wait=4.0),
+            "fast": _mock_pool("fast", queued=6, wait=0.5),
+        }
+
+        pool_id, _ = await manager.route_task("prompt", selector="latency")
+
+        assert pool_id == "fast"
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_falls_back_to_next(self) -> None:
+        manager = PoolManager()
+        full = _mock_pool("full")
+        full.execute = AsyncMock(side_effect=PoolSaturatedError("full"))
+        manager.pools = {"full": full, "spare": _mock_pool("spare", queued=3)}
+
+        pool_id, result = await manager.route_task("prompt", selector="least_loaded")
+
+        assert (pool_id, result) == ("spare", "spare-result")
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_pools_saturated(self) -> None:
+        manager = PoolManager()
+        full = _mock_pool("full")
+        full.execute = AsyncMock(side_effect=PoolSaturatedError("full"))
+        manager.pools = {"full": full}
+
+        with pytest.raises(PoolSaturatedError, match="All pools"):
+            await manager.route_task("prompt")
@@ -225,7 +225,7 @@ class TestWorkerPoolInitialize:
 
         created_worker_ids = []
 
-        def create_mock_worker(worker_id, queue, pool_id):
+        def create_mock_worker(worker_id, queue, pool_id, **kwargs):
             mock = MagicMock()
             mock.worker_id = worker_id
             mock.start = AsyncMock()
@@ -1318,7 +1318,11 @@ class TestPoolManagerExecuteOnPool:
         )
 
         mock_pool.execute.assert_called_once_with(
-            prompt="test prompt", context={"key": "value"}, timeout=30.0
+            prompt="test prompt",
+            context={"key": "value"},
+            timeout=30.0,
+            priority=0,
+            deadline=None,
         )
         assert result == "result"
 
@@ -1385,7 +1389,7 @@ class TestPoolManagerRouteTask:
         manager.pools = {"pool1": mock_pool1, "pool2": mock_pool2, "pool3": mock_pool3}
 
         # Mock execute to return (pool_id, result)
-        async def mock_execute(prompt, context=None, timeout=None):
+        async def mock_execute(prompt, context=None, timeout=None, **kwargs):
             return "result"
 
         mock_pool1.execute = mock_execute
@@ -1411,7 +1415,7 @@ class TestPoolManagerRouteTask:
 
         manager.pools = {"pool1": mock_pool1, "pool2": mock_pool2}
 
-        async def mock_execute(prompt, context=None, timeout=None):
+        async def mock_execute(prompt, context=None, timeout=None, **kwargs):
             return "result"
 
         mock_pool1.execute = mock_execute
@@ -1436,7 +1440,7 @@ class TestPoolManagerRouteTask:
 
         manager.pools = {"pool1": mock_pool1, "pool2": mock_pool2}
 
-        async def mock_execute(prompt, context=None, timeout=None):
+        async def mock_execute(prompt, context=None, timeout=None, **kwargs):
             return "result"
 
         mock_pool1.execute = mock_execute
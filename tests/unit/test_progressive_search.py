@@ -328,6 +328,105 @@ class TestProgressiveSearchEngine:
         for tier_result in result.tier_results:
             assert tier_result.latency_ms >= 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_latency_tracks_slowest_tier(self, engine, mock_db):
+        """Concurrent mode overlaps tiers instead of summing their latency."""
+
+        async def slow_reflections(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return [{"content": "reflection", "score": 0.80}]
+
+        async def slow_conversations(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return [{"content": "conversation", "score": 0.65}]
+
+        mock_db.search_reflections = AsyncMock(side_effect=slow_reflections)
+        mock_db.search_conversations = AsyncMock(side_effect=slow_conversations)
+
+        with patch.object(engine, "_db", mock_db):
+            result = await engine.search_progressive(
+                query="test query",
+                max_tiers=4,
+                enable_early_stop=False,
+                concurrent=True,
+            )
+
+        assert len(result.tiers_searched) == 4
+        # CATEGORIES (min 0.9) filters out the 0.80 reflection
+        assert result.total_results == 3
+        assert result.metadata["mode"] == "concurrent"
+        # Three reflection tiers share one adapter call
+        assert mock_db.search_reflections.await_count == 1
+        assert result.total_latency_ms < 150
+
+    @pytest.mark.asyncio
+    async def test_concurrent_early_stop_cancels_later_tiers(self, engine, mock_db):
+        """Tiers after the early-stop point are cancelled and counted."""
+        conversations_cancelled = asyncio.Event()
+
+        async def fast_reflections(*args, **kwargs):
+            return [
+                {"content": f"reflection{i}", "score": 0.97} for i in range(3)
+            ]
+
+        async def slow_conversations(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                conversations_cancelled.set()
+                raise
+            return []
+
+        mock_db.search_reflections = fast_reflections
+        mock_db.search_conversations = slow_conversations
+
+        with patch.object(engine, "_db", mock_db):
+            result = await engine.search_progressive(
+                query="test query",
+                max_tiers=4,
+                enable_early_stop=True,
+                concurrent=True,
+            )
+
+        assert result.early_stop
+        assert result.tiers_searched == [SearchTier.CATEGORIES]
+        assert result.total_results == 3
+        assert conversations_cancelled.is_set()
+        assert result.metadata["tiers_cancelled"] >= 1
+        assert (
+            result.metadata["tiers_cancelled"] + result.metadata["tiers_discarded"]
+            == 3
+        )
+
+        stats = engine.get_search_stats()
+        assert stats["total_searches"] == 1
+        assert stats["concurrent_searches"] == 1
+        assert stats["early_stop_rate"] == 1.0
+        assert stats["wasted_work"]["tiers_cancelled"] >= 1
+        assert SearchTier.CATEGORIES.value in stats["tier_latency_ms"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_matches_sequential_results(self, engine, mock_db):
+        """Both modes return the same tiers and results."""
+        mock_db.search_reflections.return_value = [
+            {"content": "reflection", "score": 0.80},
+        ]
+        mock_db.search_conversations.return_value = [
+            {"content": "conversation", "score": 0.65},
+        ]
+
+        with patch.object(engine, "_db", mock_db):
+            sequential = await engine.search_progressive(
+                query="test query", enable_early_stop=True
+            )
+            concurrent = await engine.search_progressive(
+                query="test query", enable_early_stop=True, concurrent=True
+            )
+
+        assert concurrent.tiers_searched == sequential.tiers_searched
+        assert concurrent.total_results == sequential.total_results
+        assert engine.get_search_stats()["total_searches"] == 2
+
 
 class TestProgressiveSearchSuccessCriteria:
     """Test Phase 3 success criteria for progressive search."""
@@ -0,0 +1,178 @@
+"""Tests for uint8 quantized vector search with float32 rerank."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pytest
+
+from session_buddy.adapters import reflection_adapter_oneiric as reflection_module
+from session_buddy.adapters.settings import ReflectionAdapterSettings
+from session_buddy.reflection.quantization import (
+    Calibration,
+    QuantizedIndex,
+    calibrate_from_table,
+    dequantize,
+    quantize,
+)
+
+DIM = 384
+
+
+def _unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestQuantizeRoundTrip:
+    def test_calibrated_round_trip_preserves_direction(self) -> None:
+        vectors = _unit_vectors(200)
+        calibration = Calibration(lo=vectors.min(axis=0), hi=vectors.max(axis=0))
+
+        restored = dequantize(quantize(vectors, calibration), calibration)
+
+        cosine = (restored * vectors).sum(axis=1) / np.linalg.norm(restored, axis=1)
+        assert cosine.min() > 0.99
+
+    def test_values_outside_range_are_clipped(self) -> None:
+        calibration = Calibration.fixed(2, bound=1.0)
+
+        codes = quantize([-5.0, 5.0], calibration)
+
+        assert codes.tolist() == [0, 255]
+
+
+class TestCalibrateFromTable:
+    def test_ranges_clip_outliers(self) -> None:
+        vectors = _unit_vectors(500)
+        vectors[0, 0] = 3.0  # one outlier in dimension 0
+        conn = duckdb.connect()
+        conn.execute(f"CREATE TABLE t (embedding FLOAT[{DIM}])")
+        conn.execute(
+            "INSERT INTO t SELECT unnest(?::FLOAT[384][])", [vectors.tolist()]
+        )
+
+        raw = calibrate_from_table(conn, "t", DIM, sigma=0)
+        clipped = calibrate_from_table(conn, "t", DIM, sigma=4.0)
+
+        assert raw is not None and clipped is not None
+        assert raw.sample_count == 500
+        assert raw.hi[0] == pytest.approx(3.0)
+        assert clipped.hi[0] < 1.0
+        assert np.all(clipped.lo >= raw.lo) and np.all(clipped.hi <= raw.hi)
+
+    def test_empty_table_returns_none(self) -> None:
+        conn = duckdb.connect()
+        conn.execute(f"CREATE TABLE t (embedding FLOAT[{DIM}])")
+
+        assert calibrate_from_table(conn, "t", DIM) is None
+
+
+class TestQuantizedIndex:
+    @pytest.fixture
+    def index(self) -> tuple[QuantizedIndex, np.ndarray]:
+        vectors = _unit_vectors(1000)
+        calibration = Calibration(lo=vectors.min(axis=0), hi=vectors.max(axis=0))
+        index = QuantizedIndex(calibration)
+        ids = [f"m{i}" for i in range(len(vectors))]
+        projects = ["a" if i % 2 else "b" for i in range(len(vectors))]
+        index.add(ids, quantize(vectors, calibration), projects)
+        return index, vectors
+
+    def test_finds_exact_neighbours(self, index) -> None:
+        index, vectors = index
+        query = vectors[17] + 0.05 * _unit_vectors(1, seed=1)[0]
+
+        exact = np.argsort(-(vectors @ query))[:10]
+        found = [memory_id for memory_id, _ in index.search(query, 40)]
+
+        assert found[0] == "m17"
+        assert {f"m{i}" for i in exact} <= set(found)
+
+    def test_project_filter_and_remove(self, index) -> None:
+        index, vectors = index
+
+        results = index.search(vectors[17], 5, project="b")
+        assert results and all(int(m[1:]) % 2 == 0 for m, _ in results)
+
+        index.remove(["m17"])
+        assert "m17" not in {m for m, _ in index.search(vectors[17], 5)}
+        assert len(index) == 999
+
+
+@pytest.mark.asyncio
+class TestAdapterQuantizedSearch:
+    @pytest.fixture
+    async def adapter(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        vectors = _unit_vectors(300, seed=7)
+        lookup = {f"memory {i}": vectors[i].tolist() for i in range(len(vectors))}
+
+        async def _embed(text: str) -> list[float] | None:
+            return lookup.get(text)
+
+        settings = ReflectionAdapterSettings(
+            database_path=tmp_path / "quantized.duckdb",
+            enable_hnsw_index=False,
+            enable_quantization=True,
+        )
+        adapter = reflection_module.ReflectionDatabaseAdapterOneiric(
+            settings=settings
+        )
+        monkeypatch.setattr(adapter, "_generate_embedding", _embed)
+        await adapter.initialize()
+        for i in range(len(vectors)):
+            await adapter.store_conversation(f"memory {i}", {"project": "p"})
+        yield adapter
+        await adapter.aclose()
+
+    async def test_codes_are_stored_per_row(self, adapter) -> None:
+        lengths = adapter.conn.execute(
+            "SELECT DISTINCT octet_length(embedding_q) FROM conversations_v2"
+        ).fetchall()
+
+        assert lengths == [(DIM,)]
+
+    async def test_search_matches_float_ranking(self, adapter) -> None:
+        results = await adapter._search_conversations_db(
+            "memory 42", limit=5, threshold=0.0
+        )
+
+        assert results[0]["content"] == "memory 42"
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+    async def test_calibration_is_persisted_and_reloaded(
+        self, adapter, tmp_path: Path
+    ) -> None:
+        summary = await adapter.calibrate_quantization()
+        assert summary == {"calibrated": True, "sample_count": 300, "encoded": 300}
+
+        other = reflection_module.ReflectionDatabaseAdapterOneiric(
+            settings=adapter.settings
+        )
+        await other.initialize()
+        try:
+            assert other._calibration is not None
+            np.testing.assert_array_equal(other._calibration.lo, adapter._calibration.lo)
+        finally:
+            await other.aclose()
+
+    async def test_delete_removes_from_index(self, adapter) -> None:
+        first = await adapter._search_conversations_db("memory 3", limit=1, threshold=0.0)
+        await adapter.delete_conversation(first[0]["id"])
+
+        results = await adapter._search_conversations_db(
+            "memory 3", limit=1, threshold=0.0
+        )
+
+        assert results[0]["content"] != "memory 3"
+
+    async def test_report_measures_recall_and_memory(self, adapter) -> None:
+        report = await adapter.quantization_report(k=5, sample_size=20)
+
+        assert report["queries"] == 20
+        assert report["recall_at_k"] >= 0.9
+        assert report["rows_indexed"] == 300
+        assert report["quantized_bytes"] < report["float32_bytes"] / 3
+        assert report["quantized_latency_ms"]["p50"] >= 0
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import time
 import threading
@@ -14,6 +15,7 @@ import duckdb
 from session_buddy.cache.query_cache import (
     QueryCacheEntry,
     QueryCacheManager,
+    SemanticQueryCache,
 )
 
 
@@ -642,3 +644,209 @@ class TestIntegrationPatterns:
 
         # Verify updated result
         assert cache_manager.get("key1") == ["id1", "id2", "id3"]
+
+
+class TestGenerations:
+    """Test generation-based invalidation."""
+
+    @pytest.fixture
+    async def cache_manager(self):
+        """Create cache manager backed by an in-memory DuckDB."""
+        conn = duckdb.connect()
+        manager = QueryCacheManager(l1_max_size=10, l2_batch_size=2)
+        await manager.initialize(conn=conn)
+        yield manager
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_write_retires_keys_of_its_project(self, cache_manager):
+        """A write changes the key of queries over the written project."""
+        alpha = cache_manager.scoped_cache_key("conversations", "q", project="alpha")
+        beta = cache_manager.scoped_cache_key("conversations", "q", project="beta")
+        unfiltered = cache_manager.scoped_cache_key("conversations", "q")
+
+        cache_manager.bump_generation("conversations", project="alpha")
+
+        assert cache_manager.scoped_cache_key("conversations", "q", project="alpha") != alpha
+        assert cache_manager.scoped_cache_key("conversations", "q") != unfiltered
+        assert cache_manager.scoped_cache_key("conversations", "q", project="beta") == beta
+
+    @pytest.mark.asyncio
+    async def test_write_without_project_retires_whole_table(self, cache_manager):
+        """A write whose project is unknown retires every key over the table."""
+        beta = cache_manager.scoped_cache_key("conversations", "q", project="beta")
+        other = cache_manager.scoped_cache_key("reflections", "q")
+
+        cache_manager.bump_generation("conversations")
+
+        assert cache_manager.scoped_cache_key("conversations", "q", project="beta") != beta
+        assert cache_manager.scoped_cache_key("reflections", "q") == other
+
+    @pytest.mark.asyncio
+    async def test_generations_survive_restart(self, cache_manager):
+        """Generations are persisted so stale L2 keys stay unreachable."""
+        cache_manager.bump_generation("conversations", project="alpha")
+        key = cache_manager.scoped_cache_key("conversations", "q", project="alpha")
+
+        reopened = QueryCacheManager()
+        await reopened.initialize(conn=cache_manager._conn)
+
+        assert reopened.scoped_cache_key("conversations", "q", project="alpha") == key
+
+
+class TestBatchedL2:
+    """Test the batched L2 write path against a real DuckDB."""
+
+    @pytest.fixture
+    async def cache_manager(self):
+        """Create cache manager backed by an in-memory DuckDB."""
+        conn = duckdb.connect()
+        manager = QueryCacheManager(l1_max_size=10, l2_batch_size=3)
+        await manager.initialize(conn=conn)
+        yield manager
+        await manager.aclose()
+
+    @staticmethod
+    def _l2_rows(manager):
+        return manager._conn.execute(
+            "SELECT cache_key, result_ids, scores FROM query_cache_l2 ORDER BY 1"
+        ).fetchall()
+
+    @pytest.mark.asyncio
+    async def test_puts_are_written_as_one_batch(self, cache_manager):
+        """L2 writes wait for their batch and keep order and scores."""
+        cache_manager.put("k1", ["b", "a"], "q1", scores=[0.9, 0.4])
+        cache_manager.put("k2", ["c"], "q2", scores=[0.7])
+
+        assert self._l2_rows(cache_manager) == []
+        assert cache_manager.get_stats()["l2_pending"] == 2
+
+        cache_manager.put("k3", [], "q3")
+
+        assert self._l2_rows(cache_manager) == [
+            ("k1", ["b", "a"], [0.9, 0.4]),
+            ("k2", ["c"], [0.7]),
+            ("k3", [], []),
+        ]
+        assert cache_manager.get_stats()["l2_flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_are_readable(self, cache_manager):
+        """An entry evicted from L1 is still served before its flush."""
+        cache_manager.put("k1", ["a"], "q1", scores=[0.5])
+        cache_manager._l1_cache.clear()
+
+        entry = cache_manager.get_entry("k1")
+
+        assert entry is not None
+        assert entry.scores == [0.5]
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_writes_partial_batch(self, cache_manager):
+        """A partial batch is flushed by the event loop after the interval."""
+        cache_manager.l2_flush_interval = 0.01
+        cache_manager.put("k1", ["a"], "q1", scores=[0.5])
+
+        await asyncio.sleep(0.05)
+
+        assert self._l2_rows(cache_manager) == [("k1", ["a"], [0.5])]
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_restores_scores(self, cache_manager):
+        """Entries read back from L2 keep their ranking and scores."""
+        cache_manager.put("k1", ["b", "a"], "q1", scores=[0.9, 0.4])
+        await cache_manager.flush()
+        cache_manager._l1_cache.clear()
+
+        entry = cache_manager.get_entry("k1")
+
+        assert entry is not None
+        assert entry.result_ids == ["b", "a"]
+        assert entry.scores == [0.9, 0.4]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_pending_writes(self, cache_manager):
+        """Invalidated entries are not written by a later flush."""
+        cache_manager.put("k1", ["a"], "q1")
+        cache_manager.invalidate()
+
+        assert await cache_manager.flush() == 0
+        assert self._l2_rows(cache_manager) == []
+
+
+class TestSemanticQueryCache:
+    """Test the nearest-neighbour query tier."""
+
+    @staticmethod
+    def _entry(cache_key: str = "k1") -> QueryCacheEntry:
+        return QueryCacheEntry(
+            cache_key=cache_key,
+            normalized_query="fix duckdb lock error",
+            result_ids=["a", "b"],
+            project=None,
+            scores=[0.9, 0.5],
+        )
+
+    def test_close_paraphrase_hits(self):
+        """A query within max_distance of a cached one gets its entry."""
+        tier = SemanticQueryCache(dim=3, max_distance=0.05)
+        tier.add("scope", [1.0, 0.1, 0.0], self._entry())
+
+        entry = tier.lookup("scope", [0.98, 0.12, 0.01])
+
+        assert entry is not None
+        assert entry.result_ids == ["a", "b"]
+
+    def test_distant_query_misses(self):
+        """A query beyond max_distance misses."""
+        tier = SemanticQueryCache(dim=3, max_distance=0.05)
+        tier.add("scope", [1.0, 0.0, 0.0], self._entry())
+
+        assert tier.lookup("scope", [0.0, 1.0, 0.0]) is None
+
+    def test_scopes_are_isolated(self):
+        """Neighbours cached under another scope (or generation) never hit."""
+        tier = SemanticQueryCache(dim=3)
+        tier.add("old-generation", [1.0, 0.0, 0.0], self._entry())
+
+        assert tier.lookup("new-generation", [1.0, 0.0, 0.0]) is None
+
+    def test_oldest_slot_is_reused(self):
+        """The matrix is bounded; the oldest neighbour is overwritten."""
+        tier = SemanticQueryCache(dim=3, max_entries=1)
+        tier.add("scope", [1.0, 0.0, 0.0], self._entry("k1"))
+        tier.add("scope", [0.0, 1.0, 0.0], self._entry("k2"))
+
+        assert tier.lookup("scope", [1.0, 0.0, 0.0]) is None
+        assert tier.get_stats()["size"] == 1
+
+    def test_discard_forgets_invalidated_entry(self):
+        """Invalidating an exact key drops its neighbours."""
+        manager = QueryCacheManager(semantic_cache=SemanticQueryCache(dim=3))
+        manager._initialized = True
+        manager.semantic.add("scope", [1.0, 0.0, 0.0], self._entry("k1"))
+
+        manager.invalidate("k1")
+
+        assert manager.semantic.lookup("scope", [1.0, 0.0, 0.0]) is None
+
+    def test_stats_track_hits_and_false_hits(self):
+        """Hit rate and verified false-hit rate are reported."""
+        tier = SemanticQueryCache(dim=3)
+        tier.add("scope", [1.0, 0.0, 0.0], self._entry())
+        tier.lookup("scope", [1.0, 0.0, 0.0])
+        tier.lookup("scope", [0.0, 0.0, 1.0])
+
+        assert tier.record_verification(["a", "b"], ["a", "c"]) is False
+        assert tier.record_verification(["a", "b"], ["c", "d", "a"]) is True
+
+        stats = tier.get_stats()
+        assert stats["hit_rate"] == 0.5
+        assert stats["false_hit_rate"] == 0.5
+
+    def test_manager_exposes_semantic_stats(self):
+        """Manager stats include the semantic tier when enabled."""
+        manager = QueryCacheManager(semantic_cache=SemanticQueryCache(dim=3))
+
+        assert manager.get_stats()["semantic_lookups"] == 0
+        assert "semantic_lookups" not in QueryCacheManager().get_stats()
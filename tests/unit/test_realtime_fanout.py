@@ -0,0 +1,171 @@
+"""Tests for per-client fan-out of real-time metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from session_buddy.realtime.fanout import ClientChannel, TopicFrames, diff_metrics
+from session_buddy.realtime.websocket_server import RealTimeMetricsServer
+
+
+def _skill(name: str, invocations: int, rate: float = 1.0) -> dict[str, Any]:
+    return {
+        "skill_name": name,
+        "total_invocations": invocations,
+        "completion_rate": rate,
+        "avg_duration_seconds": 1.0,
+    }
+
+
+def _message(*skills: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "metrics_update",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "data": {"top_skills": list(skills), "anomalies": []},
+    }
+
+
+class FakeWebSocket:
+    def __init__(self, *, blocked: bool = False) -> None:
+        self.remote_address = ("127.0.0.1", 12345)
+        self.subscription_skill: str | None = None
+        self.sent: list[dict[str, Any]] = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def send(self, message: str) -> None:
+        await self.release.wait()
+        self.sent.append(json.loads(message))
+
+
+class TestDiffMetrics:
+    def test_only_changed_fields(self) -> None:
+        previous = _message(_skill("a", 1), _skill("b", 5))["data"]
+        current = _message(_skill("a", 2), _skill("b", 5))["data"]
+
+        assert diff_metrics(previous, current) == {
+            "top_skills": {"changed": [{"skill_name": "a", "total_invocations": 2}]}
+        }
+
+    def test_unchanged_is_none(self) -> None:
+        data = _message(_skill("a", 1))["data"]
+        assert diff_metrics(data, data) is None
+
+    def test_added_removed_and_reordered(self) -> None:
+        previous = _message(_skill("a", 1), _skill("b", 5))["data"]
+        current = _message(_skill("c", 9), _skill("a", 1))["data"]
+
+        delta = diff_metrics(previous, current)
+
+        assert delta == {
+            "top_skills": {
+                "changed": [_skill("c", 9)],
+                "removed": ["b"],
+                "order": ["c", "a"],
+            }
+        }
+
+
+class TestClientChannel:
+    @pytest.mark.asyncio
+    async def test_snapshot_then_deltas(self) -> None:
+        websocket = FakeWebSocket()
+        channel = ClientChannel(websocket, on_close=lambda ws: None)  # type: ignore[arg-type]
+
+        channel.offer(TopicFrames(None, 1, None, {"type": "metrics_update"}, None))
+        channel.offer(TopicFrames(None, 2, 1, {"type": "metrics_update"}, None))
+        channel.offer(
+            TopicFrames(
+                None, 3, 2, {"type": "metrics_update"}, {"type": "metrics_delta"}
+            )
+        )
+        # A frame the client cannot apply a delta to falls back to a snapshot
+        channel.offer(
+            TopicFrames(
+                "a", 4, 3, {"type": "metrics_update"}, {"type": "metrics_delta"}
+            )
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert [message["type"] for message in websocket.sent] == [
+            "metrics_update",
+            "metrics_delta",
+            "metrics_update",
+        ]
+        channel.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_backlog_is_coalesced(self) -> None:
+        websocket = FakeWebSocket(blocked=True)
+        channel = ClientChannel(websocket, on_close=lambda ws: None, max_queue=2)  # type: ignore[arg-type]
+
+        for seq in range(1, 6):
+            channel.offer(
+                TopicFrames(
+                    None,
+                    seq,
+                    seq - 1 or None,
+                    {"type": "metrics_update", "seq": seq},
+                    {"type": "metrics_delta", "seq": seq},
+                )
+            )
+            # Let the sender pick up the first frame and block on it
+            await asyncio.sleep(0)
+        websocket.release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Deltas 2 and 3 were replaced by snapshot 4 when the queue was full
+        assert channel.dropped == 2
+        assert websocket.sent == [
+            {"type": "metrics_update", "seq": 1},
+            {"type": "metrics_update", "seq": 4},
+            {"type": "metrics_delta", "seq": 5},
+        ]
+        channel.close()
+
+
+class TestServerFanOut:
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self, tmp_path: Path) -> None:
+        server = RealTimeMetricsServer(db_path=tmp_path / "skills.db")
+        fast = FakeWebSocket()
+        slow = FakeWebSocket(blocked=True)
+        subscribed = FakeWebSocket()
+        server.register_client(fast)  # type: ignore[arg-type]
+        server.register_client(slow)  # type: ignore[arg-type]
+        server.register_client(subscribed)  # type: ignore[arg-type]
+        subscribed.subscription_skill = "b"
+
+        server._fan_out(_message(_skill("a", 1), _skill("b", 5)))
+        server._fan_out(_message(_skill("a", 2), _skill("b", 5)))
+        server._fan_out(_message(_skill("a", 2), _skill("b", 6)))
+        await asyncio.sleep(0.01)
+
+        assert slow.sent == []
+        assert [message["type"] for message in fast.sent] == [
+            "metrics_update",
+            "metrics_delta",
+            "metrics_delta",
+        ]
+        assert fast.sent[1]["data"] == {
+            "top_skills": {"changed": [{"skill_name": "a", "total_invocations": 2}]}
+        }
+        # The skill topic skips the tick where its skill did not change
+        assert [message["type"] for message in subscribed.sent] == [
+            "metrics_update",
+            "metrics_delta",
+        ]
+        assert subscribed.sent[0]["data"]["top_skills"] == [_skill("b", 5)]
+        assert subscribed.sent[1]["base_seq"] == subscribed.sent[0]["seq"]
+
+        for websocket in (fast, slow, subscribed):
+            server.unregister_client(websocket)  # type: ignore[arg-type]
+        server.storage.close()
@@ -0,0 +1,55 @@
+"""Unit tests for the trigger-gated and streaming redaction paths."""
+
+from __future__ import annotations
+
+import pytest
+
+from session_buddy.ingesters.redaction import (
+    MAX_REDACTION_BYTES,
+    REDACTED_MARKER,
+    TRUNCATED_MARKER,
+    redact,
+    redact_stream,
+)
+
+AWS_KEY = "AKIA" + "IOSFODNN7EXAMPLE"
+
+
+class TestRedactPatterns:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("mail bob@example.com now", f"mail {REDACTED_MARKER} now"),
+            ("a@b@c.d", REDACTED_MARKER),
+            ("@decorator\ndef f(): ...", "@decorator\ndef f(): ..."),
+            ("host 10.0.3.17 down", f"host {REDACTED_MARKER} down"),
+            ("PASSWORD=hunter2 ok", f"{REDACTED_MARKER} ok"),
+            (f"{AWS_KEY}@corp.io", REDACTED_MARKER),
+        ],
+    )
+    def test_redacts_expected_spans(self, text: str, expected: str) -> None:
+        assert redact(text) == expected
+
+
+class TestRedactStream:
+    def test_matches_whole_text_redaction(self) -> None:
+        lines = [f"line {i} user{i}@example.com key {AWS_KEY}\n" for i in range(200)]
+        text = "".join(lines)
+        chunks = [text[i : i + 97] for i in range(0, len(text), 97)]
+
+        assert "".join(redact_stream(chunks, overlap=256)) == redact(text)
+
+    def test_secret_split_across_chunks_is_redacted(self) -> None:
+        text = "x" * 50 + " " + AWS_KEY + " tail"
+        chunks = [text[:60], text[60:]]
+
+        assert AWS_KEY not in "".join(redact_stream(chunks, overlap=32))
+
+    def test_oversized_text_redacted_in_full_without_truncation(self) -> None:
+        text = ("filler " * 20_000) + AWS_KEY
+
+        result = redact(text, truncate=False)
+
+        assert len(text) > MAX_REDACTION_BYTES
+        assert result.endswith(REDACTED_MARKER)
+        assert TRUNCATED_MARKER not in result
@@ -1005,12 +1005,13 @@ class TestRegisterAllCleanupHandlers:
             register_all_cleanup_handlers(mock_shutdown_manager)
 
             # Verify all handlers were registered
-            assert mock_shutdown_manager.register_cleanup.call_count == 7
+            assert mock_shutdown_manager.register_cleanup.call_count == 8
 
             # Verify registration calls have expected names
             registered_names = [
                 call[1]["name"] for call in mock_shutdown_manager.register_cleanup.call_args_list
             ]
+            assert "access_log_flush" in registered_names
             assert "database_connections" in registered_names
             assert "http_clients" in registered_names
             assert "background_tasks" in registered_names
@@ -1048,13 +1049,14 @@ class TestRegisterAllCleanupHandlers:
             ]
 
             # Verify priorities are in descending order for critical items
-            assert priorities[0] == 100  # database_connections
-            assert priorities[1] == 100  # http_clients
-            assert priorities[2] == 80   # background_tasks
-            assert priorities[3] == 60   # session_state
-            assert priorities[4] == 40   # file_handles
-            assert priorities[5] == 20   # temp_files
-            assert priorities[6] == 10   # logging_handlers
+            assert priorities[0] == 110  # access_log_flush
+            assert priorities[1] == 100  # database_connections
+            assert priorities[2] == 100  # http_clients
+            assert priorities[3] == 80   # background_tasks
+            assert priorities[4] == 60   # session_state
+            assert priorities[5] == 40   # file_handles
+            assert priorities[6] == 20   # temp_files
+            assert priorities[7] == 10   # logging_handlers
 
     def test_register_all_cleanup_handlers_timeout_values(self, mock_logger):
         """Test cleanup handlers have correct timeout values."""
@@ -1071,6 +1073,7 @@ class TestRegisterAllCleanupHandlers:
                 for call in mock_shutdown_manager.register_cleanup.call_args_list
             }
 
+            assert timeouts["access_log_flush"] == 5.0
             assert timeouts["database_connections"] == 10.0
             assert timeouts["http_clients"] == 10.0
             assert timeouts["background_tasks"] == 15.0
@@ -22,6 +22,7 @@ from session_buddy.search_enhanced import (
     CodeSearcher,
     ErrorPatternMatcher,
     EnhancedSearchEngine,
+    PatternIndex,
     TemporalSearchParser,
 )
 from session_buddy.session_types import TimeRange
@@ -1855,6 +1856,122 @@ The debugging process needs to continue.
         assert isinstance(results, list)
 
 
+# ==============================================================================
+# Pattern Index Tests
+# ==============================================================================
+
+
+@pytest.fixture
+def duckdb_reflection_db(
+    sample_conversations: list[tuple[str, str, str, str, str]],
+) -> MagicMock:
+    """A reflection database backed by an in-memory DuckDB conversations table."""
+    import duckdb
+
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE conversations (id VARCHAR, content VARCHAR, "
+        "project VARCHAR, timestamp TIMESTAMP, metadata VARCHAR)"
+    )
+    conn.executemany(
+        "INSERT INTO conversations VALUES (?, ?, ?, ?, ?)", sample_conversations
+    )
+    conn.execute(
+        "INSERT INTO conversations VALUES ('conv-4', "
+        "'Got an ImportError: cannot import ''x''\n```python\n"
+        "import os, json\n```', 'other', '2026-05-23T08:00:00', '{}')"
+    )
+    db = MagicMock(spec=["conn"])
+    db.conn = conn
+    return db
+
+
+class TestPatternIndex:
+    """Searches answered from the persisted pattern tables."""
+
+    @pytest.mark.asyncio
+    async def test_first_search_backfills_index(
+        self, duckdb_reflection_db: MagicMock
+    ) -> None:
+        """Existing conversations are extracted once, then served from the index."""
+        engine = EnhancedSearchEngine(reflection_db=duckdb_reflection_db)
+
+        results = await engine.search_code_patterns("hello function")
+
+        assert [r["conversation_id"] for r in results] == ["conv-2"]
+        assert results[0]["pattern"]["name"] == "hello"
+        with patch.object(
+            engine.code_searcher, "_process_code_block"
+        ) as process_block:
+            await engine.search_code_patterns("hello function")
+        process_block.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_matches_full_scan(
+        self, duckdb_reflection_db: MagicMock
+    ) -> None:
+        """Indexed searches return what extracting every conversation returns."""
+        engine = EnhancedSearchEngine(reflection_db=duckdb_reflection_db)
+        conversations = duckdb_reflection_db.conn.execute(
+            "SELECT id, content, project, timestamp, metadata FROM conversations"
+        ).fetchall()
+
+        for query, error_type in [("error", None), ("import", "import_error")]:
+            indexed = await engine.search_error_patterns(query, error_type)
+            scanned = [
+                result
+                for conv in conversations
+                for result in engine._process_conversation_for_error_patterns(
+                    conv, query, error_type
+                )
+            ]
+            key = lambda r: (r["conversation_id"], r["pattern"]["subtype"])
+            assert sorted(map(key, indexed)) == sorted(map(key, scanned))
+
+        indexed = await engine.search_code_patterns("os json import")
+        assert [r["pattern"]["modules"] for r in indexed] == [["os", "json"]]
+
+    @pytest.mark.asyncio
+    async def test_deleted_conversations_leave_index(
+        self, duckdb_reflection_db: MagicMock
+    ) -> None:
+        """Patterns of deleted conversations stop matching."""
+        engine = EnhancedSearchEngine(reflection_db=duckdb_reflection_db)
+        assert await engine.search_code_patterns("hello function")
+
+        duckdb_reflection_db.conn.execute(
+            "DELETE FROM conversations WHERE id = 'conv-2'"
+        )
+
+        assert await engine.search_code_patterns("hello function") == []
+
+    def test_rebuild_pattern_index(self, duckdb_reflection_db: MagicMock) -> None:
+        """Rebuilding re-extracts every conversation."""
+        engine = EnhancedSearchEngine(reflection_db=duckdb_reflection_db)
+
+        assert engine.rebuild_pattern_index() == 4
+        assert engine.rebuild_pattern_index() == 4
+
+    def test_error_signatures_are_normalized(self) -> None:
+        """Quoted values and numbers do not split one error into many."""
+        import duckdb
+
+        index = PatternIndex(duckdb.connect())
+        index.ensure_schema()
+        index.index_conversations(
+            [
+                ("a", "ImportError: cannot import 'foo' at line 12"),
+                ("b", "ImportError: cannot import 'bar' at line 40"),
+            ]
+        )
+
+        signatures = index.conn.execute(
+            "SELECT DISTINCT signature FROM conversation_patterns "
+            "WHERE subtype = 'import_error'"
+        ).fetchall()
+        assert signatures == [("importerror: cannot import ? at line #",)]
+
+
 # ==============================================================================
 # Run Tests
 # ==============================================================================
@@ -38,6 +38,7 @@ from session_buddy.mcp.tools.memory.search_tools import (
     _parse_time_expression,
     _progressive_search_impl,
     _quick_search_impl,
+    _rebuild_pattern_index_operation,
     _reflection_stats_impl,
     _reset_reflection_database_impl,
     _search_by_concept_impl,
@@ -618,6 +619,21 @@ class TestResetReflectionDatabaseImpl:
             assert "failed" in result or "❌" in result
 
 
+class TestRebuildPatternIndex:
+    """Tests for the rebuild_pattern_index backfill tool."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_reports_indexed_conversations(self, mock_db):
+        """The tool reports how many conversations were re-extracted."""
+        with patch(
+            "session_buddy.search_enhanced.EnhancedSearchEngine.rebuild_pattern_index",
+            return_value=42,
+        ):
+            result = await _rebuild_pattern_index_operation(mock_db)
+
+        assert "42 conversations" in result
+
+
 # ==============================================================================
 # Search Code Tests
 # ==============================================================================
@@ -0,0 +1,52 @@
+"""Tests for DuckDB query-vector helpers."""
+
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pytest
+
+from session_buddy.utils.vector_sql import fetch_scored_rows, vector_literal
+
+
+class TestVectorLiteral:
+    def test_round_trips_float32_exactly(self) -> None:
+        vector = np.random.default_rng(0).standard_normal(8).astype(np.float32)
+        conn = duckdb.connect()
+
+        stored = conn.execute(f"SELECT {vector_literal(vector, 8)}").fetchone()[0]
+
+        assert np.array_equal(np.asarray(stored, dtype=np.float32), vector)
+
+    def test_rejects_wrong_dimension(self) -> None:
+        with pytest.raises(ValueError, match="4-dimensional"):
+            vector_literal([0.1, 0.2], 4)
+
+    def test_rejects_non_finite_values(self) -> None:
+        with pytest.raises(ValueError, match="NaN"):
+            vector_literal([0.1, float("nan")], 2)
+
+
+class TestFetchScoredRows:
+    def test_keeps_rows_at_or_above_threshold_in_order(self) -> None:
+        conn = duckdb.connect()
+        result = conn.execute(
+            """
+            SELECT * FROM (VALUES ('a', 0.9, '{}'), ('b', 0.5, NULL), ('c', 0.7, '{}'))
+                AS t(id, score, metadata)
+            ORDER BY score DESC
+            """
+        )
+
+        rows = fetch_scored_rows(result, "score", 0.7)
+
+        assert [row["id"] for row in rows] == ["a", "c"]
+        assert rows[0]["metadata"] == "{}"
+
+    def test_null_scores_are_dropped(self) -> None:
+        conn = duckdb.connect()
+        result = conn.execute(
+            "SELECT * FROM (VALUES ('a', NULL::DOUBLE)) AS t(id, score)"
+        )
+
+        assert fetch_scored_rows(result, "score", 0.0) == []